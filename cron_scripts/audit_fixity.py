@@ -0,0 +1,530 @@
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import dotenv
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from lib.collection_lock import CollectionLockManager  # noqa: E402
+from lib.fixity import (  # noqa: E402
+    FixityValidationResult,
+    load_fixity_cache,
+    save_fixity_cache,
+    set_aside_failed_warc,
+    validate_fixity_sidecars,
+)
+from lib.local_state import (  # noqa: E402
+    COUNTED_SIZE_KEY,
+    FIXITY_AUDIT_STATUS_FAILED,
+    FIXITY_AUDIT_STATUS_VALID,
+    LAST_AUDIT_STATUS_KEY,
+)
+from lib.orchestration import (  # noqa: E402
+    DEFAULT_COLLECTION_LOCK_HEARTBEAT_SECONDS,
+    DEFAULT_COLLECTION_LOCK_STALE_SECONDS,
+    get_collection_lock_heartbeat_seconds,
+    get_collection_lock_stale_seconds,
+    get_state_persistence_mode,
+    load_collection_state_for_run,
+    save_collection_state_for_run,
+)
+
+dotenv.load_dotenv()
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_AUDIT_CYCLE_DAYS: int = 90
+COLLECTION_LOCK_POLL_SECONDS: float = 30.0
+
+
+@dataclass(frozen=True)
+class FixityAuditCandidate:
+    """
+    Represents one downloaded WARC whose fixity sidecars can be re-verified by the audit.
+    """
+
+    collection_id: int
+    filename: str
+    warc_path: Path
+    sha256_path: Path
+    json_path: Path
+    size: int
+    last_verified_at: str | None
+
+
+@dataclass(frozen=True)
+class FixityAuditOutcome:
+    """
+    Represents one audited WARC's result, held until it is merged into freshly loaded collection state.
+    """
+
+    candidate: FixityAuditCandidate
+    validation: FixityValidationResult
+    verified_at: str
+
+
+@dataclass(frozen=True)
+class FixityAuditSummary:
+    """
+    Represents the outcome of one budgeted audit pass.
+    """
+
+    candidate_count: int
+    verified_count: int
+    failed_count: int
+    verified_bytes: int
+    byte_budget: int
+    remaining_overdue_count: int
+
+
+def configure_logging(log_level_name: str) -> None:
+    """
+    Configures console logging for the fixity audit.
+    Called by: main()
+    """
+    log_level: int = getattr(logging, log_level_name.upper(), logging.INFO)
+    logging.basicConfig(
+        level=log_level,
+        format='[%(asctime)s] %(levelname)s [%(module)s-%(funcName)s()::%(lineno)d] %(message)s',
+        datefmt='%d/%b/%Y %H:%M:%S',
+    )
+
+
+def parse_optional_int(raw_value: str | None) -> int | None:
+    """
+    Parses an optional non-negative integer from the environment, returning None when unset or blank.
+    Called by: parse_args()
+    """
+    result: int | None = None
+    if raw_value is not None and raw_value.strip():
+        if not raw_value.strip().isdigit():
+            raise ValueError(f'Expected a non-negative integer: {raw_value}')
+        result = int(raw_value.strip())
+    return result
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses command-line arguments.
+    Called by: main()
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Re-verify the least-recently-verified WARC fixity sidecars within a byte and time budget.',
+    )
+    parser.add_argument(
+        '--storage-root',
+        default=os.getenv('WARC_STORAGE_ROOT'),
+        help='WARC storage root. Defaults to WARC_STORAGE_ROOT from the environment.',
+    )
+    parser.add_argument(
+        '--collection-id',
+        type=int,
+        action='append',
+        dest='collection_ids',
+        help='Limit the audit to one collection. May be repeated. Defaults to every collection under the storage root.',
+    )
+    parser.add_argument(
+        '--byte-budget',
+        type=int,
+        default=parse_optional_int(os.getenv('FIXITY_AUDIT_BYTE_BUDGET')),
+        help='Bytes to rehash in this pass. Defaults to FIXITY_AUDIT_BYTE_BUDGET; raised if the cycle needs more.',
+    )
+    parser.add_argument(
+        '--time-budget-seconds',
+        type=int,
+        default=parse_optional_int(os.getenv('FIXITY_AUDIT_TIME_BUDGET_SECONDS')),
+        help='Stop starting new files after this many seconds. Defaults to FIXITY_AUDIT_TIME_BUDGET_SECONDS.',
+    )
+    parser.add_argument(
+        '--cycle-days',
+        type=int,
+        default=parse_optional_int(os.getenv('FIXITY_AUDIT_CYCLE_DAYS')) or DEFAULT_AUDIT_CYCLE_DAYS,
+        help='Every file is re-verified at least once per this many days. Defaults to FIXITY_AUDIT_CYCLE_DAYS or 90.',
+    )
+    parser.add_argument(
+        '--log-level',
+        default=os.getenv('LOG_LEVEL', 'INFO'),
+        help='Logging level. Defaults to LOG_LEVEL from the environment or INFO.',
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Print the files this pass would verify without hashing them.',
+    )
+    result: argparse.Namespace = parser.parse_args()
+    return result
+
+
+def resolve_storage_root(storage_root_value: str | None) -> Path:
+    """
+    Resolves the storage root path from CLI/environment input.
+    Called by: main()
+    """
+    if storage_root_value is None or not storage_root_value.strip():
+        raise ValueError('Missing storage root. Provide --storage-root or set WARC_STORAGE_ROOT.')
+    result: Path = Path(storage_root_value.strip()).expanduser()
+    return result
+
+
+def list_collection_ids(storage_root: Path) -> list[int]:
+    """
+    Lists the collection ids that have a directory under the storage root.
+    Called by: main()
+    """
+    collections_root: Path = storage_root / 'collections'
+    result: list[int] = []
+    if collections_root.exists():
+        result = sorted(int(path.name) for path in collections_root.iterdir() if path.is_dir() and path.name.isdigit())
+    return result
+
+
+def get_entry_last_verified_at(entry: dict[str, object]) -> str | None:
+    """
+    Returns when one manifest entry's WARC was last hashed: the last audit, or else the fixity write at download.
+    Called by: build_audit_candidates()
+    """
+    result: str | None = None
+    for key in ('last_verified_at', 'fixity_completed_at'):
+        value: object = entry.get(key)
+        if isinstance(value, str) and value.strip():
+            result = value
+            break
+    return result
+
+
+def get_entry_size(entry: dict[str, object], warc_path: Path) -> int:
+    """
+    Returns one WARC's byte size from the manifest when recorded there, and from disk otherwise.
+    Called by: build_audit_candidates()
+    """
+    recorded_sizes: list[int] = [
+        value
+        for value in (entry.get(COUNTED_SIZE_KEY), entry.get('size'))
+        if isinstance(value, int) and not isinstance(value, bool)
+    ]
+    result: int = 0
+    if recorded_sizes:
+        result = recorded_sizes[0]
+    else:
+        try:
+            result = warc_path.stat().st_size
+        except OSError:
+            result = 0
+    return result
+
+
+def build_audit_candidates(collection_id: int, state: dict[str, object]) -> list[FixityAuditCandidate]:
+    """
+    Builds audit candidates from manifest entries that record a downloaded WARC and both fixity sidecars.
+    Called by: run_fixity_audit()
+    """
+    result: list[FixityAuditCandidate] = []
+    files_value: object = state.get('files')
+    files_state: dict[object, object] = files_value if isinstance(files_value, dict) else {}
+    for filename, entry in files_state.items():
+        if not isinstance(filename, str) or not isinstance(entry, dict):
+            continue
+        path_values: list[object] = [entry.get('warc_path'), entry.get('sha256_path'), entry.get('json_path')]
+        if entry.get('status') != 'downloaded' or not all(isinstance(value, str) and value for value in path_values):
+            continue
+        warc_path: Path = Path(str(path_values[0]))
+        result.append(
+            FixityAuditCandidate(
+                collection_id=collection_id,
+                filename=filename,
+                warc_path=warc_path,
+                sha256_path=Path(str(path_values[1])),
+                json_path=Path(str(path_values[2])),
+                size=get_entry_size(entry, warc_path),
+                last_verified_at=get_entry_last_verified_at(entry),
+            )
+        )
+    return result
+
+
+def order_audit_candidates(candidates: list[FixityAuditCandidate]) -> list[FixityAuditCandidate]:
+    """
+    Orders candidates least-recently-verified first, with never-verified files ahead of everything else.
+    Called by: run_fixity_audit()
+    """
+    result: list[FixityAuditCandidate] = sorted(
+        candidates,
+        key=lambda candidate: (
+            candidate.last_verified_at is not None,
+            candidate.last_verified_at or '',
+            candidate.collection_id,
+            candidate.filename,
+        ),
+    )
+    return result
+
+
+def compute_effective_byte_budget(total_bytes: int, cycle_days: int, configured_byte_budget: int | None) -> int:
+    """
+    Returns the byte budget for one pass, raised to at least the share a nightly pass needs to cover the cycle.
+    Called by: run_fixity_audit()
+    """
+    cycle_share: int = math.ceil(total_bytes / max(cycle_days, 1))
+    result: int = cycle_share
+    if configured_byte_budget is not None:
+        if configured_byte_budget < cycle_share:
+            log.warning(
+                'Byte budget %s is below the %s bytes per pass needed to cover %s bytes in %s days; using %s.',
+                configured_byte_budget,
+                cycle_share,
+                total_bytes,
+                cycle_days,
+                cycle_share,
+            )
+        result = max(configured_byte_budget, cycle_share)
+    return result
+
+
+def is_candidate_overdue(candidate: FixityAuditCandidate, now: datetime, cycle_days: int) -> bool:
+    """
+    Returns whether a candidate has gone longer than one cycle without verification.
+    Called by: run_fixity_audit()
+    """
+    result: bool = True
+    if candidate.last_verified_at is not None:
+        try:
+            result = now - datetime.fromisoformat(candidate.last_verified_at) > timedelta(days=cycle_days)
+        except ValueError:
+            result = True
+    return result
+
+
+def select_audit_batch(candidates: list[FixityAuditCandidate], byte_budget: int) -> list[FixityAuditCandidate]:
+    """
+    Takes ordered candidates until the next one would exceed the byte budget, always taking at least one.
+    Called by: run_fixity_audit()
+    """
+    result: list[FixityAuditCandidate] = []
+    selected_bytes: int = 0
+    for candidate in candidates:
+        if result and selected_bytes + candidate.size > byte_budget:
+            break
+        result.append(candidate)
+        selected_bytes += candidate.size
+    return result
+
+
+def record_audit_result(state: dict[str, object], outcome: FixityAuditOutcome) -> None:
+    """
+    Records one audit outcome on the manifest entry; only a passing audit moves `last_verified_at` forward.
+    A failing file is marked `fixity_failed` and its WARC is set aside, so the next backup run downloads it again.
+    An entry that no longer points at the audited WARC (because a backup run replaced it meanwhile) is left alone.
+    Called by: save_collection_audit_outcomes()
+    """
+    candidate: FixityAuditCandidate = outcome.candidate
+    files_value: object = state.get('files')
+    entry: object = files_value.get(candidate.filename) if isinstance(files_value, dict) else None
+    if (
+        not isinstance(entry, dict)
+        or entry.get('status') != 'downloaded'
+        or entry.get('warc_path') != str(candidate.warc_path)
+    ):
+        log.info(
+            'Collection %s manifest entry for %s changed during the audit; its result is not recorded.',
+            candidate.collection_id,
+            candidate.filename,
+        )
+        return
+    entry['last_audit_at'] = outcome.verified_at
+    if outcome.validation.is_valid:
+        entry['last_verified_at'] = outcome.verified_at
+        entry[LAST_AUDIT_STATUS_KEY] = FIXITY_AUDIT_STATUS_VALID
+        entry.pop('last_audit_error', None)
+    else:
+        entry[LAST_AUDIT_STATUS_KEY] = FIXITY_AUDIT_STATUS_FAILED
+        entry['last_audit_error'] = outcome.validation.error_reason
+        entry['status'] = 'fixity_failed'
+        entry['error_summary'] = f'Fixity audit failed: {outcome.validation.error_reason}'
+        failed_path: Path | None = set_aside_failed_warc(candidate.warc_path)
+        if failed_path is not None:
+            entry['fixity_failed_warc_path'] = str(failed_path)
+
+
+def acquire_collection_lock(lock_manager: CollectionLockManager, collection_id: int) -> None:
+    """
+    Waits until this process holds the collection's lock, polling while a backup run is working on the collection.
+    Called by: run_fixity_audit()
+    """
+    while not lock_manager.try_acquire(collection_id):
+        log.info('Waiting for collection %s lock to record fixity audit results.', collection_id)
+        time.sleep(COLLECTION_LOCK_POLL_SECONDS)
+
+
+def save_collection_audit_outcomes(
+    storage_root: Path,
+    collection_id: int,
+    outcomes: list[FixityAuditOutcome],
+    state_persistence_mode: str,
+) -> None:
+    """
+    Reloads one collection's state and fixity cache, merges only the audited entries into them, and saves both.
+    The caller holds the collection lock, so updates a backup run made during the audit are kept.
+    Called by: run_fixity_audit()
+    """
+    state: dict[str, object] = load_collection_state_for_run(storage_root, collection_id, state_persistence_mode)
+    for outcome in outcomes:
+        record_audit_result(state, outcome)
+    save_collection_state_for_run(storage_root, collection_id, state, state_persistence_mode)
+    failed_outcomes: list[FixityAuditOutcome] = [outcome for outcome in outcomes if not outcome.validation.is_valid]
+    if failed_outcomes:
+        fixity_cache: dict[str, object] = load_fixity_cache(storage_root, collection_id)
+        for outcome in failed_outcomes:
+            fixity_cache.pop(outcome.candidate.warc_path.name, None)
+        save_fixity_cache(storage_root, collection_id, fixity_cache)
+
+
+def run_fixity_audit(
+    storage_root: Path,
+    collection_ids: list[int],
+    cycle_days: int,
+    byte_budget: int | None,
+    time_budget_seconds: int | None,
+    state_persistence_mode: str,
+    dry_run: bool = False,
+    collection_lock_heartbeat_seconds: int = DEFAULT_COLLECTION_LOCK_HEARTBEAT_SECONDS,
+    collection_lock_stale_seconds: int = DEFAULT_COLLECTION_LOCK_STALE_SECONDS,
+) -> FixityAuditSummary:
+    """
+    Re-verifies the least-recently-verified WARCs across the given collections within the byte and time budgets.
+    Every WARC is rehashed from disk without holding any lock. The outcomes are then merged into each collection's
+    freshly loaded state under its collection lock, so a backup run overlapping the audit loses none of its updates.
+    Failed WARCs are set aside and dropped from the fixity cache so the next backup run downloads them again.
+    Called by: main()
+    """
+    started_at: float = time.monotonic()
+    now: datetime = datetime.now(UTC)
+    candidates: list[FixityAuditCandidate] = []
+    for collection_id in collection_ids:
+        state: dict[str, object] = load_collection_state_for_run(storage_root, collection_id, state_persistence_mode)
+        candidates.extend(build_audit_candidates(collection_id, state))
+    ordered_candidates: list[FixityAuditCandidate] = order_audit_candidates(candidates)
+    effective_byte_budget: int = compute_effective_byte_budget(
+        sum(candidate.size for candidate in ordered_candidates),
+        cycle_days,
+        byte_budget,
+    )
+    batch: list[FixityAuditCandidate] = select_audit_batch(ordered_candidates, effective_byte_budget)
+    verified_filenames: set[tuple[int, str]] = set()
+    failed_count: int = 0
+    verified_bytes: int = 0
+    outcomes_by_collection: dict[int, list[FixityAuditOutcome]] = {}
+    try:
+        for candidate in batch:
+            if time_budget_seconds is not None and time.monotonic() - started_at >= time_budget_seconds:
+                log.warning('Fixity audit time budget of %s seconds reached.', time_budget_seconds)
+                break
+            if dry_run:
+                print(f'{candidate.collection_id}\t{candidate.size}\t{candidate.last_verified_at}\t{candidate.warc_path}')
+                continue
+            validation: FixityValidationResult = validate_fixity_sidecars(
+                candidate.warc_path,
+                candidate.sha256_path,
+                candidate.json_path,
+            )
+            outcomes_by_collection.setdefault(candidate.collection_id, []).append(
+                FixityAuditOutcome(candidate=candidate, validation=validation, verified_at=datetime.now(UTC).isoformat())
+            )
+            verified_filenames.add((candidate.collection_id, candidate.filename))
+            verified_bytes += candidate.size
+            if not validation.is_valid:
+                failed_count += 1
+                log.error(
+                    'Collection %s fixity audit failed for %s: %s',
+                    candidate.collection_id,
+                    candidate.filename,
+                    validation.error_reason,
+                )
+    finally:
+        if outcomes_by_collection:
+            with CollectionLockManager(
+                storage_root,
+                float(collection_lock_heartbeat_seconds),
+                float(collection_lock_stale_seconds),
+            ) as lock_manager:
+                for collection_id in sorted(outcomes_by_collection):
+                    acquire_collection_lock(lock_manager, collection_id)
+                    try:
+                        save_collection_audit_outcomes(
+                            storage_root,
+                            collection_id,
+                            outcomes_by_collection[collection_id],
+                            state_persistence_mode,
+                        )
+                    finally:
+                        lock_manager.release(collection_id)
+    remaining_overdue_count: int = sum(
+        1
+        for candidate in ordered_candidates
+        if (candidate.collection_id, candidate.filename) not in verified_filenames
+        and is_candidate_overdue(candidate, now, cycle_days)
+    )
+    result: FixityAuditSummary = FixityAuditSummary(
+        candidate_count=len(ordered_candidates),
+        verified_count=len(verified_filenames),
+        failed_count=failed_count,
+        verified_bytes=verified_bytes,
+        byte_budget=effective_byte_budget,
+        remaining_overdue_count=remaining_overdue_count,
+    )
+    return result
+
+
+def main() -> None:
+    """
+    Orchestrates one budgeted fixity audit pass.
+    Called by: __main__
+    """
+    args: argparse.Namespace = parse_args()
+    configure_logging(args.log_level)
+    try:
+        storage_root: Path = resolve_storage_root(args.storage_root)
+        collection_ids: list[int] = args.collection_ids or list_collection_ids(storage_root)
+        summary: FixityAuditSummary = run_fixity_audit(
+            storage_root,
+            collection_ids,
+            args.cycle_days,
+            args.byte_budget,
+            args.time_budget_seconds,
+            get_state_persistence_mode(),
+            args.dry_run,
+            get_collection_lock_heartbeat_seconds(),
+            get_collection_lock_stale_seconds(),
+        )
+        log.info(
+            'Fixity audit verified %s of %s files (%s bytes of a %s-byte budget); %s failed.',
+            summary.verified_count,
+            summary.candidate_count,
+            summary.verified_bytes,
+            summary.byte_budget,
+            summary.failed_count,
+        )
+        if summary.remaining_overdue_count:
+            log.warning(
+                '%s files remain unverified for longer than %s days; raise the time budget or run more often.',
+                summary.remaining_overdue_count,
+                args.cycle_days,
+            )
+        if summary.failed_count:
+            raise SystemExit(2)
+    except SystemExit:
+        raise
+    except Exception as exc:
+        log.exception('Fixity audit failed.')
+        print(f'Fixity audit failed: {exc}', file=sys.stderr)
+        raise SystemExit(1) from exc
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from concurrent.futures import Future
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from types import TracebackType
+from urllib.parse import urlsplit
+
+import httpx
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class AsyncTransferEngine:
+    """
+    Runs one asyncio event loop on a background thread and multiplexes WASAPI page fetches and WARC transfers on a
+    shared httpx.AsyncClient. Synchronous callers submit coroutines and get concurrent futures back, so collection
+    threads keep owning state, progress, and sheet updates while the loop owns the network.
+    """
+
+    def __init__(
+        self,
+        auth: tuple[str, str] | None,
+        timeout: httpx.Timeout,
+        global_limit: int | None,
+        per_host_limit: int,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Creates the event loop, async client, and limit semaphores; the loop thread starts on `start()`.
+        Called by: main.run_collection_orchestration()
+        """
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.loop_thread: threading.Thread = threading.Thread(
+            target=self.loop.run_forever,
+            name='async-transfer-engine',
+            daemon=True,
+        )
+        self.client: httpx.AsyncClient = httpx.AsyncClient(
+            auth=auth,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=per_host_limit),
+            transport=transport,
+        )
+        self.global_slots: asyncio.Semaphore | None = asyncio.Semaphore(global_limit) if global_limit is not None else None
+        self.per_host_limit: int = per_host_limit
+        self.host_slots: dict[str, asyncio.Semaphore] = {}
+        self.host_slots_lock: threading.Lock = threading.Lock()
+
+    def __enter__(self) -> 'AsyncTransferEngine':
+        """
+        Starts the event loop thread.
+        Called by: main.run_collection_orchestration()
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Closes the client and stops the event loop thread.
+        Called by: main.run_collection_orchestration()
+        """
+        self.close()
+
+    def start(self) -> None:
+        """
+        Starts running the event loop on its background thread.
+        Called by: __enter__()
+        """
+        self.loop_thread.start()
+        log.info('Async transfer engine started with per-host limit %s.', self.per_host_limit)
+
+    def close(self) -> None:
+        """
+        Closes the async client on the loop, then stops and closes the loop.
+        Called by: __exit__()
+        """
+        try:
+            self.run(self.client.aclose())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join()
+            self.loop.close()
+
+    def submit(self, coroutine: Coroutine[object, object, object]) -> Future[object]:
+        """
+        Schedules one coroutine on the event loop and returns a concurrent future for its result.
+        Called by: orchestration.submit_planned_downloads(), run()
+        """
+        result: Future[object] = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        return result
+
+    def run(self, coroutine: Coroutine[object, object, object]) -> object:
+        """
+        Runs one coroutine on the event loop and blocks the calling thread until it finishes.
+        Called by: orchestration.fetch_collection_discovery_for_run(), iterate(), close()
+        """
+        result: object = self.submit(coroutine).result()
+        return result
+
+    def iterate(self, async_iterator: AsyncIterator[object]) -> Iterator[object]:
+        """
+        Drives an async iterator on the event loop, yielding each item to the calling thread as it arrives.
+        The async iterator is closed on the loop when the caller stops early.
+        Called by: orchestration.iter_discovery_pages_for_run()
+        """
+        try:
+            has_item: bool = True
+            while has_item:
+                item: object
+                has_item, item = self.run(read_next_async_item(async_iterator))
+                if has_item:
+                    yield item
+        finally:
+            self.run(close_async_iterator(async_iterator))
+
+    def get_host_slots(self, url: str) -> asyncio.Semaphore:
+        """
+        Returns the semaphore bounding concurrent requests to the URL's host, creating it on first use.
+        Called by: transfer_slots(), orchestration.fetch_collection_discovery_for_run(),
+        orchestration.iter_discovery_pages_for_run()
+        """
+        host: str = urlsplit(url).netloc.lower()
+        with self.host_slots_lock:
+            result: asyncio.Semaphore | None = self.host_slots.get(host)
+            if result is None:
+                result = asyncio.Semaphore(self.per_host_limit)
+                self.host_slots[host] = result
+        return result
+
+    def transfer_slots(self, url: str) -> AbstractAsyncContextManager[None]:
+        """
+        Returns an async context that holds one run-wide transfer slot (when capped) and one slot for the URL's host.
+        Called by: orchestration.download_in_slot_async()
+        """
+        result: AbstractAsyncContextManager[None] = hold_semaphores(
+            [semaphore for semaphore in (self.global_slots, self.get_host_slots(url)) if semaphore is not None]
+        )
+        return result
+
+
+@asynccontextmanager
+async def hold_semaphores(semaphores: list[asyncio.Semaphore]) -> AsyncIterator[None]:
+    """
+    Acquires the semaphores in order and releases them all on exit.
+    Called by: AsyncTransferEngine.transfer_slots()
+    """
+    async with AsyncExitStack() as stack:
+        for semaphore in semaphores:
+            await stack.enter_async_context(semaphore)
+        yield
+
+
+async def read_next_async_item(async_iterator: AsyncIterator[object]) -> tuple[bool, object]:
+    """
+    Awaits the next item, returning `(False, None)` once the iterator is exhausted.
+    Called by: AsyncTransferEngine.iterate()
+    """
+    result: tuple[bool, object]
+    try:
+        result = (True, await anext(async_iterator))
+    except StopAsyncIteration:
+        result = (False, None)
+    return result
+
+
+async def close_async_iterator(async_iterator: AsyncIterator[object]) -> None:
+    """
+    Closes an async generator so its cleanup (such as cancelling outstanding page fetches) runs on the loop.
+    Called by: AsyncTransferEngine.iterate()
+    """
+    close_method: object = getattr(async_iterator, 'aclose', None)
+    if callable(close_method):
+        await close_method()
@@ -0,0 +1,209 @@
+import fcntl
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+
+from lib.local_state import build_collection_root_path
+
+log: logging.Logger = logging.getLogger(__name__)
+
+COLLECTION_LOCK_FILENAME: str = 'collection.lock'
+
+
+class CollectionLockManager:
+    """
+    Holds per-collection lock files under the storage root so overlapping runs split collections between them instead
+    of refusing to start. Each lock is an `fcntl.flock` on `collections/<id>/collection.lock`, which the kernel drops
+    when a run exits or crashes, plus a lease in the file whose heartbeat this manager refreshes. The lease covers
+    hosts sharing the storage over a network filesystem where `flock` is not shared: a lease from another host is
+    honoured until its heartbeat goes stale.
+    """
+
+    def __init__(self, storage_root: Path, heartbeat_seconds: float, stale_seconds: float) -> None:
+        """
+        Creates a manager holding no locks; the heartbeat thread starts on `start()`.
+        Called by: orchestration.build_collection_lock_manager()
+        """
+        self.storage_root: Path = storage_root
+        self.heartbeat_seconds: float = heartbeat_seconds
+        self.stale_seconds: float = stale_seconds
+        self.hostname: str = socket.gethostname()
+        self.lock: threading.Lock = threading.Lock()
+        self.held_files: dict[int, int] = {}
+        self.stop_event: threading.Event = threading.Event()
+        self.heartbeat_thread: threading.Thread = threading.Thread(
+            target=self.run_heartbeat_loop,
+            name='collection-lock-heartbeat',
+            daemon=True,
+        )
+
+    def __enter__(self) -> 'CollectionLockManager':
+        """
+        Starts the heartbeat thread.
+        Called by: main.run_collection_orchestration()
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stops the heartbeat thread and releases any lock still held.
+        Called by: main.run_collection_orchestration()
+        """
+        self.close()
+
+    def start(self) -> None:
+        """
+        Starts refreshing the heartbeat of every held lock.
+        Called by: __enter__()
+        """
+        self.heartbeat_thread.start()
+
+    def close(self) -> None:
+        """
+        Stops the heartbeat thread, then releases every lock still held.
+        Called by: __exit__()
+        """
+        self.stop_event.set()
+        self.heartbeat_thread.join()
+        with self.lock:
+            held_collection_ids: list[int] = list(self.held_files)
+        for collection_id in held_collection_ids:
+            self.release(collection_id)
+
+    def build_lock_path(self, collection_id: int) -> Path:
+        """
+        Builds the lock file path that sits next to the collection's state.
+        Called by: try_acquire()
+        """
+        result: Path = build_collection_root_path(self.storage_root, collection_id) / COLLECTION_LOCK_FILENAME
+        return result
+
+    def try_acquire(self, collection_id: int) -> bool:
+        """
+        Takes the collection's lock without waiting and returns whether this run now holds it.
+        A lease left by a crashed run, or by another host whose heartbeat is older than the stale limit, is taken over.
+        Called by: main.process_collection_job_with_failure_reporting()
+        """
+        lock_path: Path = self.build_lock_path(collection_id)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor: int = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        result: bool = True
+        try:
+            fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            result = False
+            log.info('Collection %s is locked by another run on this host.', collection_id)
+        if result:
+            lease: dict[str, object] = read_lease(file_descriptor)
+            lease_host: object = lease.get('hostname')
+            heartbeat_at: object = lease.get('heartbeat_at')
+            lease_age_seconds: float | None = (
+                time.time() - heartbeat_at if isinstance(heartbeat_at, int | float) else None
+            )
+            if (
+                lease_host not in (None, self.hostname)
+                and lease_age_seconds is not None
+                and lease_age_seconds < self.stale_seconds
+            ):
+                result = False
+                log.info(
+                    'Collection %s is leased by a run on %s with a heartbeat %.0f seconds old.',
+                    collection_id,
+                    lease_host,
+                    lease_age_seconds,
+                )
+            elif lease:
+                log.warning(
+                    'Collection %s took over a stale lock left by pid %s on %s.',
+                    collection_id,
+                    lease.get('pid'),
+                    lease_host,
+                )
+        if result:
+            write_lease(file_descriptor, self.build_lease())
+            with self.lock:
+                self.held_files[collection_id] = file_descriptor
+        else:
+            os.close(file_descriptor)
+        return result
+
+    def release(self, collection_id: int) -> None:
+        """
+        Clears the lease and drops the lock, leaving the empty lock file in place for the next run.
+        Called by: main.process_collection_job_with_failure_reporting(), close()
+        """
+        with self.lock:
+            file_descriptor: int | None = self.held_files.pop(collection_id, None)
+        if file_descriptor is not None:
+            try:
+                os.ftruncate(file_descriptor, 0)
+                fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+            finally:
+                os.close(file_descriptor)
+
+    def build_lease(self) -> dict[str, object]:
+        """
+        Builds the lease written into a held lock file.
+        Called by: try_acquire(), refresh_heartbeats()
+        """
+        result: dict[str, object] = {'hostname': self.hostname, 'pid': os.getpid(), 'heartbeat_at': time.time()}
+        return result
+
+    def refresh_heartbeats(self) -> None:
+        """
+        Rewrites the lease of every held lock with a fresh heartbeat.
+        Called by: run_heartbeat_loop()
+        """
+        with self.lock:
+            for file_descriptor in self.held_files.values():
+                write_lease(file_descriptor, self.build_lease())
+
+    def run_heartbeat_loop(self) -> None:
+        """
+        Refreshes heartbeats every interval until the manager is closed.
+        Called by: start()
+        """
+        while not self.stop_event.wait(self.heartbeat_seconds):
+            try:
+                self.refresh_heartbeats()
+            except OSError:
+                log.exception('Collection lock heartbeat refresh failed.')
+
+
+def read_lease(file_descriptor: int) -> dict[str, object]:
+    """
+    Reads the lease in a lock file, returning an empty lease when the file is empty or unreadable.
+    Called by: CollectionLockManager.try_acquire()
+    """
+    result: dict[str, object] = {}
+    content: bytes = os.pread(file_descriptor, 4096, 0)
+    if content.strip():
+        try:
+            payload: object = json.loads(content)
+        except json.JSONDecodeError:
+            payload = {}
+        if isinstance(payload, dict):
+            result = payload
+    return result
+
+
+def write_lease(file_descriptor: int, lease: dict[str, object]) -> None:
+    """
+    Replaces the lease in a held lock file.
+    Called by: CollectionLockManager.try_acquire(), CollectionLockManager.refresh_heartbeats()
+    """
+    content: bytes = json.dumps(lease, sort_keys=True).encode('utf-8')
+    os.ftruncate(file_descriptor, 0)
+    os.pwrite(file_descriptor, content, 0)
+    os.fsync(file_descriptor)
@@ -0,0 +1,116 @@
+import math
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+from lib.collection_sheet import CollectionJob
+
+
+@dataclass(frozen=True)
+class CollectionSchedulingFacts:
+    """
+    Represents what the scheduler knows about one collection from its local state before the run touches the network.
+    """
+
+    pending_bytes: int
+    last_successful_run_at: datetime | None
+
+
+def build_collection_priority_key(
+    collection_job: CollectionJob,
+    facts: CollectionSchedulingFacts,
+    now: datetime,
+) -> tuple[int, float, int, int]:
+    """
+    Builds the sort key that puts the most urgent collection first: a higher sheet priority, then never or least
+    recently completed (in whole days), then the most pending bytes, then sheet row order.
+    Called by: order_collection_jobs_by_priority()
+    """
+    days_since_success: float = (
+        math.inf
+        if facts.last_successful_run_at is None
+        else float((now - facts.last_successful_run_at).days)
+    )
+    result: tuple[int, float, int, int] = (
+        -(collection_job.priority or 0),
+        -days_since_success,
+        -facts.pending_bytes,
+        collection_job.row_number,
+    )
+    return result
+
+
+def order_collection_jobs_by_priority(
+    collection_jobs: list[CollectionJob],
+    facts_by_collection_id: dict[int, CollectionSchedulingFacts],
+    now: datetime,
+) -> list[CollectionJob]:
+    """
+    Orders collection jobs so the most at-risk or time-sensitive collections start first.
+    Called by: orchestration.order_collection_jobs_for_run()
+    """
+    empty_facts: CollectionSchedulingFacts = CollectionSchedulingFacts(pending_bytes=0, last_successful_run_at=None)
+    result: list[CollectionJob] = sorted(
+        collection_jobs,
+        key=lambda collection_job: build_collection_priority_key(
+            collection_job,
+            facts_by_collection_id.get(collection_job.collection_id, empty_facts),
+            now,
+        ),
+    )
+    return result
+
+
+class CollectionFairShare:
+    """
+    Splits the run-wide download slots evenly between the collections that are downloading at the same moment, so one
+    giant collection cannot hold every slot while the others wait. A collection's share grows again as others finish.
+    """
+
+    def __init__(self, total_slots: int) -> None:
+        """
+        Creates a fair-share ledger with no downloading collections.
+        Called by: orchestration.build_collection_fair_share()
+        """
+        self.total_slots: int = total_slots
+        self.lock: threading.Lock = threading.Lock()
+        self.active_collection_ids: set[int] = set()
+
+    def register(self, collection_id: int) -> None:
+        """
+        Marks one collection as downloading.
+        Called by: participate()
+        """
+        with self.lock:
+            self.active_collection_ids.add(collection_id)
+
+    def unregister(self, collection_id: int) -> None:
+        """
+        Marks one collection as finished downloading, returning its share to the others.
+        Called by: participate()
+        """
+        with self.lock:
+            self.active_collection_ids.discard(collection_id)
+
+    @contextmanager
+    def participate(self, collection_id: int) -> Iterator[None]:
+        """
+        Counts one collection as downloading for the duration of the context, even when its downloads fail.
+        Called by: orchestration.run_planned_downloads()
+        """
+        self.register(collection_id)
+        try:
+            yield
+        finally:
+            self.unregister(collection_id)
+
+    def get_share(self) -> int:
+        """
+        Returns how many transfers each downloading collection may have in flight right now.
+        Called by: orchestration.get_fair_worker_count()
+        """
+        with self.lock:
+            result: int = max(1, math.ceil(self.total_slots / max(1, len(self.active_collection_ids))))
+        return result
@@ -1,7 +1,10 @@
 import json
 import logging
 import os
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
+from types import TracebackType
 
 import dotenv
 import gspread
@@ -11,6 +14,10 @@ dotenv.load_dotenv()
 
 log: logging.Logger = logging.getLogger(__name__)
 
+WORKSHEET_WRITE_LOCK: threading.Lock = threading.Lock()
+SHEET_WRITE_MAX_ATTEMPTS: int = 5
+SHEET_WRITE_RETRY_BASE_SECONDS: float = 2.0
+
 COLLECTION_SHEET_NAME: str = 'At Collection Level'
 REQUIRED_HEADER_FIELDS: tuple[str, ...] = ('collection_id', 'collection_status')
 REQUIRED_REPORTING_FIELDS: tuple[str, ...] = (
@@ -30,6 +37,7 @@ HEADER_ALIASES: dict[str, set[str]] = {
     'collection_url': {'collection url'},
     'collection_name': {'collection name'},
     'seed_count': {'seed count'},
+    'priority': {'priority', 'collection-priority'},
     'collection_status': {'collection-status'},
     'status_last_fetch': {'status-last-fetch', 'processing_status_main', 'status-main'},
     'status_detail': {
@@ -61,15 +69,43 @@ HEADER_ALIASES: dict[str, set[str]] = {
     },
 }
 
+LEGACY_FIELD_NAMES: dict[str, tuple[str, ...]] = {
+    'status_last_fetch': ('processing_status_main',),
+    'status_detail': ('processing_status_detail',),
+    'last_download_timestamp': ('summary_status_last_wasapi_check',),
+    'total_col_warc_count': ('summary_status_downloaded_warcs_count',),
+    'total_downloaded_collection_size': ('summary_status_downloaded_warcs_size',),
+    'server_file_path_collection_level': ('summary_status_server_path',),
+}
+
+
+@dataclass(frozen=True)
+class ReportingColumnLayout:
+    """
+    Represents every located field resolved, once, to its zero-based column index and its A1 column letters.
+    Canonical field names also resolve through their legacy names.
+    """
+
+    column_indexes: dict[str, int]
+    column_letters: dict[str, str]
+
 
 @dataclass(frozen=True)
 class HeaderLocation:
     """
-    Represents the header row index and column map for a sheet.
+    Represents the header row index and column map for a sheet, plus the column layout resolved from that map.
     """
 
     header_row_index: int
     column_map: dict[str, int]
+    reporting_layout: ReportingColumnLayout = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Resolves the column layout once, so cell updates never search the column map again.
+        Called by: locate_header_row()
+        """
+        object.__setattr__(self, 'reporting_layout', build_reporting_column_layout(self.column_map))
 
 
 @dataclass(frozen=True)
@@ -83,6 +119,7 @@ class CollectionJob:
     collection_url: str | None
     collection_name: str | None
     row_number: int
+    priority: int | None = None
 
 
 @dataclass(frozen=True)
@@ -242,6 +279,283 @@ class CollectionSummaryUpdate:
         return result
 
 
+class SheetRowSnapshot:
+    """
+    Holds the last known value of every worksheet cell, seeded from the values read at startup and updated after each
+    successful write, so unchanged cells are never sent again.
+    """
+
+    def __init__(self, values: list[list[str]]) -> None:
+        """
+        Creates a snapshot over the startup sheet values.
+        Called by: main.run_collection_orchestration()
+        """
+        self.values: list[list[str]] = values
+        self.written_values: dict[str, str] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def get_cell_value(self, cell_range: str) -> str:
+        """
+        Returns the last known value of one A1 cell; cells beyond the startup grid read as empty.
+        Called by: select_changed_updates()
+        """
+        result: str | None = self.written_values.get(cell_range)
+        if result is None:
+            row_number: int
+            column_number: int
+            row_number, column_number = gspread.utils.a1_to_rowcol(cell_range)
+            row: list[str] = self.values[row_number - 1] if row_number <= len(self.values) else []
+            result = row[column_number - 1] if column_number <= len(row) else ''
+        return result
+
+    def select_changed_updates(self, cell_updates: list[dict[str, object]]) -> list[dict[str, object]]:
+        """
+        Returns the cell updates whose value differs from the snapshot; multi-cell ranges are always kept.
+        Called by: SnapshotSheetWriter.batch_update(), BackgroundSheetWriter.flush()
+        """
+        result: list[dict[str, object]] = []
+        with self.lock:
+            for cell_update in cell_updates:
+                cell_value: str | None = get_single_cell_value(cell_update)
+                if cell_value is None or cell_value != self.get_cell_value(str(cell_update['range'])):
+                    result.append(cell_update)
+        return result
+
+    def record_written_updates(self, cell_updates: list[dict[str, object]]) -> None:
+        """
+        Stores the values of cell updates the API has accepted.
+        Called by: SnapshotSheetWriter.batch_update(), BackgroundSheetWriter.flush()
+        """
+        with self.lock:
+            for cell_update in cell_updates:
+                cell_value: str | None = get_single_cell_value(cell_update)
+                if cell_value is not None:
+                    self.written_values[str(cell_update['range'])] = cell_value
+
+
+def get_single_cell_value(cell_update: dict[str, object]) -> str | None:
+    """
+    Returns the value of a single-cell update as the sheet displays it, or None for a multi-cell range.
+    Called by: SheetRowSnapshot.select_changed_updates(), SheetRowSnapshot.record_written_updates()
+    """
+    result: str | None = None
+    values: object = cell_update.get('values')
+    cell_range: object = cell_update.get('range')
+    if isinstance(cell_range, str) and ':' not in cell_range and isinstance(values, list) and len(values) == 1:
+        row_values: object = values[0]
+        if isinstance(row_values, list) and len(row_values) == 1:
+            result = str(row_values[0])
+    return result
+
+
+class SnapshotSheetWriter:
+    """
+    Writes cell updates inline, sending only the cells whose value differs from the row snapshot.
+    It stands in for the worksheet in the `update_collection_*` helpers, which only call `batch_update()`.
+    """
+
+    def __init__(self, worksheet: gspread.Worksheet, row_snapshot: SheetRowSnapshot) -> None:
+        """
+        Wraps the worksheet with the shared row snapshot.
+        Called by: orchestration.build_sheet_writer()
+        """
+        self.worksheet: gspread.Worksheet = worksheet
+        self.row_snapshot: SheetRowSnapshot = row_snapshot
+
+    def batch_update(self, cell_updates: list[dict[str, object]]) -> None:
+        """
+        Writes only the changed cells, merged into ranges, skipping the API call when nothing changed, then records them
+        in the snapshot.
+        Called by: update_collection_processing_status(), update_collection_final_reporting()
+        """
+        changed_updates: list[dict[str, object]] = self.row_snapshot.select_changed_updates(
+            split_range_updates(cell_updates)
+        )
+        if changed_updates:
+            self.worksheet.batch_update(merge_contiguous_cell_updates(changed_updates))
+            self.row_snapshot.record_written_updates(changed_updates)
+        log.debug(
+            'Sheet write sent %s of %s cell updates; the rest were unchanged.',
+            len(changed_updates),
+            len(cell_updates),
+        )
+
+
+class BackgroundSheetWriter:
+    """
+    Queues worksheet cell updates from every collection and writes them from one background thread as a single
+    `batch_update` per flush interval, so Sheets latency and quota errors stay off the download path.
+    Queued updates to the same cell are coalesced, keeping only the latest value, and with a row snapshot only cells
+    that differ from it are sent. It stands in for the worksheet in the `update_collection_*` helpers, which only call
+    `batch_update()`.
+    """
+
+    def __init__(
+        self,
+        worksheet: gspread.Worksheet,
+        flush_interval_seconds: float,
+        max_attempts: int = SHEET_WRITE_MAX_ATTEMPTS,
+        retry_base_seconds: float = SHEET_WRITE_RETRY_BASE_SECONDS,
+        row_snapshot: SheetRowSnapshot | None = None,
+    ) -> None:
+        """
+        Creates an empty queue; the flush thread starts on `start()`.
+        Called by: orchestration.build_sheet_writer()
+        """
+        self.worksheet: gspread.Worksheet = worksheet
+        self.flush_interval_seconds: float = flush_interval_seconds
+        self.max_attempts: int = max_attempts
+        self.retry_base_seconds: float = retry_base_seconds
+        self.row_snapshot: SheetRowSnapshot | None = row_snapshot
+        self.lock: threading.Lock = threading.Lock()
+        self.pending_updates: dict[str, dict[str, object]] = {}
+        self.stop_event: threading.Event = threading.Event()
+        self.flush_thread: threading.Thread = threading.Thread(
+            target=self.run_flush_loop,
+            name='sheet-writer',
+            daemon=True,
+        )
+
+    def __enter__(self) -> 'BackgroundSheetWriter':
+        """
+        Starts the flush thread.
+        Called by: main.run_collection_orchestration()
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stops the flush thread and writes everything still queued.
+        Called by: main.run_collection_orchestration()
+        """
+        self.close()
+
+    def start(self) -> None:
+        """
+        Starts flushing queued updates every interval.
+        Called by: __enter__()
+        """
+        self.flush_thread.start()
+        log.info('Background sheet writer started with a %s second flush interval.', self.flush_interval_seconds)
+
+    def close(self) -> None:
+        """
+        Stops the flush thread, then makes a final flush so final reports are never left in the queue.
+        Called by: __exit__()
+        """
+        self.stop_event.set()
+        self.flush_thread.join()
+        self.flush()
+        with self.lock:
+            unwritten_count: int = len(self.pending_updates)
+        if unwritten_count:
+            log.error('Background sheet writer stopped with %s cell updates it could not write.', unwritten_count)
+
+    def batch_update(self, cell_updates: list[dict[str, object]]) -> None:
+        """
+        Queues cell updates cell by cell, replacing any queued value for the same cell.
+        Called by: update_collection_processing_status(), update_collection_final_reporting()
+        """
+        with self.lock:
+            for cell_update in split_range_updates(cell_updates):
+                self.pending_updates[str(cell_update['range'])] = cell_update
+
+    def run_flush_loop(self) -> None:
+        """
+        Flushes the queue every interval until the writer is closed.
+        Called by: start()
+        """
+        while not self.stop_event.wait(self.flush_interval_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Takes every queued update off the queue and writes it, putting the batch back on the queue behind any newer
+        value for the same cell when it could not be written. Any unexpected error is logged rather than raised, so
+        the flush thread keeps running and a failed batch is never lost.
+        Called by: run_flush_loop(), close()
+        """
+        with self.lock:
+            flushed_updates: dict[str, dict[str, object]] = self.pending_updates
+            self.pending_updates = {}
+        if not flushed_updates:
+            return
+        try:
+            finished: bool = self.write_flushed_updates(flushed_updates)
+        except Exception:
+            log.exception('Background sheet writer flush failed; requeueing %s cell updates.', len(flushed_updates))
+            finished = False
+        if not finished:
+            with self.lock:
+                self.pending_updates = {**flushed_updates, **self.pending_updates}
+
+    def write_flushed_updates(self, flushed_updates: dict[str, dict[str, object]]) -> bool:
+        """
+        Writes the changed updates of one flush in one `batch_update`, with adjacent cells merged into ranges, retrying
+        quota, server, and transport errors with exponential backoff.
+        Returns False when the updates are still failing after the last attempt; updates the API rejects outright are
+        dropped and logged, and count as finished.
+        Called by: flush()
+        """
+        changed_updates: list[dict[str, object]] = (
+            self.row_snapshot.select_changed_updates(list(flushed_updates.values()))
+            if self.row_snapshot is not None
+            else list(flushed_updates.values())
+        )
+        attempt: int = 1
+        written: bool = not changed_updates
+        rejected: bool = False
+        while not written and not rejected and attempt <= self.max_attempts:
+            failure_display: str = ''
+            try:
+                with WORKSHEET_WRITE_LOCK:
+                    self.worksheet.batch_update(merge_contiguous_cell_updates(changed_updates))
+                written = True
+            except gspread.exceptions.APIError as exc:
+                if is_retryable_sheet_error(exc):
+                    failure_display = str(exc.code)
+                else:
+                    rejected = True
+                    log.exception('Background sheet writer dropped %s cell updates the API rejected.', len(changed_updates))
+            except Exception as exc:
+                failure_display = repr(exc)
+            if failure_display:
+                log.warning(
+                    'Sheet write attempt %s of %s failed with %s; retrying.',
+                    attempt,
+                    self.max_attempts,
+                    failure_display,
+                )
+                if attempt < self.max_attempts:
+                    time.sleep(self.retry_base_seconds * 2 ** (attempt - 1))
+                attempt += 1
+        if written and changed_updates:
+            if self.row_snapshot is not None:
+                self.row_snapshot.record_written_updates(changed_updates)
+            log.debug(
+                'Background sheet writer wrote %s of %s queued cell updates.',
+                len(changed_updates),
+                len(flushed_updates),
+            )
+        result: bool = written or rejected
+        return result
+
+
+def is_retryable_sheet_error(exc: gspread.exceptions.APIError) -> bool:
+    """
+    Returns whether a Sheets API error is a quota or server error worth retrying.
+    Called by: BackgroundSheetWriter.write_flushed_updates()
+    """
+    result: bool = exc.code == 429 or exc.code >= 500
+    return result
+
+
 def load_gsheet_credentials() -> dict[str, str]:
     """
     Loads service-account credentials from the environment.
@@ -320,7 +634,7 @@ def locate_header_row(values: list[list[str]]) -> HeaderLocation | None:
 def parse_collection_id(value: str | None) -> int | None:
     """
     Parses a collection id value into an integer if possible.
-    Called by: parse_collection_jobs()
+    Called by: parse_collection_jobs(), parse_collection_priority()
     """
     result: int | None = None
     if value is not None:
@@ -340,6 +654,17 @@ def parse_collection_id(value: str | None) -> int | None:
     return result
 
 
+def parse_collection_priority(value: str | None, row_number: int) -> int | None:
+    """
+    Parses the optional priority cell into an integer, treating blank or unreadable values as no priority.
+    Called by: parse_collection_jobs()
+    """
+    result: int | None = parse_collection_id(value)
+    if value is not None and result is None:
+        log.warning('Ignoring unreadable priority on collection row %s: %s', row_number, value)
+    return result
+
+
 def parse_collection_jobs(values: list[list[str]]) -> list[CollectionJob]:
     """
     Parses collection jobs from a sheet value grid.
@@ -372,6 +697,10 @@ def parse_collection_jobs(values: list[list[str]]) -> list[CollectionJob]:
             repository: str | None = get_row_cell(row, header_location.column_map.get('repository'))
             collection_url: str | None = get_row_cell(row, header_location.column_map.get('collection_url'))
             collection_name: str | None = get_row_cell(row, header_location.column_map.get('collection_name'))
+            priority: int | None = parse_collection_priority(
+                get_row_cell(row, header_location.column_map.get('priority')),
+                row_number,
+            )
 
             result.append(
                 CollectionJob(
@@ -380,6 +709,7 @@ def parse_collection_jobs(values: list[list[str]]) -> list[CollectionJob]:
                     collection_url=collection_url,
                     collection_name=collection_name,
                     row_number=row_number,
+                    priority=priority,
                 ),
             )
 
@@ -467,28 +797,120 @@ def build_spreadsheet_editability_probe_update(
 
 def get_column_index(header_location: HeaderLocation, field_name: str) -> int:
     """
-    Returns a column index for canonical or legacy field names.
-    Called by: build_collection_status_cell_updates()
+    Returns a column index for canonical or legacy field names from the precomputed column layout.
+    Called by: build_spreadsheet_editability_probe_update(), orchestration.get_blocking_coordination_summary()
     """
-    legacy_field_names: dict[str, tuple[str, ...]] = {
-        'status_last_fetch': ('processing_status_main',),
-        'status_detail': ('processing_status_detail',),
-        'last_download_timestamp': ('summary_status_last_wasapi_check',),
-        'total_col_warc_count': ('summary_status_downloaded_warcs_count',),
-        'total_downloaded_collection_size': ('summary_status_downloaded_warcs_size',),
-        'server_file_path_collection_level': ('summary_status_server_path',),
-    }
-    candidate_field_names: tuple[str, ...] = (field_name, *legacy_field_names.get(field_name, ()))
-    result: int | None = None
-    for candidate_field_name in candidate_field_names:
-        if candidate_field_name in header_location.column_map:
-            result = header_location.column_map[candidate_field_name]
-            break
+    result: int | None = header_location.reporting_layout.column_indexes.get(field_name)
     if result is None:
         raise CollectionSheetContractError(f'Missing required collection reporting column: {field_name}')
     return result
 
 
+def build_reporting_column_layout(column_map: dict[str, int]) -> ReportingColumnLayout:
+    """
+    Resolves every field in the column map, and every canonical field found only under a legacy name, to its column.
+    Called by: HeaderLocation.__post_init__()
+    """
+    column_indexes: dict[str, int] = dict(column_map)
+    for field_name, legacy_names in LEGACY_FIELD_NAMES.items():
+        if field_name not in column_indexes:
+            for legacy_name in legacy_names:
+                if legacy_name in column_map:
+                    column_indexes[field_name] = column_map[legacy_name]
+                    break
+    column_letters: dict[str, str] = {
+        field_name: gspread.utils.rowcol_to_a1(1, column_index + 1).removesuffix('1')
+        for field_name, column_index in column_indexes.items()
+    }
+    result: ReportingColumnLayout = ReportingColumnLayout(column_indexes=column_indexes, column_letters=column_letters)
+    return result
+
+
+def build_field_cell_update(
+    header_location: HeaderLocation,
+    row_number: int,
+    field_name: str,
+    field_value: str,
+) -> dict[str, object]:
+    """
+    Builds one single-cell update from the precomputed column letters.
+    Called by: build_collection_status_cell_updates(), build_collection_summary_cell_updates()
+    """
+    column_letter: str | None = header_location.reporting_layout.column_letters.get(field_name)
+    if column_letter is None:
+        raise CollectionSheetContractError(f'Missing required collection reporting column: {field_name}')
+    result: dict[str, object] = {'range': f'{column_letter}{row_number}', 'values': [[field_value]]}
+    return result
+
+
+def merge_contiguous_cell_updates(cell_updates: list[dict[str, object]]) -> list[dict[str, object]]:
+    """
+    Merges single-cell updates that sit side by side on one row into one range update each, e.g. `E7`, `F7`, and `G7`
+    into `E7:G7`; multi-cell updates pass through unchanged.
+    Called by: update_collection_processing_status(), update_collection_final_reporting(),
+    SnapshotSheetWriter.batch_update(), BackgroundSheetWriter.flush()
+    """
+    cells: list[tuple[int, int, str, str]] = []
+    result: list[dict[str, object]] = []
+    for cell_update in cell_updates:
+        cell_value: str | None = get_single_cell_value(cell_update)
+        if cell_value is None:
+            result.append(cell_update)
+        else:
+            cell_range: str = str(cell_update['range'])
+            row_number: int
+            column_number: int
+            row_number, column_number = gspread.utils.a1_to_rowcol(cell_range)
+            cells.append((row_number, column_number, cell_range, cell_value))
+    cells.sort()
+    run_start: int = 0
+    for index in range(1, len(cells) + 1):
+        run_ends: bool = (
+            index == len(cells)
+            or cells[index][0] != cells[index - 1][0]
+            or cells[index][1] != cells[index - 1][1] + 1
+        )
+        if run_ends:
+            run: list[tuple[int, int, str, str]] = cells[run_start:index]
+            merged_range: str = run[0][2] if len(run) == 1 else f'{run[0][2]}:{run[-1][2]}'
+            result.append({'range': merged_range, 'values': [[cell[3] for cell in run]]})
+            run_start = index
+    return result
+
+
+def split_range_updates(cell_updates: list[dict[str, object]]) -> list[dict[str, object]]:
+    """
+    Splits one-row range updates back into single-cell updates, so each cell can be coalesced and diffed on its own.
+    Called by: SnapshotSheetWriter.batch_update(), BackgroundSheetWriter.batch_update()
+    """
+    result: list[dict[str, object]] = []
+    for cell_update in cell_updates:
+        cell_range: object = cell_update.get('range')
+        values: object = cell_update.get('values')
+        row_values: object = values[0] if isinstance(values, list) and len(values) == 1 else None
+        if isinstance(cell_range, str) and ':' in cell_range and isinstance(row_values, list):
+            start_range: str
+            end_range: str
+            start_range, end_range = cell_range.split(':', 1)
+            start_row: int
+            start_column: int
+            end_row: int
+            end_column: int
+            start_row, start_column = gspread.utils.a1_to_rowcol(start_range)
+            end_row, end_column = gspread.utils.a1_to_rowcol(end_range)
+            if start_row == end_row and end_column - start_column + 1 == len(row_values):
+                for offset, cell_value in enumerate(row_values):
+                    result.append(
+                        {
+                            'range': gspread.utils.rowcol_to_a1(start_row, start_column + offset),
+                            'values': [[cell_value]],
+                        }
+                    )
+                continue
+        result.append(cell_update)
+    return result
+
+
 def validate_collection_sheet_connection(spreadsheet_id: str) -> CollectionSheetContext:
     """
     Validates that the collection worksheet can be opened, parsed, and edited.
@@ -513,21 +935,14 @@ def build_collection_status_cell_updates(
     Called by: update_collection_processing_status()
     """
     result: list[dict[str, object]] = [
-        {
-            'range': gspread.utils.rowcol_to_a1(row_number, get_column_index(header_location, 'status_last_fetch') + 1),
-            'values': [[status_update.status_last_fetch]],
-        },
-        {
-            'range': gspread.utils.rowcol_to_a1(row_number, get_column_index(header_location, 'status_detail') + 1),
-            'values': [[status_update.status_detail]],
-        },
-        {
-            'range': gspread.utils.rowcol_to_a1(
-                row_number,
-                get_column_index(header_location, 'status_last_fetch_file_count') + 1,
-            ),
-            'values': [[status_update.status_last_fetch_file_count]],
-        },
+        build_field_cell_update(header_location, row_number, 'status_last_fetch', status_update.status_last_fetch),
+        build_field_cell_update(header_location, row_number, 'status_detail', status_update.status_detail),
+        build_field_cell_update(
+            header_location,
+            row_number,
+            'status_last_fetch_file_count',
+            status_update.status_last_fetch_file_count,
+        ),
     ]
     return result
 
@@ -548,42 +963,58 @@ def build_collection_summary_cell_updates(
         'server_file_path_collection_level': summary_update.server_file_path_collection_level,
         'seed_count': summary_update.seed_count,
     }
-    result: list[dict[str, object]] = []
-    for field_name, field_value in summary_values.items():
-        result.append(
-            {
-                'range': gspread.utils.rowcol_to_a1(row_number, get_column_index(header_location, field_name) + 1),
-                'values': [[field_value]],
-            }
-        )
+    result: list[dict[str, object]] = [
+        build_field_cell_update(header_location, row_number, field_name, field_value)
+        for field_name, field_value in summary_values.items()
+    ]
     return result
 
 
+def write_merged_cell_updates(
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
+    cell_updates: list[dict[str, object]],
+) -> None:
+    """
+    Sends cell updates with adjacent cells merged into ranges. Inline writes are serialised across collection threads
+    under the shared worksheet write lock because gspread worksheets are not thread-safe. A background writer only
+    queues the updates under its own lock, so a caller in the download loop never waits on a Sheets request.
+    Called by: update_collection_processing_status(), update_collection_final_reporting()
+    """
+    merged_updates: list[dict[str, object]] = merge_contiguous_cell_updates(cell_updates)
+    if isinstance(worksheet, BackgroundSheetWriter):
+        worksheet.batch_update(merged_updates)
+    else:
+        with WORKSHEET_WRITE_LOCK:
+            worksheet.batch_update(merged_updates)
+
+
 def update_collection_processing_status(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     row_number: int,
     status_update: CollectionProcessingStatusUpdate,
 ) -> None:
     """
-    Updates the collection row with the current processing status fields.
+    Updates the collection row with the current processing status fields, or queues them on a background writer.
+    Adjacent columns are sent as one range.
     Called by: write_collection_status_update()
     """
     cell_updates: list[dict[str, object]] = build_collection_status_cell_updates(header_location, row_number, status_update)
-    worksheet.batch_update(cell_updates)
+    write_merged_cell_updates(worksheet, cell_updates)
 
 
 def update_collection_final_reporting(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     row_number: int,
     status_update: CollectionProcessingStatusUpdate,
     summary_update: CollectionSummaryUpdate,
 ) -> None:
     """
-    Updates the collection row with final status and summary fields.
+    Updates the collection row with final status and summary fields, or queues them on a background writer, sending
+    adjacent columns as one range.
     Called by: write_collection_final_report()
     """
     cell_updates: list[dict[str, object]] = build_collection_status_cell_updates(header_location, row_number, status_update)
     cell_updates.extend(build_collection_summary_cell_updates(header_location, row_number, summary_update))
-    worksheet.batch_update(cell_updates)
+    write_merged_cell_updates(worksheet, cell_updates)
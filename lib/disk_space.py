@@ -0,0 +1,71 @@
+import logging
+import os
+import threading
+from pathlib import Path
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class DiskSpaceAdmission:
+    """
+    Admits planned downloads against the free space on the storage volume, shared by every collection in the run.
+    Bytes admitted but not yet finished stay reserved, so concurrently planned collections cannot oversubscribe the
+    volume. A transfer in flight is counted both in its reservation and in the space it has already used, which errs
+    on the side of deferring.
+    """
+
+    def __init__(self, storage_root: Path, reserve_bytes: int) -> None:
+        """
+        Creates an admission ledger with no reservations.
+        Called by: orchestration.build_disk_space_admission()
+        """
+        self.storage_root: Path = storage_root
+        self.reserve_bytes: int = reserve_bytes
+        self.lock: threading.Lock = threading.Lock()
+        self.reservations: dict[Path, int] = {}
+        self.reserved_bytes: int = 0
+
+    def admit(self, warc_path: Path, needed_bytes: int) -> bool:
+        """
+        Reserves `needed_bytes` for one WARC and returns True when the volume keeps at least the reserve margin free
+        after every outstanding reservation; returns False, reserving nothing, otherwise.
+        Called by: orchestration.admit_planned_downloads()
+        """
+        with self.lock:
+            available_bytes: int = get_available_disk_bytes(self.storage_root)
+            result: bool = available_bytes - self.reserved_bytes - needed_bytes >= self.reserve_bytes
+            if result:
+                self.reservations[warc_path] = self.reservations.get(warc_path, 0) + needed_bytes
+                self.reserved_bytes += needed_bytes
+        return result
+
+    def release(self, warc_path: Path) -> None:
+        """
+        Drops the reservation for one WARC once its transfer has finished, whether or not it succeeded.
+        Called by: orchestration.run_planned_downloads()
+        """
+        with self.lock:
+            self.reserved_bytes -= self.reservations.pop(warc_path, 0)
+
+    def get_unreserved_bytes(self) -> int:
+        """
+        Returns the free bytes on the volume not yet promised to an admitted download.
+        Called by: orchestration.admit_planned_downloads()
+        """
+        with self.lock:
+            result: int = get_available_disk_bytes(self.storage_root) - self.reserved_bytes
+        return result
+
+
+def get_available_disk_bytes(storage_root: Path) -> int:
+    """
+    Returns the bytes an unprivileged process may still write on the volume holding the storage root.
+    A storage root that does not exist yet is measured at its nearest existing parent.
+    Called by: DiskSpaceAdmission.admit(), DiskSpaceAdmission.get_unreserved_bytes()
+    """
+    measured_path: Path = storage_root
+    while not measured_path.exists() and measured_path != measured_path.parent:
+        measured_path = measured_path.parent
+    stats: os.statvfs_result = os.statvfs(measured_path)
+    result: int = stats.f_bavail * stats.f_frsize
+    return result
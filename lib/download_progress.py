@@ -0,0 +1,166 @@
+import threading
+
+BYTES_PER_GB: int = 1000 * 1000 * 1000
+BYTES_PER_MB: int = 1000 * 1000
+
+
+class TransferByteCounter:
+    """
+    Counts the bytes every transfer of one collection has received so far, updated per chunk from any download thread.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a counter at zero.
+        Called by: DownloadProgressTracker.__init__()
+        """
+        self.lock: threading.Lock = threading.Lock()
+        self.total_bytes: int = 0
+
+    def add(self, byte_count: int) -> None:
+        """
+        Adds one received chunk to the total.
+        Called by: downloader.stream_download_attempt(), downloader.stream_download_attempt_async()
+        """
+        with self.lock:
+            self.total_bytes += byte_count
+
+    def get_total(self) -> int:
+        """
+        Returns the bytes received so far.
+        Called by: DownloadProgressTracker.get_transferred_bytes(), DownloadProgressTracker.get_done_bytes()
+        """
+        with self.lock:
+            result: int = self.total_bytes
+        return result
+
+
+class DownloadProgressTracker:
+    """
+    Tracks one collection's download progress by files and bytes, and decides when the next progress report is due.
+    Percent complete is by WASAPI bytes when every planned file has a size, and by files otherwise. The rate is the
+    aggregate bytes actually transferred this run over the elapsed time, and the ETA divides the bytes still to come
+    by that rate. Transfers add their bytes to `byte_counter` per chunk, so files still in flight count toward the
+    bytes done and the rate before they finish.
+    """
+
+    def __init__(self, interval_seconds: float, started_at: float) -> None:
+        """
+        Creates a tracker whose first report is due one interval after `started_at` (a monotonic clock reading).
+        Called by: orchestration.run_planned_downloads()
+        """
+        self.interval_seconds: float = interval_seconds
+        self.started_at: float = started_at
+        self.last_reported_at: float = started_at
+        self.planned_bytes: int = 0
+        self.has_unsized_files: bool = False
+        self.finished_bytes: int = 0
+        self.transferred_bytes: int = 0
+        self.byte_counter: TransferByteCounter = TransferByteCounter()
+
+    def add_planned_size(self, expected_size: int | None) -> None:
+        """
+        Counts one planned file toward the byte total; one file without a size switches percent to files.
+        Called by: orchestration.run_planned_downloads()
+        """
+        if expected_size is None:
+            self.has_unsized_files = True
+        else:
+            self.planned_bytes += expected_size
+
+    def record_finished(self, expected_size: int | None, bytes_written: int, resume_offset: int) -> None:
+        """
+        Counts one finished file, successful or not, toward the processed bytes, and its new bytes toward the rate.
+        Called by: orchestration.run_planned_downloads()
+        """
+        self.finished_bytes += expected_size if expected_size is not None else bytes_written + resume_offset
+        self.transferred_bytes += bytes_written
+
+    def get_transferred_bytes(self) -> int:
+        """
+        Returns the bytes transferred this run, including those of files still in flight.
+        Called by: get_bytes_per_second()
+        """
+        result: int = max(self.transferred_bytes, self.byte_counter.get_total())
+        return result
+
+    def get_done_bytes(self) -> int:
+        """
+        Returns the processed bytes of finished files plus the bytes in-flight files have received so far, never more
+        than the planned total when every planned file has a size.
+        Called by: build_report()
+        """
+        in_flight_bytes: int = max(0, self.byte_counter.get_total() - self.transferred_bytes)
+        result: int = self.finished_bytes + in_flight_bytes
+        if not self.has_unsized_files and self.planned_bytes > 0:
+            result = min(result, self.planned_bytes)
+        return result
+
+    def get_bytes_per_second(self, now: float) -> float:
+        """
+        Returns the aggregate transfer rate since the collection's downloads started.
+        Called by: build_report()
+        """
+        elapsed_seconds: float = now - self.started_at
+        result: float = self.get_transferred_bytes() / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        return result
+
+    def get_seconds_until_next_report(self, now: float) -> float:
+        """
+        Returns how long to wait for finished transfers before the next report is due, at least one second.
+        Called by: orchestration.run_planned_downloads()
+        """
+        result: float = max(1.0, self.last_reported_at + self.interval_seconds - now)
+        return result
+
+    def build_report(self, completed_count: int, total_count: int, now: float) -> str:
+        """
+        Builds compact progress text such as `40% (10/25 files, 12.0/30.0 GB) at 45.2 MB/s, ETA 0:06:38`.
+        Percent and the byte counts come from WASAPI sizes when every planned file has one.
+        Called by: poll_report()
+        """
+        bytes_per_second: float = self.get_bytes_per_second(now)
+        done_bytes: int = self.get_done_bytes()
+        sizes_known: bool = not self.has_unsized_files and self.planned_bytes > 0
+        percent_complete: int = (
+            (done_bytes * 100) // self.planned_bytes
+            if sizes_known
+            else (completed_count * 100) // max(1, total_count)
+        )
+        byte_display: str = (
+            f', {done_bytes / BYTES_PER_GB:.1f}/{self.planned_bytes / BYTES_PER_GB:.1f} GB'
+            if sizes_known
+            else f', {done_bytes / BYTES_PER_GB:.1f} GB'
+        )
+        eta_display: str = ''
+        if sizes_known and bytes_per_second > 0:
+            remaining_seconds: int = round(max(0, self.planned_bytes - done_bytes) / bytes_per_second)
+            eta_display = f', ETA {format_eta(remaining_seconds)}'
+        result: str = (
+            f'{percent_complete}% ({completed_count}/{total_count} files{byte_display})'
+            f' at {bytes_per_second / BYTES_PER_MB:.1f} MB/s{eta_display}'
+        )
+        return result
+
+    def poll_report(self, completed_count: int, total_count: int, now: float) -> str | None:
+        """
+        Returns progress text when at least one interval has passed since the last report, and None otherwise.
+        Called by: orchestration.run_planned_downloads()
+        """
+        result: str | None = None
+        if total_count > 0 and now - self.last_reported_at >= self.interval_seconds:
+            result = self.build_report(completed_count, total_count, now)
+            self.last_reported_at = now
+        return result
+
+
+def format_eta(remaining_seconds: int) -> str:
+    """
+    Formats whole seconds as `H:MM:SS`.
+    Called by: DownloadProgressTracker.build_report()
+    """
+    hours: int = remaining_seconds // 3600
+    minutes: int = (remaining_seconds % 3600) // 60
+    seconds: int = remaining_seconds % 60
+    result: str = f'{hours}:{minutes:02d}:{seconds:02d}'
+    return result
@@ -1,8 +1,39 @@
-from dataclasses import dataclass
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
 
+from lib.download_progress import TransferByteCounter
+from lib.fixity import MultiDigestHasher, find_checksum_mismatches, normalize_expected_checksums, update_hasher_from_file
+
+CONTENT_RANGE_PATTERN: re.Pattern[str] = re.compile(r'^bytes (?P<start>\d+)-(?P<end>\d+)/(?P<total>\d+|\*)$')
+TRANSIENT_HTTP_STATUS_CODES: frozenset[int] = frozenset((408, 429, 500, 502, 503, 504))
+RESUME_DECISION_STATUS_CODES: frozenset[int] = frozenset((200, 206, 416))
+FAILURE_KIND_HTTP_STATUS: str = 'http_status'
+FAILURE_KIND_TRANSPORT: str = 'transport'
+FAILURE_KIND_VERIFICATION: str = 'verification'
+FAILURE_KIND_OTHER: str = 'other'
+ASYNC_WRITE_BATCH_BYTES: int = 1024 * 1024
+PREALLOCATED_LENGTH_CHECKPOINT_BYTES: int = 64 * 1024 * 1024
+BANDWIDTH_WINDOW_PATTERN: re.Pattern[str] = re.compile(
+    r'^(?P<start>\d{1,2}:\d{2})-(?P<end>\d{1,2}:\d{2})=(?P<rate>[^=]+)$'
+)
+BYTE_RATE_PATTERN: re.Pattern[str] = re.compile(r'^(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>[KMG]?B)(?:/S)?$')
+BYTE_RATE_UNITS: dict[str, int] = {'B': 1, 'KB': 1000, 'MB': 1000 * 1000, 'GB': 1000 * 1000 * 1000}
+UNLIMITED_BYTE_RATE: str = 'unlimited'
+MINUTES_PER_DAY: int = 24 * 60
+
+log: logging.Logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class DownloadResult:
@@ -16,60 +47,731 @@ class DownloadResult:
     bytes_written: int
     source_url: str
     error_message: str | None
+    resume_offset: int = 0
+    sha256_hexdigest: str | None = None
+    digests: dict[str, str] = field(default_factory=dict)
+    failure_kind: str | None = None
+    status_code: int | None = None
+    retry_after_seconds: float | None = None
+    elapsed_seconds: float | None = None
+
+    @property
+    def is_transient_failure(self) -> bool:
+        """
+        Returns whether this failure is worth retrying soon: a transport error or a 408/429/5xx response.
+        Called by: orchestration.get_in_run_retry_delay()
+        """
+        result: bool = not self.success and (
+            self.failure_kind == FAILURE_KIND_TRANSPORT
+            or (self.failure_kind == FAILURE_KIND_HTTP_STATUS and self.status_code in TRANSIENT_HTTP_STATUS_CODES)
+        )
+        return result
+
+
+@dataclass(frozen=True)
+class BandwidthWindow:
+    """
+    Represents one daily time window and the byte rate allowed during it; None means unlimited.
+    A window whose end is not after its start wraps past midnight.
+    """
+
+    start_minute: int
+    end_minute: int
+    bytes_per_second: int | None
+
+
+class BandwidthLimiter:
+    """
+    Shares one token bucket across every concurrent download stream, sync or async.
+    The allowed rate is re-read from the daily schedule on each chunk, so a schedule boundary takes effect mid-transfer.
+    """
+
+    def __init__(self, schedule: tuple[BandwidthWindow, ...], burst_seconds: float = 1.0) -> None:
+        """
+        Creates an idle limiter for the given schedule.
+        Called by: orchestration.build_bandwidth_limiter()
+        """
+        self.schedule: tuple[BandwidthWindow, ...] = schedule
+        self.burst_seconds: float = burst_seconds
+        self.lock: threading.Lock = threading.Lock()
+        self.current_rate: int | None = None
+        self.tokens: float = 0.0
+        self.last_refill: float = time.monotonic()
+
+    def reserve(self, byte_count: int, now: datetime | None = None, monotonic_now: float | None = None) -> float:
+        """
+        Takes `byte_count` tokens and returns how many seconds the caller must wait before sending them.
+        Tokens may go negative, so concurrent callers queue behind each other instead of all waking at once.
+        Called by: acquire(), acquire_async()
+        """
+        wall_now: datetime = now if now is not None else datetime.now().astimezone()
+        current_monotonic: float = monotonic_now if monotonic_now is not None else time.monotonic()
+        result: float = 0.0
+        with self.lock:
+            rate: int | None = get_scheduled_bytes_per_second(self.schedule, wall_now)
+            if rate != self.current_rate:
+                log.info('Download bandwidth limit is now %s.', format_byte_rate(rate))
+                self.current_rate = rate
+                self.tokens = rate * self.burst_seconds if rate is not None else 0.0
+                self.last_refill = current_monotonic
+            if rate is not None:
+                capacity: float = rate * self.burst_seconds
+                self.tokens = min(capacity, self.tokens + (current_monotonic - self.last_refill) * rate)
+                self.last_refill = current_monotonic
+                self.tokens -= byte_count
+                result = max(0.0, -self.tokens / rate)
+        return result
+
+    def acquire(self, byte_count: int) -> None:
+        """
+        Blocks the calling thread until `byte_count` bytes may be sent.
+        Called by: stream_download_attempt()
+        """
+        delay_seconds: float = self.reserve(byte_count)
+        if delay_seconds > 0:
+            time.sleep(delay_seconds)
+
+    async def acquire_async(self, byte_count: int) -> None:
+        """
+        Waits on the event loop until `byte_count` bytes may be sent.
+        Called by: stream_download_attempt_async()
+        """
+        delay_seconds: float = self.reserve(byte_count)
+        if delay_seconds > 0:
+            await asyncio.sleep(delay_seconds)
+
+
+class DownloadVerificationError(RuntimeError):
+    """
+    Represents a completed transfer whose size or checksums disagree with what the server advertised.
+    """
+
+
+def parse_clock_minute(clock_text: str) -> int:
+    """
+    Parses `HH:MM` into minutes after midnight, accepting `24:00` as the end of the day.
+    Called by: parse_bandwidth_schedule()
+    """
+    hours_text: str
+    minutes_text: str
+    hours_text, minutes_text = clock_text.split(':')
+    result: int = int(hours_text) * 60 + int(minutes_text)
+    if int(minutes_text) > 59 or result > MINUTES_PER_DAY:
+        raise ValueError(f'invalid clock time: {clock_text}')
+    return result
+
+
+def parse_byte_rate(rate_text: str) -> int | None:
+    """
+    Parses a decimal byte rate such as `50MB`, `500KB/s`, or `unlimited` into bytes per second; None means unlimited.
+    Called by: parse_bandwidth_schedule()
+    """
+    cleaned_text: str = rate_text.strip().upper()
+    result: int | None = None
+    if cleaned_text != UNLIMITED_BYTE_RATE.upper():
+        match: re.Match[str] | None = BYTE_RATE_PATTERN.match(cleaned_text)
+        if match is None:
+            raise ValueError(f'invalid byte rate: {rate_text}')
+        result = int(float(match.group('amount')) * BYTE_RATE_UNITS[match.group('unit')])
+        if result < 1:
+            raise ValueError(f'byte rate must be positive: {rate_text}')
+    return result
+
+
+def parse_bandwidth_schedule(schedule_text: str | None) -> tuple[BandwidthWindow, ...]:
+    """
+    Parses `HH:MM-HH:MM=RATE` windows separated by commas or semicolons, such as `06:00-22:00=50MB;22:00-06:00=unlimited`.
+    Raises ValueError for malformed windows; times no window covers are unlimited.
+    Called by: orchestration.get_bandwidth_schedule()
+    """
+    windows: list[BandwidthWindow] = []
+    if schedule_text is not None:
+        for window_text in re.split(r'[,;]', schedule_text):
+            if not window_text.strip():
+                continue
+            match: re.Match[str] | None = BANDWIDTH_WINDOW_PATTERN.match(window_text.strip())
+            if match is None:
+                raise ValueError(f'invalid bandwidth window: {window_text.strip()}')
+            windows.append(
+                BandwidthWindow(
+                    start_minute=parse_clock_minute(match.group('start')),
+                    end_minute=parse_clock_minute(match.group('end')),
+                    bytes_per_second=parse_byte_rate(match.group('rate')),
+                )
+            )
+    result: tuple[BandwidthWindow, ...] = tuple(windows)
+    return result
+
+
+def is_minute_in_bandwidth_window(window: BandwidthWindow, minute_of_day: int) -> bool:
+    """
+    Returns whether a minute of the day falls inside a window, including windows that wrap past midnight.
+    Called by: get_scheduled_bytes_per_second()
+    """
+    result: bool
+    if window.start_minute < window.end_minute:
+        result = window.start_minute <= minute_of_day < window.end_minute
+    else:
+        result = minute_of_day >= window.start_minute or minute_of_day < window.end_minute
+    return result
+
+
+def get_scheduled_bytes_per_second(schedule: tuple[BandwidthWindow, ...], now: datetime) -> int | None:
+    """
+    Returns the byte rate of the first window containing the local time of `now`, or None (unlimited) when none does.
+    Called by: BandwidthLimiter.reserve(), orchestration.log_download_schedule_projection()
+    """
+    minute_of_day: int = now.hour * 60 + now.minute
+    result: int | None = None
+    for window in schedule:
+        if is_minute_in_bandwidth_window(window, minute_of_day):
+            result = window.bytes_per_second
+            break
+    return result
+
+
+def format_byte_rate(bytes_per_second: int | None) -> str:
+    """
+    Formats a byte rate for logs.
+    Called by: BandwidthLimiter.reserve()
+    """
+    result: str = UNLIMITED_BYTE_RATE if bytes_per_second is None else f'{bytes_per_second / 1_000_000:.2f} MB/s'
+    return result
+
+
+def parse_retry_after_seconds(retry_after_value: str | None, now: datetime | None = None) -> float | None:
+    """
+    Parses a Retry-After header given either as delay seconds or as an HTTP date, returning None when unusable.
+    Called by: classify_download_failure()
+    """
+    result: float | None = None
+    if retry_after_value is not None and retry_after_value.strip():
+        cleaned_value: str = retry_after_value.strip()
+        if cleaned_value.isdigit():
+            result = float(cleaned_value)
+        else:
+            try:
+                retry_at: datetime = parsedate_to_datetime(cleaned_value)
+                reference_time: datetime = now if now is not None else datetime.now(UTC)
+                result = max(0.0, (retry_at - reference_time).total_seconds())
+            except (TypeError, ValueError):
+                result = None
+    return result
+
+
+def classify_download_failure(exc: Exception) -> tuple[str, int | None, float | None]:
+    """
+    Returns the failure kind, HTTP status code, and Retry-After delay for one exception raised while downloading.
+    Called by: build_failed_download_result()
+    """
+    failure_kind: str = FAILURE_KIND_OTHER
+    status_code: int | None = None
+    retry_after_seconds: float | None = None
+    if isinstance(exc, httpx.HTTPStatusError):
+        failure_kind = FAILURE_KIND_HTTP_STATUS
+        status_code = exc.response.status_code
+        retry_after_seconds = parse_retry_after_seconds(exc.response.headers.get('Retry-After'))
+    elif isinstance(exc, httpx.TransportError):
+        failure_kind = FAILURE_KIND_TRANSPORT
+    elif isinstance(exc, DownloadVerificationError):
+        failure_kind = FAILURE_KIND_VERIFICATION
+    result: tuple[str, int | None, float | None] = (failure_kind, status_code, retry_after_seconds)
+    return result
 
 
 def build_partial_download_path(destination_path: Path) -> Path:
     """
     Builds the partial-download path for one final destination.
-    Called by: download_to_path()
+    Called by: prepare_partial_download()
     """
     result: Path = destination_path.with_name(f'{destination_path.name}.partial')
     return result
 
 
+def build_partial_length_path(partial_path: Path) -> Path:
+    """
+    Builds the sidecar path that records how many bytes of a preallocated partial file are real data.
+    Called by: stream_download_attempt(), stream_download_attempt_async(), trim_preallocated_partial()
+    """
+    result: Path = partial_path.with_name(f'{partial_path.name}.length')
+    return result
+
+
+def record_partial_length(partial_file: BinaryIO, length_path: Path, written_length: int) -> None:
+    """
+    Flushes a preallocated partial file and records how many bytes of it have been written.
+    A torn record can only read as a shorter length, so a resume never trusts bytes that were not written.
+    Called by: stream_download_attempt(), stream_download_attempt_async() via a worker thread
+    """
+    partial_file.flush()
+    os.fsync(partial_file.fileno())
+    length_path.write_text(str(written_length), encoding='utf-8')
+
+
+def trim_preallocated_partial(partial_path: Path) -> None:
+    """
+    Cuts a partial file left preallocated by a killed run back to its last recorded length, so it can be resumed
+    instead of being mistaken for a complete transfer. The length record stays until a stream takes the partial over,
+    so an attempt that fails before writing leaves the partial exactly as it found it.
+    Called by: prepare_partial_download()
+    """
+    length_path: Path = build_partial_length_path(partial_path)
+    if not length_path.is_file():
+        return
+    if not partial_path.is_file():
+        length_path.unlink()
+        return
+    try:
+        recorded_length: int = int(length_path.read_text(encoding='utf-8').strip())
+    except ValueError:
+        recorded_length = 0
+    if partial_path.stat().st_size > recorded_length:
+        with partial_path.open('r+b') as partial_file:
+            partial_file.truncate(recorded_length)
+        log.info('Trimmed preallocated partial %s back to its recorded %s bytes.', partial_path, recorded_length)
+
+
+def get_partial_resume_offset(partial_path: Path) -> int:
+    """
+    Returns the byte offset a leftover partial file allows resuming from, or zero when there is nothing to resume.
+    Called by: prepare_partial_download(), build_failed_download_result()
+    """
+    result: int = 0
+    if partial_path.is_file():
+        result = partial_path.stat().st_size
+    return result
+
+
+def build_resume_request_headers(resume_offset: int) -> dict[str, str]:
+    """
+    Builds the request headers for a fresh download or a ranged resume request.
+    Called by: stream_download_attempt(), stream_download_attempt_async()
+    """
+    result: dict[str, str] = {}
+    if resume_offset > 0:
+        result['Range'] = f'bytes={resume_offset}-'
+    return result
+
+
+def raise_for_unusable_resume_response(response: httpx.Response) -> None:
+    """
+    Raises for a reply to a ranged request that neither resumes (206), ignores the range (200), nor rejects it (416).
+    A throttled, failing, or missing source therefore fails the attempt and keeps its partial file for the next one,
+    instead of being mistaken for a refused resume that restarts from byte zero.
+    Called by: stream_download_attempt(), stream_download_attempt_async()
+    """
+    if response.status_code in RESUME_DECISION_STATUS_CODES:
+        return
+    response.raise_for_status()
+    raise httpx.HTTPStatusError(
+        f'Unexpected status {response.status_code} for a ranged request',
+        request=response.request,
+        response=response,
+    )
+
+
+def is_resume_response_accepted(response: httpx.Response, resume_offset: int) -> bool:
+    """
+    Returns whether the server honoured a ranged request with 206 and a Content-Range starting at the resume offset.
+    Called by: stream_download_attempt(), stream_download_attempt_async()
+    """
+    result: bool = False
+    content_range: str | None = response.headers.get('Content-Range')
+    if response.status_code == 206 and content_range is not None:
+        match: re.Match[str] | None = CONTENT_RANGE_PATTERN.match(content_range.strip())
+        if match is not None:
+            start: int = int(match.group('start'))
+            end: int = int(match.group('end'))
+            total: str = match.group('total')
+            result = start == resume_offset and end >= start and (total == '*' or int(total) > end)
+    return result
+
+
+def preallocate_partial_file(partial_file: BinaryIO, preallocate_size: int) -> bool:
+    """
+    Reserves `preallocate_size` bytes for a partial file written from byte zero, so the filesystem can lay a large
+    sequential write out contiguously. Returns False when the platform or filesystem does not support it.
+    Called by: stream_download_attempt(), stream_download_attempt_async() via a worker thread
+    """
+    result: bool = False
+    if preallocate_size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(partial_file.fileno(), 0, preallocate_size)
+            result = True
+        except OSError as exc:
+            log.debug('Could not preallocate %s bytes for %s: %s', preallocate_size, partial_file.name, exc)
+    return result
+
+
+def stream_download_attempt(
+    client: httpx.Client,
+    source_url: str,
+    partial_path: Path,
+    resume_offset: int,
+    chunk_size: int,
+    hasher: MultiDigestHasher,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate_size: int | None = None,
+    byte_counter: TransferByteCounter | None = None,
+) -> bool:
+    """
+    Streams one response into the partial file, appending when a resume offset is honoured.
+    Each written chunk also feeds the digest hasher; a resumed partial's existing bytes are hashed first.
+    With a bandwidth limiter, each chunk waits for its share of the run-wide byte rate before it is read on.
+    With a preallocate size, a partial written from byte zero is preallocated first and trimmed back to the bytes
+    actually written when the stream ends, so resume offsets and size checks stay exact. While it streams, the written
+    length is recorded every PREALLOCATED_LENGTH_CHECKPOINT_BYTES so a killed run's partial can still be resumed.
+    A byte counter, when given, is credited with each chunk so progress reports see transfers still in flight.
+    Returns False without writing when the server refuses a ranged request with 200, 416, or a mismatched
+    Content-Range; any other error status raises, keeping the partial file for a later resume.
+    Called by: download_to_path()
+    """
+    accepted: bool = True
+    with client.stream('GET', source_url, headers=build_resume_request_headers(resume_offset)) as response:
+        if resume_offset > 0:
+            raise_for_unusable_resume_response(response)
+        if resume_offset > 0 and not is_resume_response_accepted(response, resume_offset):
+            log.info(
+                'Server refused resume of %s at byte %s with status %s; restarting from byte zero.',
+                source_url,
+                resume_offset,
+                response.status_code,
+            )
+            accepted = False
+        else:
+            response.raise_for_status()
+            file_mode: str = 'wb'
+            if resume_offset > 0:
+                update_hasher_from_file(hasher, partial_path, chunk_size=chunk_size)
+                file_mode = 'ab'
+            length_path: Path = build_partial_length_path(partial_path)
+            with partial_path.open(file_mode) as partial_file:
+                preallocated: bool = False
+                if resume_offset == 0 and preallocate_size is not None:
+                    record_partial_length(partial_file, length_path, 0)
+                    preallocated = preallocate_partial_file(partial_file, preallocate_size)
+                written_length: int = 0
+                recorded_length: int = 0
+                try:
+                    for chunk in response.iter_bytes(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
+                        partial_file.write(chunk)
+                        hasher.update(chunk)
+                        written_length += len(chunk)
+                        if byte_counter is not None:
+                            byte_counter.add(len(chunk))
+                        if preallocated and written_length - recorded_length >= PREALLOCATED_LENGTH_CHECKPOINT_BYTES:
+                            record_partial_length(partial_file, length_path, written_length)
+                            recorded_length = written_length
+                        if bandwidth_limiter is not None:
+                            bandwidth_limiter.acquire(len(chunk))
+                finally:
+                    if preallocated:
+                        partial_file.truncate()
+                    length_path.unlink(missing_ok=True)
+    return accepted
+
+
+def write_and_hash_chunks(partial_file: BinaryIO, hasher: MultiDigestHasher, chunks: list[bytes]) -> None:
+    """
+    Appends a batch of streamed chunks to the partial file and feeds them to the digest hasher.
+    Called by: stream_download_attempt_async() via a worker thread
+    """
+    for chunk in chunks:
+        partial_file.write(chunk)
+        hasher.update(chunk)
+
+
+async def stream_download_attempt_async(
+    client: httpx.AsyncClient,
+    source_url: str,
+    partial_path: Path,
+    resume_offset: int,
+    chunk_size: int,
+    hasher: MultiDigestHasher,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate_size: int | None = None,
+    byte_counter: TransferByteCounter | None = None,
+) -> bool:
+    """
+    Async counterpart of stream_download_attempt(); received chunks are batched and written and hashed on a worker
+    thread, so disk I/O and hashing never block the event loop.
+    Called by: download_to_path_async()
+    """
+    accepted: bool = True
+    async with client.stream('GET', source_url, headers=build_resume_request_headers(resume_offset)) as response:
+        if resume_offset > 0:
+            raise_for_unusable_resume_response(response)
+        if resume_offset > 0 and not is_resume_response_accepted(response, resume_offset):
+            log.info(
+                'Server refused resume of %s at byte %s with status %s; restarting from byte zero.',
+                source_url,
+                resume_offset,
+                response.status_code,
+            )
+            accepted = False
+        else:
+            response.raise_for_status()
+            file_mode: str = 'wb'
+            if resume_offset > 0:
+                await asyncio.to_thread(update_hasher_from_file, hasher, partial_path, chunk_size=chunk_size)
+                file_mode = 'ab'
+            length_path: Path = build_partial_length_path(partial_path)
+            partial_file: BinaryIO = await asyncio.to_thread(partial_path.open, file_mode)
+            preallocated: bool = False
+            try:
+                if resume_offset == 0 and preallocate_size is not None:
+                    await asyncio.to_thread(record_partial_length, partial_file, length_path, 0)
+                    preallocated = await asyncio.to_thread(preallocate_partial_file, partial_file, preallocate_size)
+                pending_chunks: list[bytes] = []
+                pending_size: int = 0
+                written_length: int = 0
+                recorded_length: int = 0
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    if bandwidth_limiter is not None:
+                        await bandwidth_limiter.acquire_async(len(chunk))
+                    pending_chunks.append(chunk)
+                    pending_size += len(chunk)
+                    if byte_counter is not None:
+                        byte_counter.add(len(chunk))
+                    if pending_size >= ASYNC_WRITE_BATCH_BYTES:
+                        await asyncio.to_thread(write_and_hash_chunks, partial_file, hasher, pending_chunks)
+                        written_length += pending_size
+                        pending_chunks = []
+                        pending_size = 0
+                        if preallocated and written_length - recorded_length >= PREALLOCATED_LENGTH_CHECKPOINT_BYTES:
+                            await asyncio.to_thread(record_partial_length, partial_file, length_path, written_length)
+                            recorded_length = written_length
+                if pending_chunks:
+                    await asyncio.to_thread(write_and_hash_chunks, partial_file, hasher, pending_chunks)
+            finally:
+                if preallocated:
+                    await asyncio.to_thread(partial_file.truncate)
+                await asyncio.to_thread(partial_file.close)
+                await asyncio.to_thread(length_path.unlink, missing_ok=True)
+    return accepted
+
+
+def prepare_partial_download(destination_path: Path) -> tuple[Path, int]:
+    """
+    Creates the destination folder and returns the partial path plus the offset a leftover partial allows resuming from.
+    A partial left preallocated by a killed run is first trimmed back to its recorded length.
+    Called by: download_to_path(), download_to_path_async()
+    """
+    partial_path: Path = build_partial_download_path(destination_path)
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    trim_preallocated_partial(partial_path)
+    result: tuple[Path, int] = (partial_path, get_partial_resume_offset(partial_path))
+    return result
+
+
+def finish_partial_download(
+    destination_path: Path,
+    partial_path: Path,
+    source_url: str,
+    resume_offset: int,
+    hasher: MultiDigestHasher,
+    expected_checksums: dict[str, str] | None,
+    expected_size: int | None,
+) -> DownloadResult:
+    """
+    Verifies a fully streamed partial file against the expected size and checksums, then renames it into place.
+    A mismatch deletes the partial and raises DownloadVerificationError.
+    Called by: download_to_path(), download_to_path_async()
+    """
+    partial_size: int = partial_path.stat().st_size
+    mismatches: list[str] = find_checksum_mismatches(hasher.hexdigests(), expected_checksums)
+    if expected_size is not None and partial_size != expected_size:
+        mismatches.insert(0, f'size expected {expected_size} but received {partial_size}')
+    if mismatches:
+        partial_path.unlink()
+        raise DownloadVerificationError(f'Transfer verification failed: {"; ".join(mismatches)}')
+    partial_path.replace(destination_path)
+    result: DownloadResult = DownloadResult(
+        success=True,
+        destination_path=destination_path,
+        partial_path=partial_path,
+        bytes_written=partial_size - resume_offset,
+        source_url=source_url,
+        error_message=None,
+        resume_offset=resume_offset,
+        sha256_hexdigest=hasher.hexdigest(),
+        digests=hasher.hexdigests(),
+    )
+    return result
+
+
+def build_failed_download_result(
+    exc: Exception,
+    destination_path: Path,
+    partial_path: Path,
+    source_url: str,
+    resume_offset: int,
+) -> DownloadResult:
+    """
+    Builds the failure result for one transfer, dropping an empty partial file but keeping a resumable one.
+    Called by: download_to_path(), download_to_path_async()
+    """
+    partial_size: int = get_partial_resume_offset(partial_path)
+    if partial_path.exists() and partial_size == 0:
+        partial_path.unlink()
+    failure_kind: str
+    status_code: int | None
+    retry_after_seconds: float | None
+    failure_kind, status_code, retry_after_seconds = classify_download_failure(exc)
+    result: DownloadResult = DownloadResult(
+        success=False,
+        destination_path=destination_path,
+        partial_path=partial_path,
+        bytes_written=max(0, partial_size - resume_offset),
+        source_url=source_url,
+        error_message=str(exc),
+        resume_offset=resume_offset,
+        failure_kind=failure_kind,
+        status_code=status_code,
+        retry_after_seconds=retry_after_seconds,
+    )
+    return result
+
+
 def download_to_path(
     client: httpx.Client,
     source_url: str,
     destination_path: Path,
     chunk_size: int = 65536,
+    expected_checksums: dict[str, str] | None = None,
+    expected_size: int | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
 ) -> DownloadResult:
     """
     Streams one remote file to a local destination using a partial file and atomic rename.
-    Called by: run_planned_downloads()
+    A leftover partial file is resumed with an HTTP Range request; a clean restart happens only when the server refuses.
+    Failed transfers keep any non-empty partial file so the next attempt can resume it.
+    The SHA-256 digest, plus every digest named in `expected_checksums`, is computed from the streamed bytes so fixity
+    does not need to re-read the new file. A size or checksum mismatch fails the transfer and deletes the partial file,
+    so a corrupt copy is never renamed into place or resumed.
+    A shared bandwidth limiter paces the stream against the run-wide scheduled byte rate. With `preallocate`, a fresh
+    partial file is preallocated to the expected size before the first byte is written. The result records how long
+    the attempt took, which feeds the run deadline's throughput estimate. A shared byte counter is credited per chunk
+    for the collection's progress reports.
+    Called by: orchestration.download_in_slot()
     """
-    partial_path: Path = build_partial_download_path(destination_path)
-    destination_path.parent.mkdir(parents=True, exist_ok=True)
-    if partial_path.exists():
-        partial_path.unlink()
+    started_at: float = time.monotonic()
+    partial_path: Path
+    resume_offset: int
+    partial_path, resume_offset = prepare_partial_download(destination_path)
+    hasher: MultiDigestHasher = MultiDigestHasher(normalize_expected_checksums(expected_checksums))
+    preallocate_size: int | None = expected_size if preallocate else None
+    try:
+        if not stream_download_attempt(
+            client,
+            source_url,
+            partial_path,
+            resume_offset,
+            chunk_size,
+            hasher,
+            bandwidth_limiter,
+            preallocate_size,
+            byte_counter,
+        ):
+            resume_offset = 0
+            partial_path.unlink()
+            stream_download_attempt(
+                client,
+                source_url,
+                partial_path,
+                resume_offset,
+                chunk_size,
+                hasher,
+                bandwidth_limiter,
+                preallocate_size,
+                byte_counter,
+            )
+        result: DownloadResult = finish_partial_download(
+            destination_path,
+            partial_path,
+            source_url,
+            resume_offset,
+            hasher,
+            expected_checksums,
+            expected_size,
+        )
+    except Exception as exc:
+        result = build_failed_download_result(exc, destination_path, partial_path, source_url, resume_offset)
+    result = replace(result, elapsed_seconds=time.monotonic() - started_at)
+    return result
 
-    bytes_written: int = 0
+
+async def download_to_path_async(
+    client: httpx.AsyncClient,
+    source_url: str,
+    destination_path: Path,
+    chunk_size: int = 65536,
+    expected_checksums: dict[str, str] | None = None,
+    expected_size: int | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> DownloadResult:
+    """
+    Async counterpart of download_to_path() with the same resume, verification, and failure semantics.
+    Filesystem calls, chunk writes, and hashing run on worker threads so many transfers share one event loop.
+    Called by: orchestration.download_in_slot_async()
+    """
+    started_at: float = time.monotonic()
+    partial_path: Path
+    resume_offset: int
+    partial_path, resume_offset = await asyncio.to_thread(prepare_partial_download, destination_path)
+    hasher: MultiDigestHasher = MultiDigestHasher(normalize_expected_checksums(expected_checksums))
+    preallocate_size: int | None = expected_size if preallocate else None
     try:
-        with client.stream('GET', source_url) as response:
-            response.raise_for_status()
-            with partial_path.open('wb') as partial_file:
-                for chunk in response.iter_bytes(chunk_size=chunk_size):
-                    if not chunk:
-                        continue
-                    partial_file.write(chunk)
-                    bytes_written += len(chunk)
-        partial_path.replace(destination_path)
-        result: DownloadResult = DownloadResult(
-            success=True,
-            destination_path=destination_path,
-            partial_path=partial_path,
-            bytes_written=bytes_written,
-            source_url=source_url,
-            error_message=None,
+        if not await stream_download_attempt_async(
+            client,
+            source_url,
+            partial_path,
+            resume_offset,
+            chunk_size,
+            hasher,
+            bandwidth_limiter,
+            preallocate_size,
+            byte_counter,
+        ):
+            resume_offset = 0
+            await asyncio.to_thread(partial_path.unlink)
+            await stream_download_attempt_async(
+                client,
+                source_url,
+                partial_path,
+                resume_offset,
+                chunk_size,
+                hasher,
+                bandwidth_limiter,
+                preallocate_size,
+                byte_counter,
+            )
+        result: DownloadResult = await asyncio.to_thread(
+            finish_partial_download,
+            destination_path,
+            partial_path,
+            source_url,
+            resume_offset,
+            hasher,
+            expected_checksums,
+            expected_size,
         )
     except Exception as exc:
-        if partial_path.exists():
-            partial_path.unlink()
-        result = DownloadResult(
-            success=False,
-            destination_path=destination_path,
-            partial_path=partial_path,
-            bytes_written=bytes_written,
-            source_url=source_url,
-            error_message=str(exc),
+        result = await asyncio.to_thread(
+            build_failed_download_result,
+            exc,
+            destination_path,
+            partial_path,
+            source_url,
+            resume_offset,
         )
+    result = replace(result, elapsed_seconds=time.monotonic() - started_at)
     return result
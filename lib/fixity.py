@@ -1,9 +1,20 @@
 import hashlib
 import json
+import logging
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
+from lib.local_state import build_collection_root_path
+
+FIXITY_CACHE_FILENAME: str = 'fixity_cache.json'
+PRIMARY_DIGEST_ALGORITHM: str = 'sha256'
+FIXITY_FAILED_WARC_SUFFIX: str = '.fixity-failed'
+
+log: logging.Logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class FixityResult:
@@ -20,6 +31,7 @@ class FixityResult:
     source_url: str
     completed_at: str | None
     error_message: str | None
+    checksum_mismatch: bool = False
 
 
 @dataclass(frozen=True)
@@ -32,19 +44,110 @@ class FixityValidationResult:
     error_reason: str | None
 
 
-def compute_sha256_for_file(file_path: Path, chunk_size: int = 65536) -> str:
+class MultiDigestHasher:
     """
-    Computes the SHA-256 hex digest for one local file using chunked reads.
-    Called by: write_fixity_sidecars()
+    Feeds every chunk to SHA-256 plus any extra digest algorithms so one read pass yields all digests.
+    """
+
+    def __init__(self, extra_algorithms: Iterable[str] = ()) -> None:
+        """
+        Creates one hashlib object per supported algorithm; unsupported names are ignored.
+        Called by: compute_digests_for_file(), downloader.download_to_path()
+        """
+        algorithms: list[str] = [PRIMARY_DIGEST_ALGORITHM]
+        algorithms.extend(
+            algorithm
+            for algorithm in (name.lower() for name in extra_algorithms)
+            if algorithm in hashlib.algorithms_guaranteed and algorithm not in algorithms
+        )
+        self.hashers: dict[str, object] = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Feeds one chunk to every hasher.
+        Called by: update_hasher_from_file(), downloader.stream_download_attempt()
+        """
+        for hasher in self.hashers.values():
+            hasher.update(chunk)
+
+    def hexdigest(self) -> str:
+        """
+        Returns the SHA-256 hex digest, so this object can stand in for a plain SHA-256 hasher.
+        Called by: downloader.download_to_path()
+        """
+        result: str = self.hashers[PRIMARY_DIGEST_ALGORITHM].hexdigest()
+        return result
+
+    def hexdigests(self) -> dict[str, str]:
+        """
+        Returns every computed hex digest keyed by lower-case algorithm name.
+        Called by: compute_digests_for_file(), downloader.download_to_path()
+        """
+        result: dict[str, str] = {algorithm: hasher.hexdigest() for algorithm, hasher in self.hashers.items()}
+        return result
+
+
+def normalize_expected_checksums(expected_checksums: dict[str, str] | None) -> dict[str, str]:
+    """
+    Lower-cases expected checksum names and values, keeping only algorithms this module can compute.
+    Called by: find_checksum_mismatches(), write_fixity_sidecars(), downloader.download_to_path()
+    """
+    result: dict[str, str] = {}
+    for algorithm, digest in (expected_checksums or {}).items():
+        if isinstance(algorithm, str) and isinstance(digest, str) and algorithm.lower() in hashlib.algorithms_guaranteed:
+            result[algorithm.lower()] = digest.strip().lower()
+    return result
+
+
+def find_checksum_mismatches(actual_digests: dict[str, str], expected_checksums: dict[str, str] | None) -> list[str]:
+    """
+    Describes every expected checksum that disagrees with the computed digests; an empty list means all match.
+    Called by: write_fixity_sidecars(), downloader.download_to_path()
+    """
+    result: list[str] = [
+        f'{algorithm} expected {expected_digest} but computed {actual_digests.get(algorithm)}'
+        for algorithm, expected_digest in normalize_expected_checksums(expected_checksums).items()
+        if actual_digests.get(algorithm) != expected_digest
+    ]
+    return result
+
+
+def update_hasher_from_file(hasher: object, file_path: Path, chunk_size: int = 65536) -> None:
+    """
+    Feeds the full content of one local file into an existing hasher using chunked reads.
+    Called by: compute_sha256_for_file(), compute_digests_for_file(), downloader.stream_download_attempt()
     """
-    hasher: object = hashlib.sha256()
     with file_path.open('rb') as file_handle:
         for chunk in iter(lambda: file_handle.read(chunk_size), b''):
             hasher.update(chunk)
+
+
+def compute_sha256_for_file(file_path: Path, chunk_size: int = 65536) -> str:
+    """
+    Computes the SHA-256 hex digest for one local file using chunked reads.
+    Called by: validate_fixity_sidecars()
+    """
+    hasher: object = hashlib.sha256()
+    update_hasher_from_file(hasher, file_path, chunk_size=chunk_size)
     result: str = hasher.hexdigest()
     return result
 
 
+def compute_digests_for_file(
+    file_path: Path,
+    extra_algorithms: Iterable[str] = (),
+    chunk_size: int = 65536,
+) -> dict[str, str]:
+    """
+    Computes SHA-256 and any extra digests for one local file in a single chunked read.
+    Called by: write_fixity_sidecars()
+    """
+    hasher: MultiDigestHasher = MultiDigestHasher(extra_algorithms)
+    update_hasher_from_file(hasher, file_path, chunk_size=chunk_size)
+    result: dict[str, str] = hasher.hexdigests()
+    return result
+
+
 def build_sidecar_partial_path(path: Path) -> Path:
     """
     Builds a temporary sidecar path for atomic sidecar writing.
@@ -84,14 +187,97 @@ def validate_json_sidecar_content(json_path: Path, warc_path: Path, expected_dig
     return result
 
 
+def build_fixity_cache_path(storage_root: Path, collection_id: int) -> Path:
+    """
+    Builds the fixity verification cache path, stored next to the collection's state.json.
+    Called by: load_fixity_cache(), save_fixity_cache()
+    """
+    result: Path = build_collection_root_path(storage_root, collection_id) / FIXITY_CACHE_FILENAME
+    return result
+
+
+def get_file_identity(file_path: Path) -> list[int]:
+    """
+    Returns the (device, inode, size, mtime_ns) identity used to decide whether a verified file may have changed.
+    Called by: lookup_cached_sha256(), remember_verified_sha256()
+    """
+    stat_result: os.stat_result = file_path.stat()
+    result: list[int] = [stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns]
+    return result
+
+
+def load_fixity_cache(storage_root: Path, collection_id: int) -> dict[str, object]:
+    """
+    Loads the per-collection fixity verification cache, returning an empty cache when absent or unreadable.
+    Called by: process_collection_job()
+    """
+    cache_path: Path = build_fixity_cache_path(storage_root, collection_id)
+    result: dict[str, object] = {}
+    if cache_path.exists():
+        try:
+            payload: object = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            log.warning('Ignoring unreadable fixity cache %s; files will be re-verified.', cache_path)
+            payload = {}
+        if isinstance(payload, dict):
+            result = payload
+    return result
+
+
+def save_fixity_cache(storage_root: Path, collection_id: int, fixity_cache: dict[str, object]) -> Path:
+    """
+    Saves the per-collection fixity verification cache atomically.
+    Called by: save_fixity_cache_if_changed()
+    """
+    cache_path: Path = build_fixity_cache_path(storage_root, collection_id)
+    write_text_atomically(cache_path, f'{json.dumps(fixity_cache, indent=2, sort_keys=True)}\n')
+    result: Path = cache_path
+    return result
+
+
+def lookup_cached_sha256(fixity_cache: dict[str, object], warc_path: Path) -> str | None:
+    """
+    Returns the cached SHA-256 digest for one WARC when its file identity is unchanged since the last verification.
+    Called by: validate_fixity_sidecars()
+    """
+    result: str | None = None
+    entry: object = fixity_cache.get(warc_path.name)
+    if isinstance(entry, dict) and isinstance(entry.get('sha256'), str):
+        try:
+            if entry.get('identity') == get_file_identity(warc_path):
+                result = entry['sha256']
+        except OSError:
+            result = None
+    return result
+
+
+def remember_verified_sha256(fixity_cache: dict[str, object], warc_path: Path, sha256_hexdigest: str) -> None:
+    """
+    Records a freshly verified or freshly computed digest against the WARC's current file identity.
+    Called by: validate_fixity_sidecars(), orchestration.record_planned_download_outcome()
+    """
+    try:
+        identity: list[int] = get_file_identity(warc_path)
+    except OSError:
+        log.warning('Could not stat %s; leaving it out of the fixity cache.', warc_path)
+    else:
+        fixity_cache[warc_path.name] = {
+            'identity': identity,
+            'sha256': sha256_hexdigest,
+            'verified_at': datetime.now(UTC).isoformat(),
+        }
+
+
 def validate_fixity_sidecars(
     warc_path: Path,
     sha256_path: Path,
     json_path: Path,
     chunk_size: int = 65536,
+    fixity_cache: dict[str, object] | None = None,
 ) -> FixityValidationResult:
     """
     Validates local fixity sidecars by checking existence, parseability, and checksum consistency.
+    When a fixity cache is given, a WARC whose identity is unchanged since its last verification is not rehashed.
     Called by: evaluate_planned_download_need()
     """
     is_valid: bool = False
@@ -100,12 +286,22 @@ def validate_fixity_sidecars(
         error_reason = 'missing_fixity'
     else:
         try:
-            expected_digest: str = compute_sha256_for_file(warc_path, chunk_size=chunk_size)
+            cached_digest: str | None = None
+            if fixity_cache is not None:
+                cached_digest = lookup_cached_sha256(fixity_cache, warc_path)
+            expected_digest: str = (
+                cached_digest if cached_digest is not None else compute_sha256_for_file(warc_path, chunk_size=chunk_size)
+            )
             sha256_valid: bool = validate_sha256_sidecar_content(sha256_path, warc_path, expected_digest)
             json_valid: bool = validate_json_sidecar_content(json_path, warc_path, expected_digest)
             is_valid = sha256_valid and json_valid
             if not is_valid:
                 error_reason = 'invalid_fixity'
+            if fixity_cache is not None:
+                if is_valid and cached_digest is None:
+                    remember_verified_sha256(fixity_cache, warc_path, expected_digest)
+                elif not is_valid:
+                    fixity_cache.pop(warc_path.name, None)
         except Exception:
             error_reason = 'invalid_fixity'
     result: FixityValidationResult = FixityValidationResult(is_valid=is_valid, error_reason=error_reason)
@@ -136,34 +332,58 @@ def write_fixity_sidecars(
     json_path: Path,
     source_url: str,
     chunk_size: int = 65536,
+    sha256_hexdigest: str | None = None,
+    digests: dict[str, str] | None = None,
+    expected_checksums: dict[str, str] | None = None,
 ) -> FixityResult:
     """
-    Computes SHA-256 and writes checksum and JSON sidecars for one downloaded WARC file.
-    Called by: run_planned_downloads()
+    Writes checksum and JSON sidecars for one downloaded WARC file.
+    Uses digests computed while downloading when provided, and otherwise reads the file once to compute SHA-256
+    together with every digest algorithm named in `expected_checksums`.
+    Expected checksums (such as WASAPI's sha1/md5) must match, or no sidecars are written and the result fails with
+    `checksum_mismatch` set.
+    Digests other than SHA-256 are recorded under `checksums` in the JSON sidecar.
+    Called by: write_fixity_for_planned_download()
     """
     size: int = 0
-    sha256_hexdigest: str | None = None
     completed_at: str | None = None
     error_message: str | None = None
     success: bool = False
+    checksum_mismatch: bool = False
     try:
         size = warc_path.stat().st_size
-        sha256_hexdigest = compute_sha256_for_file(warc_path, chunk_size=chunk_size)
+        computed_digests: dict[str, str] = dict(digests or {})
+        if sha256_hexdigest is not None:
+            computed_digests[PRIMARY_DIGEST_ALGORITHM] = sha256_hexdigest
+        missing_algorithms: set[str] = set(normalize_expected_checksums(expected_checksums)) - computed_digests.keys()
+        if PRIMARY_DIGEST_ALGORITHM not in computed_digests or missing_algorithms:
+            computed_digests = compute_digests_for_file(
+                warc_path,
+                normalize_expected_checksums(expected_checksums),
+                chunk_size=chunk_size,
+            )
+        sha256_hexdigest = computed_digests[PRIMARY_DIGEST_ALGORITHM]
+        mismatches: list[str] = find_checksum_mismatches(computed_digests, expected_checksums)
+        if mismatches:
+            checksum_mismatch = True
+            raise ValueError(f'Checksum mismatch for {warc_path.name}: {"; ".join(mismatches)}')
         completed_at = datetime.now(UTC).isoformat()
         sha256_content: str = f'{sha256_hexdigest} *{warc_path.name}\n'
-        json_content: str = json.dumps(
-            {
-                'sha256': sha256_hexdigest,
-                'size': size,
-                'source_url': source_url,
-                'warc_filename': warc_path.name,
-                'warc_path': str(warc_path),
-                'sha256_path': str(sha256_path),
-                'completed_at': completed_at,
-            },
-            indent=2,
-            sort_keys=True,
-        )
+        json_payload: dict[str, object] = {
+            'sha256': sha256_hexdigest,
+            'size': size,
+            'source_url': source_url,
+            'warc_filename': warc_path.name,
+            'warc_path': str(warc_path),
+            'sha256_path': str(sha256_path),
+            'completed_at': completed_at,
+        }
+        extra_digests: dict[str, str] = {
+            algorithm: digest for algorithm, digest in computed_digests.items() if algorithm != PRIMARY_DIGEST_ALGORITHM
+        }
+        if extra_digests:
+            json_payload['checksums'] = extra_digests
+        json_content: str = json.dumps(json_payload, indent=2, sort_keys=True)
         write_text_atomically(sha256_path, sha256_content)
         write_text_atomically(json_path, f'{json_content}\n')
         success = True
@@ -179,5 +399,23 @@ def write_fixity_sidecars(
         source_url=source_url,
         completed_at=completed_at,
         error_message=error_message,
+        checksum_mismatch=checksum_mismatch,
     )
     return result
+
+
+def set_aside_failed_warc(warc_path: Path) -> Path | None:
+    """
+    Renames a WARC that does not match its recorded or advertised fixity to `<name>.fixity-failed`, so it is no longer
+    taken for a good copy and a fresh one can be downloaded, while the bad copy is kept for inspection.
+    Returns the new path, or None when the WARC could not be moved.
+    Called by: orchestration.write_fixity_for_existing_warc(), audit_fixity.record_audit_result()
+    """
+    result: Path | None = None
+    failed_path: Path = warc_path.with_name(f'{warc_path.name}{FIXITY_FAILED_WARC_SUFFIX}')
+    try:
+        warc_path.replace(failed_path)
+        result = failed_path
+    except OSError:
+        log.exception('Could not set aside failed WARC %s', warc_path)
+    return result
@@ -1,8 +1,26 @@
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
+STATE_JOURNAL_FILENAME: str = 'state.journal.jsonl'
+STATE_PERSISTENCE_MODE_SNAPSHOT: str = 'snapshot'
+STATE_PERSISTENCE_MODE_JOURNAL: str = 'journal'
+STATE_PERSISTENCE_MODE_SQLITE: str = 'sqlite'
+STATE_PERSISTENCE_MODES: frozenset[str] = frozenset(
+    (STATE_PERSISTENCE_MODE_SNAPSHOT, STATE_PERSISTENCE_MODE_JOURNAL, STATE_PERSISTENCE_MODE_SQLITE)
+)
+DEFAULT_STATE_JOURNAL_COMPACTION_BYTES: int = 4 * 1024 * 1024
+DOWNLOADED_TOTALS_KEY: str = 'downloaded_totals'
+COUNTED_SIZE_KEY: str = 'counted_size'
+COUNTED_SEED_ID_KEY: str = 'counted_seed_id'
+LAST_SUCCESSFUL_DISCOVERY_AT_KEY: str = 'last_successful_discovery_at'
+CONSECUTIVE_DOWNLOAD_FAILURES_KEY: str = 'consecutive_download_failures'
+LAST_AUDIT_STATUS_KEY: str = 'last_audit_status'
+FIXITY_AUDIT_STATUS_VALID: str = 'valid'
+FIXITY_AUDIT_STATUS_FAILED: str = 'failed'
+
 REQUIRED_TOP_LEVEL_DEFAULTS: dict[str, object] = {
     'enumeration_checkpoint_store_time_max': None,
     'files': {},
@@ -43,6 +61,15 @@ def build_state_file_path(storage_root: Path, collection_id: int) -> Path:
     return result
 
 
+def build_state_journal_path(storage_root: Path, collection_id: int) -> Path:
+    """
+    Builds the append-only manifest journal path that sits next to state.json.
+    Called by: append_file_manifest_journal_entry(), load_collection_state(), save_collection_state()
+    """
+    result: Path = build_state_file_path(storage_root, collection_id).with_name(STATE_JOURNAL_FILENAME)
+    return result
+
+
 def make_default_collection_state() -> dict[str, object]:
     """
     Builds the default in-memory collection state structure.
@@ -100,9 +127,14 @@ def update_file_manifest_for_planned_download(
     warc_path: Path,
     discovered_at: str,
     seed_id: str = '',
+    expected_size: int | None = None,
+    expected_checksums: dict[str, str] | None = None,
+    store_time: str | None = None,
 ) -> dict[str, object]:
     """
     Updates one file manifest entry with durable pre-download planning metadata.
+    WASAPI's advertised size, checksums, and store-time are kept so reconciliation retries are verified and scheduled
+    the same way.
     Called by: persist_planned_downloads_to_state()
     """
     entry: dict[str, object] = get_file_manifest_entry(state, filename)
@@ -110,6 +142,12 @@ def update_file_manifest_for_planned_download(
     entry['warc_path'] = str(warc_path)
     if seed_id:
         entry['seed_id'] = seed_id
+    if expected_size is not None:
+        entry['size'] = expected_size
+    if expected_checksums:
+        entry['expected_checksums'] = dict(expected_checksums)
+    if store_time is not None:
+        entry['store_time'] = store_time
     entry['discovered_at'] = discovered_at
     current_status: object = entry.get('status')
     if current_status != 'downloaded':
@@ -118,6 +156,23 @@ def update_file_manifest_for_planned_download(
     return result
 
 
+def get_consecutive_download_failures(entry: dict[str, object]) -> int:
+    """
+    Returns how many downloads of one file have failed in a row since its last successful download.
+    Entries written before the counter existed are seeded from `error_count` unless their last recorded download
+    succeeded; `status` is not consulted because planning rewrites it to `pending_download` before the result is recorded.
+    Called by: update_file_manifest_for_download_result(), orchestration.schedule_failed_download_retry()
+    """
+    counter_value: object = entry.get(CONSECUTIVE_DOWNLOAD_FAILURES_KEY)
+    error_count_value: object = entry.get('error_count', 0)
+    result: int = 0
+    if isinstance(counter_value, int):
+        result = counter_value
+    elif entry.get('download_status') != 'downloaded' and isinstance(error_count_value, int):
+        result = error_count_value
+    return result
+
+
 def update_file_manifest_for_download_result(
     state: dict[str, object],
     filename: str,
@@ -129,11 +184,15 @@ def update_file_manifest_for_download_result(
 ) -> dict[str, object]:
     """
     Updates one file manifest entry with the durable download outcome.
+    `error_count` keeps the file's lifetime failures, while the consecutive-failure count that drives backoff and
+    quarantine starts again after every successful download. A successful download also clears a failed fixity audit,
+    since the new copy replaces the WARC the audit set aside.
     Called by: run_planned_downloads()
     """
     entry: dict[str, object] = get_file_manifest_entry(state, filename)
     current_error_count: object = entry.get('error_count', 0)
     error_count: int = current_error_count if isinstance(current_error_count, int) else 0
+    consecutive_failures: int = get_consecutive_download_failures(entry)
     entry['source_url'] = source_url
     entry['warc_path'] = str(warc_path)
     if seed_id:
@@ -143,9 +202,15 @@ def update_file_manifest_for_download_result(
     if success:
         entry['status'] = 'downloaded'
         entry['error_summary'] = None
+        entry[CONSECUTIVE_DOWNLOAD_FAILURES_KEY] = 0
+        entry.pop('next_retry_after', None)
+        if entry.get(LAST_AUDIT_STATUS_KEY) == FIXITY_AUDIT_STATUS_FAILED:
+            entry.pop(LAST_AUDIT_STATUS_KEY)
+            entry.pop('last_audit_error', None)
     else:
         entry['status'] = 'failed'
         entry['error_count'] = error_count + 1
+        entry[CONSECUTIVE_DOWNLOAD_FAILURES_KEY] = consecutive_failures + 1
         entry['error_summary'] = error_message
     result: dict[str, object] = entry
     return result
@@ -183,12 +248,234 @@ def update_file_manifest_for_fixity_result(
     return result
 
 
+def schedule_file_manifest_retry(
+    state: dict[str, object],
+    filename: str,
+    next_retry_after: str,
+    quarantined: bool,
+) -> dict[str, object]:
+    """
+    Records when a failed file may next be attempted, moving it to `quarantined` once its attempts are exhausted.
+    Called by: orchestration.schedule_failed_download_retry()
+    """
+    entry: dict[str, object] = get_file_manifest_entry(state, filename)
+    entry['next_retry_after'] = next_retry_after
+    if quarantined:
+        entry['status'] = 'quarantined'
+    result: dict[str, object] = entry
+    return result
+
+
+def make_default_downloaded_totals(rescanned_at: str | None = None) -> dict[str, object]:
+    """
+    Builds an empty running-totals record for the WARCs a collection holds on disk.
+    Called by: replace_downloaded_totals_from_scan()
+    """
+    result: dict[str, object] = {
+        'file_count': 0,
+        'byte_count': 0,
+        'seed_file_counts': {},
+        'last_full_rescan_at': rescanned_at,
+    }
+    return result
+
+
+def get_downloaded_totals(state: dict[str, object]) -> dict[str, object] | None:
+    """
+    Returns the mutable running-totals record, or None when no full rescan has established it yet.
+    Called by: add_file_to_downloaded_totals(), remove_file_from_downloaded_totals(),
+    orchestration.build_collection_final_report()
+    """
+    totals_value: object = state.get(DOWNLOADED_TOTALS_KEY)
+    result: dict[str, object] | None = None
+    if (
+        isinstance(totals_value, dict)
+        and isinstance(totals_value.get('file_count'), int)
+        and isinstance(totals_value.get('byte_count'), int)
+        and isinstance(totals_value.get('seed_file_counts'), dict)
+    ):
+        result = totals_value
+    return result
+
+
+def add_file_to_downloaded_totals(state: dict[str, object], filename: str, size: int, seed_id: str) -> bool:
+    """
+    Counts one on-disk WARC in the running totals, replacing its previous size when it was already counted.
+    The counted size is kept on the manifest entry so repeated calls for the same file never double count.
+    Returns False without changing anything when the totals have not been established by a rescan.
+    Called by: orchestration.record_planned_download_outcome(), replace_downloaded_totals_from_scan()
+    """
+    totals: dict[str, object] | None = get_downloaded_totals(state)
+    if totals is not None:
+        entry: dict[str, object] = get_file_manifest_entry(state, filename)
+        previous_size: object = entry.get(COUNTED_SIZE_KEY)
+        seed_file_counts: dict[str, int] = totals['seed_file_counts']
+        if isinstance(previous_size, int):
+            totals['byte_count'] = totals['byte_count'] - previous_size + size
+        else:
+            totals['file_count'] = totals['file_count'] + 1
+            totals['byte_count'] = totals['byte_count'] + size
+            seed_file_counts[seed_id] = seed_file_counts.get(seed_id, 0) + 1
+            entry[COUNTED_SEED_ID_KEY] = seed_id
+        entry[COUNTED_SIZE_KEY] = size
+    result: bool = totals is not None
+    return result
+
+
+def remove_file_from_downloaded_totals(state: dict[str, object], filename: str) -> bool:
+    """
+    Removes one WARC that is no longer on disk from the running totals, returning whether it had been counted.
+    Called by: orchestration.build_reconciliation_retry_downloads()
+    """
+    totals: dict[str, object] | None = get_downloaded_totals(state)
+    files_value: object = state.get('files')
+    entry_value: object = files_value.get(filename) if isinstance(files_value, dict) else None
+    removed: bool = False
+    if totals is not None and isinstance(entry_value, dict) and isinstance(entry_value.get(COUNTED_SIZE_KEY), int):
+        seed_file_counts: dict[str, int] = totals['seed_file_counts']
+        seed_id_value: object = entry_value.pop(COUNTED_SEED_ID_KEY, None)
+        totals['file_count'] = max(0, totals['file_count'] - 1)
+        totals['byte_count'] = max(0, totals['byte_count'] - entry_value.pop(COUNTED_SIZE_KEY))
+        if isinstance(seed_id_value, str) and seed_id_value in seed_file_counts:
+            seed_file_counts[seed_id_value] -= 1
+            if seed_file_counts[seed_id_value] <= 0:
+                del seed_file_counts[seed_id_value]
+        removed = True
+    result: bool = removed
+    return result
+
+
+def replace_downloaded_totals_from_scan(
+    state: dict[str, object],
+    scanned_files: dict[str, tuple[Path, int, str]],
+    rescanned_at: str,
+) -> dict[str, object]:
+    """
+    Rebuilds the running totals from a full walk of the collection tree and returns the previous totals, if any.
+    Every manifest entry's counted size is reset first, so files deleted or changed outside the tool stop drifting.
+    `scanned_files` maps each on-disk WARC filename to its path, byte size, and seed id.
+    Called by: orchestration.refresh_downloaded_totals_if_due()
+    """
+    previous_totals: dict[str, object] | None = get_downloaded_totals(state)
+    previous_snapshot: dict[str, object] = dict(previous_totals) if previous_totals is not None else {}
+    files_value: object = normalize_collection_state(state)['files']
+    for entry_value in files_value.values():
+        if isinstance(entry_value, dict):
+            entry_value.pop(COUNTED_SIZE_KEY, None)
+            entry_value.pop(COUNTED_SEED_ID_KEY, None)
+    state['files'] = files_value
+    state[DOWNLOADED_TOTALS_KEY] = make_default_downloaded_totals(rescanned_at)
+    for filename, (warc_path, size, seed_id) in scanned_files.items():
+        entry: dict[str, object] = get_file_manifest_entry(state, filename)
+        entry.setdefault('warc_path', str(warc_path))
+        add_file_to_downloaded_totals(state, filename, size, seed_id)
+    result: dict[str, object] = previous_snapshot
+    return result
+
+
+def append_file_manifest_journal_entry(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    filename: str,
+) -> int:
+    """
+    Appends the current manifest entry for one filename to the state journal and returns the journal size in bytes.
+    Each line carries a sequence number so replay can skip lines already folded into the snapshot, plus the
+    running downloaded totals so they survive a crash between compactions.
+    Called by: orchestration.save_collection_state_after_file_processing()
+    """
+    entry: dict[str, object] = get_file_manifest_entry(state, filename)
+    current_sequence: object = state.get('journal_sequence', 0)
+    sequence: int = (current_sequence if isinstance(current_sequence, int) else 0) + 1
+    state['journal_sequence'] = sequence
+    journal_path: Path = build_state_journal_path(storage_root, collection_id)
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    record: dict[str, object] = {'sequence': sequence, 'filename': filename, 'entry': entry}
+    totals: dict[str, object] | None = get_downloaded_totals(state)
+    if totals is not None:
+        record[DOWNLOADED_TOTALS_KEY] = totals
+    line: str = json.dumps(record, sort_keys=True)
+    with journal_path.open('a', encoding='utf-8') as journal_file:
+        journal_file.write(f'{line}\n')
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+        result: int = journal_file.tell()
+    return result
+
+
+def truncate_torn_journal_tail(journal_path: Path, complete_length: int) -> None:
+    """
+    Cuts a torn final line off the journal, keeping only the bytes up to the last complete line.
+    Called by: replay_state_journal()
+    """
+    with journal_path.open('r+b') as journal_file:
+        journal_file.truncate(complete_length)
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+
+
+def fsync_directory(directory_path: Path) -> None:
+    """
+    Flushes a directory's entries to disk so a rename or unlink inside it survives a power loss.
+    Called by: save_collection_state()
+    """
+    directory_descriptor: int = os.open(directory_path, os.O_RDONLY)
+    try:
+        os.fsync(directory_descriptor)
+    finally:
+        os.close(directory_descriptor)
+
+
+def replay_state_journal(state: dict[str, object], journal_path: Path) -> dict[str, object]:
+    """
+    Replays journal lines newer than the snapshot's journal sequence onto a loaded state.
+    A torn final line left by a crash mid-append is ignored and truncated away, so the next append starts on a fresh
+    line instead of joining it; any other malformed line is an error.
+    Called by: load_collection_state()
+    """
+    snapshot_sequence_value: object = state.get('journal_sequence', 0)
+    snapshot_sequence: int = snapshot_sequence_value if isinstance(snapshot_sequence_value, int) else 0
+    latest_sequence: int = snapshot_sequence
+    files_value: dict[str, object] = state['files']
+    journal_bytes: bytes = journal_path.read_bytes()
+    complete_length: int = journal_bytes.rfind(b'\n') + 1
+    if complete_length < len(journal_bytes):
+        truncate_torn_journal_tail(journal_path, complete_length)
+    journal_text: str = journal_bytes[:complete_length].decode('utf-8')
+    complete_lines: list[str] = journal_text.split('\n')[:-1]
+    for line_number, line in enumerate(complete_lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record: object = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise LocalStateError(f'Malformed state journal line {line_number} in {journal_path}.') from exc
+        if not isinstance(record, dict) or not isinstance(record.get('entry'), dict):
+            raise LocalStateError(f'State journal line {line_number} in {journal_path} must be a manifest entry object.')
+        sequence: object = record.get('sequence')
+        filename: object = record.get('filename')
+        if not isinstance(sequence, int) or not isinstance(filename, str):
+            raise LocalStateError(f'State journal line {line_number} in {journal_path} is missing sequence or filename.')
+        if sequence > snapshot_sequence:
+            files_value[filename] = record['entry']
+            if isinstance(record.get(DOWNLOADED_TOTALS_KEY), dict):
+                state[DOWNLOADED_TOTALS_KEY] = record[DOWNLOADED_TOTALS_KEY]
+            latest_sequence = max(latest_sequence, sequence)
+    if latest_sequence != snapshot_sequence:
+        state['journal_sequence'] = latest_sequence
+    result: dict[str, object] = state
+    return result
+
+
 def load_collection_state(storage_root: Path, collection_id: int) -> dict[str, object]:
     """
     Loads collection state from disk or returns the default state when absent.
+    Any journal left next to state.json is replayed on top of the snapshot.
     Called by: process_collection_job()
     """
     state_file_path: Path = build_state_file_path(storage_root, collection_id)
+    journal_path: Path = build_state_journal_path(storage_root, collection_id)
     result: dict[str, object]
     if not state_file_path.exists():
         result = make_default_collection_state()
@@ -200,12 +487,14 @@ def load_collection_state(storage_root: Path, collection_id: int) -> dict[str, o
         if not isinstance(payload, dict):
             raise LocalStateError(f'Collection state file {state_file_path} must contain a JSON object.')
         result = normalize_collection_state(payload)
+    if journal_path.exists():
+        result = replay_state_journal(result, journal_path)
     return result
 
 
 def save_collection_state(storage_root: Path, collection_id: int, state: dict[str, object]) -> Path:
     """
-    Saves collection state to disk using an atomic replace.
+    Saves collection state to disk using a durable atomic replace, then removes the journal it now covers.
     Called by: save_collection_state_after_file_processing()
     """
     normalized_state: dict[str, object] = normalize_collection_state(state)
@@ -215,8 +504,12 @@ def save_collection_state(storage_root: Path, collection_id: int, state: dict[st
     with NamedTemporaryFile('w', encoding='utf-8', dir=state_file_path.parent, delete=False) as temp_file:
         json.dump(normalized_state, temp_file, indent=2, sort_keys=True)
         temp_file.write('\n')
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
         temp_file_path: Path = Path(temp_file.name)
 
     temp_file_path.replace(state_file_path)
+    fsync_directory(state_file_path.parent)
+    build_state_journal_path(storage_root, collection_id).unlink(missing_ok=True)
     result: Path = state_file_path
     return result
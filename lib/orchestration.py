@@ -1,42 +1,115 @@
+import asyncio
 import datetime as datetime_module
+import heapq
 import json
 import logging
 import os
-from collections.abc import Callable
-from dataclasses import dataclass
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 import gspread
 import httpx
 
+from lib.async_engine import AsyncTransferEngine
+from lib.collection_lock import CollectionLockManager
+from lib.collection_scheduling import CollectionFairShare, CollectionSchedulingFacts, order_collection_jobs_by_priority
 from lib.collection_sheet import (
+    BackgroundSheetWriter,
     CollectionJob,
     CollectionProcessingStatusUpdate,
     CollectionSummaryUpdate,
     HeaderLocation,
+    SheetRowSnapshot,
+    SnapshotSheetWriter,
     get_column_index,
     parse_collection_id,
     update_collection_final_reporting,
     update_collection_processing_status,
 )
-from lib.downloader import DownloadResult, download_to_path
-from lib.fixity import FixityResult, FixityValidationResult, validate_fixity_sidecars, write_fixity_sidecars
+from lib.disk_space import DiskSpaceAdmission
+from lib.download_progress import DownloadProgressTracker, TransferByteCounter
+from lib.downloader import (
+    BandwidthLimiter,
+    BandwidthWindow,
+    DownloadResult,
+    build_partial_download_path,
+    download_to_path,
+    download_to_path_async,
+    get_scheduled_bytes_per_second,
+    parse_bandwidth_schedule,
+)
+from lib.fixity import (
+    FixityResult,
+    FixityValidationResult,
+    load_fixity_cache,
+    remember_verified_sha256,
+    save_fixity_cache,
+    set_aside_failed_warc,
+    validate_fixity_sidecars,
+    write_fixity_sidecars,
+)
 from lib.local_state import (
+    DEFAULT_STATE_JOURNAL_COMPACTION_BYTES,
+    LAST_SUCCESSFUL_DISCOVERY_AT_KEY,
+    STATE_PERSISTENCE_MODES,
+    STATE_PERSISTENCE_MODE_JOURNAL,
+    STATE_PERSISTENCE_MODE_SNAPSHOT,
+    STATE_PERSISTENCE_MODE_SQLITE,
+    LocalStateError,
+    add_file_to_downloaded_totals,
+    append_file_manifest_journal_entry,
+    get_consecutive_download_failures,
+    get_downloaded_totals,
+    get_file_manifest_entry,
     load_collection_state,
+    remove_file_from_downloaded_totals,
+    replace_downloaded_totals_from_scan,
     save_collection_state,
+    schedule_file_manifest_retry,
     update_file_manifest_for_download_result,
     update_file_manifest_for_fixity_result,
     update_file_manifest_for_planned_download,
 )
+from lib.run_deadline import RunDeadline, parse_run_deadline
+from lib.sqlite_state import (
+    count_files_by_status,
+    hold_state_database,
+    load_collection_state_from_sqlite,
+    release_state_database,
+    save_collection_state_to_sqlite,
+    save_file_manifest_entry_to_sqlite,
+)
 from lib.storage_layout import (
     UNKNOWN_SEED_FOLDER_NAME,
     PlannedCollectionPaths,
     StorageLayoutError,
-    extract_warc_seed_id,
+    WarcFilename,
+    parse_warc_filename,
+    parse_warc_filenames,
     plan_collection_paths,
 )
-from lib.wasapi_discovery import DiscoveryResult, compute_store_time_after_datetime, fetch_collection_discovery
+from lib.wasapi_discovery import (
+    DEFAULT_PAGE_FETCH_CONCURRENCY,
+    DiscoveryPage,
+    DiscoveryResult,
+    WasapiDiscoveryError,
+    compute_store_time_after_datetime,
+    extract_record_checksums,
+    extract_record_size,
+    extract_record_store_time,
+    fetch_collection_discovery,
+    fetch_collection_discovery_async,
+    iter_collection_discovery_pages,
+    iter_collection_discovery_pages_async,
+    parse_wasapi_datetime,
+)
 
 DEFAULT_STORAGE_ROOT: Path = Path(__file__).resolve().parent.parent / 'storage'
 
@@ -48,12 +121,15 @@ STATUS_DOWNLOADING_IN_PROGRESS: str = 'downloading-in-progress'
 STATUS_NO_NEW_FILES_TO_DOWNLOAD: str = 'no-new-files-to-download'
 STATUS_DOWNLOADED_WITHOUT_ERRORS: str = 'downloaded-without-errors'
 STATUS_COMPLETED_WITH_SOME_FILE_FAILURES: str = 'completed-with-some-file-failures'
+STATUS_STOPPED_AT_RUN_DEADLINE: str = 'stopped-at-run-deadline'
+STATUS_DEFERRED_FOR_DISK_SPACE: str = 'deferred-for-disk-space'
 STATUS_DISCOVERY_FAILED: str = 'discovery-failed'
 STATUS_SPREADSHEET_UPDATE_FAILED: str = 'spreadsheet-update-failed'
 DISCOVERY_MODE_FULL_BACKFILL_FIRST_RUN: str = 'full-backfill-first-run'
 DISCOVERY_MODE_INCREMENTAL_OVERLAP_WINDOW: str = 'incremental-overlap-window'
 
 RUN_COORDINATION_MODE_SKIP_SPREADSHEET_COORDINATION_CHECK: str = 'skip_spreadsheet_coordination_check'
+RUN_COORDINATION_MODE_COLLECTION_LOCKS: str = 'collection_locks'
 BLOCKING_COORDINATION_STATUSES: frozenset[str] = frozenset(
     (
         STATUS_DISCOVERY_IN_PROGRESS,
@@ -61,7 +137,69 @@ BLOCKING_COORDINATION_STATUSES: frozenset[str] = frozenset(
     )
 )
 
-DOWNLOAD_PROGRESS_FILE_INTERVAL: int = 10
+DEFAULT_DOWNLOAD_PROGRESS_INTERVAL_SECONDS: int = 300
+DEFAULT_COLLECTION_LOCK_HEARTBEAT_SECONDS: int = 60
+DEFAULT_COLLECTION_LOCK_STALE_SECONDS: int = 600
+DEFAULT_DOWNLOAD_CONCURRENCY: int = 1
+DEFAULT_COLLECTION_CONCURRENCY: int = 1
+FIXITY_VALIDATION_MODE_CACHED: str = 'cached'
+FIXITY_VALIDATION_MODE_FULL_REVERIFICATION: str = 'full_reverification'
+DISCOVERY_PIPELINE_MODE_BUFFERED: str = 'buffered'
+DISCOVERY_PIPELINE_MODE_STREAMING: str = 'streaming'
+DISCOVERY_PIPELINE_MODES: frozenset[str] = frozenset((DISCOVERY_PIPELINE_MODE_BUFFERED, DISCOVERY_PIPELINE_MODE_STREAMING))
+DOWNLOADED_TOTALS_MODE_INCREMENTAL: str = 'incremental'
+DOWNLOADED_TOTALS_MODE_FULL_RESCAN: str = 'full_rescan'
+DOWNLOADED_TOTALS_MODES: frozenset[str] = frozenset((DOWNLOADED_TOTALS_MODE_INCREMENTAL, DOWNLOADED_TOTALS_MODE_FULL_RESCAN))
+DEFAULT_DOWNLOADED_TOTALS_RESCAN_DAYS: int = 30
+DEFAULT_DOWNLOAD_ATTEMPTS_PER_RUN: int = 3
+DEFAULT_DOWNLOAD_MAX_ATTEMPTS: int = 8
+DEFAULT_DOWNLOAD_RETRY_BASE_SECONDS: int = 6 * 60 * 60
+DEFAULT_DOWNLOAD_QUARANTINE_DAYS: int = 30
+DOWNLOAD_RETRY_MAX_SECONDS: int = 7 * 24 * 60 * 60
+IN_RUN_RETRY_BASE_SECONDS: float = 2.0
+IN_RUN_RETRY_MAX_SECONDS: float = 60.0
+IN_RUN_RETRY_AFTER_LIMIT_SECONDS: float = 300.0
+RETRY_WAITING_STATUSES: frozenset[str] = frozenset(('failed', 'quarantined'))
+DOWNLOAD_ENGINE_SYNC: str = 'sync'
+DOWNLOAD_ENGINE_ASYNC: str = 'async'
+DOWNLOAD_ENGINES: frozenset[str] = frozenset((DOWNLOAD_ENGINE_SYNC, DOWNLOAD_ENGINE_ASYNC))
+DEFAULT_PER_HOST_CONCURRENCY: int = 32
+DEFAULT_DISK_SPACE_RESERVE_BYTES: int = 10 * 1000 * 1000 * 1000
+DOWNLOAD_PREALLOCATION_MODE_NONE: str = 'none'
+DOWNLOAD_PREALLOCATION_MODE_FALLOCATE: str = 'fallocate'
+DOWNLOAD_PREALLOCATION_MODES: frozenset[str] = frozenset(
+    (DOWNLOAD_PREALLOCATION_MODE_NONE, DOWNLOAD_PREALLOCATION_MODE_FALLOCATE)
+)
+DOWNLOAD_SCHEDULING_POLICY_DISCOVERY: str = 'discovery'
+DOWNLOAD_SCHEDULING_POLICY_LARGEST_FIRST: str = 'largest_first'
+DOWNLOAD_SCHEDULING_POLICY_SMALLEST_FIRST: str = 'smallest_first'
+DOWNLOAD_SCHEDULING_POLICY_NEWEST_FIRST: str = 'newest_first'
+DOWNLOAD_SCHEDULING_POLICY_SEED_ROUND_ROBIN: str = 'seed_round_robin'
+DOWNLOAD_SCHEDULING_POLICIES: frozenset[str] = frozenset(
+    (
+        DOWNLOAD_SCHEDULING_POLICY_DISCOVERY,
+        DOWNLOAD_SCHEDULING_POLICY_LARGEST_FIRST,
+        DOWNLOAD_SCHEDULING_POLICY_SMALLEST_FIRST,
+        DOWNLOAD_SCHEDULING_POLICY_NEWEST_FIRST,
+        DOWNLOAD_SCHEDULING_POLICY_SEED_ROUND_ROBIN,
+    )
+)
+DEFAULT_PROJECTED_STREAM_BYTES_PER_SECOND: int = 10 * 1000 * 1000
+COLLECTION_SCHEDULING_POLICY_SHEET_ORDER: str = 'sheet_order'
+COLLECTION_SCHEDULING_POLICY_PRIORITY: str = 'priority'
+COLLECTION_SCHEDULING_POLICIES: frozenset[str] = frozenset(
+    (COLLECTION_SCHEDULING_POLICY_SHEET_ORDER, COLLECTION_SCHEDULING_POLICY_PRIORITY)
+)
+SHEET_WRITE_MODE_INLINE: str = 'inline'
+SHEET_WRITE_MODE_BACKGROUND: str = 'background'
+SHEET_WRITE_MODES: frozenset[str] = frozenset((SHEET_WRITE_MODE_INLINE, SHEET_WRITE_MODE_BACKGROUND))
+DEFAULT_SHEET_WRITE_FLUSH_SECONDS: int = 10
+FIXITY_VALIDATION_MODES: frozenset[str] = frozenset(
+    (
+        FIXITY_VALIDATION_MODE_CACHED,
+        FIXITY_VALIDATION_MODE_FULL_REVERIFICATION,
+    )
+)
 
 
 def format_local_display_timestamp(timestamp_text: str) -> str:
@@ -87,6 +225,12 @@ class DevCollectionsConfigurationError(ValueError):
     """
 
 
+class RunConfigurationError(ValueError):
+    """
+    Indicates that an optional run setting could not be parsed.
+    """
+
+
 @dataclass(frozen=True)
 class BlockingCoordinationSummary:
     """
@@ -107,15 +251,66 @@ def format_downloaded_size_gb(size_bytes: int) -> str:
     return result
 
 
+@dataclass(frozen=True)
+class RunSettings:
+    """
+    Represents optional run-level settings resolved from the environment before any collection is processed.
+    """
+
+    download_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY
+    collection_concurrency: int = DEFAULT_COLLECTION_CONCURRENCY
+    global_download_limit: int | None = None
+    fixity_validation_mode: str = FIXITY_VALIDATION_MODE_CACHED
+    state_persistence_mode: str = STATE_PERSISTENCE_MODE_SNAPSHOT
+    discovery_pipeline_mode: str = DISCOVERY_PIPELINE_MODE_BUFFERED
+    discovery_page_fetch_concurrency: int = DEFAULT_PAGE_FETCH_CONCURRENCY
+    downloaded_totals_mode: str = DOWNLOADED_TOTALS_MODE_INCREMENTAL
+    downloaded_totals_rescan_days: int = DEFAULT_DOWNLOADED_TOTALS_RESCAN_DAYS
+    download_attempts_per_run: int = DEFAULT_DOWNLOAD_ATTEMPTS_PER_RUN
+    download_max_attempts: int = DEFAULT_DOWNLOAD_MAX_ATTEMPTS
+    download_retry_base_seconds: int = DEFAULT_DOWNLOAD_RETRY_BASE_SECONDS
+    download_quarantine_days: int = DEFAULT_DOWNLOAD_QUARANTINE_DAYS
+    download_engine: str = DOWNLOAD_ENGINE_SYNC
+    per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY
+    bandwidth_schedule: tuple[BandwidthWindow, ...] = ()
+    disk_space_reserve_bytes: int = DEFAULT_DISK_SPACE_RESERVE_BYTES
+    download_preallocation_mode: str = DOWNLOAD_PREALLOCATION_MODE_NONE
+    download_scheduling_policy: str = DOWNLOAD_SCHEDULING_POLICY_DISCOVERY
+    projected_stream_bytes_per_second: int = DEFAULT_PROJECTED_STREAM_BYTES_PER_SECOND
+    run_deadline: datetime | None = None
+    collection_scheduling_policy: str = COLLECTION_SCHEDULING_POLICY_SHEET_ORDER
+    sheet_write_mode: str = SHEET_WRITE_MODE_INLINE
+    sheet_write_flush_seconds: int = DEFAULT_SHEET_WRITE_FLUSH_SECONDS
+    download_progress_interval_seconds: int = DEFAULT_DOWNLOAD_PROGRESS_INTERVAL_SECONDS
+    collection_lock_heartbeat_seconds: int = DEFAULT_COLLECTION_LOCK_HEARTBEAT_SECONDS
+    collection_lock_stale_seconds: int = DEFAULT_COLLECTION_LOCK_STALE_SECONDS
+
+
 @dataclass(frozen=True)
 class PlannedDownload:
     """
     Represents one discovered record that can be downloaded to a planned local path.
+    Expected checksums and size come from WASAPI and are verified while the file streams in; size and store-time also
+    drive the download scheduling policy.
     """
 
     filename: str
     source_url: str
     planned_paths: PlannedCollectionPaths
+    expected_checksums: dict[str, str] = field(default_factory=dict)
+    expected_size: int | None = None
+    store_time: str | None = None
+
+
+@dataclass(frozen=True)
+class PlannedDownloadOutcome:
+    """
+    Represents the download and fixity results produced by one worker for one planned download.
+    """
+
+    planned_download: PlannedDownload
+    download_result: DownloadResult | None
+    fixity_result: FixityResult | None
 
 
 @dataclass(frozen=True)
@@ -128,6 +323,22 @@ class CollectionProcessingReport:
     summary_update: CollectionSummaryUpdate
 
 
+@dataclass
+class StreamedDiscoveryTally:
+    """
+    Accumulates discovery and planning counts while streamed discovery pages feed the download pool.
+    """
+
+    discovered_warc_count: int = 0
+    pending_download_count: int = 0
+    discovered_filenames: list[str] = field(default_factory=list)
+    active_downloads: list[PlannedDownload] = field(default_factory=list)
+    evaluation_reason_counts: dict[str, int] = field(default_factory=dict)
+    max_observed_store_time: str | None = None
+    completed_successfully: bool = False
+    discovery_error: WasapiDiscoveryError | None = None
+
+
 def get_downloaded_storage_root() -> Path:
     """
     Returns the configured local storage root.
@@ -167,6 +378,541 @@ def get_run_coordination_mode() -> str | None:
     return result
 
 
+def parse_positive_int_setting(setting_name: str, configured_value: str | None, default_value: int) -> int:
+    """
+    Parses an optional positive-integer setting, returning the default when unset or blank.
+    Called by: get_download_concurrency(), get_collection_concurrency(), get_global_download_limit(),
+    get_discovery_page_fetch_concurrency(), get_downloaded_totals_rescan_days(), get_download_attempts_per_run(),
+    get_download_max_attempts(), get_download_retry_base_seconds(), get_download_quarantine_days(),
+    get_per_host_concurrency(), get_disk_space_reserve_bytes(), get_projected_stream_bytes_per_second()
+    """
+    result: int = default_value
+    if configured_value is not None:
+        stripped_value: str = configured_value.strip()
+        if stripped_value:
+            if not stripped_value.isdigit() or int(stripped_value) < 1:
+                raise RunConfigurationError(f'{setting_name} must be a positive integer: {configured_value}')
+            result = int(stripped_value)
+    return result
+
+
+def get_download_concurrency() -> int:
+    """
+    Returns the configured number of concurrent download workers per collection.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOAD_CONCURRENCY',
+        os.getenv('DOWNLOAD_CONCURRENCY'),
+        DEFAULT_DOWNLOAD_CONCURRENCY,
+    )
+    return result
+
+
+def get_collection_concurrency() -> int:
+    """
+    Returns the configured number of collections processed at the same time.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'COLLECTION_CONCURRENCY',
+        os.getenv('COLLECTION_CONCURRENCY'),
+        DEFAULT_COLLECTION_CONCURRENCY,
+    )
+    return result
+
+
+def get_global_download_limit() -> int | None:
+    """
+    Returns the configured cap on concurrent downloads across all collections, or None when uncapped.
+    Called by: get_run_settings()
+    """
+    configured_value: str | None = os.getenv('GLOBAL_DOWNLOAD_CONCURRENCY')
+    result: int | None = None
+    if configured_value is not None and configured_value.strip():
+        result = parse_positive_int_setting('GLOBAL_DOWNLOAD_CONCURRENCY', configured_value, DEFAULT_DOWNLOAD_CONCURRENCY)
+    return result
+
+
+def build_global_download_slots(run_settings: RunSettings) -> threading.BoundedSemaphore | None:
+    """
+    Builds the run-wide download semaphore shared by every collection's workers when a global cap is configured.
+    Called by: run_collection_orchestration()
+    """
+    result: threading.BoundedSemaphore | None = None
+    if run_settings.global_download_limit is not None:
+        result = threading.BoundedSemaphore(run_settings.global_download_limit)
+    return result
+
+
+def get_bandwidth_schedule() -> tuple[BandwidthWindow, ...]:
+    """
+    Returns the configured daily bandwidth schedule; an unset or blank value means downloads are never throttled.
+    Called by: get_run_settings()
+    """
+    configured_schedule: str | None = os.getenv('BANDWIDTH_SCHEDULE')
+    try:
+        result: tuple[BandwidthWindow, ...] = parse_bandwidth_schedule(configured_schedule)
+    except ValueError as exc:
+        raise RunConfigurationError(f'BANDWIDTH_SCHEDULE is invalid ({exc}): {configured_schedule}') from exc
+    return result
+
+
+def build_sheet_writer(
+    worksheet: gspread.Worksheet,
+    run_settings: RunSettings,
+    row_snapshot: SheetRowSnapshot,
+) -> SnapshotSheetWriter | BackgroundSheetWriter:
+    """
+    Builds the writer every collection sends its sheet updates through: inline, or queued for the background writer.
+    Either way, only cells that differ from the row snapshot are sent.
+    Called by: run_collection_orchestration()
+    """
+    result: SnapshotSheetWriter | BackgroundSheetWriter = SnapshotSheetWriter(worksheet, row_snapshot)
+    if run_settings.sheet_write_mode == SHEET_WRITE_MODE_BACKGROUND:
+        result = BackgroundSheetWriter(
+            worksheet,
+            float(run_settings.sheet_write_flush_seconds),
+            row_snapshot=row_snapshot,
+        )
+    return result
+
+
+def build_collection_lock_manager(
+    storage_root: Path,
+    coordination_mode: str | None,
+    run_settings: RunSettings,
+) -> CollectionLockManager | None:
+    """
+    Builds the per-collection lock manager when RUN_COORDINATION_MODE=collection_locks, or None otherwise.
+    Called by: run_collection_orchestration()
+    """
+    result: CollectionLockManager | None = None
+    if coordination_mode == RUN_COORDINATION_MODE_COLLECTION_LOCKS:
+        result = CollectionLockManager(
+            storage_root,
+            float(run_settings.collection_lock_heartbeat_seconds),
+            float(run_settings.collection_lock_stale_seconds),
+        )
+    return result
+
+
+def build_collection_fair_share(run_settings: RunSettings) -> CollectionFairShare | None:
+    """
+    Builds the ledger that splits the global download cap between concurrently downloading collections, or None when
+    collections run one at a time or no global cap is configured.
+    Called by: run_collection_orchestration()
+    """
+    result: CollectionFairShare | None = None
+    if run_settings.global_download_limit is not None and run_settings.collection_concurrency > 1:
+        result = CollectionFairShare(run_settings.global_download_limit)
+    return result
+
+
+def get_fair_worker_count(worker_count: int, fair_share: CollectionFairShare | None) -> int:
+    """
+    Returns how many downloads one collection may keep in flight: its worker count, capped by its fair share.
+    Called by: run_planned_downloads()
+    """
+    result: int = min(worker_count, fair_share.get_share()) if fair_share is not None else worker_count
+    return result
+
+
+def build_bandwidth_limiter(run_settings: RunSettings) -> BandwidthLimiter | None:
+    """
+    Builds the run-wide bandwidth limiter shared by every download stream, or None when no schedule is configured.
+    Called by: main.run_collection_orchestration()
+    """
+    result: BandwidthLimiter | None = (
+        BandwidthLimiter(run_settings.bandwidth_schedule) if run_settings.bandwidth_schedule else None
+    )
+    return result
+
+
+def get_disk_space_reserve_bytes() -> int:
+    """
+    Returns how many bytes must stay free on the storage volume after every admitted download.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DISK_SPACE_RESERVE_BYTES',
+        os.getenv('DISK_SPACE_RESERVE_BYTES'),
+        DEFAULT_DISK_SPACE_RESERVE_BYTES,
+    )
+    return result
+
+
+def get_download_preallocation_mode() -> str:
+    """
+    Returns the configured partial-file preallocation mode, defaulting to no preallocation.
+    Called by: get_run_settings()
+    """
+    configured_mode: str | None = os.getenv('DOWNLOAD_PREALLOCATION_MODE')
+    result: str = DOWNLOAD_PREALLOCATION_MODE_NONE
+    if configured_mode is not None and configured_mode.strip():
+        result = configured_mode.strip()
+        if result not in DOWNLOAD_PREALLOCATION_MODES:
+            raise RunConfigurationError(
+                f'DOWNLOAD_PREALLOCATION_MODE must be one of {sorted(DOWNLOAD_PREALLOCATION_MODES)}: {configured_mode}'
+            )
+    return result
+
+
+def get_download_scheduling_policy() -> str:
+    """
+    Returns the configured order for each collection's active downloads, defaulting to discovery order.
+    Called by: get_run_settings()
+    """
+    configured_policy: str | None = os.getenv('DOWNLOAD_SCHEDULING_POLICY')
+    result: str = DOWNLOAD_SCHEDULING_POLICY_DISCOVERY
+    if configured_policy is not None and configured_policy.strip():
+        result = configured_policy.strip()
+        if result not in DOWNLOAD_SCHEDULING_POLICIES:
+            raise RunConfigurationError(
+                f'DOWNLOAD_SCHEDULING_POLICY must be one of {sorted(DOWNLOAD_SCHEDULING_POLICIES)}: {configured_policy}'
+            )
+    return result
+
+
+def get_projected_stream_bytes_per_second() -> int:
+    """
+    Returns the per-stream transfer rate assumed when projecting download completion times.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'PROJECTED_STREAM_BYTES_PER_SECOND',
+        os.getenv('PROJECTED_STREAM_BYTES_PER_SECOND'),
+        DEFAULT_PROJECTED_STREAM_BYTES_PER_SECOND,
+    )
+    return result
+
+
+def get_collection_scheduling_policy() -> str:
+    """
+    Returns the configured order collections are started in, defaulting to sheet row order.
+    Called by: get_run_settings()
+    """
+    configured_policy: str | None = os.getenv('COLLECTION_SCHEDULING_POLICY')
+    result: str = COLLECTION_SCHEDULING_POLICY_SHEET_ORDER
+    if configured_policy is not None and configured_policy.strip():
+        result = configured_policy.strip()
+        if result not in COLLECTION_SCHEDULING_POLICIES:
+            raise RunConfigurationError(
+                f'COLLECTION_SCHEDULING_POLICY must be one of {sorted(COLLECTION_SCHEDULING_POLICIES)}: {configured_policy}'
+            )
+    return result
+
+
+def get_sheet_write_mode() -> str:
+    """
+    Returns the configured spreadsheet write mode, defaulting to writing each update inline.
+    Called by: get_run_settings()
+    """
+    configured_mode: str | None = os.getenv('SHEET_WRITE_MODE')
+    result: str = SHEET_WRITE_MODE_INLINE
+    if configured_mode is not None and configured_mode.strip():
+        result = configured_mode.strip()
+        if result not in SHEET_WRITE_MODES:
+            raise RunConfigurationError(f'SHEET_WRITE_MODE must be one of {sorted(SHEET_WRITE_MODES)}: {configured_mode}')
+    return result
+
+
+def get_sheet_write_flush_seconds() -> int:
+    """
+    Returns how many seconds the background sheet writer waits between flushes.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'SHEET_WRITE_FLUSH_SECONDS',
+        os.getenv('SHEET_WRITE_FLUSH_SECONDS'),
+        DEFAULT_SHEET_WRITE_FLUSH_SECONDS,
+    )
+    return result
+
+
+def get_download_progress_interval_seconds() -> int:
+    """
+    Returns the minimum number of seconds between two download progress reports for one collection.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOAD_PROGRESS_INTERVAL_SECONDS',
+        os.getenv('DOWNLOAD_PROGRESS_INTERVAL_SECONDS'),
+        DEFAULT_DOWNLOAD_PROGRESS_INTERVAL_SECONDS,
+    )
+    return result
+
+
+def get_run_deadline(configured_deadline: str | None = None) -> datetime | None:
+    """
+    Returns the run deadline from `--deadline` or, when that is not given, RUN_DEADLINE; None means no deadline.
+    Called by: get_run_settings()
+    """
+    deadline_text: str | None = configured_deadline if configured_deadline is not None else os.getenv('RUN_DEADLINE')
+    result: datetime | None = None
+    if deadline_text is not None and deadline_text.strip():
+        try:
+            result = parse_run_deadline(deadline_text, datetime_module.datetime.now(UTC))
+        except ValueError as exc:
+            raise RunConfigurationError(
+                f'RUN_DEADLINE must be HH:MM or an ISO 8601 datetime ({exc}): {deadline_text}'
+            ) from exc
+    return result
+
+
+def build_run_deadline(run_settings: RunSettings) -> RunDeadline | None:
+    """
+    Builds the run-wide deadline tracker shared by every collection, or None when no deadline is configured.
+    Called by: main.run_collection_orchestration()
+    """
+    result: RunDeadline | None = None
+    if run_settings.run_deadline is not None:
+        result = RunDeadline(run_settings.run_deadline, float(run_settings.projected_stream_bytes_per_second))
+        log.info('Run deadline is %s; transfers that cannot finish by then will not be started.', result.deadline)
+    return result
+
+
+def build_disk_space_admission(storage_root: Path, run_settings: RunSettings) -> DiskSpaceAdmission:
+    """
+    Builds the run-wide disk-space ledger that every collection's planning admits downloads against.
+    Called by: main.run_collection_orchestration()
+    """
+    result: DiskSpaceAdmission = DiskSpaceAdmission(storage_root, run_settings.disk_space_reserve_bytes)
+    return result
+
+
+def get_discovery_page_fetch_concurrency() -> int:
+    """
+    Returns the configured number of WASAPI discovery pages fetched at the same time once the page count is known.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'WASAPI_PAGE_FETCH_CONCURRENCY',
+        os.getenv('WASAPI_PAGE_FETCH_CONCURRENCY'),
+        DEFAULT_PAGE_FETCH_CONCURRENCY,
+    )
+    return result
+
+
+def get_fixity_validation_mode() -> str:
+    """
+    Returns the configured fixity validation mode, defaulting to identity-cached validation.
+    Called by: get_run_settings()
+    """
+    configured_mode: str | None = os.getenv('FIXITY_VALIDATION_MODE')
+    result: str = FIXITY_VALIDATION_MODE_CACHED
+    if configured_mode is not None and configured_mode.strip():
+        result = configured_mode.strip()
+        if result not in FIXITY_VALIDATION_MODES:
+            raise RunConfigurationError(
+                f'FIXITY_VALIDATION_MODE must be one of {sorted(FIXITY_VALIDATION_MODES)}: {configured_mode}'
+            )
+    return result
+
+
+def get_state_persistence_mode() -> str:
+    """
+    Returns the configured per-file state persistence mode, defaulting to whole-snapshot saves.
+    Called by: get_run_settings()
+    """
+    configured_mode: str | None = os.getenv('STATE_PERSISTENCE_MODE')
+    result: str = STATE_PERSISTENCE_MODE_SNAPSHOT
+    if configured_mode is not None and configured_mode.strip():
+        result = configured_mode.strip()
+        if result not in STATE_PERSISTENCE_MODES:
+            raise RunConfigurationError(
+                f'STATE_PERSISTENCE_MODE must be one of {sorted(STATE_PERSISTENCE_MODES)}: {configured_mode}'
+            )
+    return result
+
+
+def get_discovery_pipeline_mode() -> str:
+    """
+    Returns the configured discovery pipeline mode, defaulting to full enumeration before planning.
+    Called by: get_run_settings()
+    """
+    configured_mode: str | None = os.getenv('DISCOVERY_PIPELINE_MODE')
+    result: str = DISCOVERY_PIPELINE_MODE_BUFFERED
+    if configured_mode is not None and configured_mode.strip():
+        result = configured_mode.strip()
+        if result not in DISCOVERY_PIPELINE_MODES:
+            raise RunConfigurationError(
+                f'DISCOVERY_PIPELINE_MODE must be one of {sorted(DISCOVERY_PIPELINE_MODES)}: {configured_mode}'
+            )
+    return result
+
+
+def get_download_engine() -> str:
+    """
+    Returns the configured transfer engine, defaulting to the synchronous client with worker threads.
+    Called by: get_run_settings()
+    """
+    configured_engine: str | None = os.getenv('DOWNLOAD_ENGINE')
+    result: str = DOWNLOAD_ENGINE_SYNC
+    if configured_engine is not None and configured_engine.strip():
+        result = configured_engine.strip()
+        if result not in DOWNLOAD_ENGINES:
+            raise RunConfigurationError(f'DOWNLOAD_ENGINE must be one of {sorted(DOWNLOAD_ENGINES)}: {configured_engine}')
+    return result
+
+
+def get_per_host_concurrency() -> int:
+    """
+    Returns how many requests the async engine may have in flight to any one host.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'PER_HOST_CONCURRENCY',
+        os.getenv('PER_HOST_CONCURRENCY'),
+        DEFAULT_PER_HOST_CONCURRENCY,
+    )
+    return result
+
+
+def get_downloaded_totals_mode() -> str:
+    """
+    Returns the configured downloaded-totals mode, defaulting to incremental totals with periodic rescans.
+    Called by: get_run_settings()
+    """
+    configured_mode: str | None = os.getenv('DOWNLOADED_TOTALS_MODE')
+    result: str = DOWNLOADED_TOTALS_MODE_INCREMENTAL
+    if configured_mode is not None and configured_mode.strip():
+        result = configured_mode.strip()
+        if result not in DOWNLOADED_TOTALS_MODES:
+            raise RunConfigurationError(
+                f'DOWNLOADED_TOTALS_MODE must be one of {sorted(DOWNLOADED_TOTALS_MODES)}: {configured_mode}'
+            )
+    return result
+
+
+def get_downloaded_totals_rescan_days() -> int:
+    """
+    Returns how many days incremental downloaded totals are trusted before a full on-disk rescan corrects them.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOADED_TOTALS_RESCAN_DAYS',
+        os.getenv('DOWNLOADED_TOTALS_RESCAN_DAYS'),
+        DEFAULT_DOWNLOADED_TOTALS_RESCAN_DAYS,
+    )
+    return result
+
+
+def get_download_attempts_per_run() -> int:
+    """
+    Returns how many times one file may be attempted within a run when its failures are transient.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOAD_ATTEMPTS_PER_RUN',
+        os.getenv('DOWNLOAD_ATTEMPTS_PER_RUN'),
+        DEFAULT_DOWNLOAD_ATTEMPTS_PER_RUN,
+    )
+    return result
+
+
+def get_download_max_attempts() -> int:
+    """
+    Returns how many failed runs a file may accumulate before it is quarantined.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOAD_MAX_ATTEMPTS',
+        os.getenv('DOWNLOAD_MAX_ATTEMPTS'),
+        DEFAULT_DOWNLOAD_MAX_ATTEMPTS,
+    )
+    return result
+
+
+def get_download_retry_base_seconds() -> int:
+    """
+    Returns the base delay for the cross-run exponential backoff after a failed download.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOAD_RETRY_BASE_SECONDS',
+        os.getenv('DOWNLOAD_RETRY_BASE_SECONDS'),
+        DEFAULT_DOWNLOAD_RETRY_BASE_SECONDS,
+    )
+    return result
+
+
+def get_download_quarantine_days() -> int:
+    """
+    Returns how many days a quarantined file waits before it is attempted again.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'DOWNLOAD_QUARANTINE_DAYS',
+        os.getenv('DOWNLOAD_QUARANTINE_DAYS'),
+        DEFAULT_DOWNLOAD_QUARANTINE_DAYS,
+    )
+    return result
+
+
+def get_collection_lock_heartbeat_seconds() -> int:
+    """
+    Returns how many seconds pass between two heartbeats of each held collection lock.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'COLLECTION_LOCK_HEARTBEAT_SECONDS',
+        os.getenv('COLLECTION_LOCK_HEARTBEAT_SECONDS'),
+        DEFAULT_COLLECTION_LOCK_HEARTBEAT_SECONDS,
+    )
+    return result
+
+
+def get_collection_lock_stale_seconds() -> int:
+    """
+    Returns how old another host's lock heartbeat must be before its collection lock counts as stale.
+    Called by: get_run_settings()
+    """
+    result: int = parse_positive_int_setting(
+        'COLLECTION_LOCK_STALE_SECONDS',
+        os.getenv('COLLECTION_LOCK_STALE_SECONDS'),
+        DEFAULT_COLLECTION_LOCK_STALE_SECONDS,
+    )
+    return result
+
+
+def get_run_settings(configured_deadline: str | None = None) -> RunSettings:
+    """
+    Resolves all optional run-level settings from the environment; a `--deadline` value overrides RUN_DEADLINE.
+    Called by: run_collection_orchestration()
+    """
+    result: RunSettings = RunSettings(
+        download_concurrency=get_download_concurrency(),
+        collection_concurrency=get_collection_concurrency(),
+        global_download_limit=get_global_download_limit(),
+        fixity_validation_mode=get_fixity_validation_mode(),
+        state_persistence_mode=get_state_persistence_mode(),
+        discovery_pipeline_mode=get_discovery_pipeline_mode(),
+        discovery_page_fetch_concurrency=get_discovery_page_fetch_concurrency(),
+        downloaded_totals_mode=get_downloaded_totals_mode(),
+        downloaded_totals_rescan_days=get_downloaded_totals_rescan_days(),
+        download_attempts_per_run=get_download_attempts_per_run(),
+        download_max_attempts=get_download_max_attempts(),
+        download_retry_base_seconds=get_download_retry_base_seconds(),
+        download_quarantine_days=get_download_quarantine_days(),
+        download_engine=get_download_engine(),
+        per_host_concurrency=get_per_host_concurrency(),
+        bandwidth_schedule=get_bandwidth_schedule(),
+        disk_space_reserve_bytes=get_disk_space_reserve_bytes(),
+        download_preallocation_mode=get_download_preallocation_mode(),
+        download_scheduling_policy=get_download_scheduling_policy(),
+        projected_stream_bytes_per_second=get_projected_stream_bytes_per_second(),
+        run_deadline=get_run_deadline(configured_deadline),
+        collection_scheduling_policy=get_collection_scheduling_policy(),
+        sheet_write_mode=get_sheet_write_mode(),
+        sheet_write_flush_seconds=get_sheet_write_flush_seconds(),
+        download_progress_interval_seconds=get_download_progress_interval_seconds(),
+        collection_lock_heartbeat_seconds=get_collection_lock_heartbeat_seconds(),
+        collection_lock_stale_seconds=get_collection_lock_stale_seconds(),
+    )
+    return result
+
+
 def parse_dev_collection_ids(configured_collection_ids: str | None) -> list[int] | None:
     """
     Parses the optional DEV_COLLECTIONS setting into unique collection ids while preserving configured order.
@@ -227,6 +973,85 @@ def resolve_collection_jobs_for_run(
     return result
 
 
+def build_collection_scheduling_facts(state: dict[str, object]) -> CollectionSchedulingFacts:
+    """
+    Summarizes one collection's state for scheduling: bytes known but not yet downloaded, and when discovery last
+    completed.
+    Called by: load_collection_scheduling_facts()
+    """
+    files_value: object = state.get('files')
+    known_files: dict[object, object] = files_value if isinstance(files_value, dict) else {}
+    pending_bytes: int = 0
+    for entry_value in known_files.values():
+        if isinstance(entry_value, dict) and entry_value.get('status') != 'downloaded':
+            size_value: object = entry_value.get('size')
+            if isinstance(size_value, int) and not isinstance(size_value, bool) and size_value > 0:
+                pending_bytes += size_value
+    last_success_value: object = state.get(LAST_SUCCESSFUL_DISCOVERY_AT_KEY)
+    last_successful_run_at: datetime | None = None
+    if isinstance(last_success_value, str):
+        try:
+            last_successful_run_at = datetime_module.datetime.fromisoformat(last_success_value)
+        except ValueError:
+            last_successful_run_at = None
+    result: CollectionSchedulingFacts = CollectionSchedulingFacts(
+        pending_bytes=pending_bytes,
+        last_successful_run_at=last_successful_run_at,
+    )
+    return result
+
+
+def load_collection_scheduling_facts(
+    storage_root: Path,
+    collection_id: int,
+    state_persistence_mode: str,
+) -> CollectionSchedulingFacts:
+    """
+    Loads one collection's scheduling facts; an unreadable state is scheduled as a never-run collection, and the
+    collection's own processing reports the state error.
+    Called by: order_collection_jobs_for_run()
+    """
+    result: CollectionSchedulingFacts
+    try:
+        result = build_collection_scheduling_facts(
+            load_collection_state_for_run(storage_root, collection_id, state_persistence_mode)
+        )
+    except LocalStateError:
+        log.warning('Collection %s state could not be read for scheduling; treating it as never run.', collection_id)
+        result = CollectionSchedulingFacts(pending_bytes=0, last_successful_run_at=None)
+    return result
+
+
+def order_collection_jobs_for_run(
+    storage_root: Path,
+    collection_jobs: list[CollectionJob],
+    run_settings: RunSettings,
+) -> list[CollectionJob]:
+    """
+    Orders the run's collections by the collection scheduling policy, logging the chosen order when it is not sheet
+    order. The priority policy puts a higher sheet priority first, then collections never or least recently
+    discovered, then those with the most pending bytes.
+    Called by: run_collection_orchestration()
+    """
+    result: list[CollectionJob] = collection_jobs
+    if run_settings.collection_scheduling_policy == COLLECTION_SCHEDULING_POLICY_PRIORITY:
+        facts_by_collection_id: dict[int, CollectionSchedulingFacts] = {
+            collection_job.collection_id: load_collection_scheduling_facts(
+                storage_root,
+                collection_job.collection_id,
+                run_settings.state_persistence_mode,
+            )
+            for collection_job in collection_jobs
+        }
+        result = order_collection_jobs_by_priority(collection_jobs, facts_by_collection_id, datetime.now(UTC))
+        log.info(
+            'Collection scheduling policy %s ordered this run as: %s',
+            run_settings.collection_scheduling_policy,
+            [collection_job.collection_id for collection_job in result],
+        )
+    return result
+
+
 def should_skip_spreadsheet_coordination_check(coordination_mode: str | None) -> bool:
     """
     Returns whether startup spreadsheet coordination preflight should be skipped.
@@ -287,10 +1112,14 @@ def enforce_startup_run_coordination(
     collection_jobs: list[CollectionJob],
 ) -> None:
     """
-    Enforces the startup spreadsheet coordination policy unless explicitly skipped.
+    Enforces the startup spreadsheet coordination policy unless explicitly skipped, or replaced by per-collection
+    locks that are taken as each collection starts.
     Called by: run_collection_orchestration()
     """
     log.info('Resolved startup coordination mode: %s', coordination_mode or '<unset>')
+    if coordination_mode == RUN_COORDINATION_MODE_COLLECTION_LOCKS:
+        log.info('Skipping spreadsheet coordination preflight; collections are claimed with local collection locks.')
+        return
     if should_skip_spreadsheet_coordination_check(coordination_mode):
         log.info(
             'Skipping spreadsheet coordination preflight because RUN_COORDINATION_MODE=skip_spreadsheet_coordination_check.'
@@ -441,6 +1270,9 @@ def build_planned_downloads(
                 filename=filename_value,
                 source_url=source_url,
                 planned_paths=planned_paths,
+                expected_checksums=extract_record_checksums(record),
+                expected_size=extract_record_size(record),
+                store_time=extract_record_store_time(record),
             )
         )
     return result
@@ -453,7 +1285,8 @@ def build_reconciliation_retry_downloads(
 ) -> list[PlannedDownload]:
     """
     Builds retry candidates from manifest entries whose expected WARC file is absent on disk.
-    Called by: process_collection_job()
+    Absent files are also removed from the running downloaded totals, since this is where deletions are noticed.
+    Called by: process_collection_job_buffered(), iter_streamed_planned_downloads()
     """
     result: list[PlannedDownload] = []
     files_value: object = state.get('files')
@@ -466,12 +1299,14 @@ def build_reconciliation_retry_downloads(
 
         source_url_value: object = entry_value.get('source_url')
         warc_path_value: object = entry_value.get('warc_path')
-        if not isinstance(source_url_value, str) or not source_url_value.strip():
-            continue
         if not isinstance(warc_path_value, str) or not warc_path_value.strip():
             continue
         if Path(warc_path_value).exists():
             continue
+        if remove_file_from_downloaded_totals(state, filename_key):
+            log.info('Collection %s removed missing WARC %s from downloaded totals.', collection_id, filename_key)
+        if not isinstance(source_url_value, str) or not source_url_value.strip():
+            continue
 
         try:
             planned_paths: PlannedCollectionPaths = plan_collection_paths(storage_root, collection_id, filename_key)
@@ -483,11 +1318,21 @@ def build_reconciliation_retry_downloads(
             )
             continue
 
+        expected_checksums_value: object = entry_value.get('expected_checksums')
+        expected_size_value: object = entry_value.get('size')
+        store_time_value: object = entry_value.get('store_time')
         result.append(
             PlannedDownload(
                 filename=filename_key,
                 source_url=source_url_value.strip(),
                 planned_paths=planned_paths,
+                expected_checksums=dict(expected_checksums_value) if isinstance(expected_checksums_value, dict) else {},
+                expected_size=(
+                    expected_size_value
+                    if isinstance(expected_size_value, int) and not isinstance(expected_size_value, bool)
+                    else None
+                ),
+                store_time=store_time_value if isinstance(store_time_value, str) else None,
             )
         )
     return result
@@ -550,13 +1395,72 @@ def save_collection_state_after_file_processing(
     collection_id: int,
     state: dict[str, object],
     filename: str,
+    state_persistence_mode: str = STATE_PERSISTENCE_MODE_SNAPSHOT,
 ) -> None:
     """
     Saves collection state after one file outcome has been recorded durably.
-    Called by: run_planned_downloads()
+    In journal mode only the file's manifest entry is appended, and the snapshot is rewritten once the journal grows large.
+    Called by: record_planned_download_outcome()
+    """
+    if state_persistence_mode == STATE_PERSISTENCE_MODE_JOURNAL:
+        journal_size: int = append_file_manifest_journal_entry(storage_root, collection_id, state, filename)
+        log.info('Journaled collection %s state after processing %s.', collection_id, filename)
+        if journal_size >= DEFAULT_STATE_JOURNAL_COMPACTION_BYTES:
+            compact_collection_state_journal(storage_root, collection_id, state)
+    elif state_persistence_mode == STATE_PERSISTENCE_MODE_SQLITE:
+        save_file_manifest_entry_to_sqlite(storage_root, collection_id, state, filename)
+        log.info('Saved collection %s SQLite manifest row after processing %s.', collection_id, filename)
+    else:
+        save_collection_state(storage_root, collection_id, state)
+        log.info('Saved collection %s state after processing %s.', collection_id, filename)
+
+
+def load_collection_state_for_run(storage_root: Path, collection_id: int, state_persistence_mode: str) -> dict[str, object]:
+    """
+    Loads collection state from the store selected by the state persistence mode.
+    Called by: process_collection_job()
+    """
+    result: dict[str, object]
+    if state_persistence_mode == STATE_PERSISTENCE_MODE_SQLITE:
+        result = load_collection_state_from_sqlite(storage_root, collection_id)
+    else:
+        result = load_collection_state(storage_root, collection_id)
+    return result
+
+
+def save_collection_state_for_run(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    state_persistence_mode: str,
+) -> None:
+    """
+    Saves a whole collection state to the store selected by the state persistence mode.
+    Called by: process_collection_job(), persist_planned_downloads_to_state()
+    """
+    if state_persistence_mode == STATE_PERSISTENCE_MODE_SQLITE:
+        save_collection_state_to_sqlite(storage_root, collection_id, state)
+    else:
+        save_collection_state(storage_root, collection_id, state)
+
+
+def log_collection_manifest_status_counts(storage_root: Path, collection_id: int, state_persistence_mode: str) -> None:
+    """
+    Logs indexed per-status manifest counts when the SQLite state store is in use.
+    Called by: process_collection_job()
+    """
+    if state_persistence_mode == STATE_PERSISTENCE_MODE_SQLITE:
+        status_counts: dict[str, int] = count_files_by_status(storage_root, collection_id)
+        log.info('Collection %s manifest status counts: %s', collection_id, status_counts)
+
+
+def compact_collection_state_journal(storage_root: Path, collection_id: int, state: dict[str, object]) -> None:
+    """
+    Folds the state journal into a fresh state.json snapshot, which also removes the journal.
+    Called by: save_collection_state_after_file_processing(), process_collection_job()
     """
     save_collection_state(storage_root, collection_id, state)
-    log.info('Saved collection %s state after processing %s.', collection_id, filename)
+    log.info('Compacted collection %s state journal into state.json.', collection_id)
 
 
 def persist_planned_downloads_to_state(
@@ -565,6 +1469,7 @@ def persist_planned_downloads_to_state(
     state: dict[str, object],
     planned_downloads: list[PlannedDownload],
     discovered_at: str,
+    state_persistence_mode: str = STATE_PERSISTENCE_MODE_SNAPSHOT,
 ) -> None:
     """
     Persists planned-download manifest entries before the download loop begins.
@@ -581,8 +1486,11 @@ def persist_planned_downloads_to_state(
             warc_path=planned_download.planned_paths.warc_path,
             seed_id=planned_download.planned_paths.seed_id,
             discovered_at=discovered_at,
+            expected_size=planned_download.expected_size,
+            expected_checksums=planned_download.expected_checksums,
+            store_time=planned_download.store_time,
         )
-    save_collection_state(storage_root, collection_id, state)
+    save_collection_state_for_run(storage_root, collection_id, state, state_persistence_mode)
     log.info(
         'Saved collection %s state with %s planned download entries before downloads begin.',
         collection_id,
@@ -607,96 +1515,697 @@ def build_collection_status_update(
     return result
 
 
-def write_collection_status_update(
-    worksheet: gspread.Worksheet,
-    header_location: HeaderLocation,
-    collection_job: CollectionJob,
-    status_update: CollectionProcessingStatusUpdate,
-) -> None:
-    """
-    Writes one collection-level processing status update to the spreadsheet.
-    Called by: write_collection_start_status()
-    """
-    update_collection_processing_status(worksheet, header_location, collection_job.row_number, status_update)
+def write_collection_status_update(
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
+    header_location: HeaderLocation,
+    collection_job: CollectionJob,
+    status_update: CollectionProcessingStatusUpdate,
+) -> None:
+    """
+    Writes one collection-level processing status update to the spreadsheet.
+    Called by: write_collection_start_status()
+    """
+    update_collection_processing_status(worksheet, header_location, collection_job.row_number, status_update)
+
+
+def build_download_planning_status(discovered_warc_count: int) -> CollectionProcessingStatusUpdate:
+    """
+    Builds the collection-level status update written after download planning completes.
+    Called by: write_collection_download_planning_status()
+    """
+    result: CollectionProcessingStatusUpdate = build_collection_status_update(
+        STATUS_DOWNLOAD_PLANNING_COMPLETE,
+        'download planning complete',
+        discovered_warc_count,
+    )
+    return result
+
+
+def build_no_new_files_status(discovered_warc_count: int) -> CollectionProcessingStatusUpdate:
+    """
+    Builds the collection-level status update written when no downloads are needed.
+    Called by: write_collection_no_new_files_status()
+    """
+    result: CollectionProcessingStatusUpdate = build_collection_status_update(
+        STATUS_NO_NEW_FILES_TO_DOWNLOAD,
+        'no new files to download',
+        discovered_warc_count,
+    )
+    return result
+
+
+def build_download_start_status(
+    discovered_warc_count: int,
+    planned_download_count: int,
+) -> CollectionProcessingStatusUpdate:
+    """
+    Builds the initial collection-level download-in-progress status update.
+    Called by: write_collection_download_start_status()
+    """
+    result: CollectionProcessingStatusUpdate = build_collection_status_update(
+        STATUS_DOWNLOADING_IN_PROGRESS,
+        build_download_progress_detail(0, 0, planned_download_count),
+        discovered_warc_count,
+    )
+    return result
+
+
+def build_download_progress_detail(percent_complete: int, completed_count: int, total_count: int) -> str:
+    """
+    Builds compact progress-detail text for the download start status.
+    Called by: build_download_start_status()
+    """
+    result: str = f'{percent_complete}% ({completed_count}/{total_count} files)'
+    return result
+
+
+def write_fixity_for_planned_download(
+    planned_download: PlannedDownload,
+    warc_path: Path,
+    sha256_hexdigest: str | None = None,
+    digests: dict[str, str] | None = None,
+) -> FixityResult:
+    """
+    Writes fixity sidecars for one planned download, reusing digests computed during download when available.
+    The planned download's WASAPI checksums are verified, and recorded in the JSON sidecar.
+    Called by: write_fixity_for_existing_warc(), finish_planned_download()
+    """
+    result: FixityResult = write_fixity_sidecars(
+        warc_path=warc_path,
+        sha256_path=planned_download.planned_paths.sha256_path,
+        json_path=planned_download.planned_paths.json_path,
+        source_url=planned_download.source_url,
+        sha256_hexdigest=sha256_hexdigest,
+        digests=digests,
+        expected_checksums=planned_download.expected_checksums,
+    )
+    return result
+
+
+def compute_backoff_seconds(attempt_number: int, base_seconds: float, max_seconds: float, jitter_fraction: float) -> float:
+    """
+    Returns an exponential backoff delay with equal jitter: half the capped delay is fixed, half is scaled by jitter.
+    Called by: compute_next_retry_after(), get_in_run_retry_delay()
+    """
+    capped_delay: float = min(max_seconds, base_seconds * (2 ** max(0, attempt_number - 1)))
+    result: float = capped_delay / 2 + capped_delay / 2 * jitter_fraction
+    return result
+
+
+def compute_next_retry_after(
+    error_count: int,
+    retry_after_seconds: float | None,
+    settings: RunSettings,
+    now: datetime,
+    jitter_fraction: float,
+) -> tuple[str, bool]:
+    """
+    Returns when a failed file may next be attempted and whether it has used up its attempts and is quarantined.
+    A server's Retry-After delay is honoured when it is longer than the computed backoff.
+    Called by: schedule_failed_download_retry()
+    """
+    quarantined: bool = error_count >= settings.download_max_attempts
+    delay_seconds: float = (
+        settings.download_quarantine_days * 24 * 60 * 60
+        if quarantined
+        else compute_backoff_seconds(
+            error_count,
+            settings.download_retry_base_seconds,
+            DOWNLOAD_RETRY_MAX_SECONDS,
+            jitter_fraction,
+        )
+    )
+    if retry_after_seconds is not None:
+        delay_seconds = max(delay_seconds, retry_after_seconds)
+    next_retry_after: datetime = now + datetime_module.timedelta(seconds=delay_seconds)
+    result: tuple[str, bool] = (next_retry_after.isoformat(), quarantined)
+    return result
+
+
+def download_in_slot(
+    client: httpx.Client,
+    planned_download: PlannedDownload,
+    download_slots: threading.BoundedSemaphore | None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> DownloadResult:
+    """
+    Runs one transfer attempt, holding a run-wide download slot for its duration when slots are configured.
+    Called by: download_with_in_run_retries()
+    """
+    download_slot: AbstractContextManager[object] = download_slots if download_slots is not None else nullcontext()
+    with download_slot:
+        result: DownloadResult = download_to_path(
+            client,
+            planned_download.source_url,
+            planned_download.planned_paths.warc_path,
+            expected_checksums=planned_download.expected_checksums,
+            expected_size=planned_download.expected_size,
+            bandwidth_limiter=bandwidth_limiter,
+            preallocate=preallocate,
+            byte_counter=byte_counter,
+        )
+    return result
+
+
+async def download_in_slot_async(
+    transfer_engine: AsyncTransferEngine,
+    planned_download: PlannedDownload,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> DownloadResult:
+    """
+    Runs one async transfer attempt while holding the engine's run-wide and per-host transfer slots.
+    Called by: download_with_in_run_retries_async()
+    """
+    async with transfer_engine.transfer_slots(planned_download.source_url):
+        result: DownloadResult = await download_to_path_async(
+            transfer_engine.client,
+            planned_download.source_url,
+            planned_download.planned_paths.warc_path,
+            expected_checksums=planned_download.expected_checksums,
+            expected_size=planned_download.expected_size,
+            bandwidth_limiter=bandwidth_limiter,
+            preallocate=preallocate,
+            byte_counter=byte_counter,
+        )
+    return result
+
+
+def get_in_run_retry_delay(
+    collection_id: int,
+    planned_download: PlannedDownload,
+    download_result: DownloadResult,
+    attempt_number: int,
+    attempts_per_run: int,
+) -> float | None:
+    """
+    Returns how long to wait before retrying a transient failure within this run, or None when it should not be retried.
+    A Retry-After delay is honoured up to a limit; a longer one ends in-run retries and is left to the next run.
+    Called by: download_with_in_run_retries(), download_with_in_run_retries_async()
+    """
+    result: float | None = None
+    if not download_result.success and attempt_number < attempts_per_run and download_result.is_transient_failure is True:
+        retry_after_seconds: float | None = download_result.retry_after_seconds
+        if retry_after_seconds is None or retry_after_seconds <= IN_RUN_RETRY_AFTER_LIMIT_SECONDS:
+            backoff_seconds: float = compute_backoff_seconds(
+                attempt_number,
+                IN_RUN_RETRY_BASE_SECONDS,
+                IN_RUN_RETRY_MAX_SECONDS,
+                random.random(),
+            )
+            result = max(retry_after_seconds or 0.0, backoff_seconds)
+            log.warning(
+                'Collection %s transient download failure for %s (%s); retrying in %.1f seconds.',
+                collection_id,
+                planned_download.filename,
+                download_result.error_message,
+                result,
+            )
+    return result
+
+
+def download_with_in_run_retries(
+    client: httpx.Client,
+    collection_id: int,
+    planned_download: PlannedDownload,
+    download_slots: threading.BoundedSemaphore | None,
+    attempts_per_run: int,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> DownloadResult:
+    """
+    Downloads one file, retrying transient failures (transport errors, 408/429/5xx) with jittered backoff in this run.
+    The download slot is released while waiting, so a backing-off file does not hold up other transfers.
+    Called by: execute_planned_download()
+    """
+    attempt_number: int = 1
+    download_result: DownloadResult = download_in_slot(
+        client,
+        planned_download,
+        download_slots,
+        bandwidth_limiter,
+        preallocate,
+        byte_counter,
+    )
+    delay_seconds: float | None = get_in_run_retry_delay(
+        collection_id,
+        planned_download,
+        download_result,
+        attempt_number,
+        attempts_per_run,
+    )
+    while delay_seconds is not None:
+        time.sleep(delay_seconds)
+        attempt_number += 1
+        download_result = download_in_slot(
+            client,
+            planned_download,
+            download_slots,
+            bandwidth_limiter,
+            preallocate,
+            byte_counter,
+        )
+        delay_seconds = get_in_run_retry_delay(
+            collection_id,
+            planned_download,
+            download_result,
+            attempt_number,
+            attempts_per_run,
+        )
+    return download_result
+
+
+async def download_with_in_run_retries_async(
+    transfer_engine: AsyncTransferEngine,
+    collection_id: int,
+    planned_download: PlannedDownload,
+    attempts_per_run: int,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> DownloadResult:
+    """
+    Async counterpart of download_with_in_run_retries(); waiting between attempts holds no transfer slot.
+    Called by: execute_planned_download_async()
+    """
+    attempt_number: int = 1
+    download_result: DownloadResult = await download_in_slot_async(
+        transfer_engine,
+        planned_download,
+        bandwidth_limiter,
+        preallocate,
+        byte_counter,
+    )
+    delay_seconds: float | None = get_in_run_retry_delay(
+        collection_id,
+        planned_download,
+        download_result,
+        attempt_number,
+        attempts_per_run,
+    )
+    while delay_seconds is not None:
+        await asyncio.sleep(delay_seconds)
+        attempt_number += 1
+        download_result = await download_in_slot_async(
+            transfer_engine,
+            planned_download,
+            bandwidth_limiter,
+            preallocate,
+            byte_counter,
+        )
+        delay_seconds = get_in_run_retry_delay(
+            collection_id,
+            planned_download,
+            download_result,
+            attempt_number,
+            attempts_per_run,
+        )
+    return download_result
+
+
+def write_fixity_for_existing_warc(collection_id: int, planned_download: PlannedDownload) -> FixityResult | None:
+    """
+    Writes fixity sidecars for a WARC that is already at its destination, or returns None when that copy disagrees
+    with the WASAPI size or checksums. A disagreeing copy is set aside as `<name>.fixity-failed` so the caller
+    downloads a fresh one, instead of every run rehashing the same bad copy and failing fixity again.
+    Called by: execute_planned_download(), execute_planned_download_async()
+    """
+    warc_path: Path = planned_download.planned_paths.warc_path
+    result: FixityResult | None = None
+    mismatch_reason: str | None = None
+    existing_size: int = warc_path.stat().st_size
+    if planned_download.expected_size is not None and existing_size != planned_download.expected_size:
+        mismatch_reason = f'size expected {planned_download.expected_size} but found {existing_size}'
+    else:
+        result = write_fixity_for_planned_download(planned_download, warc_path)
+        if result.checksum_mismatch:
+            mismatch_reason = result.error_message
+    if mismatch_reason is not None:
+        log.warning(
+            'Collection %s existing WARC %s does not match WASAPI (%s); setting it aside and downloading it again.',
+            collection_id,
+            planned_download.filename,
+            mismatch_reason,
+        )
+        set_aside_failed_warc(warc_path)
+        result = None
+    return result
+
+
+def log_planned_download_start(collection_id: int, planned_download: PlannedDownload) -> bool:
+    """
+    Logs whether one planned file is about to be downloaded or only needs fixity handling, and returns whether the
+    destination already exists.
+    Called by: execute_planned_download(), execute_planned_download_async()
+    """
+    destination_path: Path = planned_download.planned_paths.warc_path
+    result: bool = destination_path.exists()
+    if result:
+        log.info(
+            'Collection %s skipping download for %s because the destination already exists '
+            'and proceeding to fixity handling: %s',
+            collection_id,
+            planned_download.filename,
+            destination_path,
+        )
+    else:
+        log.debug(
+            'Collection ``%s`` about to download ``%s`` from ``%s`` to ``%s``',
+            collection_id,
+            planned_download.filename,
+            planned_download.source_url,
+            destination_path,
+        )
+    return result
+
+
+def finish_planned_download(
+    collection_id: int,
+    planned_download: PlannedDownload,
+    download_result: DownloadResult,
+) -> FixityResult | None:
+    """
+    Logs one finished transfer and, when it succeeded, writes fixity sidecars from the digests computed while streaming.
+    Called by: execute_planned_download(), execute_planned_download_async()
+    """
+    result: FixityResult | None = None
+    if download_result.success:
+        log.info(
+            'Collection %s downloaded %s bytes for %s to %s (resumed from byte %s)',
+            collection_id,
+            download_result.bytes_written,
+            planned_download.filename,
+            download_result.destination_path,
+            download_result.resume_offset,
+        )
+        result = write_fixity_for_planned_download(
+            planned_download,
+            download_result.destination_path,
+            download_result.sha256_hexdigest,
+            download_result.digests,
+        )
+    else:
+        log.error(
+            'Collection %s download failed for %s from %s: %s',
+            collection_id,
+            planned_download.filename,
+            planned_download.source_url,
+            download_result.error_message,
+        )
+    return result
+
+
+def execute_planned_download(
+    client: httpx.Client,
+    collection_id: int,
+    planned_download: PlannedDownload,
+    download_slots: threading.BoundedSemaphore | None = None,
+    attempts_per_run: int = 1,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> PlannedDownloadOutcome:
+    """
+    Downloads one planned WARC file and writes its fixity sidecars without touching collection state.
+    When run-wide download slots are given, the transfer waits for a free slot so all collections share one cap.
+    Transient failures are retried up to `attempts_per_run` times before the outcome is returned. An existing WARC
+    that disagrees with WASAPI is set aside and downloaded again.
+    Called by: run_planned_downloads() worker threads
+    """
+    download_result: DownloadResult | None = None
+    fixity_result: FixityResult | None = None
+    if log_planned_download_start(collection_id, planned_download):
+        fixity_result = write_fixity_for_existing_warc(collection_id, planned_download)
+    if fixity_result is None:
+        download_result = download_with_in_run_retries(
+            client,
+            collection_id,
+            planned_download,
+            download_slots,
+            attempts_per_run,
+            bandwidth_limiter,
+            preallocate,
+            byte_counter,
+        )
+        fixity_result = finish_planned_download(collection_id, planned_download, download_result)
+    result: PlannedDownloadOutcome = PlannedDownloadOutcome(
+        planned_download=planned_download,
+        download_result=download_result,
+        fixity_result=fixity_result,
+    )
+    return result
 
 
-def build_download_planning_status(discovered_warc_count: int) -> CollectionProcessingStatusUpdate:
-    """
-    Builds the collection-level status update written after download planning completes.
-    Called by: write_collection_download_planning_status()
-    """
-    result: CollectionProcessingStatusUpdate = build_collection_status_update(
-        STATUS_DOWNLOAD_PLANNING_COMPLETE,
-        'download planning complete',
-        discovered_warc_count,
+async def execute_planned_download_async(
+    transfer_engine: AsyncTransferEngine,
+    collection_id: int,
+    planned_download: PlannedDownload,
+    attempts_per_run: int = 1,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> PlannedDownloadOutcome:
+    """
+    Async counterpart of execute_planned_download(), run on the transfer engine's event loop.
+    Filesystem checks and fixity hashing run on worker threads so they never stall other transfers.
+    Called by: submit_planned_downloads() via AsyncTransferEngine.submit()
+    """
+    download_result: DownloadResult | None = None
+    fixity_result: FixityResult | None = None
+    if await asyncio.to_thread(log_planned_download_start, collection_id, planned_download):
+        fixity_result = await asyncio.to_thread(write_fixity_for_existing_warc, collection_id, planned_download)
+    if fixity_result is None:
+        download_result = await download_with_in_run_retries_async(
+            transfer_engine,
+            collection_id,
+            planned_download,
+            attempts_per_run,
+            bandwidth_limiter,
+            preallocate,
+            byte_counter,
+        )
+        fixity_result = await asyncio.to_thread(finish_planned_download, collection_id, planned_download, download_result)
+    result: PlannedDownloadOutcome = PlannedDownloadOutcome(
+        planned_download=planned_download,
+        download_result=download_result,
+        fixity_result=fixity_result,
     )
     return result
 
 
-def build_no_new_files_status(discovered_warc_count: int) -> CollectionProcessingStatusUpdate:
+def record_planned_download_outcome(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    outcome: PlannedDownloadOutcome,
+    fixity_cache: dict[str, object] | None = None,
+    state_persistence_mode: str = STATE_PERSISTENCE_MODE_SNAPSHOT,
+    run_settings: RunSettings | None = None,
+) -> None:
     """
-    Builds the collection-level status update written when no downloads are needed.
-    Called by: write_collection_no_new_files_status()
+    Records one worker outcome in the collection manifest, saving state after the download and fixity steps.
+    Successful fixity digests are also remembered in the fixity cache so the next run does not rehash the file,
+    and the verified file's size is counted in the running downloaded totals.
+    A failed download is given a jittered `next_retry_after`, or quarantined once it has used up its attempts.
+    Called by: run_planned_downloads()
     """
-    result: CollectionProcessingStatusUpdate = build_collection_status_update(
-        STATUS_NO_NEW_FILES_TO_DOWNLOAD,
-        'no new files to download',
-        discovered_warc_count,
-    )
-    return result
+    planned_download: PlannedDownload = outcome.planned_download
+    if outcome.download_result is not None:
+        update_file_manifest_for_download_result(
+            state=state,
+            filename=planned_download.filename,
+            source_url=planned_download.source_url,
+            warc_path=planned_download.planned_paths.warc_path,
+            seed_id=planned_download.planned_paths.seed_id,
+            success=outcome.download_result.success,
+            error_message=outcome.download_result.error_message,
+        )
+        if outcome.download_result.success is False:
+            schedule_failed_download_retry(
+                collection_id,
+                state,
+                planned_download.filename,
+                outcome.download_result,
+                run_settings if run_settings is not None else RunSettings(),
+            )
+        save_collection_state_after_file_processing(
+            storage_root,
+            collection_id,
+            state,
+            planned_download.filename,
+            state_persistence_mode,
+        )
+    fixity_result: FixityResult | None = outcome.fixity_result
+    if fixity_result is not None:
+        update_file_manifest_for_fixity_result(
+            state=state,
+            filename=planned_download.filename,
+            sha256_path=planned_download.planned_paths.sha256_path,
+            json_path=planned_download.planned_paths.json_path,
+            success=fixity_result.success,
+            completed_at=fixity_result.completed_at,
+            error_message=fixity_result.error_message,
+        )
+        if fixity_result.success:
+            add_file_to_downloaded_totals(
+                state,
+                planned_download.filename,
+                fixity_result.size,
+                planned_download.planned_paths.seed_id,
+            )
+        save_collection_state_after_file_processing(
+            storage_root,
+            collection_id,
+            state,
+            planned_download.filename,
+            state_persistence_mode,
+        )
+        repaired: bool = outcome.download_result is None
+        if fixity_result.success and fixity_cache is not None and fixity_result.sha256_hexdigest is not None:
+            remember_verified_sha256(fixity_cache, fixity_result.warc_path, fixity_result.sha256_hexdigest)
+        if fixity_result.success:
+            log.info(
+                'Collection %s %s fixity sidecars for %s: sha256=%s json=%s',
+                collection_id,
+                'repaired or refreshed' if repaired else 'wrote',
+                planned_download.filename,
+                fixity_result.sha256_path,
+                fixity_result.json_path,
+            )
+        else:
+            log.error(
+                'Collection %s fixity %s failed for %s: %s',
+                collection_id,
+                'repair' if repaired else 'writing',
+                planned_download.filename,
+                fixity_result.error_message,
+            )
 
 
-def build_download_start_status(
-    discovered_warc_count: int,
-    planned_download_count: int,
-) -> CollectionProcessingStatusUpdate:
+def schedule_failed_download_retry(
+    collection_id: int,
+    state: dict[str, object],
+    filename: str,
+    download_result: DownloadResult,
+    settings: RunSettings,
+) -> None:
     """
-    Builds the initial collection-level download-in-progress status update.
-    Called by: write_collection_download_start_status()
+    Stores the next retry time for one failed download and logs when the file is quarantined.
+    Called by: record_planned_download_outcome()
     """
-    result: CollectionProcessingStatusUpdate = build_collection_status_update(
-        STATUS_DOWNLOADING_IN_PROGRESS,
-        build_download_progress_detail(0, 0, planned_download_count),
-        discovered_warc_count,
+    entry: dict[str, object] = get_file_manifest_entry(state, filename)
+    error_count: int = get_consecutive_download_failures(entry)
+    retry_after_value: object = download_result.retry_after_seconds
+    retry_after_seconds: float | None = (
+        float(retry_after_value)
+        if isinstance(retry_after_value, int | float) and not isinstance(retry_after_value, bool)
+        else None
     )
-    return result
+    next_retry_after: str
+    quarantined: bool
+    next_retry_after, quarantined = compute_next_retry_after(
+        error_count,
+        retry_after_seconds,
+        settings,
+        datetime_module.datetime.now(UTC),
+        random.random(),
+    )
+    schedule_file_manifest_retry(state, filename, next_retry_after, quarantined)
+    if quarantined:
+        log.error(
+            'Collection %s quarantined %s after %s consecutive failed attempts; next attempt after %s.',
+            collection_id,
+            filename,
+            error_count,
+            next_retry_after,
+        )
+    else:
+        log.info('Collection %s will retry %s after %s.', collection_id, filename, next_retry_after)
 
 
-def build_download_progress_detail(percent_complete: int, completed_count: int, total_count: int) -> str:
+def submit_planned_downloads(
+    executor: ThreadPoolExecutor | None,
+    client: httpx.Client,
+    collection_id: int,
+    pending_downloads: Iterator[PlannedDownload],
+    in_flight: set[Future[PlannedDownloadOutcome]],
+    worker_count: int,
+    download_slots: threading.BoundedSemaphore | None = None,
+    attempts_per_run: int = 1,
+    transfer_engine: AsyncTransferEngine | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    preallocate: bool = False,
+    byte_counter: TransferByteCounter | None = None,
+) -> None:
     """
-    Builds compact progress-detail text for one download progress update.
-    Called by: get_download_progress_file_interval_update()
+    Tops up the in-flight set from the pending iterator without exceeding the worker count.
+    With an async transfer engine, each download is a task on its event loop instead of a worker thread.
+    Called by: run_planned_downloads()
     """
-    result: str = f'{percent_complete}% ({completed_count}/{total_count} files)'
-    return result
+    while len(in_flight) < worker_count:
+        planned_download: PlannedDownload | None = next(pending_downloads, None)
+        if planned_download is None:
+            break
+        if transfer_engine is not None:
+            in_flight.add(
+                transfer_engine.submit(
+                    execute_planned_download_async(
+                        transfer_engine,
+                        collection_id,
+                        planned_download,
+                        attempts_per_run,
+                        bandwidth_limiter,
+                        preallocate,
+                        byte_counter,
+                    )
+                )
+            )
+        elif executor is not None:
+            in_flight.add(
+                executor.submit(
+                    execute_planned_download,
+                    client,
+                    collection_id,
+                    planned_download,
+                    download_slots,
+                    attempts_per_run,
+                    bandwidth_limiter,
+                    preallocate,
+                    byte_counter,
+                )
+            )
 
 
-def get_download_progress_file_interval_update(
-    total_count: int,
-    completed_count: int,
-    last_reported_completed_count: int,
-) -> tuple[int, str | None]:
-    """
-    Returns progress text when another ten completed downloads have been reached.
+def iter_deadline_admitted_downloads(
+    collection_id: int,
+    planned_downloads: Iterable[PlannedDownload],
+    run_deadline: RunDeadline,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+) -> Iterator[PlannedDownload]:
+    """
+    Yields the planned downloads that can still finish before the run deadline, checked as each one is about to start.
+    Refused files are counted as deferred and release any disk-space reservation; they stay `pending_download` in the
+    manifest so the next run picks them up. The whole iterable is still consumed, so streamed discovery completes and
+    its checkpoint stays consistent.
     Called by: run_planned_downloads()
     """
-    next_reported_completed_count: int = last_reported_completed_count
-    progress_detail: str | None = None
-    if (
-        total_count > 0
-        and completed_count >= DOWNLOAD_PROGRESS_FILE_INTERVAL
-        and completed_count % DOWNLOAD_PROGRESS_FILE_INTERVAL == 0
-        and completed_count > last_reported_completed_count
-    ):
-        percent_complete: int = (completed_count * 100) // total_count
-        next_reported_completed_count = completed_count
-        progress_detail = build_download_progress_detail(
-            percent_complete,
-            completed_count,
-            total_count,
-        )
-    result: tuple[int, str | None] = (next_reported_completed_count, progress_detail)
-    return result
+    for planned_download in planned_downloads:
+        if run_deadline.allows_start(get_remaining_download_bytes(planned_download)):
+            yield planned_download
+        else:
+            if run_deadline.get_deferred_count(collection_id) == 0:
+                log.warning(
+                    'Collection %s is deferring downloads to the next run; they cannot finish before the run deadline %s.',
+                    collection_id,
+                    run_deadline.deadline,
+                )
+            run_deadline.record_deferral(collection_id)
+            if disk_space_admission is not None:
+                disk_space_admission.release(planned_download.planned_paths.warc_path)
 
 
 def run_planned_downloads(
@@ -704,138 +2213,144 @@ def run_planned_downloads(
     storage_root: Path,
     collection_id: int,
     state: dict[str, object],
-    planned_downloads: list[PlannedDownload],
+    planned_downloads: Iterable[PlannedDownload],
     progress_callback: Callable[[str], None] | None = None,
+    run_settings: RunSettings | None = None,
+    fixity_cache: dict[str, object] | None = None,
+    planned_download_count_source: Callable[[], int] | None = None,
+    download_slots: threading.BoundedSemaphore | None = None,
+    transfer_engine: AsyncTransferEngine | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+    run_deadline: RunDeadline | None = None,
+    fair_share: CollectionFairShare | None = None,
 ) -> tuple[list[DownloadResult], list[FixityResult]]:
     """
-    Downloads planned WARC files sequentially, generates fixity for successful downloads, and returns the per-file results.
-    Called by: process_collection_job()
-    """
+    Downloads planned WARC files with a bounded worker pool, generates fixity, and returns the per-file results.
+    Workers only download and write fixity; manifest updates, state saves, and progress callbacks stay on this thread.
+    With an async transfer engine, the in-flight downloads run on its event loop instead of a thread pool.
+    Each finished file releases its disk-space reservation, since its bytes are now counted by the filesystem.
+    With a run deadline, files that cannot finish in time are not started, and each finished transfer updates the
+    observed throughput the deadline estimates from.
+    With a fair share, the collection keeps no more downloads in flight than its share of the global cap, which grows
+    back as other collections finish.
+    A lazily produced iterable (streamed discovery) is pulled only as worker slots free up; its growing total comes
+    from planned_download_count_source.
+    Progress (percent by WASAPI bytes for a known list, aggregate MB/s, and ETA) is logged and passed to the progress
+    callback at most once per DOWNLOAD_PROGRESS_INTERVAL_SECONDS. The wait for finished transfers times out when the
+    next report is due, and transfers count their bytes per chunk, so large files in flight still show progress.
+    Called by: process_collection_job_buffered(), process_collection_job_streaming()
+    """
+    settings: RunSettings = run_settings if run_settings is not None else RunSettings()
     results: list[DownloadResult] = []
     fixity_results: list[FixityResult] = []
-    last_reported_completed_count: int = 0
     progress_detail: str | None = None
-    total_planned_downloads: int = len(planned_downloads)
-    for planned_download in planned_downloads:
-        destination_path: Path = planned_download.planned_paths.warc_path
-        if destination_path.exists():
-            log.info(
-                'Collection %s skipping download for %s because the destination already exists '
-                'and proceeding to fixity handling: %s',
-                collection_id,
-                planned_download.filename,
-                destination_path,
-            )
-            fixity_result: FixityResult = write_fixity_sidecars(
-                warc_path=destination_path,
-                sha256_path=planned_download.planned_paths.sha256_path,
-                json_path=planned_download.planned_paths.json_path,
-                source_url=planned_download.source_url,
-            )
-            fixity_results.append(fixity_result)
-            update_file_manifest_for_fixity_result(
-                state=state,
-                filename=planned_download.filename,
-                sha256_path=planned_download.planned_paths.sha256_path,
-                json_path=planned_download.planned_paths.json_path,
-                success=fixity_result.success,
-                completed_at=fixity_result.completed_at,
-                error_message=fixity_result.error_message,
-            )
-            save_collection_state_after_file_processing(storage_root, collection_id, state, planned_download.filename)
-            if fixity_result.success:
-                log.info(
-                    'Collection %s repaired or refreshed fixity sidecars for %s: sha256=%s json=%s',
-                    collection_id,
-                    planned_download.filename,
-                    fixity_result.sha256_path,
-                    fixity_result.json_path,
-                )
-            else:
-                log.error(
-                    'Collection %s fixity repair failed for %s: %s',
-                    collection_id,
-                    planned_download.filename,
-                    fixity_result.error_message,
-                )
-            continue
-
-        log.debug(
-            'Collection ``%s`` about to download ``%s`` from ``%s`` to ``%s``',
+    progress_tracker: DownloadProgressTracker = DownloadProgressTracker(
+        float(settings.download_progress_interval_seconds),
+        time.monotonic(),
+    )
+    is_known_list: bool = isinstance(planned_downloads, list)
+    total_planned_downloads: int = len(planned_downloads) if isinstance(planned_downloads, list) else 0
+    if isinstance(planned_downloads, list):
+        for planned_download in planned_downloads:
+            progress_tracker.add_planned_size(planned_download.expected_size)
+    worker_count: int = (
+        max(1, min(settings.download_concurrency, total_planned_downloads))
+        if is_known_list
+        else settings.download_concurrency
+    )
+    pending_downloads: Iterator[PlannedDownload] = (
+        iter_deadline_admitted_downloads(collection_id, planned_downloads, run_deadline, disk_space_admission)
+        if run_deadline is not None
+        else iter(planned_downloads)
+    )
+    in_flight: set[Future[PlannedDownloadOutcome]] = set()
+    if total_planned_downloads > 0 or not is_known_list:
+        log.info(
+            'Collection %s starting %s planned downloads with %s workers.',
             collection_id,
-            planned_download.filename,
-            planned_download.source_url,
-            destination_path,
+            total_planned_downloads if is_known_list else 'streamed',
+            worker_count,
         )
-        download_result: DownloadResult = download_to_path(client, planned_download.source_url, destination_path)
-        results.append(download_result)
-        update_file_manifest_for_download_result(
-            state=state,
-            filename=planned_download.filename,
-            source_url=planned_download.source_url,
-            warc_path=destination_path,
-            seed_id=planned_download.planned_paths.seed_id,
-            success=download_result.success,
-            error_message=download_result.error_message,
+        executor_context: AbstractContextManager[ThreadPoolExecutor | None] = (
+            ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix=f'download-{collection_id}')
+            if transfer_engine is None
+            else nullcontext()
         )
-        save_collection_state_after_file_processing(storage_root, collection_id, state, planned_download.filename)
-        if download_result.success:
-            log.info(
-                'Collection %s downloaded %s bytes for %s to %s',
+        fair_share_context: AbstractContextManager[None] = (
+            fair_share.participate(collection_id) if fair_share is not None else nullcontext()
+        )
+        with executor_context as executor, fair_share_context:
+            submit_planned_downloads(
+                executor,
+                client,
                 collection_id,
-                download_result.bytes_written,
-                planned_download.filename,
-                download_result.destination_path,
-            )
-            fixity_result = write_fixity_sidecars(
-                warc_path=download_result.destination_path,
-                sha256_path=planned_download.planned_paths.sha256_path,
-                json_path=planned_download.planned_paths.json_path,
-                source_url=planned_download.source_url,
-            )
-            fixity_results.append(fixity_result)
-            update_file_manifest_for_fixity_result(
-                state=state,
-                filename=planned_download.filename,
-                sha256_path=planned_download.planned_paths.sha256_path,
-                json_path=planned_download.planned_paths.json_path,
-                success=fixity_result.success,
-                completed_at=fixity_result.completed_at,
-                error_message=fixity_result.error_message,
+                pending_downloads,
+                in_flight,
+                get_fair_worker_count(worker_count, fair_share),
+                download_slots,
+                settings.download_attempts_per_run,
+                transfer_engine,
+                bandwidth_limiter,
+                settings.download_preallocation_mode == DOWNLOAD_PREALLOCATION_MODE_FALLOCATE,
+                progress_tracker.byte_counter,
             )
-            save_collection_state_after_file_processing(storage_root, collection_id, state, planned_download.filename)
-            if fixity_result.success:
-                log.info(
-                    'Collection %s wrote fixity sidecars for %s: sha256=%s json=%s',
+            wait_timeout_seconds: float = progress_tracker.get_seconds_until_next_report(progress_tracker.started_at)
+            while in_flight:
+                done: set[Future[PlannedDownloadOutcome]]
+                done, in_flight = wait(in_flight, timeout=wait_timeout_seconds, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcome: PlannedDownloadOutcome = future.result()
+                    record_planned_download_outcome(
+                        storage_root,
+                        collection_id,
+                        state,
+                        outcome,
+                        fixity_cache,
+                        settings.state_persistence_mode,
+                        settings,
+                    )
+                    if disk_space_admission is not None:
+                        disk_space_admission.release(outcome.planned_download.planned_paths.warc_path)
+                    if outcome.fixity_result is not None:
+                        fixity_results.append(outcome.fixity_result)
+                    if outcome.download_result is None:
+                        continue
+                    if run_deadline is not None and outcome.download_result.success is True:
+                        elapsed_seconds: object = outcome.download_result.elapsed_seconds
+                        if isinstance(elapsed_seconds, float):
+                            run_deadline.record_transfer(outcome.download_result.bytes_written, elapsed_seconds)
+                    results.append(outcome.download_result)
+                    bytes_written: object = outcome.download_result.bytes_written
+                    resume_offset: object = outcome.download_result.resume_offset
+                    progress_tracker.record_finished(
+                        outcome.planned_download.expected_size,
+                        bytes_written if isinstance(bytes_written, int) else 0,
+                        resume_offset if isinstance(resume_offset, int) else 0,
+                    )
+                if planned_download_count_source is not None:
+                    total_planned_downloads = planned_download_count_source()
+                progress_now: float = time.monotonic()
+                progress_detail = progress_tracker.poll_report(len(results), total_planned_downloads, progress_now)
+                if progress_detail is not None:
+                    log.info('Collection %s download progress: %s', collection_id, progress_detail)
+                    if progress_callback is not None:
+                        progress_callback(progress_detail)
+                wait_timeout_seconds = progress_tracker.get_seconds_until_next_report(progress_now)
+                submit_planned_downloads(
+                    executor,
+                    client,
                     collection_id,
-                    planned_download.filename,
-                    fixity_result.sha256_path,
-                    fixity_result.json_path,
+                    pending_downloads,
+                    in_flight,
+                    get_fair_worker_count(worker_count, fair_share),
+                    download_slots,
+                    settings.download_attempts_per_run,
+                    transfer_engine,
+                    bandwidth_limiter,
+                    settings.download_preallocation_mode == DOWNLOAD_PREALLOCATION_MODE_FALLOCATE,
+                    progress_tracker.byte_counter,
                 )
-            else:
-                log.error(
-                    'Collection %s fixity writing failed for %s: %s',
-                    collection_id,
-                    planned_download.filename,
-                    fixity_result.error_message,
-                )
-        else:
-            log.error(
-                'Collection %s download failed for %s from %s: %s',
-                collection_id,
-                planned_download.filename,
-                planned_download.source_url,
-                download_result.error_message,
-            )
-        completed_count: int = len(results)
-        last_reported_completed_count, progress_detail = get_download_progress_file_interval_update(
-            total_planned_downloads,
-            completed_count,
-            last_reported_completed_count,
-        )
-        if progress_detail is not None and progress_callback is not None:
-            log.info('Collection %s wrote download progress update: %s', collection_id, progress_detail)
-            progress_callback(progress_detail)
     result: tuple[list[DownloadResult], list[FixityResult]] = (results, fixity_results)
     return result
 
@@ -856,9 +2371,11 @@ def log_collection_download_summary(
     skipped_count: int = planned_download_count - len(download_results)
     fixity_success_count: int = sum(1 for result in fixity_results if result.success)
     fixity_failure_count: int = sum(1 for result in fixity_results if not result.success)
+    resumed_byte_count: int = sum(result.resume_offset for result in download_results if result.success)
     log.info(
         'Collection %s has %s pending candidates, %s planned downloads, %s download successes, '
-        '%s download failures, %s skipped existing files, %s fixity successes, and %s fixity failures.',
+        '%s download failures, %s skipped existing files, %s fixity successes, and %s fixity failures. '
+        'Range resume saved re-transferring %s bytes.',
         collection_job.collection_id,
         pending_download_count,
         planned_download_count,
@@ -867,13 +2384,14 @@ def log_collection_download_summary(
         skipped_count,
         fixity_success_count,
         fixity_failure_count,
+        resumed_byte_count,
     )
 
 
 def iter_collection_warc_paths(storage_root: Path, collection_id: int) -> list[Path]:
     """
     Returns downloaded WARC paths currently present on disk for one collection.
-    Called by: get_collection_downloaded_totals()
+    Called by: get_collection_downloaded_totals(), scan_collection_downloaded_files()
     """
     collection_root: Path = storage_root / 'collections' / str(collection_id)
     result: list[Path] = []
@@ -888,8 +2406,8 @@ def iter_collection_warc_paths(storage_root: Path, collection_id: int) -> list[P
 
 def get_collection_downloaded_totals(storage_root: Path, collection_id: int) -> tuple[int, int]:
     """
-    Returns the total downloaded WARC count and byte size currently present for one collection.
-    Called by: build_collection_summary_update()
+    Returns the total downloaded WARC count and byte size currently present for one collection by walking the tree.
+    Called by: build_collection_summary_update() when the collection state has no running totals
     """
     warc_paths: list[Path] = iter_collection_warc_paths(storage_root, collection_id)
     total_count: int = len(warc_paths)
@@ -904,16 +2422,96 @@ def get_collection_downloaded_totals(storage_root: Path, collection_id: int) ->
     return result
 
 
+def scan_collection_downloaded_files(storage_root: Path, collection_id: int) -> dict[str, tuple[Path, int, str]]:
+    """
+    Walks the collection tree once and maps each on-disk WARC filename to its path, byte size, and seed id.
+    Called by: refresh_downloaded_totals_if_due()
+    """
+    result: dict[str, tuple[Path, int, str]] = {}
+    for warc_path in iter_collection_warc_paths(storage_root, collection_id):
+        result[warc_path.name] = (
+            warc_path,
+            warc_path.stat().st_size,
+            parse_warc_filename(warc_path.name).seed_id,
+        )
+    return result
+
+
+def is_downloaded_totals_rescan_due(state: dict[str, object], settings: RunSettings, now: datetime) -> bool:
+    """
+    Returns whether the running downloaded totals must be rebuilt from a full walk of the collection tree.
+    A rescan is due when totals are missing, the full-rescan mode is configured, or the last rescan is too old.
+    Called by: refresh_downloaded_totals_if_due()
+    """
+    totals: dict[str, object] | None = get_downloaded_totals(state)
+    rescan_due: bool = totals is None or settings.downloaded_totals_mode == DOWNLOADED_TOTALS_MODE_FULL_RESCAN
+    if totals is not None and not rescan_due:
+        last_rescan_value: object = totals.get('last_full_rescan_at')
+        last_rescan_at: datetime | None = None
+        if isinstance(last_rescan_value, str):
+            try:
+                last_rescan_at = datetime.fromisoformat(last_rescan_value)
+            except ValueError:
+                last_rescan_at = None
+        rescan_due = last_rescan_at is None or now - last_rescan_at >= datetime_module.timedelta(
+            days=settings.downloaded_totals_rescan_days
+        )
+    result: bool = rescan_due
+    return result
+
+
+def refresh_downloaded_totals_if_due(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    settings: RunSettings,
+    now: datetime,
+) -> bool:
+    """
+    Rebuilds the running downloaded totals from disk when a rescan is due, logging any drift it corrects.
+    The refreshed totals are persisted with the next state save rather than with a save of their own.
+    Called by: process_collection_job()
+    """
+    rescanned: bool = is_downloaded_totals_rescan_due(state, settings, now)
+    if rescanned:
+        scanned_files: dict[str, tuple[Path, int, str]] = scan_collection_downloaded_files(storage_root, collection_id)
+        previous_totals: dict[str, object] = replace_downloaded_totals_from_scan(state, scanned_files, now.isoformat())
+        refreshed_totals: dict[str, object] | None = get_downloaded_totals(state)
+        refreshed_file_count: object = refreshed_totals['file_count'] if refreshed_totals is not None else 0
+        refreshed_byte_count: object = refreshed_totals['byte_count'] if refreshed_totals is not None else 0
+        log.info(
+            'Collection %s downloaded totals rebuilt from a full rescan: %s files, %s bytes.',
+            collection_id,
+            refreshed_file_count,
+            refreshed_byte_count,
+        )
+        if previous_totals and (
+            previous_totals.get('file_count') != refreshed_file_count
+            or previous_totals.get('byte_count') != refreshed_byte_count
+        ):
+            log.warning(
+                'Collection %s downloaded totals drifted from %s files, %s bytes to %s files, %s bytes on disk.',
+                collection_id,
+                previous_totals.get('file_count'),
+                previous_totals.get('byte_count'),
+                refreshed_file_count,
+                refreshed_byte_count,
+            )
+    result: bool = rescanned
+    return result
+
+
 def get_observed_seed_ids_from_filenames(filenames: list[str]) -> set[str]:
     """
     Returns distinct parsed seed ids from WARC filenames, excluding unknown-seed placeholders.
     Called by: get_collection_observed_seed_count()
     """
-    result: set[str] = set()
-    for filename in filenames:
-        seed_id: str = extract_warc_seed_id(filename)
-        if seed_id != UNKNOWN_SEED_FOLDER_NAME:
-            result.add(seed_id)
+    parsed_filenames: dict[str, WarcFilename] = parse_warc_filenames(filenames)
+    result: set[str] = {
+        parsed_filename.seed_id
+        for parsed_filename in parsed_filenames.values()
+        if parsed_filename.seed_id != UNKNOWN_SEED_FOLDER_NAME
+    }
     return result
 
 
@@ -921,9 +2519,11 @@ def get_collection_observed_seed_count(
     storage_root: Path,
     collection_id: int,
     discovered_records: list[dict[str, object]],
+    local_seed_ids: Iterable[str] | None = None,
 ) -> int:
     """
     Returns the observed WARC seed count from discovered records and downloaded files.
+    Seeds of downloaded files come from the running totals when given, and from a walk of the tree otherwise.
     Called by: build_collection_final_report()
     """
     discovered_filenames: list[str] = []
@@ -931,8 +2531,13 @@ def get_collection_observed_seed_count(
         filename_value: object = record.get('filename')
         if isinstance(filename_value, str) and filename_value.strip():
             discovered_filenames.append(filename_value.strip())
-    local_filenames: list[str] = [path.name for path in iter_collection_warc_paths(storage_root, collection_id)]
-    seed_ids: set[str] = get_observed_seed_ids_from_filenames(discovered_filenames + local_filenames)
+    seed_ids: set[str]
+    if local_seed_ids is None:
+        local_filenames: list[str] = [path.name for path in iter_collection_warc_paths(storage_root, collection_id)]
+        seed_ids = get_observed_seed_ids_from_filenames(discovered_filenames + local_filenames)
+    else:
+        seed_ids = get_observed_seed_ids_from_filenames(discovered_filenames)
+        seed_ids.update(seed_id for seed_id in local_seed_ids if seed_id != UNKNOWN_SEED_FOLDER_NAME)
     result: int = len(seed_ids)
     return result
 
@@ -942,15 +2547,20 @@ def build_collection_summary_update(
     collection_id: int,
     discovery_completed_at: str,
     observed_seed_count: int = 0,
+    downloaded_totals: tuple[int, int] | None = None,
 ) -> CollectionSummaryUpdate:
     """
     Builds final spreadsheet summary-field values for one collection.
+    Running downloaded totals are used when given; otherwise the collection tree is walked.
     Called by: build_collection_final_report()
     """
     collection_root: Path = storage_root / 'collections' / str(collection_id)
     total_downloaded_count: int
     total_downloaded_size: int
-    total_downloaded_count, total_downloaded_size = get_collection_downloaded_totals(storage_root, collection_id)
+    if downloaded_totals is None:
+        total_downloaded_count, total_downloaded_size = get_collection_downloaded_totals(storage_root, collection_id)
+    else:
+        total_downloaded_count, total_downloaded_size = downloaded_totals
     displayed_download_timestamp: str = format_local_display_timestamp(discovery_completed_at)
     result: CollectionSummaryUpdate = CollectionSummaryUpdate(
         last_download_timestamp=displayed_download_timestamp,
@@ -970,10 +2580,17 @@ def build_collection_final_report(
     download_results: list[DownloadResult],
     fixity_results: list[FixityResult],
     discovered_records: list[dict[str, object]] | None = None,
+    state: dict[str, object] | None = None,
+    deadline_deferred_count: int = 0,
+    disk_space_deferred_count: int = 0,
 ) -> CollectionProcessingReport:
     """
     Builds the final collection status and summary payload for spreadsheet reporting.
-    Called by: process_collection_job()
+    When the collection state carries running downloaded totals, no on-disk walk is needed.
+    Downloads deferred by the run deadline give a non-blocking `stopped-at-run-deadline` status, so the next run starts.
+    Downloads deferred for lack of disk space give the non-blocking `deferred-for-disk-space` status, even when nothing
+    else was planned, so a full volume is never reported as a clean run.
+    Called by: process_collection_job_buffered(), process_collection_job_streaming()
     """
     failure_count: int = sum(1 for result in download_results if not result.success)
     failure_count += sum(1 for result in fixity_results if not result.success)
@@ -990,10 +2607,31 @@ def build_collection_final_report(
         status_main = STATUS_COMPLETED_WITH_SOME_FILE_FAILURES
         operation_noun: str = 'operation' if failure_count == 1 else 'operations'
         status_detail = f'{failure_count} file {operation_noun} failed'
+    if planned_downloads and deadline_deferred_count > 0:
+        status_main = STATUS_STOPPED_AT_RUN_DEADLINE
+        status_detail = f'{status_detail}; {deadline_deferred_count} left for the next run'
+    if disk_space_deferred_count > 0:
+        if not planned_downloads:
+            status_detail = f'{successful_download_count} file {download_noun} completed successfully'
+        status_main = STATUS_DEFERRED_FOR_DISK_SPACE
+        status_detail = f'{status_detail}; {disk_space_deferred_count} deferred for lack of disk space'
+    totals: dict[str, object] | None = get_downloaded_totals(state) if state is not None else None
+    downloaded_totals: tuple[int, int] | None = None
+    local_seed_ids: list[str] | None = None
+    if totals is not None:
+        downloaded_totals = (totals['file_count'], totals['byte_count'])
+        local_seed_ids = list(totals['seed_file_counts'])
+        log.info(
+            'Collection %s final summary totals taken from running totals: %s files, %s bytes.',
+            collection_job.collection_id,
+            downloaded_totals[0],
+            downloaded_totals[1],
+        )
     observed_seed_count: int = get_collection_observed_seed_count(
         storage_root,
         collection_job.collection_id,
         discovery_records,
+        local_seed_ids,
     )
     result: CollectionProcessingReport = CollectionProcessingReport(
         status_update=CollectionProcessingStatusUpdate(
@@ -1006,6 +2644,7 @@ def build_collection_final_report(
             collection_id=collection_job.collection_id,
             discovery_completed_at=discovery_completed_at,
             observed_seed_count=observed_seed_count,
+            downloaded_totals=downloaded_totals,
         ),
     )
     return result
@@ -1057,7 +2696,7 @@ def determine_collection_discovery_mode(
 
 
 def write_collection_start_status(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     collection_job: CollectionJob,
     discovery_mode: str,
@@ -1082,7 +2721,7 @@ def write_collection_start_status(
 
 
 def write_collection_download_planning_status(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     collection_job: CollectionJob,
     discovered_warc_count: int,
@@ -1096,7 +2735,7 @@ def write_collection_download_planning_status(
 
 
 def write_collection_no_new_files_status(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     collection_job: CollectionJob,
     discovered_warc_count: int,
@@ -1110,7 +2749,7 @@ def write_collection_no_new_files_status(
 
 
 def write_collection_download_start_status(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     collection_job: CollectionJob,
     discovered_warc_count: int,
@@ -1128,7 +2767,7 @@ def write_collection_download_start_status(
 
 
 def write_collection_download_progress_status(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     collection_job: CollectionJob,
     progress_detail: str,
@@ -1147,65 +2786,218 @@ def write_collection_download_progress_status(
 
 
 def write_collection_final_report(
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
     collection_job: CollectionJob,
     report: CollectionProcessingReport,
 ) -> None:
     """
-    Writes the final collection-level status and summary fields.
-    Called by: process_collection_job()
+    Writes the final collection-level status and summary fields.
+    Called by: process_collection_job()
+    """
+    update_collection_final_reporting(
+        worksheet,
+        header_location,
+        collection_job.row_number,
+        report.status_update,
+        report.summary_update,
+    )
+
+
+def process_collection_job(
+    client: httpx.Client,
+    collection_job: CollectionJob,
+    storage_root: Path,
+    wasapi_base_url: str,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
+    header_location: HeaderLocation,
+    run_settings: RunSettings | None = None,
+    download_slots: threading.BoundedSemaphore | None = None,
+    transfer_engine: AsyncTransferEngine | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+    run_deadline: RunDeadline | None = None,
+    fair_share: CollectionFairShare | None = None,
+) -> CollectionProcessingReport:
+    """
+    Processes one collection through the implemented sequential orchestration stages and returns final reporting values.
+    When an async transfer engine is given, discovery page fetches and downloads run on its event loop.
+    In sqlite persistence mode the collection's state database stays open for the whole collection run.
+    Called by: run_collection_orchestration()
+    """
+    settings: RunSettings = run_settings if run_settings is not None else RunSettings()
+    if settings.state_persistence_mode == STATE_PERSISTENCE_MODE_SQLITE:
+        hold_state_database(storage_root, collection_job.collection_id)
+    try:
+        state: dict[str, object] = load_collection_state_for_run(
+            storage_root,
+            collection_job.collection_id,
+            settings.state_persistence_mode,
+        )
+        refresh_downloaded_totals_if_due(storage_root, collection_job.collection_id, state, settings, datetime.now(UTC))
+        checkpoint_store_time_max: object = state.get('enumeration_checkpoint_store_time_max')
+        checkpoint_value: str | None = checkpoint_store_time_max if isinstance(checkpoint_store_time_max, str) else None
+        discovery_mode: str
+        after_datetime: datetime | None
+        discovery_mode, after_datetime = determine_collection_discovery_mode(checkpoint_value, datetime.now(UTC))
+
+        if after_datetime is None:
+            log.info(
+                'Processing collection %s in %s mode with no store-time-after boundary.',
+                collection_job.collection_id,
+                discovery_mode,
+            )
+        else:
+            log.info(
+                'Processing collection %s in %s mode with store-time-after boundary %s.',
+                collection_job.collection_id,
+                discovery_mode,
+                after_datetime.isoformat(),
+            )
+
+        write_collection_start_status(worksheet, header_location, collection_job, discovery_mode, after_datetime)
+        log.info('Collection %s spreadsheet status updated: discovery in progress.', collection_job.collection_id)
+
+        result: CollectionProcessingReport
+        if settings.discovery_pipeline_mode == DISCOVERY_PIPELINE_MODE_STREAMING:
+            result = process_collection_job_streaming(
+                client,
+                collection_job,
+                storage_root,
+                wasapi_base_url,
+                worksheet,
+                header_location,
+                settings,
+                state,
+                after_datetime,
+                download_slots,
+                transfer_engine,
+                bandwidth_limiter,
+                disk_space_admission,
+                run_deadline,
+                fair_share,
+            )
+        else:
+            result = process_collection_job_buffered(
+                client,
+                collection_job,
+                storage_root,
+                wasapi_base_url,
+                worksheet,
+                header_location,
+                settings,
+                state,
+                after_datetime,
+                download_slots,
+                transfer_engine,
+                bandwidth_limiter,
+                disk_space_admission,
+                run_deadline,
+                fair_share,
+            )
+    finally:
+        release_state_database(storage_root, collection_job.collection_id)
+    return result
+
+
+def fetch_collection_discovery_for_run(
+    client: httpx.Client,
+    transfer_engine: AsyncTransferEngine | None,
+    wasapi_base_url: str,
+    collection_id: int,
+    after_datetime: datetime | None,
+    page_fetch_concurrency: int,
+) -> DiscoveryResult:
+    """
+    Enumerates every discovery page with the sync client, or on the async engine's event loop when one is given.
+    Called by: process_collection_job_buffered()
+    """
+    result: DiscoveryResult
+    if transfer_engine is None:
+        result = fetch_collection_discovery(
+            client=client,
+            base_url=wasapi_base_url,
+            collection_id=collection_id,
+            after_datetime=after_datetime,
+            page_fetch_concurrency=page_fetch_concurrency,
+        )
+    else:
+        result = transfer_engine.run(
+            fetch_collection_discovery_async(
+                client=transfer_engine.client,
+                base_url=wasapi_base_url,
+                collection_id=collection_id,
+                after_datetime=after_datetime,
+                page_fetch_concurrency=page_fetch_concurrency,
+                request_slots=transfer_engine.get_host_slots(wasapi_base_url),
+            )
+        )
+    return result
+
+
+def iter_discovery_pages_for_run(
+    client: httpx.Client,
+    transfer_engine: AsyncTransferEngine | None,
+    wasapi_base_url: str,
+    collection_id: int,
+    after_datetime: datetime | None,
+    page_fetch_concurrency: int,
+) -> Iterator[DiscoveryPage]:
+    """
+    Streams discovery pages with the sync client, or from the async engine's event loop when one is given.
+    Called by: iter_streamed_planned_downloads()
     """
-    update_collection_final_reporting(
-        worksheet,
-        header_location,
-        collection_job.row_number,
-        report.status_update,
-        report.summary_update,
-    )
+    result: Iterator[DiscoveryPage]
+    if transfer_engine is None:
+        result = iter_collection_discovery_pages(
+            client,
+            wasapi_base_url,
+            collection_id,
+            after_datetime,
+            page_fetch_concurrency=page_fetch_concurrency,
+        )
+    else:
+        result = transfer_engine.iterate(
+            iter_collection_discovery_pages_async(
+                transfer_engine.client,
+                wasapi_base_url,
+                collection_id,
+                after_datetime,
+                page_fetch_concurrency=page_fetch_concurrency,
+                request_slots=transfer_engine.get_host_slots(wasapi_base_url),
+            )
+        )
+    return result
 
 
-def process_collection_job(
+def process_collection_job_buffered(
     client: httpx.Client,
     collection_job: CollectionJob,
     storage_root: Path,
     wasapi_base_url: str,
-    worksheet: gspread.Worksheet,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
     header_location: HeaderLocation,
+    settings: RunSettings,
+    state: dict[str, object],
+    after_datetime: datetime | None,
+    download_slots: threading.BoundedSemaphore | None = None,
+    transfer_engine: AsyncTransferEngine | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+    run_deadline: RunDeadline | None = None,
+    fair_share: CollectionFairShare | None = None,
 ) -> CollectionProcessingReport:
     """
-    Processes one collection through the implemented sequential orchestration stages and returns final reporting values.
-    Called by: run_collection_orchestration()
+    Enumerates every discovery page, then plans, downloads, and reports one collection.
+    Called by: process_collection_job()
     """
-    state: dict[str, object] = load_collection_state(storage_root, collection_job.collection_id)
-    checkpoint_store_time_max: object = state.get('enumeration_checkpoint_store_time_max')
-    checkpoint_value: str | None = checkpoint_store_time_max if isinstance(checkpoint_store_time_max, str) else None
-    discovery_mode: str
-    after_datetime: datetime | None
-    discovery_mode, after_datetime = determine_collection_discovery_mode(checkpoint_value, datetime.now(UTC))
-
-    if after_datetime is None:
-        log.info(
-            'Processing collection %s in %s mode with no store-time-after boundary.',
-            collection_job.collection_id,
-            discovery_mode,
-        )
-    else:
-        log.info(
-            'Processing collection %s in %s mode with store-time-after boundary %s.',
-            collection_job.collection_id,
-            discovery_mode,
-            after_datetime.isoformat(),
-        )
-
-    write_collection_start_status(worksheet, header_location, collection_job, discovery_mode, after_datetime)
-    log.info('Collection %s spreadsheet status updated: discovery in progress.', collection_job.collection_id)
-
-    discovery_result: DiscoveryResult = fetch_collection_discovery(
-        client=client,
-        base_url=wasapi_base_url,
-        collection_id=collection_job.collection_id,
-        after_datetime=after_datetime,
+    discovery_result: DiscoveryResult = fetch_collection_discovery_for_run(
+        client,
+        transfer_engine,
+        wasapi_base_url,
+        collection_job.collection_id,
+        after_datetime,
+        settings.discovery_page_fetch_concurrency,
     )
     log.info(
         'Collection %s discovery returned %s records across %s requests.',
@@ -1217,7 +3009,8 @@ def process_collection_job(
 
     if discovery_result.completed_successfully:
         state['enumeration_checkpoint_store_time_max'] = discovery_result.max_observed_store_time
-        save_collection_state(storage_root, collection_job.collection_id, state)
+        state[LAST_SUCCESSFUL_DISCOVERY_AT_KEY] = datetime.now(UTC).isoformat()
+        save_collection_state_for_run(storage_root, collection_job.collection_id, state, settings.state_persistence_mode)
         log.info(
             'Saved collection %s state with checkpoint %s.',
             collection_job.collection_id,
@@ -1253,19 +3046,41 @@ def process_collection_job(
     )
     active_downloads: list[PlannedDownload]
     evaluation_reason_counts: dict[str, int]
-    active_downloads, evaluation_reason_counts = build_evaluated_active_downloads(planned_downloads, state)
+    fixity_cache: dict[str, object] = load_collection_fixity_cache(
+        storage_root,
+        collection_job.collection_id,
+        settings.fixity_validation_mode,
+    )
+    saved_fixity_cache: dict[str, object] = dict(fixity_cache)
+    active_downloads, evaluation_reason_counts = build_evaluated_active_downloads(planned_downloads, state, fixity_cache)
+    active_downloads = order_planned_downloads(active_downloads, settings.download_scheduling_policy)
+    deferred_downloads: list[PlannedDownload]
+    active_downloads, deferred_downloads = admit_planned_downloads(
+        collection_job.collection_id,
+        active_downloads,
+        evaluation_reason_counts,
+        disk_space_admission,
+    )
+    saved_fixity_cache = save_fixity_cache_if_changed(
+        storage_root,
+        collection_job.collection_id,
+        fixity_cache,
+        saved_fixity_cache,
+    )
     log_active_download_evaluation_counts(
         collection_job.collection_id,
         len(planned_downloads),
         len(active_downloads),
         evaluation_reason_counts,
     )
+    log_download_schedule_projection(collection_job.collection_id, active_downloads, settings)
     persist_planned_downloads_to_state(
         storage_root=storage_root,
         collection_id=collection_job.collection_id,
         state=state,
-        planned_downloads=active_downloads,
+        planned_downloads=active_downloads + deferred_downloads,
         discovered_at=datetime.now(UTC).isoformat(),
+        state_persistence_mode=settings.state_persistence_mode,
     )
     write_collection_download_planning_status(
         worksheet,
@@ -1314,7 +3129,19 @@ def process_collection_job(
             progress_detail,
             discovered_warc_count,
         ),
+        run_settings=settings,
+        fixity_cache=fixity_cache,
+        download_slots=download_slots,
+        transfer_engine=transfer_engine,
+        bandwidth_limiter=bandwidth_limiter,
+        disk_space_admission=disk_space_admission,
+        run_deadline=run_deadline,
+        fair_share=fair_share,
     )
+    if settings.state_persistence_mode == STATE_PERSISTENCE_MODE_JOURNAL and active_downloads:
+        compact_collection_state_journal(storage_root, collection_job.collection_id, state)
+    log_collection_manifest_status_counts(storage_root, collection_job.collection_id, settings.state_persistence_mode)
+    save_fixity_cache_if_changed(storage_root, collection_job.collection_id, fixity_cache, saved_fixity_cache)
     log_collection_download_summary(
         collection_job,
         pending_download_count,
@@ -1330,6 +3157,281 @@ def process_collection_job(
         download_results=download_results,
         fixity_results=fixity_results,
         discovered_records=discovery_result.records,
+        state=state,
+        deadline_deferred_count=(
+            run_deadline.get_deferred_count(collection_job.collection_id) if run_deadline is not None else 0
+        ),
+        disk_space_deferred_count=len(deferred_downloads),
+    )
+    write_collection_final_report(worksheet, header_location, collection_job, result)
+    log.info('Collection %s spreadsheet status updated: final outcome written.', collection_job.collection_id)
+    return result
+
+
+def plan_streamed_discovery_page(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    page: DiscoveryPage,
+    fixity_cache: dict[str, object],
+    settings: RunSettings,
+    tally: StreamedDiscoveryTally,
+    emitted_filenames: set[str],
+    disk_space_admission: DiskSpaceAdmission | None = None,
+) -> list[PlannedDownload]:
+    """
+    Plans, evaluates, and persists one streamed discovery page, returning the downloads it adds to the pipeline.
+    Called by: iter_streamed_planned_downloads()
+    """
+    tally.discovered_warc_count += count_discovered_warc_filename_records(page.records)
+    tally.pending_download_count += count_pending_download_candidates(page.records, state)
+    for record in page.records:
+        filename_value: object = record.get('filename')
+        if isinstance(filename_value, str) and filename_value.strip():
+            tally.discovered_filenames.append(filename_value.strip())
+    page_planned_downloads: list[PlannedDownload] = [
+        planned_download
+        for planned_download in build_planned_downloads(storage_root, collection_id, page.records)
+        if planned_download.filename not in emitted_filenames
+    ]
+    active_downloads: list[PlannedDownload] = plan_streamed_downloads(
+        storage_root,
+        collection_id,
+        state,
+        page_planned_downloads,
+        fixity_cache,
+        settings,
+        tally,
+        emitted_filenames,
+        disk_space_admission,
+    )
+    log.info(
+        'Collection %s discovery page %s added %s of %s records to the download pipeline.',
+        collection_id,
+        page.page_number,
+        len(active_downloads),
+        len(page.records),
+    )
+    return active_downloads
+
+
+def plan_streamed_downloads(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    planned_downloads: list[PlannedDownload],
+    fixity_cache: dict[str, object],
+    settings: RunSettings,
+    tally: StreamedDiscoveryTally,
+    emitted_filenames: set[str],
+    disk_space_admission: DiskSpaceAdmission | None = None,
+) -> list[PlannedDownload]:
+    """
+    Evaluates, orders, and admits streamed planned downloads, persists the active and disk-space-deferred ones to
+    state, and records them in the tally. The scheduling policy orders each page's batch, since later pages have not
+    arrived yet.
+    Called by: plan_streamed_discovery_page(), iter_streamed_planned_downloads()
+    """
+    active_downloads: list[PlannedDownload]
+    reason_counts: dict[str, int]
+    active_downloads, reason_counts = build_evaluated_active_downloads(planned_downloads, state, fixity_cache)
+    active_downloads = order_planned_downloads(active_downloads, settings.download_scheduling_policy)
+    deferred_downloads: list[PlannedDownload]
+    active_downloads, deferred_downloads = admit_planned_downloads(
+        collection_id,
+        active_downloads,
+        reason_counts,
+        disk_space_admission,
+    )
+    for reason, count in reason_counts.items():
+        tally.evaluation_reason_counts[reason] = tally.evaluation_reason_counts.get(reason, 0) + count
+    emitted_filenames.update(planned_download.filename for planned_download in planned_downloads)
+    persist_planned_downloads_to_state(
+        storage_root=storage_root,
+        collection_id=collection_id,
+        state=state,
+        planned_downloads=active_downloads + deferred_downloads,
+        discovered_at=datetime.now(UTC).isoformat(),
+        state_persistence_mode=settings.state_persistence_mode,
+    )
+    tally.active_downloads.extend(active_downloads)
+    return active_downloads
+
+
+def iter_streamed_planned_downloads(
+    client: httpx.Client,
+    wasapi_base_url: str,
+    storage_root: Path,
+    collection_id: int,
+    after_datetime: datetime | None,
+    state: dict[str, object],
+    fixity_cache: dict[str, object],
+    settings: RunSettings,
+    tally: StreamedDiscoveryTally,
+    transfer_engine: AsyncTransferEngine | None = None,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+) -> Iterator[PlannedDownload]:
+    """
+    Yields active planned downloads page by page as WASAPI discovery streams in, then reconciliation retries.
+    A discovery failure is stored on the tally instead of raised, so in-flight downloads are still recorded.
+    Called by: process_collection_job_streaming()
+    """
+    emitted_filenames: set[str] = set()
+    try:
+        for page in iter_discovery_pages_for_run(
+            client,
+            transfer_engine,
+            wasapi_base_url,
+            collection_id,
+            after_datetime,
+            settings.discovery_page_fetch_concurrency,
+        ):
+            tally.max_observed_store_time = page.max_observed_store_time
+            yield from plan_streamed_discovery_page(
+                storage_root,
+                collection_id,
+                state,
+                page,
+                fixity_cache,
+                settings,
+                tally,
+                emitted_filenames,
+                disk_space_admission,
+            )
+        tally.completed_successfully = True
+    except WasapiDiscoveryError as exc:
+        log.error('Collection %s streamed discovery stopped: %s', collection_id, exc)
+        tally.discovery_error = exc
+    if tally.completed_successfully:
+        reconciliation_downloads: list[PlannedDownload] = [
+            planned_download
+            for planned_download in build_reconciliation_retry_downloads(storage_root, collection_id, state)
+            if planned_download.filename not in emitted_filenames
+        ]
+        yield from plan_streamed_downloads(
+            storage_root,
+            collection_id,
+            state,
+            reconciliation_downloads,
+            fixity_cache,
+            settings,
+            tally,
+            emitted_filenames,
+            disk_space_admission,
+        )
+
+
+def process_collection_job_streaming(
+    client: httpx.Client,
+    collection_job: CollectionJob,
+    storage_root: Path,
+    wasapi_base_url: str,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
+    header_location: HeaderLocation,
+    settings: RunSettings,
+    state: dict[str, object],
+    after_datetime: datetime | None,
+    download_slots: threading.BoundedSemaphore | None = None,
+    transfer_engine: AsyncTransferEngine | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+    run_deadline: RunDeadline | None = None,
+    fair_share: CollectionFairShare | None = None,
+) -> CollectionProcessingReport:
+    """
+    Plans and downloads one collection while discovery pages are still arriving, then reports it.
+    The enumeration checkpoint advances only after every page was fetched and the pipeline has drained.
+    Called by: process_collection_job()
+    """
+    tally: StreamedDiscoveryTally = StreamedDiscoveryTally()
+    fixity_cache: dict[str, object] = load_collection_fixity_cache(
+        storage_root,
+        collection_job.collection_id,
+        settings.fixity_validation_mode,
+    )
+    saved_fixity_cache: dict[str, object] = dict(fixity_cache)
+    write_collection_download_start_status(worksheet, header_location, collection_job, 0, 0)
+    log.info(
+        'Collection %s spreadsheet status updated: downloading in progress while discovery streams.',
+        collection_job.collection_id,
+    )
+    download_results: list[DownloadResult]
+    fixity_results: list[FixityResult]
+    download_results, fixity_results = run_planned_downloads(
+        client,
+        storage_root,
+        collection_job.collection_id,
+        state,
+        iter_streamed_planned_downloads(
+            client,
+            wasapi_base_url,
+            storage_root,
+            collection_job.collection_id,
+            after_datetime,
+            state,
+            fixity_cache,
+            settings,
+            tally,
+            transfer_engine,
+            disk_space_admission,
+        ),
+        lambda progress_detail: write_collection_download_progress_status(
+            worksheet,
+            header_location,
+            collection_job,
+            progress_detail,
+            tally.discovered_warc_count,
+        ),
+        run_settings=settings,
+        fixity_cache=fixity_cache,
+        planned_download_count_source=lambda: len(tally.active_downloads),
+        download_slots=download_slots,
+        transfer_engine=transfer_engine,
+        bandwidth_limiter=bandwidth_limiter,
+        disk_space_admission=disk_space_admission,
+        run_deadline=run_deadline,
+        fair_share=fair_share,
+    )
+    save_fixity_cache_if_changed(storage_root, collection_job.collection_id, fixity_cache, saved_fixity_cache)
+    if settings.state_persistence_mode == STATE_PERSISTENCE_MODE_JOURNAL and tally.active_downloads:
+        compact_collection_state_journal(storage_root, collection_job.collection_id, state)
+    if tally.discovery_error is not None:
+        raise tally.discovery_error
+    log_active_download_evaluation_counts(
+        collection_job.collection_id,
+        sum(tally.evaluation_reason_counts.values()),
+        len(tally.active_downloads),
+        tally.evaluation_reason_counts,
+    )
+    state['enumeration_checkpoint_store_time_max'] = tally.max_observed_store_time
+    state[LAST_SUCCESSFUL_DISCOVERY_AT_KEY] = datetime.now(UTC).isoformat()
+    save_collection_state_for_run(storage_root, collection_job.collection_id, state, settings.state_persistence_mode)
+    log.info(
+        'Saved collection %s state with checkpoint %s after streamed discovery completed.',
+        collection_job.collection_id,
+        tally.max_observed_store_time,
+    )
+    log_collection_manifest_status_counts(storage_root, collection_job.collection_id, settings.state_persistence_mode)
+    log_collection_download_summary(
+        collection_job,
+        tally.pending_download_count,
+        len(tally.active_downloads),
+        download_results,
+        fixity_results,
+    )
+    result: CollectionProcessingReport = build_collection_final_report(
+        storage_root=storage_root,
+        collection_job=collection_job,
+        discovery_completed_at=datetime.now(UTC).isoformat(),
+        planned_downloads=tally.active_downloads,
+        download_results=download_results,
+        fixity_results=fixity_results,
+        discovered_records=[{'filename': filename} for filename in tally.discovered_filenames],
+        state=state,
+        deadline_deferred_count=(
+            run_deadline.get_deferred_count(collection_job.collection_id) if run_deadline is not None else 0
+        ),
+        disk_space_deferred_count=tally.evaluation_reason_counts.get('deferred_disk_space', 0),
     )
     write_collection_final_report(worksheet, header_location, collection_job, result)
     log.info('Collection %s spreadsheet status updated: final outcome written.', collection_job.collection_id)
@@ -1372,14 +3474,46 @@ def get_manifest_expected_size(state: dict[str, object], filename: str) -> int |
     return result
 
 
+def get_retry_cooldown_reason(entry_value: object, now: datetime) -> str | None:
+    """
+    Returns `retry_cooldown` or `quarantined` while a failed entry's `next_retry_after` is still in the future.
+    Called by: evaluate_planned_download_need()
+    """
+    result: str | None = None
+    if isinstance(entry_value, dict) and entry_value.get('status') in RETRY_WAITING_STATUSES:
+        next_retry_value: object = entry_value.get('next_retry_after')
+        next_retry_after: datetime | None = None
+        if isinstance(next_retry_value, str):
+            try:
+                next_retry_after = datetime_module.datetime.fromisoformat(next_retry_value)
+            except ValueError:
+                next_retry_after = None
+        if next_retry_after is not None and next_retry_after > now:
+            result = 'quarantined' if entry_value.get('status') == 'quarantined' else 'retry_cooldown'
+    return result
+
+
 def evaluate_planned_download_need(
     planned_download: PlannedDownload,
     state: dict[str, object],
+    fixity_cache: dict[str, object] | None = None,
+    now: datetime | None = None,
 ) -> DownloadNeedEvaluation:
     """
     Evaluates whether one planned candidate still requires backup work now.
+    Files still cooling down after a failure are skipped from the manifest alone, before any disk access.
     Called by: build_evaluated_active_downloads()
     """
+    files_value: object = state.get('files')
+    files_state: dict[object, object] = files_value if isinstance(files_value, dict) else {}
+    entry_value: object = files_state.get(planned_download.filename)
+    cooldown_reason: str | None = get_retry_cooldown_reason(
+        entry_value,
+        now if now is not None else datetime_module.datetime.now(UTC),
+    )
+    if cooldown_reason is not None:
+        return DownloadNeedEvaluation(needs_work=False, reason=cooldown_reason)
+
     warc_path: Path = planned_download.planned_paths.warc_path
     if not warc_path.exists():
         return DownloadNeedEvaluation(needs_work=True, reason='missing_warc')
@@ -1392,15 +3526,13 @@ def evaluate_planned_download_need(
         warc_path=warc_path,
         sha256_path=planned_download.planned_paths.sha256_path,
         json_path=planned_download.planned_paths.json_path,
+        fixity_cache=fixity_cache,
     )
     if not fixity_validation.is_valid:
         reason: str = fixity_validation.error_reason or 'invalid_fixity'
         return DownloadNeedEvaluation(needs_work=True, reason=reason)
 
-    files_value: object = state.get('files')
-    files_state: dict[object, object] = files_value if isinstance(files_value, dict) else {}
-    entry_value: object = files_state.get(planned_download.filename)
-    if isinstance(entry_value, dict) and entry_value.get('status') == 'failed':
+    if isinstance(entry_value, dict) and entry_value.get('status') in RETRY_WAITING_STATUSES:
         return DownloadNeedEvaluation(needs_work=True, reason='retry_after_prior_failure')
 
     return DownloadNeedEvaluation(needs_work=False, reason='already_complete')
@@ -1409,6 +3541,7 @@ def evaluate_planned_download_need(
 def build_evaluated_active_downloads(
     planned_downloads: list[PlannedDownload],
     state: dict[str, object],
+    fixity_cache: dict[str, object] | None = None,
 ) -> tuple[list[PlannedDownload], dict[str, int]]:
     """
     Builds the evaluated active-download list and a summary of evaluation reasons.
@@ -1416,8 +3549,9 @@ def build_evaluated_active_downloads(
     """
     active_downloads: list[PlannedDownload] = []
     reason_counts: dict[str, int] = {}
+    now: datetime = datetime_module.datetime.now(UTC)
     for planned_download in planned_downloads:
-        evaluation: DownloadNeedEvaluation = evaluate_planned_download_need(planned_download, state)
+        evaluation: DownloadNeedEvaluation = evaluate_planned_download_need(planned_download, state, fixity_cache, now)
         reason_counts[evaluation.reason] = reason_counts.get(evaluation.reason, 0) + 1
         if evaluation.needs_work:
             active_downloads.append(planned_download)
@@ -1425,6 +3559,207 @@ def build_evaluated_active_downloads(
     return result
 
 
+def get_store_time_sort_value(planned_download: PlannedDownload) -> float | None:
+    """
+    Returns the planned download's WASAPI store-time as a POSIX timestamp, or None when it is missing or unparsable.
+    Called by: order_planned_downloads()
+    """
+    result: float | None = None
+    if planned_download.store_time is not None:
+        try:
+            result = parse_wasapi_datetime(planned_download.store_time).timestamp()
+        except ValueError:
+            result = None
+    return result
+
+
+def interleave_planned_downloads_by_seed(planned_downloads: list[PlannedDownload]) -> list[PlannedDownload]:
+    """
+    Takes one file from each seed in turn, keeping each seed's own order, so no single seed monopolises the workers.
+    Called by: order_planned_downloads()
+    """
+    seed_queues: dict[str, list[PlannedDownload]] = {}
+    for planned_download in planned_downloads:
+        seed_queues.setdefault(planned_download.planned_paths.seed_id, []).append(planned_download)
+    result: list[PlannedDownload] = []
+    round_index: int = 0
+    while len(result) < len(planned_downloads):
+        for seed_downloads in seed_queues.values():
+            if round_index < len(seed_downloads):
+                result.append(seed_downloads[round_index])
+        round_index += 1
+    return result
+
+
+def order_planned_downloads(planned_downloads: list[PlannedDownload], policy: str) -> list[PlannedDownload]:
+    """
+    Orders active downloads by the scheduling policy. Size- and time-based policies keep files lacking that WASAPI
+    field at the end, and every policy is stable, so ties keep discovery order.
+    - `largest_first` shortens the overall makespan when several workers share the list.
+    - `smallest_first` completes the most files in a limited window.
+    - `newest_first` fetches the most recently stored WARCs first.
+    - `seed_round_robin` alternates between seeds.
+    Called by: process_collection_job_buffered(), plan_streamed_downloads()
+    """
+    result: list[PlannedDownload] = list(planned_downloads)
+    if policy == DOWNLOAD_SCHEDULING_POLICY_LARGEST_FIRST:
+        result.sort(
+            key=lambda planned_download: (
+                planned_download.expected_size is None,
+                -(planned_download.expected_size or 0),
+            )
+        )
+    elif policy == DOWNLOAD_SCHEDULING_POLICY_SMALLEST_FIRST:
+        result.sort(
+            key=lambda planned_download: (
+                planned_download.expected_size is None,
+                planned_download.expected_size or 0,
+            )
+        )
+    elif policy == DOWNLOAD_SCHEDULING_POLICY_NEWEST_FIRST:
+        store_times: dict[str, float | None] = {
+            planned_download.filename: get_store_time_sort_value(planned_download) for planned_download in result
+        }
+        result.sort(
+            key=lambda planned_download: (
+                store_times[planned_download.filename] is None,
+                -(store_times[planned_download.filename] or 0.0),
+            )
+        )
+    elif policy == DOWNLOAD_SCHEDULING_POLICY_SEED_ROUND_ROBIN:
+        result = interleave_planned_downloads_by_seed(result)
+    return result
+
+
+def project_download_completion_seconds(
+    planned_downloads: list[PlannedDownload],
+    worker_count: int,
+    stream_bytes_per_second: float,
+) -> list[float]:
+    """
+    Projects when each download finishes, in seconds from the start, by handing files in order to whichever worker
+    frees up first at the given per-stream rate. Files without a WASAPI size are projected as instant.
+    Called by: log_download_schedule_projection()
+    """
+    worker_free_times: list[float] = [0.0] * max(1, worker_count)
+    result: list[float] = []
+    for planned_download in planned_downloads:
+        start_seconds: float = heapq.heappop(worker_free_times)
+        finish_seconds: float = start_seconds + (planned_download.expected_size or 0) / stream_bytes_per_second
+        heapq.heappush(worker_free_times, finish_seconds)
+        result.append(finish_seconds)
+    return result
+
+
+def log_download_schedule_projection(
+    collection_id: int,
+    planned_downloads: list[PlannedDownload],
+    settings: RunSettings,
+) -> None:
+    """
+    Logs the scheduling policy with projected completion times for the ordered active downloads.
+    The per-stream rate is the configured projection rate, lowered to a fair share of any scheduled bandwidth limit.
+    Called by: process_collection_job_buffered()
+    """
+    if not planned_downloads:
+        return
+
+    worker_count: int = max(1, min(settings.download_concurrency, len(planned_downloads)))
+    started_at: datetime = datetime_module.datetime.now(UTC)
+    stream_bytes_per_second: float = float(settings.projected_stream_bytes_per_second)
+    scheduled_bytes_per_second: int | None = get_scheduled_bytes_per_second(
+        settings.bandwidth_schedule,
+        started_at.astimezone(),
+    )
+    if scheduled_bytes_per_second is not None:
+        stream_bytes_per_second = min(stream_bytes_per_second, scheduled_bytes_per_second / worker_count)
+    completion_seconds: list[float] = project_download_completion_seconds(
+        planned_downloads,
+        worker_count,
+        stream_bytes_per_second,
+    )
+    total_bytes: int = sum(planned_download.expected_size or 0 for planned_download in planned_downloads)
+    half_done_seconds: float = sorted(completion_seconds)[(len(completion_seconds) - 1) // 2]
+    log.info(
+        'Collection %s scheduling %s downloads (%s) with policy %s on %s workers at %.2f MB/s per stream; '
+        'projected half done after %.0f seconds and all done after %.0f seconds, around %s.',
+        collection_id,
+        len(planned_downloads),
+        format_downloaded_size_gb(total_bytes),
+        settings.download_scheduling_policy,
+        worker_count,
+        stream_bytes_per_second / 1_000_000,
+        half_done_seconds,
+        max(completion_seconds),
+        format_local_display_timestamp(
+            (started_at + datetime_module.timedelta(seconds=max(completion_seconds))).isoformat()
+        ),
+    )
+    for planned_download, finish_seconds in zip(planned_downloads, completion_seconds):
+        log.debug(
+            'Collection %s projected %s to finish after %.0f seconds.',
+            collection_id,
+            planned_download.filename,
+            finish_seconds,
+        )
+
+
+def get_remaining_download_bytes(planned_download: PlannedDownload) -> int:
+    """
+    Returns how many more bytes one planned download will write: zero when the WARC already exists or WASAPI gave no
+    size, otherwise the advertised size less any resumable partial file.
+    Called by: admit_planned_downloads()
+    """
+    result: int = 0
+    warc_path: Path = planned_download.planned_paths.warc_path
+    if planned_download.expected_size is not None and not warc_path.exists():
+        partial_path: Path = build_partial_download_path(warc_path)
+        partial_size: int = partial_path.stat().st_size if partial_path.exists() else 0
+        result = max(0, planned_download.expected_size - partial_size)
+    return result
+
+
+def admit_planned_downloads(
+    collection_id: int,
+    planned_downloads: list[PlannedDownload],
+    reason_counts: dict[str, int],
+    disk_space_admission: DiskSpaceAdmission | None,
+) -> tuple[list[PlannedDownload], list[PlannedDownload]]:
+    """
+    Admits active downloads in priority order while the storage volume keeps its reserve free, deferring the rest.
+    Returns the admitted and the deferred downloads. Deferred files are counted under `deferred_disk_space`; callers
+    persist them as pending manifest entries so reconciliation picks them up again once space is freed, even after the
+    discovery checkpoint has moved past them.
+    Called by: process_collection_job_buffered(), plan_streamed_downloads()
+    """
+    admitted_downloads: list[PlannedDownload] = planned_downloads
+    deferred_downloads: list[PlannedDownload] = []
+    if disk_space_admission is not None and planned_downloads:
+        admitted_downloads = []
+        deferred_bytes: int = 0
+        for planned_download in planned_downloads:
+            needed_bytes: int = get_remaining_download_bytes(planned_download)
+            if disk_space_admission.admit(planned_download.planned_paths.warc_path, needed_bytes):
+                admitted_downloads.append(planned_download)
+            else:
+                deferred_downloads.append(planned_download)
+                deferred_bytes += needed_bytes
+        deferred_count: int = len(deferred_downloads)
+        if deferred_count:
+            reason_counts['deferred_disk_space'] = reason_counts.get('deferred_disk_space', 0) + deferred_count
+            log.warning(
+                'Collection %s deferred %s planned downloads (%s) for lack of disk space; %s unreserved above the '
+                '%s reserve.',
+                collection_id,
+                deferred_count,
+                format_downloaded_size_gb(deferred_bytes),
+                format_downloaded_size_gb(max(0, disk_space_admission.get_unreserved_bytes())),
+                format_downloaded_size_gb(disk_space_admission.reserve_bytes),
+            )
+    result: tuple[list[PlannedDownload], list[PlannedDownload]] = (admitted_downloads, deferred_downloads)
+    return result
+
+
 def log_active_download_evaluation_counts(
     collection_id: int,
     merged_count: int,
@@ -1442,3 +3777,34 @@ def log_active_download_evaluation_counts(
         merged_count,
         reason_counts,
     )
+
+
+def load_collection_fixity_cache(storage_root: Path, collection_id: int, fixity_validation_mode: str) -> dict[str, object]:
+    """
+    Loads the collection's fixity cache, or starts an empty one when full re-verification is requested.
+    Called by: process_collection_job()
+    """
+    result: dict[str, object] = {}
+    if fixity_validation_mode == FIXITY_VALIDATION_MODE_FULL_REVERIFICATION:
+        log.info('Collection %s fixity cache bypassed; every existing WARC will be rehashed.', collection_id)
+    else:
+        result = load_fixity_cache(storage_root, collection_id)
+    return result
+
+
+def save_fixity_cache_if_changed(
+    storage_root: Path,
+    collection_id: int,
+    fixity_cache: dict[str, object],
+    saved_fixity_cache: dict[str, object],
+) -> dict[str, object]:
+    """
+    Saves the fixity cache when it differs from the last saved copy and returns the new saved copy.
+    Called by: process_collection_job()
+    """
+    result: dict[str, object] = saved_fixity_cache
+    if fixity_cache != saved_fixity_cache:
+        save_fixity_cache(storage_root, collection_id, fixity_cache)
+        log.info('Saved collection %s fixity cache with %s verified files.', collection_id, len(fixity_cache))
+        result = dict(fixity_cache)
+    return result
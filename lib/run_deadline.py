@@ -0,0 +1,113 @@
+import logging
+import re
+import threading
+from datetime import datetime, timedelta
+
+log: logging.Logger = logging.getLogger(__name__)
+
+CLOCK_DEADLINE_PATTERN: re.Pattern[str] = re.compile(r'^(?P<hour>\d{1,2}):(?P<minute>\d{2})$')
+DEADLINE_SAFETY_FACTOR: float = 1.25
+
+
+class RunDeadline:
+    """
+    Decides, run-wide, whether a transfer can still finish before the deadline, using the per-stream throughput
+    observed so far in this run (or a configured estimate until the first transfer completes).
+    Transfers already running are never interrupted; only new starts are refused.
+    """
+
+    def __init__(self, deadline: datetime, fallback_stream_bytes_per_second: float) -> None:
+        """
+        Creates a deadline tracker with no observed transfers yet.
+        Called by: orchestration.build_run_deadline()
+        """
+        self.deadline: datetime = deadline
+        self.fallback_stream_bytes_per_second: float = fallback_stream_bytes_per_second
+        self.lock: threading.Lock = threading.Lock()
+        self.observed_bytes: int = 0
+        self.observed_seconds: float = 0.0
+        self.deferred_counts: dict[int, int] = {}
+
+    def has_passed(self, now: datetime | None = None) -> bool:
+        """
+        Returns whether the deadline has been reached.
+        Called by: allows_start(), main.process_collection_job_with_failure_reporting()
+        """
+        current_time: datetime = now if now is not None else datetime.now().astimezone()
+        result: bool = current_time >= self.deadline
+        return result
+
+    def get_stream_bytes_per_second(self) -> float:
+        """
+        Returns the observed average per-stream rate, or the fallback estimate before any transfer has been timed.
+        Called by: allows_start()
+        """
+        with self.lock:
+            result: float = (
+                self.observed_bytes / self.observed_seconds
+                if self.observed_bytes > 0 and self.observed_seconds > 0
+                else self.fallback_stream_bytes_per_second
+            )
+        return result
+
+    def allows_start(self, remaining_bytes: int, now: datetime | None = None) -> bool:
+        """
+        Returns whether a transfer of `remaining_bytes` is expected to finish before the deadline, with a safety margin.
+        Called by: orchestration.iter_deadline_admitted_downloads()
+        """
+        current_time: datetime = now if now is not None else datetime.now().astimezone()
+        result: bool = not self.has_passed(current_time)
+        if result and remaining_bytes > 0:
+            estimated_seconds: float = remaining_bytes / self.get_stream_bytes_per_second() * DEADLINE_SAFETY_FACTOR
+            result = current_time + timedelta(seconds=estimated_seconds) <= self.deadline
+        return result
+
+    def record_transfer(self, bytes_written: int, elapsed_seconds: float) -> None:
+        """
+        Adds one finished transfer to the observed per-stream throughput.
+        Called by: orchestration.run_planned_downloads()
+        """
+        if bytes_written > 0 and elapsed_seconds > 0:
+            with self.lock:
+                self.observed_bytes += bytes_written
+                self.observed_seconds += elapsed_seconds
+
+    def record_deferral(self, collection_id: int) -> None:
+        """
+        Counts one download left for the next run because it could not finish in time.
+        Called by: orchestration.iter_deadline_admitted_downloads()
+        """
+        with self.lock:
+            self.deferred_counts[collection_id] = self.deferred_counts.get(collection_id, 0) + 1
+
+    def get_deferred_count(self, collection_id: int) -> int:
+        """
+        Returns how many of the collection's downloads were deferred to the next run.
+        Called by: orchestration.process_collection_job_buffered(), orchestration.process_collection_job_streaming()
+        """
+        with self.lock:
+            result: int = self.deferred_counts.get(collection_id, 0)
+        return result
+
+
+def parse_run_deadline(deadline_text: str, now: datetime) -> datetime:
+    """
+    Parses a deadline given as a local `HH:MM` clock time (its next occurrence after `now`) or as an ISO 8601
+    datetime (local time when no offset is given). Raises ValueError for anything else.
+    Called by: orchestration.get_run_deadline()
+    """
+    cleaned_text: str = deadline_text.strip()
+    local_now: datetime = now.astimezone()
+    clock_match: re.Match[str] | None = CLOCK_DEADLINE_PATTERN.match(cleaned_text)
+    if clock_match is not None:
+        hour: int = int(clock_match.group('hour'))
+        minute: int = int(clock_match.group('minute'))
+        if hour > 23 or minute > 59:
+            raise ValueError(f'invalid clock time: {deadline_text}')
+        result: datetime = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if result <= local_now:
+            result += timedelta(days=1)
+    else:
+        parsed: datetime = datetime.fromisoformat(cleaned_text)
+        result = parsed.astimezone() if parsed.tzinfo is None else parsed
+    return result
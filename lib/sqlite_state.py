@@ -0,0 +1,294 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from lib.local_state import (
+    DOWNLOADED_TOTALS_KEY,
+    LocalStateError,
+    build_collection_root_path,
+    build_state_file_path,
+    get_downloaded_totals,
+    get_file_manifest_entry,
+    load_collection_state,
+    make_default_collection_state,
+    normalize_collection_state,
+)
+
+SQLITE_STATE_FILENAME: str = 'state.sqlite3'
+SQLITE_STATE_SCHEMA_VERSION: int = 2
+SQLITE_STATE_SCHEMA_STATEMENTS: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value_json TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS files (
+        filename TEXT PRIMARY KEY,
+        status TEXT,
+        entry_json TEXT NOT NULL
+    )
+    """,
+    'CREATE INDEX IF NOT EXISTS files_status_idx ON files (status)',
+    'DROP INDEX IF EXISTS files_seed_id_idx',
+    'DROP INDEX IF EXISTS files_size_idx',
+    'DROP INDEX IF EXISTS files_last_attempt_at_idx',
+)
+
+
+@dataclass(frozen=True)
+class HeldStateDatabase:
+    """
+    Represents one collection's state database connection kept open for a collection run, with the lock that
+    serialises transactions on it.
+    """
+
+    connection: sqlite3.Connection
+    lock: threading.Lock
+
+
+HELD_STATE_DATABASES: dict[Path, HeldStateDatabase] = {}
+HELD_STATE_DATABASES_LOCK: threading.Lock = threading.Lock()
+
+
+def build_sqlite_state_path(storage_root: Path, collection_id: int) -> Path:
+    """
+    Builds the SQLite state database path that sits next to state.json.
+    Called by: open_state_database(), hold_state_database(), release_state_database(), use_state_database()
+    """
+    result: Path = build_collection_root_path(storage_root, collection_id) / SQLITE_STATE_FILENAME
+    return result
+
+
+def open_state_database(storage_root: Path, collection_id: int) -> sqlite3.Connection:
+    """
+    Opens one collection's SQLite state database, creating the schema when it is new. Databases written before the
+    schema version 2 keep their unused `seed_id`, `size`, and `last_attempt_at` columns, whose indexes are dropped.
+    Called by: hold_state_database(), use_state_database()
+    """
+    database_path: Path = build_sqlite_state_path(storage_root, collection_id)
+    database_path.parent.mkdir(parents=True, exist_ok=True)
+    connection: sqlite3.Connection = sqlite3.connect(database_path, check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=FULL')
+    with connection:
+        for statement in SQLITE_STATE_SCHEMA_STATEMENTS:
+            connection.execute(statement)
+        connection.execute(
+            'INSERT OR REPLACE INTO meta (key, value_json) VALUES (?, ?)',
+            ('schema_version', json.dumps(SQLITE_STATE_SCHEMA_VERSION)),
+        )
+    result: sqlite3.Connection = connection
+    return result
+
+
+def hold_state_database(storage_root: Path, collection_id: int) -> None:
+    """
+    Opens one collection's state database for a whole collection run, migrating any state.json first. Until it is
+    released, every load, whole-state save, and per-file save reuses this connection instead of reconnecting and
+    re-running the PRAGMAs and schema setup.
+    Called by: orchestration.process_collection_job()
+    """
+    migrate_state_json_to_sqlite(storage_root, collection_id)
+    database_path: Path = build_sqlite_state_path(storage_root, collection_id)
+    with HELD_STATE_DATABASES_LOCK:
+        if database_path not in HELD_STATE_DATABASES:
+            HELD_STATE_DATABASES[database_path] = HeldStateDatabase(
+                connection=open_state_database(storage_root, collection_id),
+                lock=threading.Lock(),
+            )
+
+
+def release_state_database(storage_root: Path, collection_id: int) -> None:
+    """
+    Closes the connection held for a collection run, if any.
+    Called by: orchestration.process_collection_job()
+    """
+    with HELD_STATE_DATABASES_LOCK:
+        held_database: HeldStateDatabase | None = HELD_STATE_DATABASES.pop(
+            build_sqlite_state_path(storage_root, collection_id),
+            None,
+        )
+    if held_database is not None:
+        with held_database.lock:
+            held_database.connection.close()
+
+
+@contextmanager
+def use_state_database(storage_root: Path, collection_id: int) -> Iterator[sqlite3.Connection]:
+    """
+    Yields the connection held for the collection run, used under its lock, or else a new connection closed afterwards.
+    Called by: load_collection_state_from_sqlite(), save_collection_state_to_sqlite(),
+    save_file_manifest_entry_to_sqlite(), count_files_by_status()
+    """
+    with HELD_STATE_DATABASES_LOCK:
+        held_database: HeldStateDatabase | None = HELD_STATE_DATABASES.get(
+            build_sqlite_state_path(storage_root, collection_id)
+        )
+    if held_database is None:
+        with closing(open_state_database(storage_root, collection_id)) as connection:
+            yield connection
+    else:
+        with held_database.lock:
+            yield held_database.connection
+
+
+def build_file_row(filename: str, entry: dict[str, object]) -> tuple[str, str | None, str]:
+    """
+    Builds the indexed status value and JSON payload for one manifest entry.
+    Called by: build_file_rows()
+    """
+    status_value: object = entry.get('status')
+    result: tuple[str, str | None, str] = (
+        filename,
+        status_value if isinstance(status_value, str) else None,
+        json.dumps(entry, sort_keys=True),
+    )
+    return result
+
+
+def build_file_rows(files_state: dict[str, object]) -> list[tuple[str, str | None, str]]:
+    """
+    Builds the rows for every manifest entry that is a JSON object.
+    Called by: save_collection_state_to_sqlite(), save_file_manifest_entry_to_sqlite()
+    """
+    result: list[tuple[str, str | None, str]] = [
+        build_file_row(filename, entry) for filename, entry in files_state.items() if isinstance(entry, dict)
+    ]
+    return result
+
+
+def upsert_file_rows(
+    connection: sqlite3.Connection,
+    rows: list[tuple[str, str | None, str]],
+) -> None:
+    """
+    Inserts or replaces manifest rows inside the caller's transaction.
+    Called by: save_collection_state_to_sqlite(), save_file_manifest_entry_to_sqlite()
+    """
+    connection.executemany(
+        """
+        INSERT INTO files (filename, status, entry_json)
+        VALUES (?, ?, ?)
+        ON CONFLICT (filename) DO UPDATE SET
+            status = excluded.status,
+            entry_json = excluded.entry_json
+        """,
+        rows,
+    )
+
+
+def save_top_level_state_fields(connection: sqlite3.Connection, state: dict[str, object]) -> None:
+    """
+    Stores every top-level state field except the file manifest in the meta table.
+    Called by: save_collection_state_to_sqlite()
+    """
+    rows: list[tuple[str, str]] = [
+        (f'state:{key}', json.dumps(value, sort_keys=True)) for key, value in state.items() if key != 'files'
+    ]
+    connection.execute("DELETE FROM meta WHERE key LIKE 'state:%'")
+    connection.executemany('INSERT INTO meta (key, value_json) VALUES (?, ?)', rows)
+
+
+def load_collection_state_from_sqlite(storage_root: Path, collection_id: int) -> dict[str, object]:
+    """
+    Loads collection state from SQLite in the same shape load_collection_state() returns.
+    A collection that has only a state.json is migrated into SQLite first.
+    Called by: orchestration.load_collection_state_for_run()
+    """
+    migrate_state_json_to_sqlite(storage_root, collection_id)
+    state: dict[str, object] = make_default_collection_state()
+    files_state: dict[str, object] = {}
+    with use_state_database(storage_root, collection_id) as connection:
+        for key, value_json in connection.execute("SELECT key, value_json FROM meta WHERE key LIKE 'state:%'"):
+            state[key.removeprefix('state:')] = json.loads(value_json)
+        for filename, entry_json in connection.execute('SELECT filename, entry_json FROM files ORDER BY filename'):
+            files_state[filename] = json.loads(entry_json)
+    state['files'] = files_state
+    result: dict[str, object] = normalize_collection_state(state)
+    return result
+
+
+def save_collection_state_to_sqlite(storage_root: Path, collection_id: int, state: dict[str, object]) -> Path:
+    """
+    Saves a whole collection state to SQLite in one transaction, matching save_collection_state() semantics.
+    Only rows whose entry differs from the stored JSON are written, and rows no longer in the manifest are deleted,
+    so a save after a few changes does not rewrite every row and its index entries.
+    Called by: orchestration.save_collection_state_for_run(), migrate_state_json_to_sqlite()
+    """
+    normalized_state: dict[str, object] = normalize_collection_state(state)
+    files_value: object = normalized_state['files']
+    if not isinstance(files_value, dict):
+        raise LocalStateError('Collection state field `files` must be a JSON object.')
+    with use_state_database(storage_root, collection_id) as connection:
+        with connection:
+            save_top_level_state_fields(connection, normalized_state)
+            stored_entries: dict[str, str] = dict(connection.execute('SELECT filename, entry_json FROM files'))
+            removed_filenames: list[tuple[str]] = [(filename,) for filename in stored_entries.keys() - files_value.keys()]
+            connection.executemany('DELETE FROM files WHERE filename = ?', removed_filenames)
+            changed_rows: list[tuple[str, str | None, str]] = [
+                row for row in build_file_rows(files_value) if stored_entries.get(row[0]) != row[2]
+            ]
+            upsert_file_rows(connection, changed_rows)
+    result: Path = build_sqlite_state_path(storage_root, collection_id)
+    return result
+
+
+def save_file_manifest_entry_to_sqlite(
+    storage_root: Path,
+    collection_id: int,
+    state: dict[str, object],
+    filename: str,
+) -> Path:
+    """
+    Writes one file's manifest entry, and the running downloaded totals, in its own transaction without rewriting
+    the rest of the manifest.
+    Called by: orchestration.save_collection_state_after_file_processing()
+    """
+    entry: dict[str, object] = get_file_manifest_entry(state, filename)
+    with use_state_database(storage_root, collection_id) as connection:
+        with connection:
+            upsert_file_rows(connection, build_file_rows({filename: entry}))
+            totals: dict[str, object] | None = get_downloaded_totals(state)
+            if totals is not None:
+                connection.execute(
+                    'INSERT OR REPLACE INTO meta (key, value_json) VALUES (?, ?)',
+                    (f'state:{DOWNLOADED_TOTALS_KEY}', json.dumps(totals, sort_keys=True)),
+                )
+    result: Path = build_sqlite_state_path(storage_root, collection_id)
+    return result
+
+
+def migrate_state_json_to_sqlite(storage_root: Path, collection_id: int) -> bool:
+    """
+    Copies an existing state.json (plus any journal) into SQLite once, returning whether a migration happened.
+    The JSON files are left in place so a run can fall back to snapshot mode.
+    Called by: load_collection_state_from_sqlite()
+    """
+    migrated: bool = False
+    database_exists: bool = build_sqlite_state_path(storage_root, collection_id).exists()
+    if not database_exists and build_state_file_path(storage_root, collection_id).exists():
+        state: dict[str, object] = load_collection_state(storage_root, collection_id)
+        save_collection_state_to_sqlite(storage_root, collection_id, state)
+        migrated = True
+    result: bool = migrated
+    return result
+
+
+def count_files_by_status(storage_root: Path, collection_id: int) -> dict[str, int]:
+    """
+    Returns manifest entry counts grouped by status, using the status index. Run-time planning and reconciliation
+    work on the manifest loaded into memory instead, because reconciliation must check every entry's WARC on disk.
+    Called by: orchestration.log_collection_manifest_status_counts()
+    """
+    with use_state_database(storage_root, collection_id) as connection:
+        rows: list[tuple[str | None, int]] = connection.execute(
+            'SELECT status, COUNT(*) FROM files GROUP BY status'
+        ).fetchall()
+    result: dict[str, int] = {status if status is not None else '': count for status, count in rows}
+    return result
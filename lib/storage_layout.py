@@ -1,11 +1,17 @@
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from lib.local_state import build_collection_root_path
 
-WARC_FILENAME_TIMESTAMP_PATTERN: re.Pattern[str] = re.compile(r'-(\d{4})(\d{2})\d{2}\d{6}(?:\d+)?-')
-WARC_FILENAME_SEED_PATTERN: re.Pattern[str] = re.compile(r'(?:^|-)SEED(?P<seed_digits>[0-9]+)(?:-|$)')
+WARC_FILENAME_PATTERN: re.Pattern[str] = re.compile(
+    r'(?=(?:.*?-(?P<year>\d{4})(?P<month>\d{2})\d{2}\d{6}(?:\d+)?-)?)'
+    r'(?=(?:.*?(?:^|-)SEED(?P<seed_digits>[0-9]+)(?:-|$))?)',
+    re.DOTALL,
+)
+WARC_FILENAME_PARSE_CACHE_SIZE: int = 131072
 UNKNOWN_SEED_FOLDER_NAME: str = 'UNKNOWN_SEED'
 
 
@@ -15,6 +21,18 @@ class StorageLayoutError(ValueError):
     """
 
 
+@dataclass(frozen=True)
+class WarcFilename:
+    """
+    Represents the storage-relevant parts of one WARC filename, parsed in a single regex pass.
+    """
+
+    filename: str
+    year: str | None
+    month: str | None
+    seed_id: str
+
+
 @dataclass(frozen=True)
 class PlannedCollectionPaths:
     """
@@ -30,33 +48,67 @@ class PlannedCollectionPaths:
     seed_id: str
 
 
-def extract_warc_timestamp_parts(filename: str) -> tuple[str, str]:
+@lru_cache(maxsize=WARC_FILENAME_PARSE_CACHE_SIZE)
+def parse_warc_filename(filename: str) -> WarcFilename:
     """
-    Extracts the year and month partitions from a WARC filename timestamp.
-    Called by: build_warc_destination_path()
+    Parses the timestamp partitions and seed id from a WARC filename in one pass, memoised per filename.
+    Called by: extract_warc_timestamp_parts(), extract_warc_seed_id(), plan_collection_paths(), parse_warc_filenames()
     """
     normalized_filename: str = filename.strip()
     if not normalized_filename:
         raise StorageLayoutError('WARC filename must not be blank.')
-    match: re.Match[str] | None = WARC_FILENAME_TIMESTAMP_PATTERN.search(normalized_filename)
-    if match is None:
-        raise StorageLayoutError(f'Could not extract year/month timestamp parts from filename: {filename}')
-    result: tuple[str, str] = (match.group(1), match.group(2))
+    match: re.Match[str] = WARC_FILENAME_PATTERN.match(normalized_filename)
+    seed_digits: str | None = match.group('seed_digits')
+    result: WarcFilename = WarcFilename(
+        filename=filename,
+        year=match.group('year'),
+        month=match.group('month'),
+        seed_id=f'SEED{seed_digits}' if seed_digits is not None else UNKNOWN_SEED_FOLDER_NAME,
+    )
+    return result
+
+
+def parse_warc_filenames(filenames: Iterable[str]) -> dict[str, WarcFilename]:
+    """
+    Parses a batch of WARC filenames, such as a whole discovery result, skipping blank names and duplicates.
+    Called by: orchestration.get_observed_seed_ids_from_filenames()
+    """
+    result: dict[str, WarcFilename] = {}
+    for filename in filenames:
+        if filename in result or not filename.strip():
+            continue
+        result[filename] = parse_warc_filename(filename)
+    return result
+
+
+def get_warc_timestamp_parts(parsed_filename: WarcFilename) -> tuple[str, str]:
+    """
+    Returns the year and month partitions of a parsed WARC filename, raising when it has no timestamp.
+    Called by: extract_warc_timestamp_parts(), plan_collection_paths()
+    """
+    if parsed_filename.year is None or parsed_filename.month is None:
+        raise StorageLayoutError(
+            f'Could not extract year/month timestamp parts from filename: {parsed_filename.filename}'
+        )
+    result: tuple[str, str] = (parsed_filename.year, parsed_filename.month)
+    return result
+
+
+def extract_warc_timestamp_parts(filename: str) -> tuple[str, str]:
+    """
+    Extracts the year and month partitions from a WARC filename timestamp.
+    Called by: build_warc_destination_path()
+    """
+    result: tuple[str, str] = get_warc_timestamp_parts(parse_warc_filename(filename))
     return result
 
 
 def extract_warc_seed_id(filename: str) -> str:
     """
     Extracts the normalized seed id folder name from a WARC filename.
-    Called by: plan_collection_paths()
+    Called by: single-field callers; planning code reads seed_id from parse_warc_filename() directly
     """
-    normalized_filename: str = filename.strip()
-    if not normalized_filename:
-        raise StorageLayoutError('WARC filename must not be blank.')
-    match: re.Match[str] | None = WARC_FILENAME_SEED_PATTERN.search(normalized_filename)
-    result: str = UNKNOWN_SEED_FOLDER_NAME
-    if match is not None:
-        result = f'SEED{match.group("seed_digits")}'
+    result: str = parse_warc_filename(filename).seed_id
     return result
 
 
@@ -72,12 +124,13 @@ def build_collection_storage_root(storage_root: Path, collection_id: int) -> Pat
 def build_warc_destination_path(storage_root: Path, collection_id: int, filename: str) -> Path:
     """
     Builds the destination path for one WARC file.
-    Called by: plan_collection_paths()
+    Called by: build_fixity_paths()
     """
+    parsed_filename: WarcFilename = parse_warc_filename(filename)
     year: str
     month: str
-    year, month = extract_warc_timestamp_parts(filename)
-    seed_id: str = extract_warc_seed_id(filename)
+    year, month = get_warc_timestamp_parts(parsed_filename)
+    seed_id: str = parsed_filename.seed_id
     collection_root: Path = build_collection_storage_root(storage_root, collection_id)
     result: Path = collection_root / seed_id / year / month / filename
     return result
@@ -95,17 +148,17 @@ def build_fixity_paths(storage_root: Path, collection_id: int, filename: str) ->
 
 def plan_collection_paths(storage_root: Path, collection_id: int, filename: str) -> PlannedCollectionPaths:
     """
-    Builds the planned local WARC and fixity paths for one filename.
+    Builds the planned local WARC and fixity paths for one filename from a single cached parse.
     Called by: build_planned_download_paths()
     """
+    parsed_filename: WarcFilename = parse_warc_filename(filename)
     year: str
     month: str
-    year, month = extract_warc_timestamp_parts(filename)
-    seed_id: str = extract_warc_seed_id(filename)
-    warc_path: Path = build_warc_destination_path(storage_root, collection_id, filename)
-    sha256_path: Path
-    json_path: Path
-    sha256_path, json_path = build_fixity_paths(storage_root, collection_id, filename)
+    year, month = get_warc_timestamp_parts(parsed_filename)
+    seed_id: str = parsed_filename.seed_id
+    warc_path: Path = build_collection_storage_root(storage_root, collection_id) / seed_id / year / month / filename
+    sha256_path: Path = warc_path.with_name(f'{filename}.sha256')
+    json_path: Path = warc_path.with_name(f'{filename}.json')
     result: PlannedCollectionPaths = PlannedCollectionPaths(
         filename=filename,
         warc_path=warc_path,
@@ -1,5 +1,11 @@
+import asyncio
 import json
 import logging
+import math
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from urllib.parse import ParseResult, parse_qs, urlparse
@@ -9,6 +15,7 @@ import httpx
 DEFAULT_WASAPI_BASE_URL: str = 'https://warcs.archive-it.org/wasapi/v1/webdata'
 DEFAULT_OVERLAP_DAYS: int = 30
 DEFAULT_PAGE_SIZE: int = 100
+DEFAULT_PAGE_FETCH_CONCURRENCY: int = 1
 RECORD_LIST_FIELD_CANDIDATES: tuple[str, ...] = ('results', 'files', 'items', 'data')
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -19,9 +26,19 @@ class WasapiDiscoveryError(RuntimeError):
     Represents a discovery failure that may still include partial results.
     """
 
-    def __init__(self, message: str, partial_result: 'DiscoveryResult | None' = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        partial_result: 'DiscoveryResult | None' = None,
+        partial_record_count: int | None = None,
+    ) -> None:
         super().__init__(message)
         self.partial_result = partial_result
+        self.partial_record_count = (
+            partial_record_count
+            if partial_record_count is not None
+            else (len(partial_result.records) if partial_result is not None else 0)
+        )
 
 
 @dataclass(frozen=True)
@@ -51,10 +68,35 @@ class DiscoveryResult:
     max_observed_store_time: str | None
 
 
+@dataclass(frozen=True)
+class DiscoveryPage:
+    """
+    Represents the records and request metadata from one successfully fetched WASAPI page.
+    """
+
+    page_number: int
+    records: list[dict[str, object]]
+    request_record: DiscoveryRequestRecord
+    max_observed_store_time: str | None
+
+
+@dataclass(frozen=True)
+class DiscoveryPageFetch:
+    """
+    Represents the raw outcome of fetching one WASAPI page, including any error raised while fetching it.
+    """
+
+    page_number: int
+    request_record: DiscoveryRequestRecord
+    payload: dict[str, object] | None
+    records: list[dict[str, object]]
+    error: Exception | None
+
+
 def parse_wasapi_datetime(value: str) -> datetime:
     """
     Parses a WASAPI datetime string into an aware UTC datetime.
-    Called by: compute_store_time_after_datetime()
+    Called by: compute_store_time_after_datetime(), orchestration.get_store_time_sort_value()
     """
     normalized: str = value.strip()
     if normalized.endswith('Z'):
@@ -85,7 +127,7 @@ def compute_store_time_after_datetime(
 def format_wasapi_datetime(value: datetime) -> str:
     """
     Formats an aware datetime in the UTC form expected by WASAPI query params.
-    Called by: fetch_collection_discovery()
+    Called by: iter_collection_discovery_pages()
     """
     utc_value: datetime = value.astimezone(UTC)
     result: str = utc_value.strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -95,7 +137,7 @@ def format_wasapi_datetime(value: datetime) -> str:
 def extract_discovery_records(page_payload: dict[str, object]) -> list[dict[str, object]]:
     """
     Extracts record payloads from one WASAPI page.
-    Called by: fetch_collection_discovery()
+    Called by: fetch_discovery_page()
     """
     records: list[dict[str, object]] | None = None
     for field_name in RECORD_LIST_FIELD_CANDIDATES:
@@ -113,10 +155,38 @@ def extract_discovery_records(page_payload: dict[str, object]) -> list[dict[str,
     return result
 
 
+def extract_record_checksums(record: dict[str, object]) -> dict[str, str]:
+    """
+    Extracts the record's advertised `checksums` object (for example sha1 and md5) as algorithm-to-digest strings.
+    Called by: orchestration.build_planned_downloads()
+    """
+    checksums_value: object = record.get('checksums')
+    result: dict[str, str] = {}
+    if isinstance(checksums_value, dict):
+        result = {
+            algorithm.strip().lower(): digest.strip().lower()
+            for algorithm, digest in checksums_value.items()
+            if isinstance(algorithm, str) and algorithm.strip() and isinstance(digest, str) and digest.strip()
+        }
+    return result
+
+
+def extract_record_size(record: dict[str, object]) -> int | None:
+    """
+    Extracts the record's advertised byte size when it is a non-negative integer.
+    Called by: orchestration.build_planned_downloads()
+    """
+    size_value: object = record.get('size')
+    result: int | None = None
+    if isinstance(size_value, int) and not isinstance(size_value, bool) and size_value >= 0:
+        result = size_value
+    return result
+
+
 def extract_record_store_time(record: dict[str, object]) -> str | None:
     """
     Extracts a usable store-time string from one record when present.
-    Called by: compute_max_store_time()
+    Called by: compute_max_store_time(), orchestration.build_planned_downloads()
     """
     result: str | None = None
     candidate: object = record.get('store-time')
@@ -127,13 +197,13 @@ def extract_record_store_time(record: dict[str, object]) -> str | None:
     return result
 
 
-def compute_max_store_time(records: list[dict[str, object]]) -> str | None:
+def compute_max_store_time(records: list[dict[str, object]], initial_store_time: str | None = None) -> str | None:
     """
-    Computes the maximum usable store-time across discovered records.
-    Called by: fetch_collection_discovery()
+    Computes the maximum usable store-time across discovered records, starting from an optional earlier maximum.
+    Called by: iter_collection_discovery_pages(), fetch_collection_discovery()
     """
-    max_datetime: datetime | None = None
-    max_store_time: str | None = None
+    max_datetime: datetime | None = parse_wasapi_datetime(initial_store_time) if initial_store_time is not None else None
+    max_store_time: str | None = initial_store_time
     for record in records:
         store_time: str | None = extract_record_store_time(record)
         if store_time is None:
@@ -150,7 +220,7 @@ def compute_max_store_time(records: list[dict[str, object]]) -> str | None:
 def get_next_page_number(page_payload: dict[str, object], current_page_number: int) -> int | None:
     """
     Determines the next page number from a WASAPI page payload.
-    Called by: fetch_collection_discovery()
+    Called by: iter_collection_discovery_pages()
     """
     result: int | None = None
     next_value: object = page_payload.get('next')
@@ -175,7 +245,7 @@ def get_next_page_number(page_payload: dict[str, object], current_page_number: i
 def build_payload_debug_summary(page_payload: dict[str, object], page_records: list[dict[str, object]]) -> dict[str, object]:
     """
     Builds a compact summary of one WASAPI response payload for debug logging.
-    Called by: fetch_collection_discovery()
+    Called by: fetch_discovery_page()
     """
     result: dict[str, object] = {
         'keys': sorted(page_payload.keys()),
@@ -188,101 +258,587 @@ def build_payload_debug_summary(page_payload: dict[str, object], page_records: l
     return result
 
 
-def fetch_collection_discovery(
+def build_discovery_page_params(
+    collection_id: int,
+    page_number: int,
+    page_size: int,
+    formatted_after_datetime: str | None,
+) -> dict[str, object]:
+    """
+    Builds the WASAPI query params for one discovery page.
+    Called by: iter_collection_discovery_pages(), schedule_async_discovery_page_fetches()
+    """
+    result: dict[str, object] = {
+        'collection': collection_id,
+        'page': page_number,
+        'page_size': page_size,
+    }
+    if formatted_after_datetime is not None:
+        result['store-time-after'] = formatted_after_datetime
+    return result
+
+
+def fetch_discovery_page(
+    client: httpx.Client,
+    base_url: str,
+    collection_id: int,
+    page_number: int,
+    params: dict[str, object],
+) -> DiscoveryPageFetch:
+    """
+    Fetches one WASAPI page and returns its request record, payload, and records, or the error raised while fetching.
+    The request record is always returned so failed fetches still appear in the request audit trail.
+    Called by: iter_collection_discovery_pages(), iter_parallel_discovery_page_fetches()
+    """
+    requested_at: datetime = datetime.now(UTC)
+    request_record: DiscoveryRequestRecord = build_discovery_request_record(page_number, base_url, params, requested_at)
+    payload_result: dict[str, object] | None = None
+    page_records: list[dict[str, object]] = []
+    error: Exception | None = None
+    try:
+        response: httpx.Response = client.get(base_url, params=params)
+        request_record = build_discovery_request_record(page_number, base_url, params, requested_at, response)
+        payload_result, page_records = read_discovery_page_response(collection_id, page_number, params, response)
+    except Exception as exc:
+        error = exc
+    result: DiscoveryPageFetch = DiscoveryPageFetch(
+        page_number=page_number,
+        request_record=request_record,
+        payload=payload_result,
+        records=page_records,
+        error=error,
+    )
+    return result
+
+
+async def fetch_discovery_page_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    collection_id: int,
+    page_number: int,
+    params: dict[str, object],
+    request_slots: asyncio.Semaphore | None = None,
+) -> DiscoveryPageFetch:
+    """
+    Async counterpart of fetch_discovery_page(), holding one of the given request slots while the request runs.
+    Called by: iter_collection_discovery_pages_async(), schedule_async_discovery_page_fetches()
+    """
+    requested_at: datetime = datetime.now(UTC)
+    request_record: DiscoveryRequestRecord = build_discovery_request_record(page_number, base_url, params, requested_at)
+    payload_result: dict[str, object] | None = None
+    page_records: list[dict[str, object]] = []
+    error: Exception | None = None
+    request_slot: AbstractAsyncContextManager[object] = request_slots if request_slots is not None else nullcontext()
+    try:
+        async with request_slot:
+            response: httpx.Response = await client.get(base_url, params=params)
+        request_record = build_discovery_request_record(page_number, base_url, params, requested_at, response)
+        payload_result, page_records = read_discovery_page_response(collection_id, page_number, params, response)
+    except Exception as exc:
+        error = exc
+    result: DiscoveryPageFetch = DiscoveryPageFetch(
+        page_number=page_number,
+        request_record=request_record,
+        payload=payload_result,
+        records=page_records,
+        error=error,
+    )
+    return result
+
+
+def build_discovery_request_record(
+    page_number: int,
+    base_url: str,
+    params: dict[str, object],
+    requested_at: datetime,
+    response: httpx.Response | None = None,
+) -> DiscoveryRequestRecord:
+    """
+    Builds the audit record for one page request, using the final URL and status code once a response has arrived.
+    Called by: fetch_discovery_page(), fetch_discovery_page_async()
+    """
+    result: DiscoveryRequestRecord = DiscoveryRequestRecord(
+        page_number=page_number,
+        requested_url=str(response.request.url) if response is not None else base_url,
+        requested_params=dict(params),
+        requested_at_utc=requested_at.isoformat(),
+        status_code=response.status_code if response is not None else None,
+    )
+    return result
+
+
+def read_discovery_page_response(
+    collection_id: int,
+    page_number: int,
+    params: dict[str, object],
+    response: httpx.Response,
+) -> tuple[dict[str, object], list[dict[str, object]]]:
+    """
+    Checks one page response and returns its JSON payload and records, raising on HTTP errors or a non-object body.
+    Called by: fetch_discovery_page(), fetch_discovery_page_async()
+    """
+    log.debug(
+        'Collection %s requested WASAPI page %s: %s params=%s',
+        collection_id,
+        page_number,
+        response.request.url,
+        params,
+    )
+    response.raise_for_status()
+    payload: object = response.json()
+    if not isinstance(payload, dict):
+        raise WasapiDiscoveryError('WASAPI response JSON is not an object.')
+    page_records: list[dict[str, object]] = extract_discovery_records(payload)
+    log.debug(
+        'Collection %s page %s payload summary: %s',
+        collection_id,
+        page_number,
+        build_payload_debug_summary(payload, page_records),
+    )
+    log.debug(
+        'Collection %s page %s full payload: %s',
+        collection_id,
+        page_number,
+        json.dumps(payload, sort_keys=True),
+    )
+    result: tuple[dict[str, object], list[dict[str, object]]] = (payload, page_records)
+    return result
+
+
+def compute_remaining_page_numbers(
+    first_page_payload: dict[str, object],
+    page_size: int,
+    next_page_number: int | None,
+) -> list[int]:
+    """
+    Computes pages 2..N from the first page's total `count` when the server pages by sequential page number.
+    Returns an empty list when the count is missing or the next link does not point at page 2.
+    Called by: iter_collection_discovery_pages(), iter_collection_discovery_pages_async()
+    """
+    result: list[int] = []
+    count_value: object = first_page_payload.get('count')
+    if next_page_number == 2 and isinstance(count_value, int) and not isinstance(count_value, bool) and page_size > 0:
+        total_pages: int = math.ceil(count_value / page_size)
+        result = list(range(2, total_pages + 1))
+    return result
+
+
+def iter_parallel_discovery_page_fetches(
+    executor: ThreadPoolExecutor,
+    client: httpx.Client,
+    base_url: str,
+    collection_id: int,
+    page_numbers: list[int],
+    params_by_page: dict[int, dict[str, object]],
+    fan_out: int,
+) -> Iterator[DiscoveryPageFetch]:
+    """
+    Fetches the given pages concurrently and yields them in page order, keeping at most `fan_out` fetches outstanding.
+    Called by: iter_collection_discovery_pages()
+    """
+    pending_fetches: deque[Future[DiscoveryPageFetch]] = deque()
+    page_number_iterator: Iterator[int] = iter(page_numbers)
+    for page_number in page_number_iterator:
+        pending_fetches.append(
+            executor.submit(fetch_discovery_page, client, base_url, collection_id, page_number, params_by_page[page_number])
+        )
+        if len(pending_fetches) >= fan_out:
+            break
+    while pending_fetches:
+        page_fetch: DiscoveryPageFetch = pending_fetches.popleft().result()
+        following_page_number: int | None = next(page_number_iterator, None)
+        if following_page_number is not None:
+            pending_fetches.append(
+                executor.submit(
+                    fetch_discovery_page,
+                    client,
+                    base_url,
+                    collection_id,
+                    following_page_number,
+                    params_by_page[following_page_number],
+                )
+            )
+        yield page_fetch
+
+
+def build_discovery_page_error(
+    collection_id: int,
+    page_number: int,
+    error: Exception,
+    partial_result: DiscoveryResult,
+    partial_record_count: int,
+) -> WasapiDiscoveryError:
+    """
+    Wraps a page fetch failure in a WasapiDiscoveryError carrying partial results.
+    Called by: iter_collection_discovery_pages(), iter_collection_discovery_pages_async()
+    """
+    message: str = (
+        str(error)
+        if isinstance(error, WasapiDiscoveryError)
+        else f'Failed fetching collection {collection_id} page {page_number}: {error}'
+    )
+    result: WasapiDiscoveryError = WasapiDiscoveryError(message, partial_result, partial_record_count)
+    return result
+
+
+def build_failed_discovery_partial_result(
+    collection_id: int,
+    after_datetime_utc: datetime | None,
+    request_records: list[DiscoveryRequestRecord],
+) -> DiscoveryResult:
+    """
+    Builds the incomplete result attached to a page failure; records are not kept because pages were already yielded.
+    Called by: iter_collection_discovery_pages(), iter_collection_discovery_pages_async()
+    """
+    result: DiscoveryResult = DiscoveryResult(
+        collection_id=collection_id,
+        after_datetime=after_datetime_utc,
+        records=[],
+        request_records=list(request_records),
+        completed_successfully=False,
+        max_observed_store_time=None,
+    )
+    return result
+
+
+def iter_collection_discovery_pages(
     client: httpx.Client,
     base_url: str,
     collection_id: int,
     after_datetime: datetime | None,
     page_size: int = DEFAULT_PAGE_SIZE,
-) -> DiscoveryResult:
+    page_fetch_concurrency: int = DEFAULT_PAGE_FETCH_CONCURRENCY,
+) -> Iterator[DiscoveryPage]:
     """
-    Fetches paginated WASAPI discovery records for one collection.
-    Called by: process_collection_job()
+    Yields WASAPI discovery pages for one collection as each page arrives, without keeping earlier pages' records.
+    Each yielded page carries the running maximum store-time, so the last page holds the enumeration maximum.
+    With a page fetch concurrency above one, pages 2..N are computed from the first page's `count` and fetched
+    concurrently, but still yielded strictly in page order; any `next` link after page N is then followed serially.
+    A failure raises WasapiDiscoveryError whose partial result covers only the contiguous pages before the failure.
+    Called by: fetch_collection_discovery(), orchestration.iter_streamed_planned_downloads()
     """
-    page_number: int = 1
-    discovered_records: list[dict[str, object]] = []
+    page_number: int | None = 1
     request_records: list[DiscoveryRequestRecord] = []
+    yielded_record_count: int = 0
+    max_store_time: str | None = None
     after_datetime_utc: datetime | None = after_datetime.astimezone(UTC) if after_datetime is not None else None
     formatted_after_datetime: str | None = (
         format_wasapi_datetime(after_datetime_utc) if after_datetime_utc is not None else None
     )
-
-    while True:
-        requested_at: datetime = datetime.now(UTC)
-        params: dict[str, object] = {
-            'collection': collection_id,
-            'page': page_number,
-            'page_size': page_size,
-        }
-        if formatted_after_datetime is not None:
-            params['store-time-after'] = formatted_after_datetime
-        response: httpx.Response | None = None
-        try:
-            response = client.get(base_url, params=params)
-            log.debug(
-                'Collection %s requested WASAPI page %s: %s params=%s',
-                collection_id,
-                page_number,
-                response.request.url,
-                params,
-            )
-            request_records.append(
-                DiscoveryRequestRecord(
-                    page_number=page_number,
-                    requested_url=str(response.request.url),
-                    requested_params=dict(params),
-                    requested_at_utc=requested_at.isoformat(),
-                    status_code=response.status_code,
-                ),
-            )
-            response.raise_for_status()
-            payload: object = response.json()
-            if not isinstance(payload, dict):
-                raise WasapiDiscoveryError('WASAPI response JSON is not an object.')
-            page_records: list[dict[str, object]] = extract_discovery_records(payload)
-            log.debug(
-                'Collection %s page %s payload summary: %s',
-                collection_id,
-                page_number,
-                build_payload_debug_summary(payload, page_records),
+    parallel_fetches: Iterator[DiscoveryPageFetch] = iter(())
+    executor: ThreadPoolExecutor | None = None
+    if page_fetch_concurrency > 1:
+        executor = ThreadPoolExecutor(max_workers=page_fetch_concurrency, thread_name_prefix=f'wasapi-{collection_id}')
+
+    try:
+        while page_number is not None:
+            page_fetch: DiscoveryPageFetch | None = next(parallel_fetches, None)
+            if page_fetch is None:
+                page_fetch = fetch_discovery_page(
+                    client,
+                    base_url,
+                    collection_id,
+                    page_number,
+                    build_discovery_page_params(collection_id, page_number, page_size, formatted_after_datetime),
+                )
+            request_records.append(page_fetch.request_record)
+            if page_fetch.error is not None or page_fetch.payload is None:
+                page_error: Exception = (
+                    page_fetch.error
+                    if page_fetch.error is not None
+                    else WasapiDiscoveryError('WASAPI page payload is missing.')
+                )
+                raise build_discovery_page_error(
+                    collection_id,
+                    page_fetch.page_number,
+                    page_error,
+                    build_failed_discovery_partial_result(collection_id, after_datetime_utc, request_records),
+                    yielded_record_count,
+                ) from page_error
+            max_store_time = compute_max_store_time(page_fetch.records, max_store_time)
+            yielded_record_count += len(page_fetch.records)
+            yield DiscoveryPage(
+                page_number=page_fetch.page_number,
+                records=page_fetch.records,
+                request_record=page_fetch.request_record,
+                max_observed_store_time=max_store_time,
             )
-            log.debug(
-                'Collection %s page %s full payload: %s',
-                collection_id,
-                page_number,
-                json.dumps(payload, sort_keys=True),
+            page_number = get_next_page_number(page_fetch.payload, page_fetch.page_number)
+            if executor is not None and page_fetch.page_number == 1:
+                remaining_page_numbers: list[int] = compute_remaining_page_numbers(
+                    page_fetch.payload,
+                    page_size,
+                    page_number,
+                )
+                if remaining_page_numbers:
+                    log.info(
+                        'Collection %s fetching %s remaining WASAPI pages with fan-out %s.',
+                        collection_id,
+                        len(remaining_page_numbers),
+                        page_fetch_concurrency,
+                    )
+                    parallel_fetches = iter_parallel_discovery_page_fetches(
+                        executor,
+                        client,
+                        base_url,
+                        collection_id,
+                        remaining_page_numbers,
+                        {
+                            remaining_page_number: build_discovery_page_params(
+                                collection_id,
+                                remaining_page_number,
+                                page_size,
+                                formatted_after_datetime,
+                            )
+                            for remaining_page_number in remaining_page_numbers
+                        },
+                        page_fetch_concurrency,
+                    )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def schedule_async_discovery_page_fetches(
+    pending_fetches: deque[asyncio.Task[DiscoveryPageFetch]],
+    page_numbers: deque[int],
+    fan_out: int,
+    client: httpx.AsyncClient,
+    base_url: str,
+    collection_id: int,
+    page_size: int,
+    formatted_after_datetime: str | None,
+    request_slots: asyncio.Semaphore | None,
+) -> None:
+    """
+    Starts page fetch tasks in page order until `fan_out` are outstanding or no page numbers remain.
+    Called by: iter_collection_discovery_pages_async()
+    """
+    while page_numbers and len(pending_fetches) < fan_out:
+        page_number: int = page_numbers.popleft()
+        pending_fetches.append(
+            asyncio.create_task(
+                fetch_discovery_page_async(
+                    client,
+                    base_url,
+                    collection_id,
+                    page_number,
+                    build_discovery_page_params(collection_id, page_number, page_size, formatted_after_datetime),
+                    request_slots,
+                )
             )
-            discovered_records.extend(page_records)
-            next_page_number: int | None = get_next_page_number(payload, page_number)
-            if next_page_number is None:
-                break
-            page_number = next_page_number
-        except Exception as exc:
-            if response is None:
-                request_records.append(
-                    DiscoveryRequestRecord(
-                        page_number=page_number,
-                        requested_url=base_url,
-                        requested_params=dict(params),
-                        requested_at_utc=requested_at.isoformat(),
-                        status_code=None,
-                    ),
+        )
+
+
+async def iter_collection_discovery_pages_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    collection_id: int,
+    after_datetime: datetime | None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    page_fetch_concurrency: int = DEFAULT_PAGE_FETCH_CONCURRENCY,
+    request_slots: asyncio.Semaphore | None = None,
+) -> AsyncIterator[DiscoveryPage]:
+    """
+    Async counterpart of iter_collection_discovery_pages(): pages 2..N are fetched as concurrent tasks on the event loop
+    instead of worker threads, with the same in-order yielding, `next`-link fallback, and partial-failure semantics.
+    Called by: fetch_collection_discovery_async(), orchestration.iter_discovery_pages_for_run()
+    """
+    page_number: int | None = 1
+    request_records: list[DiscoveryRequestRecord] = []
+    yielded_record_count: int = 0
+    max_store_time: str | None = None
+    after_datetime_utc: datetime | None = after_datetime.astimezone(UTC) if after_datetime is not None else None
+    formatted_after_datetime: str | None = (
+        format_wasapi_datetime(after_datetime_utc) if after_datetime_utc is not None else None
+    )
+    pending_fetches: deque[asyncio.Task[DiscoveryPageFetch]] = deque()
+    remaining_page_numbers: deque[int] = deque()
+
+    try:
+        while page_number is not None:
+            page_fetch: DiscoveryPageFetch
+            if pending_fetches:
+                page_fetch = await pending_fetches.popleft()
+                schedule_async_discovery_page_fetches(
+                    pending_fetches,
+                    remaining_page_numbers,
+                    page_fetch_concurrency,
+                    client,
+                    base_url,
+                    collection_id,
+                    page_size,
+                    formatted_after_datetime,
+                    request_slots,
+                )
+            else:
+                page_fetch = await fetch_discovery_page_async(
+                    client,
+                    base_url,
+                    collection_id,
+                    page_number,
+                    build_discovery_page_params(collection_id, page_number, page_size, formatted_after_datetime),
+                    request_slots,
+                )
+            request_records.append(page_fetch.request_record)
+            if page_fetch.error is not None or page_fetch.payload is None:
+                page_error: Exception = (
+                    page_fetch.error
+                    if page_fetch.error is not None
+                    else WasapiDiscoveryError('WASAPI page payload is missing.')
                 )
-            partial_result: DiscoveryResult = DiscoveryResult(
-                collection_id=collection_id,
-                after_datetime=after_datetime_utc,
-                records=list(discovered_records),
-                request_records=list(request_records),
-                completed_successfully=False,
-                max_observed_store_time=None,
+                raise build_discovery_page_error(
+                    collection_id,
+                    page_fetch.page_number,
+                    page_error,
+                    build_failed_discovery_partial_result(collection_id, after_datetime_utc, request_records),
+                    yielded_record_count,
+                ) from page_error
+            max_store_time = compute_max_store_time(page_fetch.records, max_store_time)
+            yielded_record_count += len(page_fetch.records)
+            yield DiscoveryPage(
+                page_number=page_fetch.page_number,
+                records=page_fetch.records,
+                request_record=page_fetch.request_record,
+                max_observed_store_time=max_store_time,
             )
-            if isinstance(exc, WasapiDiscoveryError):
-                raise WasapiDiscoveryError(str(exc), partial_result) from exc
-            raise WasapiDiscoveryError(
-                f'Failed fetching collection {collection_id} page {page_number}: {exc}', partial_result
-            ) from exc
+            page_number = get_next_page_number(page_fetch.payload, page_fetch.page_number)
+            if page_fetch_concurrency > 1 and page_fetch.page_number == 1:
+                remaining_page_numbers.extend(compute_remaining_page_numbers(page_fetch.payload, page_size, page_number))
+                if remaining_page_numbers:
+                    log.info(
+                        'Collection %s fetching %s remaining WASAPI pages with fan-out %s.',
+                        collection_id,
+                        len(remaining_page_numbers),
+                        page_fetch_concurrency,
+                    )
+                    schedule_async_discovery_page_fetches(
+                        pending_fetches,
+                        remaining_page_numbers,
+                        page_fetch_concurrency,
+                        client,
+                        base_url,
+                        collection_id,
+                        page_size,
+                        formatted_after_datetime,
+                        request_slots,
+                    )
+    finally:
+        for pending_fetch in pending_fetches:
+            pending_fetch.cancel()
+
+
+async def fetch_collection_discovery_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    collection_id: int,
+    after_datetime: datetime | None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    page_fetch_concurrency: int = DEFAULT_PAGE_FETCH_CONCURRENCY,
+    request_slots: asyncio.Semaphore | None = None,
+) -> DiscoveryResult:
+    """
+    Async counterpart of fetch_collection_discovery(), collecting every page from iter_collection_discovery_pages_async().
+    Called by: orchestration.fetch_collection_discovery_for_run()
+    """
+    discovered_records: list[dict[str, object]] = []
+    request_records: list[DiscoveryRequestRecord] = []
+    max_store_time: str | None = None
+    after_datetime_utc: datetime | None = after_datetime.astimezone(UTC) if after_datetime is not None else None
+    try:
+        async for page in iter_collection_discovery_pages_async(
+            client,
+            base_url,
+            collection_id,
+            after_datetime,
+            page_size,
+            page_fetch_concurrency,
+            request_slots,
+        ):
+            discovered_records.extend(page.records)
+            request_records.append(page.request_record)
+            max_store_time = page.max_observed_store_time
+    except WasapiDiscoveryError as exc:
+        raise build_buffered_discovery_error(
+            exc,
+            collection_id,
+            after_datetime_utc,
+            discovered_records,
+            request_records,
+        ) from exc.__cause__
+
+    result: DiscoveryResult = DiscoveryResult(
+        collection_id=collection_id,
+        after_datetime=after_datetime_utc,
+        records=discovered_records,
+        request_records=request_records,
+        completed_successfully=True,
+        max_observed_store_time=max_store_time,
+    )
+    return result
+
+
+def build_buffered_discovery_error(
+    exc: WasapiDiscoveryError,
+    collection_id: int,
+    after_datetime_utc: datetime | None,
+    discovered_records: list[dict[str, object]],
+    request_records: list[DiscoveryRequestRecord],
+) -> WasapiDiscoveryError:
+    """
+    Rebuilds a streamed page failure as a buffered-discovery failure whose partial result keeps the records gathered.
+    Called by: fetch_collection_discovery(), fetch_collection_discovery_async()
+    """
+    stream_partial_result: DiscoveryResult | None = exc.partial_result
+    partial_result: DiscoveryResult = DiscoveryResult(
+        collection_id=collection_id,
+        after_datetime=after_datetime_utc,
+        records=list(discovered_records),
+        request_records=list(stream_partial_result.request_records) if stream_partial_result else request_records,
+        completed_successfully=False,
+        max_observed_store_time=None,
+    )
+    result: WasapiDiscoveryError = WasapiDiscoveryError(str(exc), partial_result)
+    return result
+
+
+def fetch_collection_discovery(
+    client: httpx.Client,
+    base_url: str,
+    collection_id: int,
+    after_datetime: datetime | None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    page_fetch_concurrency: int = DEFAULT_PAGE_FETCH_CONCURRENCY,
+) -> DiscoveryResult:
+    """
+    Fetches paginated WASAPI discovery records for one collection.
+    Called by: process_collection_job_buffered()
+    """
+    discovered_records: list[dict[str, object]] = []
+    request_records: list[DiscoveryRequestRecord] = []
+    max_store_time: str | None = None
+    after_datetime_utc: datetime | None = after_datetime.astimezone(UTC) if after_datetime is not None else None
+    try:
+        for page in iter_collection_discovery_pages(
+            client,
+            base_url,
+            collection_id,
+            after_datetime,
+            page_size,
+            page_fetch_concurrency,
+        ):
+            discovered_records.extend(page.records)
+            request_records.append(page.request_record)
+            max_store_time = page.max_observed_store_time
+    except WasapiDiscoveryError as exc:
+        raise build_buffered_discovery_error(
+            exc,
+            collection_id,
+            after_datetime_utc,
+            discovered_records,
+            request_records,
+        ) from exc.__cause__
 
-    max_store_time: str | None = compute_max_store_time(discovered_records)
     result: DiscoveryResult = DiscoveryResult(
         collection_id=collection_id,
         after_datetime=after_datetime_utc,
@@ -1,5 +1,9 @@
+import argparse
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -7,30 +11,51 @@ import dotenv
 import gspread
 import httpx
 
+from lib.async_engine import AsyncTransferEngine
+from lib.collection_lock import CollectionLockManager
+from lib.collection_scheduling import CollectionFairShare
 from lib.collection_sheet import (
+    BackgroundSheetWriter,
     CollectionJob,
     CollectionSheetContext,
     CollectionSheetContractError,
     HeaderLocation,
+    SheetRowSnapshot,
+    SnapshotSheetWriter,
     load_collection_sheet_context,
 )
+from lib.disk_space import DiskSpaceAdmission
+from lib.downloader import BandwidthLimiter
 from lib.orchestration import (
+    DOWNLOAD_ENGINE_ASYNC,
     STATUS_DISCOVERY_FAILED,
     STATUS_SPREADSHEET_UPDATE_FAILED,
     CollectionProcessingReport,
     DevCollectionsConfigurationError,
+    RunConfigurationError,
     RunCoordinationError,
+    RunSettings,
+    build_bandwidth_limiter,
     build_collection_failure_report,
+    build_collection_fair_share,
+    build_collection_lock_manager,
+    build_disk_space_admission,
+    build_global_download_slots,
+    build_run_deadline,
+    build_sheet_writer,
     enforce_startup_run_coordination,
     get_archive_it_credentials,
     get_dev_collection_ids,
     get_downloaded_storage_root,
     get_run_coordination_mode,
+    get_run_settings,
+    order_collection_jobs_for_run,
     process_collection_job,
     resolve_collection_jobs_for_run,
     write_collection_final_report,
 )
-from lib.wasapi_discovery import DEFAULT_WASAPI_BASE_URL, DiscoveryResult, WasapiDiscoveryError
+from lib.run_deadline import RunDeadline
+from lib.wasapi_discovery import DEFAULT_WASAPI_BASE_URL, WasapiDiscoveryError
 
 dotenv.load_dotenv()
 
@@ -65,9 +90,20 @@ def run_collection_orchestration(
     downloaded_storage_root: Path,
     wasapi_base_url: str,
     archive_it_credentials: tuple[str, str],
+    configured_deadline: str | None = None,
 ) -> None:
     """
-    Runs the current sequential collection orchestration flow. (Concurrent processing may be added in the future.)
+    Runs the collection orchestration flow for COLLECTION_CONCURRENCY collections at a time, each with
+    DOWNLOAD_CONCURRENCY download workers, optionally capped run-wide by GLOBAL_DOWNLOAD_CONCURRENCY.
+    With DOWNLOAD_ENGINE=async, page fetches and transfers share one asyncio event loop instead of worker threads.
+    A BANDWIDTH_SCHEDULE paces every transfer against one shared, time-of-day byte rate.
+    Planned downloads are admitted against free space on the storage volume, keeping DISK_SPACE_RESERVE_BYTES free.
+    With a --deadline or RUN_DEADLINE, transfers that cannot finish in time are left for the next run.
+    COLLECTION_SCHEDULING_POLICY=priority starts the most urgent collections first, and concurrent collections split
+    GLOBAL_DOWNLOAD_CONCURRENCY evenly between them.
+    With SHEET_WRITE_MODE=background, sheet updates are queued and written by one background thread, which makes a
+    final flush before the run returns. Either way, cells whose value is unchanged since the sheet was read or last
+    written are not sent again.
 
     Re the "coordination-mode" references below...
     - Coordination-mode here means startup coordination for the WARC tracker run.
@@ -78,6 +114,13 @@ def run_collection_orchestration(
             - discovery-in-progress
             - downloading-in-progress
         - This prevents two copies of the script from processing/updating the same collection rows at once.
+    - Collection-locks mode processing:
+        - With RUN_COORDINATION_MODE=collection_locks, startup no longer reads sheet statuses at all.
+        - Each collection is claimed with a lock file under the storage root just before it is processed, and
+        released when it finishes. A run that finds a collection claimed skips it, so overlapping runs split the
+        collections between them.
+        - Locks left by a crashed run, or by another host whose lease heartbeat is older than
+        COLLECTION_LOCK_STALE_SECONDS, are taken over.
 
     Called by: main()
     """
@@ -100,57 +143,204 @@ def run_collection_orchestration(
     if requested_collection_ids is not None:
         selected_collection_ids: list[int] = [collection_job.collection_id for collection_job in collection_jobs]
         log.info('DEV_COLLECTIONS limited this run to collection ids: %s', selected_collection_ids)
+    run_settings: RunSettings = get_run_settings(configured_deadline)
+    log.info('Resolved run settings: %s', run_settings)
+    collection_jobs = order_collection_jobs_for_run(downloaded_storage_root, collection_jobs, run_settings)
 
     timeout: httpx.Timeout = httpx.Timeout(30.0, connect=30.0)
-    with httpx.Client(auth=archive_it_credentials, timeout=timeout, follow_redirects=True) as client:
-        for collection_job in collection_jobs:
-            try:
-                process_collection_job(
+    download_slots: threading.BoundedSemaphore | None = None
+    bandwidth_limiter: BandwidthLimiter | None = build_bandwidth_limiter(run_settings)
+    disk_space_admission: DiskSpaceAdmission = build_disk_space_admission(downloaded_storage_root, run_settings)
+    run_deadline: RunDeadline | None = build_run_deadline(run_settings)
+    fair_share: CollectionFairShare | None = build_collection_fair_share(run_settings)
+    engine_context: AbstractContextManager[AsyncTransferEngine | None] = nullcontext()
+    collection_lock_manager: CollectionLockManager | None = build_collection_lock_manager(
+        downloaded_storage_root,
+        coordination_mode,
+        run_settings,
+    )
+    lock_context: AbstractContextManager[CollectionLockManager | None] = (
+        collection_lock_manager if collection_lock_manager is not None else nullcontext()
+    )
+    sheet_writer: SnapshotSheetWriter | BackgroundSheetWriter = build_sheet_writer(
+        worksheet,
+        run_settings,
+        SheetRowSnapshot(sheet_context.values),
+    )
+    sheet_writer_context: AbstractContextManager[SnapshotSheetWriter | BackgroundSheetWriter] = (
+        sheet_writer if isinstance(sheet_writer, BackgroundSheetWriter) else nullcontext(sheet_writer)
+    )
+    if run_settings.download_engine == DOWNLOAD_ENGINE_ASYNC:
+        engine_context = AsyncTransferEngine(
+            auth=archive_it_credentials,
+            timeout=timeout,
+            global_limit=run_settings.global_download_limit,
+            per_host_limit=run_settings.per_host_concurrency,
+        )
+    else:
+        download_slots = build_global_download_slots(run_settings)
+    with (
+        httpx.Client(auth=archive_it_credentials, timeout=timeout, follow_redirects=True) as client,
+        engine_context as transfer_engine,
+        sheet_writer_context as sheet_target,
+        lock_context as collection_locks,
+    ):
+        if run_settings.collection_concurrency == 1:
+            for collection_job in collection_jobs:
+                process_collection_job_with_failure_reporting(
                     client,
                     collection_job,
                     downloaded_storage_root,
                     wasapi_base_url,
-                    worksheet,
+                    sheet_target,
                     header_location,
+                    run_settings,
+                    download_slots,
+                    transfer_engine,
+                    bandwidth_limiter,
+                    disk_space_admission,
+                    run_deadline,
+                    fair_share,
+                    collection_locks,
                 )
-            except WasapiDiscoveryError as exc:
-                partial_result: DiscoveryResult | None = exc.partial_result
-                partial_record_count: int = 0 if partial_result is None else len(partial_result.records)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=run_settings.collection_concurrency,
+                thread_name_prefix='collection',
+            ) as executor:
+                collection_futures: list[Future[None]] = [
+                    executor.submit(
+                        process_collection_job_with_failure_reporting,
+                        client,
+                        collection_job,
+                        downloaded_storage_root,
+                        wasapi_base_url,
+                        sheet_target,
+                        header_location,
+                        run_settings,
+                        download_slots,
+                        transfer_engine,
+                        bandwidth_limiter,
+                        disk_space_admission,
+                        run_deadline,
+                        fair_share,
+                        collection_locks,
+                    )
+                    for collection_job in collection_jobs
+                ]
+                for collection_future in collection_futures:
+                    collection_future.result()
+
+
+def process_collection_job_with_failure_reporting(
+    client: httpx.Client,
+    collection_job: CollectionJob,
+    downloaded_storage_root: Path,
+    wasapi_base_url: str,
+    worksheet: gspread.Worksheet | SnapshotSheetWriter | BackgroundSheetWriter,
+    header_location: HeaderLocation,
+    run_settings: RunSettings,
+    download_slots: threading.BoundedSemaphore | None,
+    transfer_engine: AsyncTransferEngine | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    disk_space_admission: DiskSpaceAdmission | None = None,
+    run_deadline: RunDeadline | None = None,
+    fair_share: CollectionFairShare | None = None,
+    collection_locks: CollectionLockManager | None = None,
+) -> None:
+    """
+    Processes one collection and writes a failure report if it fails, so one collection never stops the others.
+    A collection reached after the run deadline, or locked by another run, is skipped untouched, leaving its sheet row
+    for the next run.
+    Called by: run_collection_orchestration()
+    """
+    if run_deadline is not None and run_deadline.has_passed():
+        log.warning(
+            'Collection %s skipped because the run deadline %s has passed; the next run will process it.',
+            collection_job.collection_id,
+            run_deadline.deadline,
+        )
+        return
+    if collection_locks is not None and not collection_locks.try_acquire(collection_job.collection_id):
+        log.info('Collection %s skipped because another run holds its collection lock.', collection_job.collection_id)
+        return
+    try:
+        try:
+            process_collection_job(
+                client,
+                collection_job,
+                downloaded_storage_root,
+                wasapi_base_url,
+                worksheet,
+                header_location,
+                run_settings=run_settings,
+                download_slots=download_slots,
+                transfer_engine=transfer_engine,
+                bandwidth_limiter=bandwidth_limiter,
+                disk_space_admission=disk_space_admission,
+                run_deadline=run_deadline,
+                fair_share=fair_share,
+            )
+        except WasapiDiscoveryError as exc:
+            partial_record_count: int = exc.partial_record_count
+            log.exception(
+                'Collection %s discovery failed after %s partial records.',
+                collection_job.collection_id,
+                partial_record_count,
+            )
+            failure_report: CollectionProcessingReport = build_collection_failure_report(
+                storage_root=downloaded_storage_root,
+                collection_job=collection_job,
+                status_main=STATUS_DISCOVERY_FAILED,
+                status_detail=f'discovery failed after {partial_record_count} partial records',
+                reported_at=datetime.now(UTC).isoformat(),
+            )
+            try:
+                write_collection_final_report(worksheet, header_location, collection_job, failure_report)
+            except Exception:
                 log.exception(
-                    'Collection %s discovery failed after %s partial records.',
+                    'Collection %s final spreadsheet reporting failed after discovery failure.',
                     collection_job.collection_id,
-                    partial_record_count,
                 )
-                failure_report: CollectionProcessingReport = build_collection_failure_report(
-                    storage_root=downloaded_storage_root,
-                    collection_job=collection_job,
-                    status_main=STATUS_DISCOVERY_FAILED,
-                    status_detail=f'discovery failed after {partial_record_count} partial records',
-                    reported_at=datetime.now(UTC).isoformat(),
-                )
-                try:
-                    write_collection_final_report(worksheet, header_location, collection_job, failure_report)
-                except Exception:
-                    log.exception(
-                        'Collection %s final spreadsheet reporting failed after discovery failure.',
-                        collection_job.collection_id,
-                    )
+        except Exception:
+            log.exception('Collection %s processing failed.', collection_job.collection_id)
+            failure_report = build_collection_failure_report(
+                storage_root=downloaded_storage_root,
+                collection_job=collection_job,
+                status_main=STATUS_SPREADSHEET_UPDATE_FAILED,
+                status_detail='collection processing or reporting failed',
+                reported_at=datetime.now(UTC).isoformat(),
+            )
+            try:
+                write_collection_final_report(worksheet, header_location, collection_job, failure_report)
             except Exception:
-                log.exception('Collection %s processing failed.', collection_job.collection_id)
-                failure_report = build_collection_failure_report(
-                    storage_root=downloaded_storage_root,
-                    collection_job=collection_job,
-                    status_main=STATUS_SPREADSHEET_UPDATE_FAILED,
-                    status_detail='collection processing or reporting failed',
-                    reported_at=datetime.now(UTC).isoformat(),
+                log.exception(
+                    'Collection %s final spreadsheet reporting failed after processing error.',
+                    collection_job.collection_id,
                 )
-                try:
-                    write_collection_final_report(worksheet, header_location, collection_job, failure_report)
-                except Exception:
-                    log.exception(
-                        'Collection %s final spreadsheet reporting failed after processing error.',
-                        collection_job.collection_id,
-                    )
+    finally:
+        if collection_locks is not None:
+            collection_locks.release(collection_job.collection_id)
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses command-line arguments.
+    Called by: main()
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Back up WARCs for the active collections listed in the tracking spreadsheet.',
+    )
+    parser.add_argument(
+        '--deadline',
+        default=None,
+        help=(
+            'Stop starting transfers that cannot finish by this local HH:MM time or ISO 8601 datetime. '
+            'Defaults to RUN_DEADLINE from the environment.'
+        ),
+    )
+    result: argparse.Namespace = parser.parse_args()
+    return result
 
 
 ## manager function -------------------------------------------------
@@ -159,6 +349,7 @@ def main() -> None:
     Orchestrates the current sheet, state, and WASAPI discovery flow.
     Called by: __main__
     """
+    args: argparse.Namespace = parse_args()
     log.info('\n\nstarting-processing')
     ## get environment variables ------------------------------------
     spreadsheet_id: str | None = os.getenv('GSHEET_SPREADSHEET_ID')
@@ -177,11 +368,19 @@ def main() -> None:
     log.debug('envars loaded')
 
     try:
-        run_collection_orchestration(spreadsheet_id, downloaded_storage_root, wasapi_base_url, archive_it_credentials)
+        run_collection_orchestration(
+            spreadsheet_id,
+            downloaded_storage_root,
+            wasapi_base_url,
+            archive_it_credentials,
+            args.deadline,
+        )
     except CollectionSheetContractError:
         log.exception('Collection worksheet reporting contract validation failed.')
     except DevCollectionsConfigurationError:
         log.exception('DEV_COLLECTIONS configuration is invalid.')
+    except RunConfigurationError:
+        log.exception('Run configuration is invalid.')
     except RunCoordinationError:
         log.exception('Startup run coordination preflight refused to begin processing.')
     log.info('processing complete')
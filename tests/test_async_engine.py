@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import httpx
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.async_engine import AsyncTransferEngine
+from lib.downloader import download_to_path_async
+from lib.orchestration import PlannedDownload, RunSettings, build_planned_download_paths, run_planned_downloads
+from lib.wasapi_discovery import WasapiDiscoveryError, fetch_collection_discovery_async
+
+
+class ConcurrencyTracker:
+    """
+    Records how many fake requests are in flight at once.
+    """
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def hold(self, seconds: float) -> None:
+        """
+        Counts one request as in flight for the given time.
+        """
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(seconds)
+        self.active -= 1
+
+
+class TestDownloadToPathAsync(TestCase):
+    """
+    Test cases for the async downloader.
+    """
+
+    def test_resumes_partial_and_computes_digest_of_whole_file(self) -> None:
+        """
+        Checks that a leftover partial is resumed with a Range request and the digest covers the whole file.
+        """
+        requested_ranges: list[str | None] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested_ranges.append(request.headers.get('Range'))
+            return httpx.Response(206, headers={'Content-Range': 'bytes 6-10/11'}, content=b'world')
+
+        async def download(destination_path: Path) -> object:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                result = await download_to_path_async(client, 'https://example.org/file.warc.gz', destination_path)
+            return result
+
+        with TemporaryDirectory() as temp_dir:
+            destination_path = Path(temp_dir) / 'file.warc.gz'
+            destination_path.with_name('file.warc.gz.partial').write_bytes(b'hello ')
+            result = asyncio.run(download(destination_path))
+            content = destination_path.read_bytes()
+
+        self.assertTrue(result.success)
+        self.assertEqual(requested_ranges, ['bytes=6-'])
+        self.assertEqual(content, b'hello world')
+        self.assertEqual(result.resume_offset, 6)
+        self.assertEqual(result.sha256_hexdigest, hashlib.sha256(b'hello world').hexdigest())
+
+
+class TestFetchCollectionDiscoveryAsync(TestCase):
+    """
+    Test cases for async WASAPI discovery.
+    """
+
+    def test_fetches_remaining_pages_concurrently_and_keeps_page_order(self) -> None:
+        """
+        Checks that pages 2..N overlap on the event loop while records are still assembled in page order.
+        """
+        tracker = ConcurrencyTracker()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            page_number = int(request.url.params['page'])
+            await tracker.hold(0.05 / page_number)
+            next_link = f'https://example.org/wasapi?page={page_number + 1}' if page_number < 5 else None
+            return httpx.Response(
+                200,
+                json={'count': 5, 'next': next_link, 'files': [{'filename': f'page-{page_number}.warc.gz'}]},
+            )
+
+        async def discover() -> object:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                result = await fetch_collection_discovery_async(
+                    client,
+                    'https://example.org/wasapi',
+                    123,
+                    None,
+                    page_size=1,
+                    page_fetch_concurrency=3,
+                )
+            return result
+
+        result = asyncio.run(discover())
+
+        self.assertTrue(result.completed_successfully)
+        self.assertEqual([record['filename'] for record in result.records], [f'page-{n}.warc.gz' for n in range(1, 6)])
+        self.assertEqual([record.page_number for record in result.request_records], [1, 2, 3, 4, 5])
+        self.assertEqual(tracker.peak, 3)
+
+    def test_failure_keeps_only_the_contiguous_prefix(self) -> None:
+        """
+        Checks that a failed page raises with only the records from the pages before it.
+        """
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            page_number = int(request.url.params['page'])
+            result = httpx.Response(
+                200,
+                json={
+                    'count': 4,
+                    'next': f'https://example.org/wasapi?page={page_number + 1}',
+                    'files': [{'filename': f'p{page_number}'}],
+                },
+            )
+            if page_number == 3:
+                result = httpx.Response(502)
+            return result
+
+        async def discover() -> object:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                result = await fetch_collection_discovery_async(
+                    client,
+                    'https://example.org/wasapi',
+                    123,
+                    None,
+                    page_size=1,
+                    page_fetch_concurrency=4,
+                )
+            return result
+
+        with self.assertRaises(WasapiDiscoveryError) as context:
+            asyncio.run(discover())
+
+        self.assertEqual([record['filename'] for record in context.exception.partial_result.records], ['p1', 'p2'])
+
+
+class TestRunPlannedDownloadsWithEngine(TestCase):
+    """
+    Test cases for running a collection's downloads on the async transfer engine.
+    """
+
+    def test_multiplexes_downloads_within_per_host_limit_and_records_outcomes(self) -> None:
+        """
+        Checks that downloads overlap on one event loop, never exceed the per-host limit, and land in the manifest.
+        """
+        tracker = ConcurrencyTracker()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await tracker.hold(0.02)
+            return httpx.Response(200, content=request.url.path.encode('utf-8'))
+
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            filenames = [f'ARCHIVEIT-123-202603061234{index:02d}-0000{index}-alpha.warc.gz' for index in range(6)]
+            planned_downloads = [
+                PlannedDownload(
+                    filename=filename,
+                    source_url=f'https://example.org/{filename}',
+                    planned_paths=build_planned_download_paths(storage_root, 123, [{'filename': filename}])[0],
+                )
+                for filename in filenames
+            ]
+            state: dict[str, object] = {'enumeration_checkpoint_store_time_max': None, 'files': {}}
+            with AsyncTransferEngine(
+                auth=None,
+                timeout=httpx.Timeout(5.0),
+                global_limit=None,
+                per_host_limit=2,
+                transport=httpx.MockTransport(handler),
+            ) as transfer_engine:
+                download_results, fixity_results = run_planned_downloads(
+                    client=httpx.Client(),
+                    storage_root=storage_root,
+                    collection_id=123,
+                    state=state,
+                    planned_downloads=planned_downloads,
+                    run_settings=RunSettings(download_concurrency=6),
+                    transfer_engine=transfer_engine,
+                )
+            first_content = planned_downloads[0].planned_paths.warc_path.read_bytes()
+
+        self.assertEqual(len(download_results), 6)
+        self.assertTrue(all(fixity_result.success for fixity_result in fixity_results))
+        self.assertEqual(tracker.peak, 2)
+        self.assertEqual(first_content, f'/{filenames[0]}'.encode('utf-8'))
+        self.assertEqual({entry['status'] for entry in state['files'].values()}, {'downloaded'})
+
+
+if __name__ == '__main__':
+    unittest.main()
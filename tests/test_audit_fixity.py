@@ -0,0 +1,188 @@
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cron_scripts.audit_fixity import (
+    FixityAuditCandidate,
+    compute_effective_byte_budget,
+    order_audit_candidates,
+    run_fixity_audit,
+    select_audit_batch,
+)
+from lib.fixity import (
+    FixityValidationResult,
+    load_fixity_cache,
+    remember_verified_sha256,
+    save_fixity_cache,
+    validate_fixity_sidecars,
+    write_fixity_sidecars,
+)
+from lib.local_state import load_collection_state, save_collection_state
+from lib.orchestration import build_reconciliation_retry_downloads
+
+BAD_WARC_FILENAME: str = 'ARCHIVEIT-123-20260306123456-00000-bad.warc.gz'
+
+
+def build_candidate(filename: str, size: int, last_verified_at: str | None) -> FixityAuditCandidate:
+    """
+    Builds an audit candidate with placeholder paths.
+    """
+    result: FixityAuditCandidate = FixityAuditCandidate(
+        collection_id=123,
+        filename=filename,
+        warc_path=Path(f'/tmp/{filename}'),
+        sha256_path=Path(f'/tmp/{filename}.sha256'),
+        json_path=Path(f'/tmp/{filename}.json'),
+        size=size,
+        last_verified_at=last_verified_at,
+    )
+    return result
+
+
+class TestAuditScheduling(TestCase):
+    """
+    Test cases for ordering and budgeting fixity audit candidates.
+    """
+
+    def test_orders_never_verified_then_oldest_and_stops_at_budget(self) -> None:
+        """
+        Checks least-recently-verified ordering and that the batch stops before exceeding the byte budget.
+        """
+        candidates = [
+            build_candidate('recent.warc.gz', 10, '2026-03-01T00:00:00+00:00'),
+            build_candidate('old.warc.gz', 10, '2025-01-01T00:00:00+00:00'),
+            build_candidate('never.warc.gz', 10, None),
+        ]
+
+        ordered = order_audit_candidates(candidates)
+        batch = select_audit_batch(ordered, 25)
+
+        self.assertEqual([candidate.filename for candidate in ordered], ['never.warc.gz', 'old.warc.gz', 'recent.warc.gz'])
+        self.assertEqual([candidate.filename for candidate in batch], ['never.warc.gz', 'old.warc.gz'])
+
+    def test_byte_budget_is_raised_to_cover_the_cycle(self) -> None:
+        """
+        Checks that a too-small budget is raised to the per-pass share of the archive the cycle requires.
+        """
+        self.assertEqual(compute_effective_byte_budget(900, 90, 5), 10)
+        self.assertEqual(compute_effective_byte_budget(900, 90, 50), 50)
+        self.assertEqual(compute_effective_byte_budget(900, 90, None), 10)
+
+
+class TestRunFixityAudit(TestCase):
+    """
+    Test cases for one audit pass over collection state on disk.
+    """
+
+    def test_records_last_verified_at_and_uncaches_failures(self) -> None:
+        """
+        Checks that a passing file gets `last_verified_at` and a corrupted file is dropped from the fixity cache, set
+        aside, and planned for download again by the next backup run's reconciliation.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            warc_dir = storage_root / 'collections' / '123' / 'SEED1' / '2026' / '03'
+            warc_dir.mkdir(parents=True)
+            state: dict[str, object] = {'enumeration_checkpoint_store_time_max': None, 'files': {}}
+            fixity_cache: dict[str, object] = {}
+            for filename in ('good.warc.gz', BAD_WARC_FILENAME):
+                warc_path = warc_dir / filename
+                warc_path.write_bytes(b'original')
+                fixity_result = write_fixity_sidecars(
+                    warc_path,
+                    warc_path.with_name(f'{filename}.sha256'),
+                    warc_path.with_name(f'{filename}.json'),
+                    'https://example.org/warc',
+                )
+                remember_verified_sha256(fixity_cache, warc_path, str(fixity_result.sha256_hexdigest))
+                state['files'][filename] = {
+                    'status': 'downloaded',
+                    'source_url': f'https://example.org/{filename}',
+                    'warc_path': str(warc_path),
+                    'sha256_path': str(fixity_result.sha256_path),
+                    'json_path': str(fixity_result.json_path),
+                    'fixity_completed_at': '2025-01-01T00:00:00+00:00',
+                }
+            (warc_dir / BAD_WARC_FILENAME).write_bytes(b'corrupted')
+            save_collection_state(storage_root, 123, state)
+            save_fixity_cache(storage_root, 123, fixity_cache)
+
+            summary = run_fixity_audit(storage_root, [123], 90, 1000, None, 'snapshot')
+            saved_state = load_collection_state(storage_root, 123)
+            saved_cache = load_fixity_cache(storage_root, 123)
+            retry_downloads = build_reconciliation_retry_downloads(storage_root, 123, saved_state)
+            bad_warc_exists = (warc_dir / BAD_WARC_FILENAME).exists()
+            set_aside_bytes = (warc_dir / f'{BAD_WARC_FILENAME}.fixity-failed').read_bytes()
+
+        self.assertEqual(summary.verified_count, 2)
+        self.assertEqual(summary.failed_count, 1)
+        self.assertEqual(summary.remaining_overdue_count, 0)
+        self.assertEqual(saved_state['files']['good.warc.gz']['last_audit_status'], 'valid')
+        self.assertIn('last_verified_at', saved_state['files']['good.warc.gz'])
+        self.assertEqual(saved_state['files'][BAD_WARC_FILENAME]['last_audit_status'], 'failed')
+        self.assertNotIn('last_verified_at', saved_state['files'][BAD_WARC_FILENAME])
+        self.assertIn('good.warc.gz', saved_cache)
+        self.assertNotIn(BAD_WARC_FILENAME, saved_cache)
+        self.assertEqual(saved_state['files'][BAD_WARC_FILENAME]['status'], 'fixity_failed')
+        self.assertFalse(bad_warc_exists)
+        self.assertEqual(set_aside_bytes, b'corrupted')
+        self.assertEqual([download.filename for download in retry_downloads], [BAD_WARC_FILENAME])
+
+    def test_merges_results_into_state_saved_by_an_overlapping_backup_run(self) -> None:
+        """
+        Checks that entries a backup run adds while files are being hashed survive the audit's save.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            warc_dir = storage_root / 'collections' / '123' / 'SEED1' / '2026' / '03'
+            warc_dir.mkdir(parents=True)
+            warc_path = warc_dir / 'good.warc.gz'
+            warc_path.write_bytes(b'original')
+            fixity_result = write_fixity_sidecars(
+                warc_path,
+                warc_path.with_name('good.warc.gz.sha256'),
+                warc_path.with_name('good.warc.gz.json'),
+                'https://example.org/warc',
+            )
+            save_collection_state(
+                storage_root,
+                123,
+                {
+                    'enumeration_checkpoint_store_time_max': None,
+                    'files': {
+                        'good.warc.gz': {
+                            'status': 'downloaded',
+                            'warc_path': str(warc_path),
+                            'sha256_path': str(fixity_result.sha256_path),
+                            'json_path': str(fixity_result.json_path),
+                        },
+                    },
+                },
+            )
+
+            def validate_during_backup(warc: Path, sha256_path: Path, json_path: Path) -> FixityValidationResult:
+                backup_state = load_collection_state(storage_root, 123)
+                backup_state['enumeration_checkpoint_store_time_max'] = '2026-03-02T00:00:00Z'
+                backup_state['files']['new.warc.gz'] = {'status': 'downloaded'}
+                save_collection_state(storage_root, 123, backup_state)
+                return validate_fixity_sidecars(warc, sha256_path, json_path)
+
+            with patch('cron_scripts.audit_fixity.validate_fixity_sidecars', side_effect=validate_during_backup):
+                summary = run_fixity_audit(storage_root, [123], 90, 1000, None, 'snapshot')
+            saved_state = load_collection_state(storage_root, 123)
+            lock_file_exists = (storage_root / 'collections' / '123' / 'collection.lock').exists()
+
+        self.assertEqual(summary.verified_count, 1)
+        self.assertEqual(saved_state['enumeration_checkpoint_store_time_max'], '2026-03-02T00:00:00Z')
+        self.assertEqual(saved_state['files']['new.warc.gz'], {'status': 'downloaded'})
+        self.assertEqual(saved_state['files']['good.warc.gz']['last_audit_status'], 'valid')
+        self.assertTrue(lock_file_exists)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.collection_lock import CollectionLockManager
+
+
+class TestCollectionLockManager(TestCase):
+    """
+    Test cases for per-collection lock files and their heartbeat leases.
+    """
+
+    def test_second_run_skips_a_held_collection_until_it_is_released(self) -> None:
+        """
+        Checks that a held lock blocks another run, and that release leaves an empty lock file the other run can take.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            first_run = CollectionLockManager(storage_root, heartbeat_seconds=60, stale_seconds=600)
+            second_run = CollectionLockManager(storage_root, heartbeat_seconds=60, stale_seconds=600)
+
+            first_acquired = first_run.try_acquire(7)
+            blocked = second_run.try_acquire(7)
+            lease = json.loads(first_run.build_lock_path(7).read_text())
+            first_run.release(7)
+            released_content = first_run.build_lock_path(7).read_text()
+            second_acquired = second_run.try_acquire(7)
+            second_run.release(7)
+
+        self.assertTrue(first_acquired)
+        self.assertFalse(blocked)
+        self.assertEqual(lease['pid'], os.getpid())
+        self.assertEqual(released_content, '')
+        self.assertTrue(second_acquired)
+
+    def test_lease_from_another_host_blocks_until_its_heartbeat_goes_stale(self) -> None:
+        """
+        Checks that another host's fresh lease is honoured, and that a stale one is taken over.
+        """
+        with TemporaryDirectory() as temp_dir:
+            manager = CollectionLockManager(Path(temp_dir), heartbeat_seconds=60, stale_seconds=600)
+            fresh_path = manager.build_lock_path(1)
+            stale_path = manager.build_lock_path(2)
+            fresh_path.parent.mkdir(parents=True)
+            stale_path.parent.mkdir(parents=True)
+            fresh_path.write_text(json.dumps({'hostname': 'other-host', 'pid': 1, 'heartbeat_at': time.time() - 30}))
+            stale_path.write_text(json.dumps({'hostname': 'other-host', 'pid': 1, 'heartbeat_at': time.time() - 900}))
+
+            fresh_acquired = manager.try_acquire(1)
+            with self.assertLogs('lib.collection_lock', level='WARNING'):
+                stale_acquired = manager.try_acquire(2)
+            taken_over_lease = json.loads(stale_path.read_text())
+            manager.release(2)
+
+        self.assertFalse(fresh_acquired)
+        self.assertTrue(stale_acquired)
+        self.assertEqual(taken_over_lease['hostname'], manager.hostname)
+
+
+if __name__ == '__main__':
+    unittest.main()
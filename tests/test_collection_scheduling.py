@@ -0,0 +1,104 @@
+import sys
+import unittest
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.collection_scheduling import CollectionFairShare, CollectionSchedulingFacts, order_collection_jobs_by_priority
+from lib.collection_sheet import CollectionJob
+from lib.local_state import save_collection_state
+from lib.orchestration import (
+    COLLECTION_SCHEDULING_POLICY_PRIORITY,
+    RunSettings,
+    get_fair_worker_count,
+    order_collection_jobs_for_run,
+)
+
+
+class TestCollectionPriorityOrder(TestCase):
+    """
+    Test cases for ordering collections by priority, time since last success, and pending bytes.
+    """
+
+    def test_priority_then_staleness_then_pending_bytes_then_row_order(self) -> None:
+        """
+        Checks each tie-breaker in turn, with never-discovered collections ahead of any stale one.
+        """
+        now = datetime(2026, 3, 6, 12, 0, tzinfo=UTC)
+        jobs = [
+            CollectionJob(1, None, None, None, 2),
+            CollectionJob(2, None, None, None, 3),
+            CollectionJob(3, None, None, None, 4),
+            CollectionJob(4, None, None, None, 5),
+            CollectionJob(5, None, None, None, 6),
+            CollectionJob(6, None, None, None, 7, priority=5),
+        ]
+        facts = {
+            1: CollectionSchedulingFacts(pending_bytes=10, last_successful_run_at=now - timedelta(hours=2)),
+            2: CollectionSchedulingFacts(pending_bytes=900, last_successful_run_at=now - timedelta(hours=3)),
+            3: CollectionSchedulingFacts(pending_bytes=0, last_successful_run_at=now - timedelta(days=4)),
+            4: CollectionSchedulingFacts(pending_bytes=0, last_successful_run_at=None),
+            6: CollectionSchedulingFacts(pending_bytes=0, last_successful_run_at=now),
+        }
+
+        result = order_collection_jobs_by_priority(jobs, facts, now)
+
+        self.assertEqual([job.collection_id for job in result], [6, 4, 5, 3, 2, 1])
+
+    def test_run_order_reads_pending_bytes_and_last_success_from_local_state(self) -> None:
+        """
+        Checks that the priority policy orders by the sizes of undownloaded manifest entries, and that sheet order is
+        kept otherwise.
+        """
+        recent = datetime.now(UTC).isoformat()
+        jobs = [CollectionJob(10, None, None, None, 2), CollectionJob(20, None, None, None, 3)]
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            save_collection_state(
+                storage_root,
+                10,
+                {'files': {'a.warc.gz': {'status': 'downloaded', 'size': 500}}, 'last_successful_discovery_at': recent},
+            )
+            save_collection_state(
+                storage_root,
+                20,
+                {'files': {'b.warc.gz': {'status': 'failed', 'size': 50}}, 'last_successful_discovery_at': recent},
+            )
+
+            default_order = order_collection_jobs_for_run(storage_root, jobs, RunSettings())
+            priority_order = order_collection_jobs_for_run(
+                storage_root,
+                jobs,
+                RunSettings(collection_scheduling_policy=COLLECTION_SCHEDULING_POLICY_PRIORITY),
+            )
+
+        self.assertEqual([job.collection_id for job in default_order], [10, 20])
+        self.assertEqual([job.collection_id for job in priority_order], [20, 10])
+
+
+class TestCollectionFairShare(TestCase):
+    """
+    Test cases for splitting the global download cap between concurrently downloading collections.
+    """
+
+    def test_share_shrinks_while_collections_overlap_and_grows_back_when_one_finishes(self) -> None:
+        """
+        Checks that each collection's in-flight cap is an even split of the global cap while others are downloading.
+        """
+        fair_share = CollectionFairShare(total_slots=8)
+
+        with fair_share.participate(1):
+            alone = get_fair_worker_count(6, fair_share)
+            with fair_share.participate(2), fair_share.participate(3):
+                crowded = get_fair_worker_count(6, fair_share)
+            after = get_fair_worker_count(6, fair_share)
+
+        self.assertEqual((alone, crowded, after), (6, 3, 6))
+        self.assertEqual(get_fair_worker_count(6, None), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,31 @@
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+import gspread
+
 sys.path.append(str(Path(__file__).parent.parent))
 
 from lib.collection_sheet import (
+    WORKSHEET_WRITE_LOCK,
+    BackgroundSheetWriter,
     CollectionProcessingStatusUpdate,
     CollectionSheetContractError,
     CollectionSummaryUpdate,
     HeaderLocation,
+    SheetRowSnapshot,
+    SnapshotSheetWriter,
+    build_collection_status_cell_updates,
     build_spreadsheet_editability_probe_update,
     load_collection_sheet_context,
+    merge_contiguous_cell_updates,
     parse_collection_id,
     parse_collection_jobs,
+    split_range_updates,
     update_collection_final_reporting,
     update_collection_processing_status,
     validate_collection_sheet_connection,
@@ -96,6 +107,19 @@ class TestParseCollectionJobs(TestCase):
         self.assertEqual(result[0].collection_id, 321)
         self.assertEqual(result[0].repository, 'UA')
 
+    def test_optional_priority_column_is_parsed(self) -> None:
+        """
+        Checks that the optional priority column becomes an integer and that blank or unreadable values mean no priority.
+        """
+        values = [
+            ['Collection ID', 'Collection-Status', 'Priority'],
+            ['1', 'Active', '3'],
+            ['2', 'Active', ''],
+            ['3', 'Active', 'urgent'],
+        ]
+        result = parse_collection_jobs(values)
+        self.assertEqual([job.priority for job in result], [3, None, None])
+
     def test_new_reporting_column_labels_are_accepted(self) -> None:
         """
         Checks that the new row-3 reporting column labels are accepted.
@@ -188,11 +212,7 @@ class TestCollectionReportingContract(TestCase):
 
         self.assertEqual(
             worksheet.batch_update.call_args.args[0],
-            [
-                {'range': 'E7', 'values': [['discovery-in-progress']]},
-                {'range': 'F7', 'values': [['full historical backfill']]},
-                {'range': 'G7', 'values': [['12']]},
-            ],
+            [{'range': 'E7:G7', 'values': [['discovery-in-progress', 'full historical backfill', '12']]}],
         )
 
     def test_final_reporting_write_includes_status_and_summary_fields(self) -> None:
@@ -231,14 +251,21 @@ class TestCollectionReportingContract(TestCase):
         self.assertEqual(
             worksheet.batch_update.call_args.args[0],
             [
-                {'range': 'A9', 'values': [['downloaded-without-errors']]},
-                {'range': 'B9', 'values': [['1 file download completed successfully']]},
-                {'range': 'C9', 'values': [['1']]},
-                {'range': 'D9', 'values': [['2026-03-07T15:00:00+00:00']]},
-                {'range': 'E9', 'values': [['1']]},
-                {'range': 'F9', 'values': [['0.0 GB']]},
-                {'range': 'G9', 'values': [['/tmp/storage/collections/123']]},
-                {'range': 'H9', 'values': [['1']]},
+                {
+                    'range': 'A9:H9',
+                    'values': [
+                        [
+                            'downloaded-without-errors',
+                            '1 file download completed successfully',
+                            '1',
+                            '2026-03-07T15:00:00+00:00',
+                            '1',
+                            '0.0 GB',
+                            '/tmp/storage/collections/123',
+                            '1',
+                        ]
+                    ],
+                },
             ],
         )
 
@@ -303,5 +330,170 @@ class TestCollectionSheetConnectionValidation(TestCase):
         self.assertEqual(worksheet.batch_update.call_args.args[0], [{'range': 'D2', 'values': [['status-last-fetch']]}])
 
 
+
+class TestReportingColumnLayout(TestCase):
+    """
+    Test cases for the precomputed column layout and contiguous range updates.
+    """
+
+    def test_layout_resolves_legacy_names_and_adjacent_cells_merge_into_ranges(self) -> None:
+        """
+        Checks column letters past `Z`, legacy-name resolution, and that only side-by-side cells on one row merge.
+        """
+        header_location = HeaderLocation(
+            header_row_index=0,
+            column_map={'processing_status_main': 26, 'status_detail': 27, 'status_last_fetch_file_count': 29},
+        )
+        cell_updates = build_collection_status_cell_updates(
+            header_location,
+            5,
+            CollectionProcessingStatusUpdate(
+                status_last_fetch='downloading-in-progress',
+                status_detail='10% (1/10 files)',
+                status_last_fetch_file_count='10',
+            ),
+        )
+
+        merged = merge_contiguous_cell_updates(cell_updates)
+
+        self.assertEqual(header_location.reporting_layout.column_letters['status_last_fetch'], 'AA')
+        self.assertEqual(
+            merged,
+            [
+                {'range': 'AA5:AB5', 'values': [['downloading-in-progress', '10% (1/10 files)']]},
+                {'range': 'AD5', 'values': [['10']]},
+            ],
+        )
+        self.assertEqual(split_range_updates(merged), cell_updates)
+
+
+class TestSheetRowSnapshot(TestCase):
+    """
+    Test cases for skipping cells whose value has not changed.
+    """
+
+    def test_only_changed_cells_are_sent_and_the_snapshot_follows_each_write(self) -> None:
+        """
+        Checks that a status already in the sheet is not re-sent and that a repeated write makes no API call.
+        """
+        worksheet = MagicMock()
+        header_location = HeaderLocation(
+            header_row_index=0,
+            column_map={'status_last_fetch': 1, 'status_detail': 2, 'status_last_fetch_file_count': 3},
+        )
+        values = [
+            ['Collection ID', 'status-last-fetch', 'status-detail', 'status-last-fetch-file-count'],
+            ['123', 'no-new-files-to-download', 'no new files since last run', '40'],
+        ]
+        writer = SnapshotSheetWriter(worksheet, SheetRowSnapshot(values))
+        status_update = CollectionProcessingStatusUpdate(
+            status_last_fetch='no-new-files-to-download',
+            status_detail='no new files since last run',
+            status_last_fetch_file_count='41',
+        )
+
+        update_collection_processing_status(writer, header_location, 2, status_update)
+        update_collection_processing_status(writer, header_location, 2, status_update)
+
+        worksheet.batch_update.assert_called_once_with([{'range': 'D2', 'values': [['41']]}])
+
+
+class TestBackgroundSheetWriter(TestCase):
+    """
+    Test cases for the coalescing background sheet writer.
+    """
+
+    def test_updates_to_the_same_cell_coalesce_into_one_batch_written_at_close(self) -> None:
+        """
+        Checks that only the latest value per cell is written, in one call, by the final flush.
+        """
+        worksheet = MagicMock()
+        header_location = HeaderLocation(
+            header_row_index=1,
+            column_map={'status_last_fetch': 0, 'status_detail': 1, 'status_last_fetch_file_count': 2},
+        )
+
+        with BackgroundSheetWriter(worksheet, flush_interval_seconds=3600) as writer:
+            for detail in ('10% (1/10 files)', '50% (5/10 files)'):
+                update_collection_processing_status(
+                    writer,
+                    header_location,
+                    4,
+                    CollectionProcessingStatusUpdate(
+                        status_last_fetch='downloading-in-progress',
+                        status_detail=detail,
+                        status_last_fetch_file_count='10',
+                    ),
+                )
+            worksheet.batch_update.assert_not_called()
+
+        worksheet.batch_update.assert_called_once_with(
+            [{'range': 'A4:C4', 'values': [['downloading-in-progress', '50% (5/10 files)', '10']]}]
+        )
+
+    def test_queueing_does_not_wait_for_a_sheet_write_in_progress(self) -> None:
+        """
+        Checks that queueing a status update on the background writer does not take the shared worksheet write lock.
+        """
+        header_location = HeaderLocation(
+            header_row_index=1,
+            column_map={'status_last_fetch': 0, 'status_detail': 1, 'status_last_fetch_file_count': 2},
+        )
+        writer = BackgroundSheetWriter(MagicMock(), flush_interval_seconds=3600)
+        queue_thread = threading.Thread(
+            target=update_collection_processing_status,
+            args=(writer, header_location, 4, CollectionProcessingStatusUpdate(status_last_fetch='downloading-in-progress')),
+        )
+
+        with WORKSHEET_WRITE_LOCK:
+            queue_thread.start()
+            queue_thread.join(timeout=5)
+            queued_while_locked = not queue_thread.is_alive()
+        queue_thread.join()
+
+        self.assertTrue(queued_while_locked)
+        self.assertEqual(writer.pending_updates['A4'], {'range': 'A4', 'values': [['downloading-in-progress']]})
+
+    def test_quota_errors_are_retried_and_failed_batches_are_requeued_behind_newer_values(self) -> None:
+        """
+        Checks bounded retries on HTTP 429 and that a newer queued value wins over a failed batch's value.
+        """
+        response = MagicMock()
+        response.json.return_value = {'error': {'code': 429, 'message': 'Quota exceeded', 'status': 'RESOURCE_EXHAUSTED'}}
+        worksheet = MagicMock()
+        worksheet.batch_update.side_effect = gspread.exceptions.APIError(response)
+        writer = BackgroundSheetWriter(worksheet, flush_interval_seconds=3600, max_attempts=2, retry_base_seconds=0)
+
+        writer.batch_update([{'range': 'A1', 'values': [['old']]}, {'range': 'B1', 'values': [['kept']]}])
+        writer.flush()
+        writer.batch_update([{'range': 'A1', 'values': [['new']]}])
+        worksheet.batch_update.side_effect = None
+        writer.flush()
+
+        self.assertEqual(worksheet.batch_update.call_count, 3)
+        self.assertEqual(worksheet.batch_update.call_args.args[0], [{'range': 'A1:B1', 'values': [['new', 'kept']]}])
+
+
+    def test_transport_errors_keep_the_flush_thread_alive_and_requeue_the_batch(self) -> None:
+        """
+        Checks that a non-API error is retried, then requeued, and written by a later flush of the same thread.
+        """
+        worksheet = MagicMock()
+        worksheet.batch_update.side_effect = [ConnectionError('reset'), ConnectionError('reset'), None]
+        writer = BackgroundSheetWriter(worksheet, flush_interval_seconds=0.01, max_attempts=2, retry_base_seconds=0)
+
+        with writer:
+            writer.batch_update([{'range': 'A1', 'values': [['value']]}])
+            for _ in range(500):
+                if worksheet.batch_update.call_count >= 3:
+                    break
+                time.sleep(0.01)
+            thread_alive = writer.flush_thread.is_alive()
+
+        self.assertTrue(thread_alive)
+        self.assertEqual(worksheet.batch_update.call_count, 3)
+        self.assertEqual(writer.pending_updates, {})
+
+
 if __name__ == '__main__':
     unittest.main()
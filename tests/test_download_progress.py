@@ -0,0 +1,66 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import TestCase
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.download_progress import DownloadProgressTracker, format_eta
+
+
+class TestDownloadProgressTracker(TestCase):
+    """
+    Test cases for time-based download progress with byte percent, rate, and ETA.
+    """
+
+    def test_reports_are_rate_limited_and_resumed_bytes_do_not_inflate_the_rate(self) -> None:
+        """
+        Checks that no report is due inside the interval and that resumed bytes count as done but not as transferred.
+        """
+        tracker = DownloadProgressTracker(interval_seconds=60, started_at=0.0)
+        tracker.add_planned_size(3_000_000_000)
+        tracker.add_planned_size(1_000_000_000)
+
+        tracker.record_finished(3_000_000_000, bytes_written=1_200_000_000, resume_offset=1_800_000_000)
+        early_report = tracker.poll_report(1, 2, 30.0)
+        report = tracker.poll_report(1, 2, 120.0)
+        repeat_report = tracker.poll_report(1, 2, 150.0)
+
+        self.assertIsNone(early_report)
+        self.assertEqual(report, '75% (1/2 files, 3.0/4.0 GB) at 10.0 MB/s, ETA 0:01:40')
+        self.assertIsNone(repeat_report)
+
+    def test_unsized_files_fall_back_to_percent_by_files_without_an_eta(self) -> None:
+        """
+        Checks that one planned file with no WASAPI size switches percent to files and drops the ETA.
+        """
+        tracker = DownloadProgressTracker(interval_seconds=60, started_at=0.0)
+        tracker.add_planned_size(500_000_000)
+        tracker.add_planned_size(None)
+
+        tracker.record_finished(None, bytes_written=250_000_000, resume_offset=0)
+        report = tracker.poll_report(1, 2, 100.0)
+
+        self.assertEqual(report, '50% (1/2 files, 0.2 GB) at 2.5 MB/s')
+        self.assertEqual(format_eta(3725), '1:02:05')
+
+    def test_in_flight_bytes_count_toward_percent_and_rate_before_any_file_finishes(self) -> None:
+        """
+        Checks that per-chunk counter bytes are reported mid-transfer and not counted twice once the file finishes.
+        """
+        tracker = DownloadProgressTracker(interval_seconds=60, started_at=0.0)
+        tracker.add_planned_size(4_000_000_000)
+
+        tracker.byte_counter.add(1_000_000_000)
+        in_flight_report = tracker.poll_report(0, 1, 100.0)
+        tracker.byte_counter.add(3_000_000_000)
+        tracker.record_finished(4_000_000_000, bytes_written=4_000_000_000, resume_offset=0)
+        finished_report = tracker.poll_report(1, 1, 200.0)
+
+        self.assertEqual(in_flight_report, '25% (0/1 files, 1.0/4.0 GB) at 10.0 MB/s, ETA 0:05:00')
+        self.assertEqual(finished_report, '100% (1/1 files, 4.0/4.0 GB) at 20.0 MB/s, ETA 0:00:00')
+        self.assertEqual(tracker.get_seconds_until_next_report(230.0), 30.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
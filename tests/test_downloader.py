@@ -1,3 +1,4 @@
+import hashlib
 import sys
 import tempfile
 import unittest
@@ -11,7 +12,15 @@ import httpx
 sys.path.append(str(Path(__file__).parent.parent))
 
 from lib.collection_sheet import CollectionJob, HeaderLocation
-from lib.downloader import build_partial_download_path, download_to_path
+from lib.downloader import (
+    BandwidthLimiter,
+    BandwidthWindow,
+    build_partial_download_path,
+    build_partial_length_path,
+    download_to_path,
+    parse_bandwidth_schedule,
+    parse_retry_after_seconds,
+)
 from lib.orchestration import build_planned_downloads, process_collection_job
 
 
@@ -31,6 +40,47 @@ class TestBuildPartialDownloadPath(TestCase):
         self.assertEqual(result, Path('/tmp/example/file.warc.gz.partial'))
 
 
+class TestBandwidthSchedule(TestCase):
+    """
+    Test cases for the scheduled bandwidth limiter.
+    """
+
+    def test_parses_windows_including_one_that_wraps_past_midnight(self) -> None:
+        """
+        Checks decimal units, the unlimited keyword, and both separators.
+        """
+        result = parse_bandwidth_schedule('06:00-22:00=50MB/s; 22:00-06:00=unlimited, 12:00-13:00=500KB')
+
+        self.assertEqual(
+            result,
+            (
+                BandwidthWindow(start_minute=360, end_minute=1320, bytes_per_second=50_000_000),
+                BandwidthWindow(start_minute=1320, end_minute=360, bytes_per_second=None),
+                BandwidthWindow(start_minute=720, end_minute=780, bytes_per_second=500_000),
+            ),
+        )
+        with self.assertRaises(ValueError):
+            parse_bandwidth_schedule('06:00-22:00=fast')
+
+    def test_paces_shared_bucket_and_switches_rate_at_window_boundary(self) -> None:
+        """
+        Checks that reservations beyond the burst wait in turn and that an unlimited window stops all waiting.
+        """
+        limiter = BandwidthLimiter(parse_bandwidth_schedule('06:00-22:00=100B;22:00-06:00=unlimited'))
+        daytime = datetime(2026, 3, 6, 12, 0)
+        night = datetime(2026, 3, 6, 23, 30)
+
+        first_delay = limiter.reserve(100, now=daytime, monotonic_now=10.0)
+        second_delay = limiter.reserve(50, now=daytime, monotonic_now=10.0)
+        third_delay = limiter.reserve(50, now=daytime, monotonic_now=10.25)
+        night_delay = limiter.reserve(10_000_000, now=night, monotonic_now=10.25)
+
+        self.assertEqual(first_delay, 0.0)
+        self.assertAlmostEqual(second_delay, 0.5)
+        self.assertAlmostEqual(third_delay, 0.75)
+        self.assertEqual(night_delay, 0.0)
+
+
 class TestDownloadToPath(TestCase):
     """
     Test cases for streamed file downloading.
@@ -53,6 +103,7 @@ class TestDownloadToPath(TestCase):
 
             self.assertTrue(result.success)
             self.assertEqual(result.bytes_written, len(b''.join(chunks)))
+            self.assertEqual(result.sha256_hexdigest, hashlib.sha256(b''.join(chunks)).hexdigest())
             self.assertTrue(destination_path.exists())
             self.assertEqual(destination_path.read_bytes(), b''.join(chunks))
             self.assertFalse(result.partial_path.exists())
@@ -99,6 +150,289 @@ class TestDownloadToPath(TestCase):
             self.assertFalse(result.partial_path.exists())
             self.assertIn('404', result.error_message)
 
+    def test_classifies_throttling_and_not_found_failures(self) -> None:
+        """
+        Checks that 429 and 503 responses are transient and carry Retry-After, while 404 is permanent.
+        """
+        responses = {
+            '/throttled': httpx.Response(429, headers={'Retry-After': '120'}),
+            '/unavailable': httpx.Response(503, headers={'Retry-After': 'Wed, 21 Oct 2099 07:28:00 GMT'}),
+            '/missing': httpx.Response(404),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses[request.url.path]
+
+        transport = httpx.MockTransport(handler)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with httpx.Client(transport=transport) as client:
+                results = {
+                    path: download_to_path(client, f'https://example.org{path}', Path(temp_dir) / path.strip('/'))
+                    for path in responses
+                }
+
+        self.assertTrue(results['/throttled'].is_transient_failure)
+        self.assertEqual(results['/throttled'].status_code, 429)
+        self.assertEqual(results['/throttled'].retry_after_seconds, 120.0)
+        self.assertTrue(results['/unavailable'].is_transient_failure)
+        self.assertGreater(results['/unavailable'].retry_after_seconds, 0)
+        self.assertFalse(results['/missing'].is_transient_failure)
+        self.assertIsNone(results['/missing'].retry_after_seconds)
+
+    def test_parses_retry_after_http_date_relative_to_now(self) -> None:
+        """
+        Checks that an HTTP-date Retry-After becomes a non-negative delay and junk values are ignored.
+        """
+        now = datetime(2026, 3, 6, 12, 0, tzinfo=UTC)
+
+        self.assertEqual(parse_retry_after_seconds('Fri, 06 Mar 2026 12:01:30 GMT', now), 90.0)
+        self.assertEqual(parse_retry_after_seconds('Fri, 06 Mar 2026 11:00:00 GMT', now), 0.0)
+        self.assertIsNone(parse_retry_after_seconds('soon', now))
+
+    def test_verifies_wasapi_checksums_inline_and_discards_mismatched_transfer(self) -> None:
+        """
+        Checks that matching checksums are returned with the result and a mismatch deletes the partial file.
+        """
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'warc-bytes', request=request)
+
+        transport = httpx.MockTransport(handler)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            good_path = Path(temp_dir) / 'good.warc.gz'
+            bad_path = Path(temp_dir) / 'bad.warc.gz'
+            with httpx.Client(transport=transport) as client:
+                good_result = download_to_path(
+                    client,
+                    'https://example.org/good.warc.gz',
+                    good_path,
+                    expected_checksums={'md5': hashlib.md5(b'warc-bytes').hexdigest()},
+                    expected_size=10,
+                )
+                bad_result = download_to_path(
+                    client,
+                    'https://example.org/bad.warc.gz',
+                    bad_path,
+                    expected_checksums={'sha1': hashlib.sha1(b'other-bytes').hexdigest()},
+                )
+
+            self.assertTrue(good_result.success)
+            self.assertEqual(good_result.digests['md5'], hashlib.md5(b'warc-bytes').hexdigest())
+            self.assertFalse(bad_result.success)
+            self.assertIn('sha1 expected', bad_result.error_message)
+            self.assertFalse(bad_path.exists())
+            self.assertFalse(bad_result.partial_path.exists())
+
+
+class TestPreallocatedDownload(TestCase):
+    """
+    Test cases for preallocating partial files to the WASAPI size.
+    """
+
+    def test_trims_preallocated_partial_to_the_bytes_actually_received(self) -> None:
+        """
+        Checks that a short response still fails the size check instead of passing on preallocated zero bytes.
+        """
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'hello', request=request)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            complete_path = Path(temp_dir) / 'complete.warc.gz'
+            short_path = Path(temp_dir) / 'short.warc.gz'
+            with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+                complete_result = download_to_path(
+                    client,
+                    'https://example.org/file.warc.gz',
+                    complete_path,
+                    expected_size=5,
+                    preallocate=True,
+                )
+                short_result = download_to_path(
+                    client,
+                    'https://example.org/file.warc.gz',
+                    short_path,
+                    expected_size=4096,
+                    preallocate=True,
+                )
+            complete_content = complete_path.read_bytes()
+
+        self.assertTrue(complete_result.success)
+        self.assertEqual(complete_content, b'hello')
+        self.assertFalse(short_result.success)
+        self.assertIn('size expected 4096 but received 5', short_result.error_message)
+
+    def test_killed_preallocated_partial_resumes_from_its_recorded_length(self) -> None:
+        """
+        Checks that a full-size preallocated partial left by a killed run is trimmed to its recorded length and resumed.
+        """
+        full_content = b'0123456789abcdef'
+        seen_range_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_range_headers.append(request.headers.get('Range'))
+            return httpx.Response(
+                206,
+                headers={'Content-Range': f'bytes 6-15/{len(full_content)}'},
+                content=full_content[6:],
+                request=request,
+            )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination_path = Path(temp_dir) / 'file.warc.gz'
+            partial_path = build_partial_download_path(destination_path)
+            partial_path.write_bytes(full_content[:6] + bytes(len(full_content) - 6))
+            build_partial_length_path(partial_path).write_text('6', encoding='utf-8')
+            with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+                result = download_to_path(
+                    client,
+                    'https://example.org/file.warc.gz',
+                    destination_path,
+                    expected_size=len(full_content),
+                    preallocate=True,
+                )
+            content = destination_path.read_bytes()
+            length_record_left = build_partial_length_path(partial_path).exists()
+
+        self.assertTrue(result.success)
+        self.assertEqual(seen_range_headers, ['bytes=6-'])
+        self.assertEqual(result.resume_offset, 6)
+        self.assertEqual(content, full_content)
+        self.assertFalse(length_record_left)
+
+
+class TestRangeResume(TestCase):
+    """
+    Test cases for resuming leftover partial downloads with HTTP Range requests.
+    """
+
+    def test_resumes_partial_when_server_returns_matching_content_range(self) -> None:
+        """
+        Checks that an honoured Range request appends to the partial file and records the resume offset.
+        """
+        full_content = b'0123456789abcdef'
+        seen_range_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_range_headers.append(request.headers.get('Range'))
+            return httpx.Response(
+                206,
+                content=full_content[10:],
+                headers={'Content-Range': f'bytes 10-15/{len(full_content)}'},
+                request=request,
+            )
+
+        transport = httpx.MockTransport(handler)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination_path = Path(temp_dir) / 'resume' / 'file.warc.gz'
+            partial_path = build_partial_download_path(destination_path)
+            partial_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path.write_bytes(full_content[:10])
+
+            with httpx.Client(transport=transport) as client:
+                result = download_to_path(client, 'https://example.org/file.warc.gz', destination_path)
+
+            self.assertTrue(result.success)
+            self.assertEqual(seen_range_headers, ['bytes=10-'])
+            self.assertEqual(result.resume_offset, 10)
+            self.assertEqual(result.bytes_written, 6)
+            self.assertEqual(result.sha256_hexdigest, hashlib.sha256(full_content).hexdigest())
+            self.assertEqual(destination_path.read_bytes(), full_content)
+            self.assertFalse(partial_path.exists())
+
+    def test_restarts_cleanly_when_content_range_does_not_match_offset(self) -> None:
+        """
+        Checks that a 206 starting at the wrong offset is rejected in favour of a fresh full request.
+        """
+        full_content = b'0123456789abcdef'
+        seen_range_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            range_header = request.headers.get('Range')
+            seen_range_headers.append(range_header)
+            if range_header is not None:
+                return httpx.Response(
+                    206,
+                    content=full_content[4:],
+                    headers={'Content-Range': f'bytes 4-15/{len(full_content)}'},
+                    request=request,
+                )
+            return httpx.Response(200, content=full_content, request=request)
+
+        transport = httpx.MockTransport(handler)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination_path = Path(temp_dir) / 'resume' / 'file.warc.gz'
+            partial_path = build_partial_download_path(destination_path)
+            partial_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path.write_bytes(b'stale-bytes')
+
+            with httpx.Client(transport=transport) as client:
+                result = download_to_path(client, 'https://example.org/file.warc.gz', destination_path)
+
+            self.assertTrue(result.success)
+            self.assertEqual(seen_range_headers, ['bytes=11-', None])
+            self.assertEqual(result.resume_offset, 0)
+            self.assertEqual(destination_path.read_bytes(), full_content)
+
+    def test_keeps_partial_and_length_record_when_ranged_request_gets_server_error(self) -> None:
+        """
+        Checks that a 503 reply to a ranged request fails the attempt without discarding the partial or restarting.
+        """
+        seen_range_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_range_headers.append(request.headers.get('Range'))
+            return httpx.Response(503, headers={'Retry-After': '30'}, request=request)
+
+        transport = httpx.MockTransport(handler)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination_path = Path(temp_dir) / 'resume' / 'file.warc.gz'
+            partial_path = build_partial_download_path(destination_path)
+            partial_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path.write_bytes(b'x' * 500 + bytes(500))
+            build_partial_length_path(partial_path).write_text('500', encoding='utf-8')
+
+            with httpx.Client(transport=transport) as client:
+                result = download_to_path(
+                    client,
+                    'https://example.org/file.warc.gz',
+                    destination_path,
+                    expected_size=1000,
+                    preallocate=True,
+                )
+
+            self.assertFalse(result.success)
+            self.assertEqual(result.status_code, 503)
+            self.assertEqual(result.retry_after_seconds, 30.0)
+            self.assertEqual(seen_range_headers, ['bytes=500-'])
+            self.assertEqual(partial_path.read_bytes(), b'x' * 500)
+            self.assertEqual(build_partial_length_path(partial_path).read_text(encoding='utf-8'), '500')
+
+    def test_keeps_non_empty_partial_after_interrupted_transfer(self) -> None:
+        """
+        Checks that bytes received before a mid-stream failure stay on disk for the next resume attempt.
+        """
+
+        class InterruptedStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b'first-half-'
+                raise httpx.ReadError('connection reset')
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=InterruptedStream(), request=request)
+
+        transport = httpx.MockTransport(handler)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination_path = Path(temp_dir) / 'interrupted' / 'file.warc.gz'
+            with httpx.Client(transport=transport) as client:
+                result = download_to_path(client, 'https://example.org/file.warc.gz', destination_path, chunk_size=1)
+
+            self.assertFalse(result.success)
+            self.assertFalse(destination_path.exists())
+            self.assertEqual(result.partial_path.read_bytes(), b'first-half-')
+            self.assertEqual(result.bytes_written, len(b'first-half-'))
+            self.assertIn('connection reset', result.error_message)
+
 
 class TestOrchestrationDownloadConsumption(TestCase):
     """
@@ -1,5 +1,6 @@
 import hashlib
 import json
+import os
 import sys
 import tempfile
 import unittest
@@ -9,7 +10,13 @@ from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from lib.fixity import compute_sha256_for_file, write_fixity_sidecars
+from lib.fixity import (
+    compute_sha256_for_file,
+    load_fixity_cache,
+    save_fixity_cache,
+    validate_fixity_sidecars,
+    write_fixity_sidecars,
+)
 
 
 class TestComputeSha256ForFile(TestCase):
@@ -66,6 +73,84 @@ class TestWriteFixitySidecars(TestCase):
             self.assertEqual(json_data['warc_filename'], 'file.warc.gz')
             self.assertTrue(json_data['completed_at'])
 
+    def test_uses_supplied_digest_without_rereading_warc(self) -> None:
+        """
+        Checks that a digest computed during download is written without hashing the file again.
+        """
+        content = b'warc-content-here'
+        expected_digest = hashlib.sha256(content).hexdigest()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            warc_path = Path(temp_dir) / 'warcs' / 'file.warc.gz'
+            sha256_path = Path(temp_dir) / 'fixity' / 'file.warc.gz.sha256'
+            json_path = Path(temp_dir) / 'fixity' / 'file.warc.gz.json'
+            warc_path.parent.mkdir(parents=True, exist_ok=True)
+            warc_path.write_bytes(content)
+
+            with patch('lib.fixity.compute_digests_for_file') as mock_compute:
+                result = write_fixity_sidecars(
+                    warc_path,
+                    sha256_path,
+                    json_path,
+                    'https://example.org/file.warc.gz',
+                    sha256_hexdigest=expected_digest,
+                )
+
+            self.assertTrue(result.success)
+            self.assertFalse(mock_compute.called)
+            self.assertEqual(result.size, len(content))
+            self.assertEqual(sha256_path.read_text(encoding='utf-8'), f'{expected_digest} *file.warc.gz\n')
+
+    def test_verifies_and_records_wasapi_checksums_in_one_pass(self) -> None:
+        """
+        Checks that expected sha1/md5 digests are computed alongside SHA-256 and stored in the JSON sidecar.
+        """
+        content = b'warc-content-here'
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            warc_path = Path(temp_dir) / 'file.warc.gz'
+            sha256_path = Path(temp_dir) / 'file.warc.gz.sha256'
+            json_path = Path(temp_dir) / 'file.warc.gz.json'
+            warc_path.write_bytes(content)
+
+            result = write_fixity_sidecars(
+                warc_path,
+                sha256_path,
+                json_path,
+                'https://example.org/file.warc.gz',
+                expected_checksums={'SHA1': hashlib.sha1(content).hexdigest(), 'md5': hashlib.md5(content).hexdigest()},
+            )
+            json_data = json.loads(json_path.read_text(encoding='utf-8'))
+
+        self.assertTrue(result.success)
+        self.assertEqual(
+            json_data['checksums'],
+            {'md5': hashlib.md5(content).hexdigest(), 'sha1': hashlib.sha1(content).hexdigest()},
+        )
+
+    def test_fails_without_sidecars_when_wasapi_checksum_mismatches(self) -> None:
+        """
+        Checks that a WARC disagreeing with its advertised checksum gets no sidecars and a failing result.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            warc_path = Path(temp_dir) / 'file.warc.gz'
+            sha256_path = Path(temp_dir) / 'file.warc.gz.sha256'
+            json_path = Path(temp_dir) / 'file.warc.gz.json'
+            warc_path.write_bytes(b'corrupted')
+
+            result = write_fixity_sidecars(
+                warc_path,
+                sha256_path,
+                json_path,
+                'https://example.org/file.warc.gz',
+                expected_checksums={'md5': hashlib.md5(b'original').hexdigest()},
+            )
+
+            self.assertFalse(result.success)
+            self.assertIn('Checksum mismatch', result.error_message)
+            self.assertFalse(sha256_path.exists())
+            self.assertFalse(json_path.exists())
+
     def test_returns_failure_and_leaves_warc_in_place_when_sidecar_write_fails(self) -> None:
         """
         Checks that sidecar-writing failure leaves the downloaded WARC file in place.
@@ -89,5 +174,67 @@ class TestWriteFixitySidecars(TestCase):
             self.assertFalse(json_path.exists())
 
 
+class TestFixityValidationCache(TestCase):
+    """
+    Test cases for identity-keyed fixity validation caching.
+    """
+
+    def test_skips_rehash_when_file_identity_is_unchanged(self) -> None:
+        """
+        Checks that a second validation of an unchanged WARC uses the cached digest instead of rehashing.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            warc_path = Path(temp_dir) / 'file.warc.gz'
+            sha256_path = Path(temp_dir) / 'file.warc.gz.sha256'
+            json_path = Path(temp_dir) / 'file.warc.gz.json'
+            warc_path.write_bytes(b'warc-content-here')
+            write_fixity_sidecars(warc_path, sha256_path, json_path, 'https://example.org/file.warc.gz')
+            fixity_cache: dict[str, object] = {}
+
+            first_result = validate_fixity_sidecars(warc_path, sha256_path, json_path, fixity_cache=fixity_cache)
+            with patch('lib.fixity.compute_sha256_for_file') as mock_compute:
+                second_result = validate_fixity_sidecars(warc_path, sha256_path, json_path, fixity_cache=fixity_cache)
+
+            self.assertTrue(first_result.is_valid)
+            self.assertTrue(second_result.is_valid)
+            self.assertFalse(mock_compute.called)
+            self.assertIn('file.warc.gz', fixity_cache)
+
+    def test_rehashes_when_file_identity_changes(self) -> None:
+        """
+        Checks that a modified WARC is rehashed and reported invalid despite a cached digest.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            warc_path = Path(temp_dir) / 'file.warc.gz'
+            sha256_path = Path(temp_dir) / 'file.warc.gz.sha256'
+            json_path = Path(temp_dir) / 'file.warc.gz.json'
+            warc_path.write_bytes(b'warc-content-here')
+            write_fixity_sidecars(warc_path, sha256_path, json_path, 'https://example.org/file.warc.gz')
+            fixity_cache: dict[str, object] = {}
+            validate_fixity_sidecars(warc_path, sha256_path, json_path, fixity_cache=fixity_cache)
+            warc_path.write_bytes(b'warc-content-HERE')
+            os.utime(warc_path, ns=(0, 0))
+
+            result = validate_fixity_sidecars(warc_path, sha256_path, json_path, fixity_cache=fixity_cache)
+
+            self.assertFalse(result.is_valid)
+            self.assertEqual(result.error_reason, 'invalid_fixity')
+            self.assertNotIn('file.warc.gz', fixity_cache)
+
+    def test_cache_round_trips_next_to_collection_state(self) -> None:
+        """
+        Checks that the cache is stored in the collection folder and loads back unchanged.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            fixity_cache = {'file.warc.gz': {'identity': [1, 2, 3, 4], 'sha256': 'abc', 'verified_at': 'now'}}
+
+            cache_path = save_fixity_cache(storage_root, 123, fixity_cache)
+            result = load_fixity_cache(storage_root, 123)
+
+            self.assertEqual(cache_path, storage_root / 'collections' / '123' / 'fixity_cache.json')
+            self.assertEqual(result, fixity_cache)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,10 +9,15 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from lib.local_state import (
     LocalStateError,
+    add_file_to_downloaded_totals,
+    append_file_manifest_journal_entry,
     build_collection_root_path,
     build_state_file_path,
+    build_state_journal_path,
     load_collection_state,
     make_default_collection_state,
+    remove_file_from_downloaded_totals,
+    replace_downloaded_totals_from_scan,
     save_collection_state,
     update_file_manifest_for_planned_download,
 )
@@ -138,6 +143,142 @@ class TestSaveCollectionState(TestCase):
             self.assertEqual(sibling_names, {'state.json'})
 
 
+class TestStateJournal(TestCase):
+    """
+    Test cases for the append-only manifest journal.
+    """
+
+    def test_load_replays_journal_entries_onto_snapshot(self) -> None:
+        """
+        Checks that journaled manifest entries survive a crash before the next snapshot.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            save_collection_state(storage_root, 123, state)
+            state['files']['alpha.warc.gz'] = {'status': 'downloaded'}
+            append_file_manifest_journal_entry(storage_root, 123, state, 'alpha.warc.gz')
+            state['files']['alpha.warc.gz'] = {'status': 'fixity-complete'}
+            append_file_manifest_journal_entry(storage_root, 123, state, 'alpha.warc.gz')
+
+            result = load_collection_state(storage_root, 123)
+
+        self.assertEqual(result['files'], {'alpha.warc.gz': {'status': 'fixity-complete'}})
+        self.assertEqual(result['journal_sequence'], 2)
+
+    def test_load_ignores_torn_trailing_line(self) -> None:
+        """
+        Checks that a partially written final journal line is dropped instead of failing the load.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files']['alpha.warc.gz'] = {'status': 'downloaded'}
+            append_file_manifest_journal_entry(storage_root, 123, state, 'alpha.warc.gz')
+            journal_path = build_state_journal_path(storage_root, 123)
+            with journal_path.open('a', encoding='utf-8') as journal_file:
+                journal_file.write('{"sequence": 2, "filename": "beta.warc')
+
+            result = load_collection_state(storage_root, 123)
+
+        self.assertEqual(result['files'], {'alpha.warc.gz': {'status': 'downloaded'}})
+
+    def test_append_after_torn_line_starts_a_fresh_line(self) -> None:
+        """
+        Checks that replay truncates a torn final line, so the next append does not corrupt the journal.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files']['alpha.warc.gz'] = {'status': 'downloaded'}
+            append_file_manifest_journal_entry(storage_root, 123, state, 'alpha.warc.gz')
+            journal_path = build_state_journal_path(storage_root, 123)
+            with journal_path.open('a', encoding='utf-8') as journal_file:
+                journal_file.write('{"sequence": 2, "filename": "beta.warc')
+
+            reloaded_state = load_collection_state(storage_root, 123)
+            reloaded_state['files']['gamma.warc.gz'] = {'status': 'downloaded'}
+            append_file_manifest_journal_entry(storage_root, 123, reloaded_state, 'gamma.warc.gz')
+            result = load_collection_state(storage_root, 123)
+
+        self.assertEqual(set(result['files']), {'alpha.warc.gz', 'gamma.warc.gz'})
+
+    def test_snapshot_save_compacts_journal_and_skips_covered_lines(self) -> None:
+        """
+        Checks that saving a snapshot removes the journal and that stale lines are not replayed over it.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files']['alpha.warc.gz'] = {'status': 'downloaded'}
+            append_file_manifest_journal_entry(storage_root, 123, state, 'alpha.warc.gz')
+            journal_path = build_state_journal_path(storage_root, 123)
+            stale_journal_text = journal_path.read_text(encoding='utf-8')
+            state['files']['alpha.warc.gz'] = {'status': 'fixity-complete'}
+            save_collection_state(storage_root, 123, state)
+            journal_removed = not journal_path.exists()
+            journal_path.write_text(stale_journal_text, encoding='utf-8')
+
+            result = load_collection_state(storage_root, 123)
+
+        self.assertTrue(journal_removed)
+        self.assertEqual(result['files'], {'alpha.warc.gz': {'status': 'fixity-complete'}})
+
+
+class TestDownloadedTotals(TestCase):
+    """
+    Test cases for running downloaded totals kept in collection state.
+    """
+
+    def test_totals_count_each_file_once_and_drop_removed_files(self) -> None:
+        """
+        Checks that re-counting a file replaces its size and that removal reverses its contribution.
+        """
+        state = make_default_collection_state()
+        replace_downloaded_totals_from_scan(
+            state,
+            {'alpha.warc.gz': (Path('/tmp/alpha.warc.gz'), 10, 'SEED1')},
+            '2026-03-07T15:00:00+00:00',
+        )
+        add_file_to_downloaded_totals(state, 'beta.warc.gz', 5, 'SEED2')
+        add_file_to_downloaded_totals(state, 'beta.warc.gz', 7, 'SEED2')
+        removed = remove_file_from_downloaded_totals(state, 'alpha.warc.gz')
+
+        self.assertTrue(removed)
+        self.assertEqual(state['downloaded_totals']['file_count'], 1)
+        self.assertEqual(state['downloaded_totals']['byte_count'], 7)
+        self.assertEqual(state['downloaded_totals']['seed_file_counts'], {'SEED2': 1})
+        self.assertFalse(remove_file_from_downloaded_totals(state, 'alpha.warc.gz'))
+
+    def test_totals_are_not_started_without_a_rescan(self) -> None:
+        """
+        Checks that incremental updates wait for a full rescan to establish the baseline.
+        """
+        state = make_default_collection_state()
+
+        counted = add_file_to_downloaded_totals(state, 'alpha.warc.gz', 10, 'SEED1')
+
+        self.assertFalse(counted)
+        self.assertNotIn('downloaded_totals', state)
+
+    def test_journal_replay_restores_totals(self) -> None:
+        """
+        Checks that journaled lines carry running totals so they survive until the next snapshot.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            replace_downloaded_totals_from_scan(state, {}, '2026-03-07T15:00:00+00:00')
+            save_collection_state(storage_root, 123, state)
+            add_file_to_downloaded_totals(state, 'alpha.warc.gz', 10, 'SEED1')
+            append_file_manifest_journal_entry(storage_root, 123, state, 'alpha.warc.gz')
+
+            result = load_collection_state(storage_root, 123)
+
+        self.assertEqual(result['downloaded_totals']['file_count'], 1)
+        self.assertEqual(result['downloaded_totals']['byte_count'], 10)
+
+
 class TestPlannedDownloadManifestUpdates(TestCase):
     """
     Test cases for pre-download manifest persistence.
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from lib.collection_lock import CollectionLockManager
 from lib.collection_sheet import CollectionJob, HeaderLocation
 
 
@@ -109,6 +110,113 @@ class TestRunCollectionOrchestration(TestCase):
         self.assertEqual(processed_collection_job.row_number, 7)
         self.assertEqual(processed_count, 1)
 
+    def test_concurrent_collections_isolate_failures(self) -> None:
+        """
+        Checks that with COLLECTION_CONCURRENCY above one, a failing collection is reported without stopping the others.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file_path = Path(tmp_dir) / 'warc_tracker_script.log'
+            active_collection_jobs = [
+                CollectionJob(1, 'MS', 'https://example.com/1', 'Alpha', 4),
+                CollectionJob(2, 'UA', 'https://example.com/2', 'Beta', 5),
+                CollectionJob(3, 'UA', 'https://example.com/3', 'Gamma', 6),
+            ]
+            sheet_context = SimpleNamespace(
+                collection_jobs=active_collection_jobs,
+                worksheet=MagicMock(),
+                header_location=HeaderLocation(header_row_index=2, column_map={'status_last_fetch': 3}),
+                values=[],
+            )
+            http_client_context = MagicMock()
+            http_client_context.__enter__.return_value = MagicMock()
+
+            def fake_process(client: object, collection_job: CollectionJob, *args: object, **kwargs: object) -> None:
+                if collection_job.collection_id == 2:
+                    raise RuntimeError('boom')
+
+            with (
+                patch.dict(os.environ, {'LOG_PATH': str(log_file_path), 'COLLECTION_CONCURRENCY': '3'}, clear=False),
+                patch('dotenv.load_dotenv', return_value=False),
+            ):
+                os.environ.pop('DEV_COLLECTIONS', None)
+                import main
+
+                importlib.reload(main)
+                with (
+                    patch('main.load_collection_sheet_context', return_value=sheet_context),
+                    patch('main.enforce_startup_run_coordination'),
+                    patch('main.httpx.Client', return_value=http_client_context),
+                    patch('main.process_collection_job', side_effect=fake_process) as mock_process_collection_job,
+                    patch('main.build_collection_failure_report', return_value='failure-report'),
+                    patch('main.write_collection_final_report') as mock_write_final_report,
+                ):
+                    main.run_collection_orchestration(
+                        spreadsheet_id='spreadsheet-id',
+                        downloaded_storage_root=Path(tmp_dir),
+                        wasapi_base_url='https://example.com/wasapi',
+                        archive_it_credentials=('user', 'pass'),
+                    )
+
+                processed_ids = sorted(call.args[1].collection_id for call in mock_process_collection_job.call_args_list)
+                reported_ids = [call.args[2].collection_id for call in mock_write_final_report.call_args_list]
+
+        self.assertEqual(processed_ids, [1, 2, 3])
+        self.assertEqual(reported_ids, [2])
+
+    def test_collection_locks_mode_skips_collections_held_by_another_run(self) -> None:
+        """
+        Checks that RUN_COORDINATION_MODE=collection_locks skips a collection locked by another run and releases its own.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file_path = Path(tmp_dir) / 'warc_tracker_script.log'
+            storage_root = Path(tmp_dir) / 'storage'
+            active_collection_jobs = [
+                CollectionJob(1, 'MS', 'https://example.com/1', 'Alpha', 4),
+                CollectionJob(2, 'UA', 'https://example.com/2', 'Beta', 5),
+            ]
+            sheet_context = SimpleNamespace(
+                collection_jobs=active_collection_jobs,
+                worksheet=MagicMock(),
+                header_location=HeaderLocation(header_row_index=2, column_map={'status_last_fetch': 3}),
+                values=[],
+            )
+            http_client_context = MagicMock()
+            http_client_context.__enter__.return_value = MagicMock()
+            other_run = CollectionLockManager(storage_root, heartbeat_seconds=60, stale_seconds=600)
+            other_run.try_acquire(2)
+
+            with (
+                patch.dict(
+                    os.environ,
+                    {'LOG_PATH': str(log_file_path), 'RUN_COORDINATION_MODE': 'collection_locks'},
+                    clear=False,
+                ),
+                patch('dotenv.load_dotenv', return_value=False),
+            ):
+                os.environ.pop('DEV_COLLECTIONS', None)
+                import main
+
+                importlib.reload(main)
+                with (
+                    patch('main.load_collection_sheet_context', return_value=sheet_context),
+                    patch('main.httpx.Client', return_value=http_client_context),
+                    patch('main.process_collection_job') as mock_process_collection_job,
+                ):
+                    main.run_collection_orchestration(
+                        spreadsheet_id='spreadsheet-id',
+                        downloaded_storage_root=storage_root,
+                        wasapi_base_url='https://example.com/wasapi',
+                        archive_it_credentials=('user', 'pass'),
+                    )
+
+                processed_ids = [call.args[1].collection_id for call in mock_process_collection_job.call_args_list]
+                other_run.release(2)
+                collection_one_free = other_run.try_acquire(1)
+                other_run.release(1)
+
+        self.assertEqual(processed_ids, [1])
+        self.assertTrue(collection_one_free)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@ import hashlib
 import json
 import os
 import sys
+import threading
 import unittest
 from copy import deepcopy
 from datetime import UTC, datetime
@@ -15,13 +16,22 @@ import httpx
 sys.path.append(str(Path(__file__).parent.parent))
 
 from lib.collection_sheet import CollectionJob, HeaderLocation
+from lib.disk_space import DiskSpaceAdmission
+from lib.downloader import DownloadResult
 from lib.fixity import FixityResult
+from lib.local_state import (
+    load_collection_state,
+    update_file_manifest_for_download_result,
+    update_file_manifest_for_planned_download,
+)
 from lib.orchestration import (
     BLOCKING_COORDINATION_STATUSES,
     DISCOVERY_MODE_FULL_BACKFILL_FIRST_RUN,
     DISCOVERY_MODE_INCREMENTAL_OVERLAP_WINDOW,
+    FIXITY_VALIDATION_MODE_FULL_REVERIFICATION,
     RUN_COORDINATION_MODE_SKIP_SPREADSHEET_COORDINATION_CHECK,
     STATUS_COMPLETED_WITH_SOME_FILE_FAILURES,
+    STATUS_DEFERRED_FOR_DISK_SPACE,
     STATUS_DISCOVERY_IN_PROGRESS,
     STATUS_DOWNLOADED_WITHOUT_ERRORS,
     STATUS_DOWNLOADING_IN_PROGRESS,
@@ -29,14 +39,19 @@ from lib.orchestration import (
     STATUS_NO_NEW_FILES_TO_DOWNLOAD,
     DevCollectionsConfigurationError,
     PlannedDownload,
+    RunConfigurationError,
     RunCoordinationError,
+    RunSettings,
+    admit_planned_downloads,
     build_collection_failure_report,
     build_collection_final_report,
     build_download_progress_detail,
     build_evaluated_active_downloads,
+    build_global_download_slots,
     build_planned_download_paths,
     build_planned_downloads,
     build_reconciliation_retry_downloads,
+    compute_next_retry_after,
     count_discovered_warc_filename_records,
     count_pending_download_candidates,
     determine_collection_discovery_mode,
@@ -45,17 +60,25 @@ from lib.orchestration import (
     get_archive_it_credentials,
     get_blocking_coordination_summary,
     get_dev_collection_ids,
-    get_download_progress_file_interval_update,
+    get_download_concurrency,
     get_downloaded_storage_root,
     get_record_source_url,
     get_run_coordination_mode,
+    get_run_settings,
+    load_collection_fixity_cache,
     merge_planned_downloads,
+    order_planned_downloads,
     parse_dev_collection_ids,
+    parse_positive_int_setting,
     process_collection_job,
+    project_download_completion_seconds,
+    refresh_downloaded_totals_if_due,
     resolve_collection_jobs_for_run,
     run_planned_downloads,
+    schedule_failed_download_retry,
     should_skip_spreadsheet_coordination_check,
 )
+from lib.wasapi_discovery import DiscoveryPage, DiscoveryRequestRecord, WasapiDiscoveryError
 
 
 class TestGetStorageRoot(TestCase):
@@ -410,6 +433,24 @@ class TestDownloadPlanningHelpers(TestCase):
         self.assertEqual(result[0].filename, 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz')
         self.assertEqual(result[0].source_url, 'https://example.org/alpha.warc.gz')
 
+    def test_build_planned_downloads_carries_wasapi_checksums_and_size(self) -> None:
+        """
+        Checks that advertised checksums and size travel with the planned download for inline verification.
+        """
+        discovered_records = [
+            {
+                'filename': 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz',
+                'locations': ['https://example.org/alpha.warc.gz'],
+                'checksums': {'SHA1': 'ABC123', 'md5': 'def456'},
+                'size': 42,
+            },
+        ]
+
+        result = build_planned_downloads(Path('/tmp/storage'), 123, discovered_records)
+
+        self.assertEqual(result[0].expected_checksums, {'sha1': 'abc123', 'md5': 'def456'})
+        self.assertEqual(result[0].expected_size, 42)
+
     def test_build_reconciliation_retry_downloads_includes_missing_local_warc(self) -> None:
         """
         Checks that a manifest entry with a missing local WARC and usable source URL becomes a retry candidate.
@@ -603,6 +644,374 @@ class TestDownloadPlanningHelpers(TestCase):
         self.assertEqual(reason_counts['retry_after_prior_failure'], 1)
 
 
+    def test_build_evaluated_active_downloads_skips_files_still_cooling_down(self) -> None:
+        """
+        Checks that failed and quarantined files wait out `next_retry_after`, and are retried once it has passed.
+        """
+        storage_root = Path('/tmp/storage')
+        filenames = [f'ARCHIVEIT-123-20260306123456-0000{index}-cooldown.warc.gz' for index in range(3)]
+        planned_downloads = [
+            PlannedDownload(
+                filename=filename,
+                source_url=f'https://example.org/{filename}',
+                planned_paths=build_planned_download_paths(storage_root, 123, [{'filename': filename}])[0],
+            )
+            for filename in filenames
+        ]
+        state = {
+            'files': {
+                filenames[0]: {'status': 'failed', 'next_retry_after': '2099-01-01T00:00:00+00:00'},
+                filenames[1]: {'status': 'quarantined', 'next_retry_after': '2099-01-01T00:00:00+00:00'},
+                filenames[2]: {'status': 'failed', 'next_retry_after': '2020-01-01T00:00:00+00:00'},
+            }
+        }
+
+        with patch('pathlib.Path.exists', return_value=False):
+            active_downloads, reason_counts = build_evaluated_active_downloads(planned_downloads, state)
+
+        self.assertEqual([planned_download.filename for planned_download in active_downloads], [filenames[2]])
+        self.assertEqual(reason_counts, {'retry_cooldown': 1, 'quarantined': 1, 'missing_warc': 1})
+
+
+class TestDownloadRetryScheduling(TestCase):
+    """
+    Test cases for cross-run retry backoff, quarantine, and in-run transient retries.
+    """
+
+    def test_backoff_grows_per_failure_and_honours_longer_retry_after(self) -> None:
+        """
+        Checks exponential backoff with equal jitter, Retry-After taking precedence, and quarantine after max attempts.
+        """
+        settings = RunSettings(download_max_attempts=3, download_retry_base_seconds=100, download_quarantine_days=2)
+        now = datetime(2026, 3, 6, 12, 0, tzinfo=UTC)
+
+        first_retry = compute_next_retry_after(1, None, settings, now, 0.0)
+        second_retry = compute_next_retry_after(2, None, settings, now, 1.0)
+        throttled_retry = compute_next_retry_after(1, 3600.0, settings, now, 1.0)
+        quarantined_retry = compute_next_retry_after(3, None, settings, now, 0.5)
+
+        self.assertEqual(first_retry, ('2026-03-06T12:00:50+00:00', False))
+        self.assertEqual(second_retry, ('2026-03-06T12:03:20+00:00', False))
+        self.assertEqual(throttled_retry, ('2026-03-06T13:00:00+00:00', False))
+        self.assertEqual(quarantined_retry, ('2026-03-08T12:00:00+00:00', True))
+
+    def test_success_resets_the_consecutive_failures_that_drive_quarantine(self) -> None:
+        """
+        Checks that a file with old failures behind a successful download is not quarantined on its next failure.
+        """
+        filename = 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz'
+        warc_path = Path('/tmp/storage') / filename
+        state = {'files': {filename: {'status': 'failed', 'error_count': 7}}}
+        settings = RunSettings(download_max_attempts=8)
+        failed_result = DownloadResult(
+            success=False,
+            destination_path=warc_path,
+            partial_path=warc_path.with_name(f'{filename}.partial'),
+            bytes_written=0,
+            source_url='https://example.org/alpha.warc.gz',
+            error_message='503 Service Unavailable',
+        )
+
+        update_file_manifest_for_download_result(state, filename, failed_result.source_url, warc_path, True, None)
+        update_file_manifest_for_download_result(state, filename, failed_result.source_url, warc_path, False, 'boom')
+        schedule_failed_download_retry(123, state, filename, failed_result, settings)
+
+        entry = state['files'][filename]
+        self.assertEqual(entry['status'], 'failed')
+        self.assertEqual(entry['consecutive_download_failures'], 1)
+        self.assertEqual(entry['error_count'], 8)
+
+    def test_legacy_failures_seed_the_counter_after_planning_resets_the_status(self) -> None:
+        """
+        Checks that a pre-counter entry keeps its `error_count` failures once planning has marked it pending.
+        """
+        filename = 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz'
+        warc_path = Path('/tmp/storage') / filename
+        state = {'files': {filename: {'status': 'failed', 'download_status': 'failed', 'error_count': 3}}}
+        settings = RunSettings(download_max_attempts=4)
+        failed_result = DownloadResult(
+            success=False,
+            destination_path=warc_path,
+            partial_path=warc_path.with_name(f'{filename}.partial'),
+            bytes_written=0,
+            source_url='https://example.org/alpha.warc.gz',
+            error_message='503 Service Unavailable',
+        )
+
+        update_file_manifest_for_planned_download(
+            state, filename, failed_result.source_url, warc_path, '2026-03-06T12:00:00+00:00'
+        )
+        self.assertEqual(state['files'][filename]['status'], 'pending_download')
+        update_file_manifest_for_download_result(state, filename, failed_result.source_url, warc_path, False, 'boom')
+        schedule_failed_download_retry(123, state, filename, failed_result, settings)
+
+        entry = state['files'][filename]
+        self.assertEqual(entry['consecutive_download_failures'], 4)
+        self.assertEqual(entry['status'], 'quarantined')
+
+    def test_retries_transient_failure_in_run_after_retry_after_and_schedules_next_run(self) -> None:
+        """
+        Checks that a 429 is retried within the run after its Retry-After delay and the last failure gets a retry time.
+        """
+        filename = 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz'
+        planned_download = PlannedDownload(
+            filename=filename,
+            source_url='https://example.org/alpha.warc.gz',
+            planned_paths=build_planned_download_paths(Path('/tmp/storage'), 123, [{'filename': filename}])[0],
+        )
+        state = {'files': {}}
+        throttled_result = DownloadResult(
+            success=False,
+            destination_path=planned_download.planned_paths.warc_path,
+            partial_path=planned_download.planned_paths.warc_path.with_name(f'{filename}.part'),
+            bytes_written=0,
+            source_url=planned_download.source_url,
+            error_message='429 Too Many Requests',
+            failure_kind='http_status',
+            status_code=429,
+            retry_after_seconds=7.0,
+        )
+
+        with (
+            patch('lib.orchestration.download_to_path', return_value=throttled_result) as mock_download,
+            patch('lib.orchestration.save_collection_state'),
+            patch('lib.orchestration.time.sleep') as mock_sleep,
+            patch('pathlib.Path.exists', return_value=False),
+        ):
+            run_planned_downloads(
+                client=MagicMock(spec=httpx.Client),
+                storage_root=Path('/tmp/storage'),
+                collection_id=123,
+                state=state,
+                planned_downloads=[planned_download],
+                run_settings=RunSettings(download_attempts_per_run=2),
+            )
+
+        self.assertEqual(mock_download.call_count, 2)
+        mock_sleep.assert_called_once_with(7.0)
+        self.assertEqual(state['files'][filename]['status'], 'failed')
+        self.assertEqual(state['files'][filename]['error_count'], 1)
+        self.assertIn('next_retry_after', state['files'][filename])
+
+
+class TestDownloadSchedulingPolicies(TestCase):
+    """
+    Test cases for ordering active downloads and projecting their completion.
+    """
+
+    def build_scheduled_downloads(self) -> list[PlannedDownload]:
+        """
+        Builds four planned downloads across two seeds with varied sizes and store-times, one lacking both.
+        """
+        result: list[PlannedDownload] = []
+        for index, seed_id, size, store_time in (
+            (0, 'SEED1', 300, '2026-03-01T00:00:00Z'),
+            (1, 'SEED1', 100, '2026-03-05T00:00:00Z'),
+            (2, 'SEED1', None, None),
+            (3, 'SEED2', 200, '2026-03-03T00:00:00Z'),
+        ):
+            filename = f'ARCHIVEIT-123-20260306123456-0000{index}-{seed_id}-alpha.warc.gz'
+            result.append(
+                PlannedDownload(
+                    filename=filename,
+                    source_url=f'https://example.org/{filename}',
+                    planned_paths=build_planned_download_paths(Path('/tmp/storage'), 123, [{'filename': filename}])[0],
+                    expected_size=size,
+                    store_time=store_time,
+                )
+            )
+        return result
+
+    def test_orders_by_each_policy_with_missing_fields_last(self) -> None:
+        """
+        Checks size, store-time, and seed round-robin ordering, and that the discovery policy keeps the input order.
+        """
+        planned_downloads = self.build_scheduled_downloads()
+
+        def order_indexes(policy: str) -> list[int]:
+            return [planned_downloads.index(item) for item in order_planned_downloads(planned_downloads, policy)]
+
+        self.assertEqual(order_indexes('discovery'), [0, 1, 2, 3])
+        self.assertEqual(order_indexes('largest_first'), [0, 3, 1, 2])
+        self.assertEqual(order_indexes('smallest_first'), [1, 3, 0, 2])
+        self.assertEqual(order_indexes('newest_first'), [1, 3, 0, 2])
+        self.assertEqual(order_indexes('seed_round_robin'), [0, 3, 1, 2])
+
+    def test_projects_completion_by_assigning_each_file_to_the_first_free_worker(self) -> None:
+        """
+        Checks list-scheduling projection across two workers at a fixed per-stream rate.
+        """
+        planned_downloads = order_planned_downloads(self.build_scheduled_downloads(), 'largest_first')
+
+        result = project_download_completion_seconds(planned_downloads, 2, 100.0)
+
+        self.assertEqual(result, [3.0, 2.0, 3.0, 3.0])
+
+
+class TestDiskSpaceAdmission(TestCase):
+    """
+    Test cases for admitting planned downloads against free space on the storage volume.
+    """
+
+    def test_defers_files_that_would_break_the_reserve_and_frees_space_on_release(self) -> None:
+        """
+        Checks priority-order admission that skips only the files that do not fit, and that a release frees room.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            planned_downloads = [
+                PlannedDownload(
+                    filename=filename,
+                    source_url=f'https://example.org/{filename}',
+                    planned_paths=build_planned_download_paths(storage_root, 123, [{'filename': filename}])[0],
+                    expected_size=size,
+                )
+                for filename, size in (
+                    ('ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz', 500),
+                    ('ARCHIVEIT-123-20260306123456-00001-alpha.warc.gz', 450),
+                    ('ARCHIVEIT-123-20260306123456-00002-alpha.warc.gz', 300),
+                )
+            ]
+            reason_counts: dict[str, int] = {'missing_warc': 3}
+            admission = DiskSpaceAdmission(storage_root, reserve_bytes=100)
+
+            with patch('lib.disk_space.get_available_disk_bytes', return_value=1000):
+                admitted, deferred = admit_planned_downloads(123, planned_downloads, reason_counts, admission)
+                admission.release(planned_downloads[0].planned_paths.warc_path)
+                readmitted, _ = admit_planned_downloads(123, [planned_downloads[1]], {}, admission)
+
+        self.assertEqual(admitted, [planned_downloads[0], planned_downloads[2]])
+        self.assertEqual(deferred, [planned_downloads[1]])
+        self.assertEqual(reason_counts, {'missing_warc': 3, 'deferred_disk_space': 1})
+        self.assertEqual(readmitted, [planned_downloads[1]])
+        self.assertEqual(admission.reserved_bytes, 750)
+
+    def test_deferred_file_is_kept_in_the_manifest_and_downloaded_by_the_next_run(self) -> None:
+        """
+        Checks that a deferred file gets a pending manifest entry and a non-success status, and that the next run
+        retries it through reconciliation even though the discovery checkpoint has already moved past it.
+        """
+        filename = 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz'
+        collection_job = CollectionJob(123, 'UA', 'https://example.com', 'Example', 7)
+        header_location = HeaderLocation(header_row_index=1, column_map={'status_last_fetch': 0})
+        first_discovery = MagicMock()
+        first_discovery.records = [
+            {'filename': filename, 'locations': ['https://example.org/alpha.warc.gz'], 'size': 500}
+        ]
+        first_discovery.request_records = [{'page': 1}]
+        first_discovery.completed_successfully = True
+        first_discovery.max_observed_store_time = '2026-03-06T12:00:00Z'
+        second_discovery = MagicMock()
+        second_discovery.records = []
+        second_discovery.request_records = [{'page': 1}]
+        second_discovery.completed_successfully = True
+        second_discovery.max_observed_store_time = '2026-03-06T12:00:00Z'
+
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            warc_path = build_planned_download_paths(storage_root, 123, [{'filename': filename}])[0].warc_path
+            download_result = DownloadResult(
+                success=True,
+                destination_path=warc_path,
+                partial_path=warc_path.with_name(f'{filename}.partial'),
+                bytes_written=500,
+                source_url='https://example.org/alpha.warc.gz',
+                error_message=None,
+            )
+            with (
+                patch('lib.orchestration.fetch_collection_discovery', side_effect=[first_discovery, second_discovery]),
+                patch('lib.orchestration.download_to_path', return_value=download_result) as mock_download,
+                patch('lib.orchestration.write_fixity_sidecars', return_value=None),
+                patch('lib.orchestration.update_collection_processing_status'),
+                patch('lib.orchestration.update_collection_final_reporting'),
+                patch('lib.disk_space.get_available_disk_bytes', return_value=0),
+            ):
+                first_report = process_collection_job(
+                    MagicMock(spec=httpx.Client),
+                    collection_job,
+                    storage_root,
+                    'https://example.org/wasapi',
+                    MagicMock(),
+                    header_location,
+                    disk_space_admission=DiskSpaceAdmission(storage_root, reserve_bytes=100),
+                )
+                first_download_count = mock_download.call_count
+                deferred_entry = load_collection_state(storage_root, 123)['files'][filename]
+                process_collection_job(
+                    MagicMock(spec=httpx.Client),
+                    collection_job,
+                    storage_root,
+                    'https://example.org/wasapi',
+                    MagicMock(),
+                    header_location,
+                )
+
+        self.assertEqual(first_download_count, 0)
+        self.assertEqual(first_report.status_update.status_last_fetch, STATUS_DEFERRED_FOR_DISK_SPACE)
+        self.assertIn('1 deferred for lack of disk space', first_report.status_update.status_detail)
+        self.assertEqual(deferred_entry['status'], 'pending_download')
+        self.assertEqual(mock_download.call_count, 1)
+        self.assertEqual(mock_download.call_args.args[1], 'https://example.org/alpha.warc.gz')
+
+    def test_existing_warc_failing_wasapi_checksum_is_set_aside_and_downloaded_again(self) -> None:
+        """
+        Checks that a bad existing copy is replaced in the run that finds it, and that the next run leaves the good
+        copy alone instead of failing fixity on it again.
+        """
+        filename = 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz'
+        good_content = b'original'
+        collection_job = CollectionJob(123, 'UA', 'https://example.com', 'Example', 7)
+        header_location = HeaderLocation(header_row_index=1, column_map={'status_last_fetch': 0})
+        discovery = MagicMock()
+        discovery.records = [
+            {
+                'filename': filename,
+                'locations': ['https://example.org/alpha.warc.gz'],
+                'size': len(good_content),
+                'checksums': {'sha1': hashlib.sha1(good_content).hexdigest()},
+            }
+        ]
+        discovery.request_records = [{'page': 1}]
+        discovery.completed_successfully = True
+        discovery.max_observed_store_time = '2026-03-06T12:00:00Z'
+        seen_urls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_urls.append(str(request.url))
+            return httpx.Response(200, content=good_content, request=request)
+
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            warc_path = build_planned_download_paths(storage_root, 123, [{'filename': filename}])[0].warc_path
+            warc_path.parent.mkdir(parents=True)
+            warc_path.write_bytes(b'corruptd')
+            with (
+                httpx.Client(transport=httpx.MockTransport(handler)) as client,
+                patch('lib.orchestration.fetch_collection_discovery', return_value=discovery),
+                patch('lib.orchestration.update_collection_processing_status'),
+                patch('lib.orchestration.update_collection_final_reporting'),
+            ):
+                process_collection_job(
+                    client, collection_job, storage_root, 'https://example.org/wasapi', MagicMock(), header_location
+                )
+                first_run_urls = list(seen_urls)
+                first_run_entry = load_collection_state(storage_root, 123)['files'][filename]
+                process_collection_job(
+                    client, collection_job, storage_root, 'https://example.org/wasapi', MagicMock(), header_location
+                )
+            second_run_entry = load_collection_state(storage_root, 123)['files'][filename]
+            content = warc_path.read_bytes()
+            set_aside_content = warc_path.with_name(f'{filename}.fixity-failed').read_bytes()
+
+        self.assertEqual(first_run_urls, ['https://example.org/alpha.warc.gz'])
+        self.assertEqual(first_run_entry['status'], 'downloaded')
+        self.assertEqual(first_run_entry['fixity_status'], 'created')
+        self.assertEqual(content, good_content)
+        self.assertEqual(set_aside_content, b'corruptd')
+        self.assertEqual(seen_urls, first_run_urls)
+        self.assertEqual(second_run_entry['status'], 'downloaded')
+
+
 class TestProcessCollectionJob(TestCase):
     """
     Test cases for per-collection orchestration.
@@ -741,8 +1150,10 @@ class TestProcessCollectionJob(TestCase):
         self.assertEqual(result.status_update.processing_status_main, STATUS_DOWNLOADED_WITHOUT_ERRORS)
         self.assertEqual(result.status_update.processing_status_detail, '1 file download completed successfully')
         self.assertEqual(result.status_update.status_last_fetch_file_count, '1')
-        self.assertEqual(result.summary_update.summary_status_downloaded_warcs_count, '0')
+        self.assertEqual(result.summary_update.summary_status_downloaded_warcs_count, '1')
         self.assertEqual(result.summary_update.summary_status_downloaded_warcs_size, '0.0 GB')
+        self.assertEqual(saved_state['downloaded_totals']['file_count'], 1)
+        self.assertEqual(saved_state['downloaded_totals']['seed_file_counts'], {'UNKNOWN_SEED': 1})
 
     def test_zero_planned_downloads_write_planning_then_no_new_files_statuses(self) -> None:
         """
@@ -1246,50 +1657,141 @@ class TestProcessCollectionJob(TestCase):
         self.assertEqual(mock_download.call_count, 1)
 
 
-class TestRunPlannedDownloads(TestCase):
+class TestStreamedDiscoveryPipeline(TestCase):
     """
-    Test cases for the sequential planned-download loop.
+    Test cases for the streaming discovery pipeline.
     """
 
-    def test_download_progress_helper_formats_expected_update_text(self) -> None:
+    def build_page(self, page_number: int, filename: str, store_time: str) -> DiscoveryPage:
         """
-        Checks that progress-detail text uses the expected compact update format.
+        Builds one discovery page holding a single WARC record.
         """
-        result = build_download_progress_detail(40, 6, 15)
-
-        self.assertEqual(result, '40% (6/15 files)')
+        result = DiscoveryPage(
+            page_number=page_number,
+            records=[{'filename': filename, 'locations': [f'https://example.org/{filename}'], 'store-time': store_time}],
+            request_record=DiscoveryRequestRecord(page_number, 'https://example.org/wasapi', {}, '', 200),
+            max_observed_store_time=store_time,
+        )
+        return result
 
-    def test_download_progress_helper_emits_every_ten_completed_downloads(self) -> None:
+    def run_streaming_job(self, pages: list[object]) -> tuple[list[str], list[dict[str, object]], object]:
         """
-        Checks that progress updates are emitted only when another ten downloads complete.
+        Runs process_collection_job in streaming mode over fake pages and returns events, saved states, and any error.
         """
-        last_reported_completed_count, progress_detail = get_download_progress_file_interval_update(25, 9, 0)
-        self.assertEqual(last_reported_completed_count, 0)
-        self.assertIsNone(progress_detail)
+        events: list[str] = []
+        saved_state_snapshots: list[dict[str, object]] = []
+        collection_job = CollectionJob(123, 'UA', 'https://example.com', 'Example', 7)
+        header_location = HeaderLocation(header_row_index=1, column_map={})
+
+        def fake_pages(*args: object, **kwargs: object):
+            for page in pages:
+                if isinstance(page, Exception):
+                    events.append('discovery failed')
+                    raise page
+                events.append(f'page {page.page_number}')
+                yield page
+
+        def fake_download(client: object, source_url: str, destination_path: Path, **kwargs: object) -> DownloadResult:
+            events.append(f'download {destination_path.name}')
+            result = DownloadResult(True, destination_path, destination_path, 11, source_url, None)
+            return result
+
+        def fake_fixity(warc_path: Path, sha256_path: Path, json_path: Path, source_url: str, **kwargs: object):
+            result = FixityResult(True, warc_path, sha256_path, json_path, 'abc', 11, source_url, '2026', None)
+            return result
+
+        error: object = None
+        with (
+            patch(
+                'lib.orchestration.load_collection_state',
+                return_value={'enumeration_checkpoint_store_time_max': None, 'files': {}},
+            ),
+            patch('lib.orchestration.iter_collection_discovery_pages', side_effect=fake_pages),
+            patch('lib.orchestration.fetch_collection_discovery') as mock_fetch,
+            patch('lib.orchestration.save_collection_state') as mock_save,
+            patch('lib.orchestration.download_to_path', side_effect=fake_download),
+            patch('lib.orchestration.write_fixity_sidecars', side_effect=fake_fixity),
+            patch('lib.orchestration.load_collection_fixity_cache', return_value={}),
+            patch('lib.orchestration.save_fixity_cache_if_changed'),
+            patch('lib.orchestration.log_collection_download_summary'),
+            patch('lib.orchestration.get_collection_downloaded_totals', return_value=(0, 0)),
+            patch('lib.orchestration.update_collection_processing_status'),
+            patch('lib.orchestration.update_collection_final_reporting'),
+        ):
+            mock_save.side_effect = lambda storage_root, collection_id, state: saved_state_snapshots.append(deepcopy(state))
+            try:
+                process_collection_job(
+                    MagicMock(spec=httpx.Client),
+                    collection_job,
+                    Path('/tmp/storage'),
+                    'https://example.org/wasapi',
+                    MagicMock(),
+                    header_location,
+                    run_settings=RunSettings(discovery_pipeline_mode='streaming'),
+                )
+            except WasapiDiscoveryError as exc:
+                error = exc
+            mock_fetch.assert_not_called()
+        result = (events, saved_state_snapshots, error)
+        return result
+
+    def test_downloads_start_before_enumeration_finishes_and_checkpoint_advances_last(self) -> None:
+        """
+        Checks that page one's WARC downloads before page two is fetched and the checkpoint is saved only at the end.
+        """
+        events, saved_states, error = self.run_streaming_job(
+            [
+                self.build_page(1, 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz', '2026-03-06T12:00:00Z'),
+                self.build_page(2, 'ARCHIVEIT-123-20260306123457-00000-beta.warc.gz', '2026-03-06T13:00:00Z'),
+            ]
+        )
 
-        last_reported_completed_count, progress_detail = get_download_progress_file_interval_update(
-            25,
-            10,
-            last_reported_completed_count,
+        self.assertIsNone(error)
+        self.assertEqual(
+            events,
+            [
+                'page 1',
+                'download ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz',
+                'page 2',
+                'download ARCHIVEIT-123-20260306123457-00000-beta.warc.gz',
+            ],
         )
-        self.assertEqual(last_reported_completed_count, 10)
-        self.assertEqual(progress_detail, '40% (10/25 files)')
+        self.assertTrue(all(state['enumeration_checkpoint_store_time_max'] is None for state in saved_states[:-1]))
+        self.assertEqual(saved_states[-1]['enumeration_checkpoint_store_time_max'], '2026-03-06T13:00:00Z')
 
-        last_reported_completed_count, progress_detail = get_download_progress_file_interval_update(
-            25,
-            11,
-            last_reported_completed_count,
+    def test_discovery_failure_keeps_checkpoint_and_records_started_downloads(self) -> None:
+        """
+        Checks that a mid-stream failure is raised after recording finished downloads, without moving the checkpoint.
+        """
+        events, saved_states, error = self.run_streaming_job(
+            [
+                self.build_page(1, 'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz', '2026-03-06T12:00:00Z'),
+                WasapiDiscoveryError('page 2 failed', partial_record_count=1),
+            ]
         )
-        self.assertEqual(last_reported_completed_count, 10)
-        self.assertIsNone(progress_detail)
 
-        last_reported_completed_count, progress_detail = get_download_progress_file_interval_update(
-            25,
-            20,
-            last_reported_completed_count,
+        self.assertIsInstance(error, WasapiDiscoveryError)
+        self.assertEqual(error.partial_record_count, 1)
+        self.assertIn('download ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz', events)
+        self.assertTrue(all(state['enumeration_checkpoint_store_time_max'] is None for state in saved_states))
+        self.assertEqual(
+            saved_states[-1]['files']['ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz']['status'],
+            'downloaded',
         )
-        self.assertEqual(last_reported_completed_count, 20)
-        self.assertEqual(progress_detail, '80% (20/25 files)')
+
+
+class TestRunPlannedDownloads(TestCase):
+    """
+    Test cases for the sequential planned-download loop.
+    """
+
+    def test_download_progress_helper_formats_expected_update_text(self) -> None:
+        """
+        Checks that progress-detail text uses the expected compact update format.
+        """
+        result = build_download_progress_detail(40, 6, 15)
+
+        self.assertEqual(result, '40% (6/15 files)')
 
     def test_logs_debug_message_immediately_before_download_attempt(self) -> None:
         """
@@ -1336,9 +1838,9 @@ class TestRunPlannedDownloads(TestCase):
             ),
         )
 
-    def test_progress_callback_emits_every_ten_completed_downloads(self) -> None:
+    def test_progress_callback_reports_bytes_rate_and_eta_once_per_interval(self) -> None:
         """
-        Checks that the sequential download loop emits progress after every ten completed downloads.
+        Checks that progress is reported by elapsed time rather than file count, with percent by WASAPI bytes.
         """
         planned_downloads = [
             PlannedDownload(
@@ -1349,19 +1851,23 @@ class TestRunPlannedDownloads(TestCase):
                     123,
                     [{'filename': f'ARCHIVEIT-123-202603061234{index:02d}-0000{index}-alpha.warc.gz'}],
                 )[0],
+                expected_size=1_000_000_000,
             )
-            for index in range(25)
+            for index in range(4)
         ]
         state = {'files': {}}
         client = MagicMock(spec=httpx.Client)
         download_result = MagicMock()
         download_result.success = False
         download_result.error_message = '502 Bad Gateway'
+        download_result.bytes_written = 1_000_000_000
+        download_result.resume_offset = 0
         progress_updates: list[str] = []
 
         with (
             patch('lib.orchestration.download_to_path', return_value=download_result),
             patch('lib.orchestration.save_collection_state'),
+            patch('lib.orchestration.time.monotonic', side_effect=[0.0, 100.0, 200.0, 300.0, 400.0]),
             patch('pathlib.Path.exists', return_value=False),
         ):
             run_planned_downloads(
@@ -1371,17 +1877,158 @@ class TestRunPlannedDownloads(TestCase):
                 state=state,
                 planned_downloads=planned_downloads,
                 progress_callback=progress_updates.append,
+                run_settings=RunSettings(download_concurrency=1, download_progress_interval_seconds=150),
             )
 
         self.assertEqual(
             progress_updates,
             [
-                '40% (10/25 files)',
-                '80% (20/25 files)',
+                '50% (2/4 files, 2.0/4.0 GB) at 10.0 MB/s, ETA 0:03:20',
+                '100% (4/4 files, 4.0/4.0 GB) at 10.0 MB/s, ETA 0:00:00',
             ],
         )
 
 
+    def test_worker_pool_runs_downloads_concurrently_and_records_every_outcome(self) -> None:
+        """
+        Checks that downloads overlap across workers while each outcome still lands in the manifest.
+        """
+        planned_downloads = [
+            PlannedDownload(
+                filename=f'ARCHIVEIT-123-202603061234{index:02d}-0000{index}-alpha.warc.gz',
+                source_url=f'https://example.org/{index}.warc.gz',
+                planned_paths=build_planned_download_paths(
+                    Path('/tmp/storage'),
+                    123,
+                    [{'filename': f'ARCHIVEIT-123-202603061234{index:02d}-0000{index}-alpha.warc.gz'}],
+                )[0],
+            )
+            for index in range(6)
+        ]
+        state = {'files': {}}
+        client = MagicMock(spec=httpx.Client)
+        barrier = threading.Barrier(3, timeout=5)
+        download_result = MagicMock()
+        download_result.success = False
+        download_result.error_message = '502 Bad Gateway'
+        saving_threads: set[str] = set()
+
+        def fake_download(*args: object, **kwargs: object) -> MagicMock:
+            barrier.wait()
+            return download_result
+
+        with (
+            patch('lib.orchestration.download_to_path', side_effect=fake_download) as mock_download,
+            patch(
+                'lib.orchestration.save_collection_state',
+                side_effect=lambda *args: saving_threads.add(threading.current_thread().name),
+            ),
+            patch('pathlib.Path.exists', return_value=False),
+        ):
+            download_results, fixity_results = run_planned_downloads(
+                client=client,
+                storage_root=Path('/tmp/storage'),
+                collection_id=123,
+                state=state,
+                planned_downloads=planned_downloads,
+                run_settings=RunSettings(download_concurrency=3),
+            )
+
+        self.assertEqual(mock_download.call_count, 6)
+        self.assertEqual(len(download_results), 6)
+        self.assertEqual(fixity_results, [])
+        self.assertEqual(saving_threads, {threading.current_thread().name})
+        self.assertEqual(
+            {entry['status'] for entry in state['files'].values()},
+            {'failed'},
+        )
+        self.assertEqual(len(state['files']), 6)
+
+
+class TestRunSettings(TestCase):
+    """
+    Test cases for optional run-level settings.
+    """
+
+    def test_defaults_to_one_worker_when_unset(self) -> None:
+        """
+        Checks that downloads stay sequential unless concurrency is configured.
+        """
+        with patch.dict(os.environ, {}, clear=True):
+            result = get_download_concurrency()
+
+        self.assertEqual(result, 1)
+
+    def test_reads_configured_worker_count(self) -> None:
+        """
+        Checks that a configured positive worker count is used.
+        """
+        with patch.dict(os.environ, {'DOWNLOAD_CONCURRENCY': ' 4 '}, clear=True):
+            result = get_download_concurrency()
+
+        self.assertEqual(result, 4)
+
+    def test_run_settings_reject_unknown_fixity_validation_mode(self) -> None:
+        """
+        Checks that an unknown FIXITY_VALIDATION_MODE fails before any collection is processed.
+        """
+        with patch.dict(os.environ, {'FIXITY_VALIDATION_MODE': 'sometimes'}, clear=True):
+            with self.assertRaises(RunConfigurationError):
+                get_run_settings()
+
+    def test_run_settings_read_journal_state_persistence_mode(self) -> None:
+        """
+        Checks that STATE_PERSISTENCE_MODE selects journaled per-file saves and rejects unknown modes.
+        """
+        with patch.dict(os.environ, {'STATE_PERSISTENCE_MODE': 'journal'}, clear=True):
+            result = get_run_settings()
+        with patch.dict(os.environ, {'STATE_PERSISTENCE_MODE': 'database'}, clear=True):
+            with self.assertRaises(RunConfigurationError):
+                get_run_settings()
+
+        self.assertEqual(result.state_persistence_mode, 'journal')
+
+    def test_global_download_limit_builds_shared_slots(self) -> None:
+        """
+        Checks that GLOBAL_DOWNLOAD_CONCURRENCY produces a shared semaphore and stays uncapped when unset.
+        """
+        with patch.dict(os.environ, {'GLOBAL_DOWNLOAD_CONCURRENCY': '2', 'COLLECTION_CONCURRENCY': '3'}, clear=True):
+            capped_settings = get_run_settings()
+        with patch.dict(os.environ, {}, clear=True):
+            uncapped_settings = get_run_settings()
+
+        download_slots = build_global_download_slots(capped_settings)
+        self.assertEqual(capped_settings.collection_concurrency, 3)
+        self.assertTrue(download_slots.acquire(blocking=False))
+        self.assertTrue(download_slots.acquire(blocking=False))
+        self.assertFalse(download_slots.acquire(blocking=False))
+        self.assertIsNone(build_global_download_slots(uncapped_settings))
+
+    def test_full_reverification_ignores_saved_fixity_cache(self) -> None:
+        """
+        Checks that full re-verification starts from an empty cache so every WARC is rehashed.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            cache_path = storage_root / 'collections' / '123' / 'fixity_cache.json'
+            cache_path.parent.mkdir(parents=True)
+            cache_path.write_text(json.dumps({'file.warc.gz': {'sha256': 'abc'}}), encoding='utf-8')
+
+            cached_result = load_collection_fixity_cache(storage_root, 123, 'cached')
+            full_result = load_collection_fixity_cache(storage_root, 123, FIXITY_VALIDATION_MODE_FULL_REVERIFICATION)
+
+        self.assertEqual(cached_result, {'file.warc.gz': {'sha256': 'abc'}})
+        self.assertEqual(full_result, {})
+
+    def test_rejects_non_positive_values(self) -> None:
+        """
+        Checks that zero and non-numeric values fail with a clear configuration error.
+        """
+        for configured_value in ('0', 'many', '-2'):
+            with self.assertRaises(RunConfigurationError):
+                parse_positive_int_setting('DOWNLOAD_CONCURRENCY', configured_value, 1)
+
+
 class TestCollectionReportingHelpers(TestCase):
     """
     Test cases for final spreadsheet reporting helper payloads.
@@ -1448,6 +2095,71 @@ class TestCollectionReportingHelpers(TestCase):
         self.assertEqual(result.summary_update.summary_status_downloaded_warcs_count, '2')
         self.assertEqual(result.summary_update.summary_status_downloaded_warcs_size, '2.0 GB')
 
+    def test_build_collection_final_report_uses_running_totals_without_walking_disk(self) -> None:
+        """
+        Checks that running totals in state replace the on-disk walk for summary counts and seeds.
+        """
+        collection_job = CollectionJob(123, 'UA', 'https://example.com', 'Example', 7)
+        state: dict[str, object] = {
+            'files': {},
+            'downloaded_totals': {
+                'file_count': 4,
+                'byte_count': 4 * (1024**3),
+                'seed_file_counts': {'SEED1': 3, 'UNKNOWN_SEED': 1},
+                'last_full_rescan_at': '2026-03-01T00:00:00+00:00',
+            },
+        }
+
+        with patch('lib.orchestration.iter_collection_warc_paths') as mock_walk:
+            result = build_collection_final_report(
+                storage_root=Path('/tmp/storage'),
+                collection_job=collection_job,
+                discovery_completed_at='2026-03-07T15:00:00+00:00',
+                planned_downloads=[],
+                download_results=[],
+                fixity_results=[],
+                discovered_records=[{'filename': 'ARCHIVEIT-123-SEED2-20260306123456-00000-beta.warc.gz'}],
+                state=state,
+            )
+
+        mock_walk.assert_not_called()
+        self.assertEqual(result.summary_update.summary_status_downloaded_warcs_count, '4')
+        self.assertEqual(result.summary_update.summary_status_downloaded_warcs_size, '4.0 GB')
+        self.assertEqual(result.summary_update.seed_count, '2')
+
+    def test_refresh_downloaded_totals_rescans_when_due_and_corrects_drift(self) -> None:
+        """
+        Checks that stale running totals are rebuilt from disk and fresh ones are left alone.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            warc_path = storage_root / 'collections' / '123' / 'SEED1' / '2026' / '03'
+            warc_path.mkdir(parents=True)
+            (warc_path / 'ARCHIVEIT-123-SEED1-20260306123456-00000-alpha.warc.gz').write_bytes(b'abc')
+            state: dict[str, object] = {
+                'files': {},
+                'downloaded_totals': {
+                    'file_count': 9,
+                    'byte_count': 99,
+                    'seed_file_counts': {'SEED9': 9},
+                    'last_full_rescan_at': '2026-01-01T00:00:00+00:00',
+                },
+            }
+            settings = RunSettings(downloaded_totals_rescan_days=30)
+
+            rescanned = refresh_downloaded_totals_if_due(
+                storage_root, 123, state, settings, datetime(2026, 3, 7, tzinfo=UTC)
+            )
+            rescanned_again = refresh_downloaded_totals_if_due(
+                storage_root, 123, state, settings, datetime(2026, 3, 8, tzinfo=UTC)
+            )
+
+        self.assertTrue(rescanned)
+        self.assertFalse(rescanned_again)
+        self.assertEqual(state['downloaded_totals']['file_count'], 1)
+        self.assertEqual(state['downloaded_totals']['byte_count'], 3)
+        self.assertEqual(state['downloaded_totals']['seed_file_counts'], {'SEED1': 1})
+
     def test_build_collection_final_report_for_file_failures(self) -> None:
         """
         Checks that file failures map to the expected final collection status.
@@ -0,0 +1,101 @@
+import sys
+import unittest
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.downloader import DownloadResult
+from lib.orchestration import PlannedDownload, RunSettings, build_planned_download_paths, run_planned_downloads
+from lib.run_deadline import RunDeadline, parse_run_deadline
+
+
+class TestParseRunDeadline(TestCase):
+    """
+    Test cases for parsing `--deadline` / RUN_DEADLINE values.
+    """
+
+    def test_clock_time_means_its_next_occurrence_and_iso_datetimes_keep_their_offset(self) -> None:
+        """
+        Checks that a clock time already past today rolls to tomorrow and that an ISO datetime is taken as given.
+        """
+        eastern = timezone(timedelta(hours=-5))
+        now = datetime(2026, 3, 6, 23, 0, tzinfo=eastern)
+
+        iso_result = parse_run_deadline('2026-03-07T06:30:00+00:00', now)
+        clock_result = parse_run_deadline('06:00', now)
+
+        self.assertEqual(iso_result, datetime(2026, 3, 7, 6, 30, tzinfo=UTC))
+        self.assertEqual((clock_result.hour, clock_result.minute), (6, 0))
+        self.assertGreater(clock_result, now)
+        self.assertLessEqual(clock_result - now, timedelta(days=1))
+        with self.assertRaises(ValueError):
+            parse_run_deadline('25:00', now)
+
+
+class TestRunDeadline(TestCase):
+    """
+    Test cases for deciding which transfers may still start before the deadline.
+    """
+
+    def test_uses_observed_throughput_once_transfers_complete(self) -> None:
+        """
+        Checks the fallback rate, the switch to observed throughput, and that nothing starts after the deadline.
+        """
+        now = datetime(2026, 3, 6, 5, 0, tzinfo=UTC)
+        run_deadline = RunDeadline(now + timedelta(seconds=100), fallback_stream_bytes_per_second=100.0)
+
+        fits_at_fallback_rate = run_deadline.allows_start(7_000, now)
+        run_deadline.record_transfer(1_000, 100.0)
+        fits_at_observed_rate = run_deadline.allows_start(7_000, now)
+        small_file_fits = run_deadline.allows_start(500, now)
+        after_deadline = run_deadline.allows_start(0, now + timedelta(seconds=100))
+
+        self.assertTrue(fits_at_fallback_rate)
+        self.assertFalse(fits_at_observed_rate)
+        self.assertTrue(small_file_fits)
+        self.assertFalse(after_deadline)
+
+    def test_run_planned_downloads_defers_files_that_cannot_finish(self) -> None:
+        """
+        Checks that past the deadline no transfer starts and every file is counted as deferred for the next run.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            planned_downloads = [
+                PlannedDownload(
+                    filename=filename,
+                    source_url=f'https://example.org/{filename}',
+                    planned_paths=build_planned_download_paths(storage_root, 123, [{'filename': filename}])[0],
+                    expected_size=10,
+                )
+                for filename in (
+                    'ARCHIVEIT-123-20260306123456-00000-alpha.warc.gz',
+                    'ARCHIVEIT-123-20260306123456-00001-alpha.warc.gz',
+                )
+            ]
+            run_deadline = RunDeadline(datetime(2020, 1, 1, tzinfo=UTC), fallback_stream_bytes_per_second=100.0)
+
+            with patch('lib.orchestration.download_to_path', return_value=MagicMock(spec=DownloadResult)) as mock_download:
+                download_results, fixity_results = run_planned_downloads(
+                    client=MagicMock(spec=httpx.Client),
+                    storage_root=storage_root,
+                    collection_id=123,
+                    state={'files': {}},
+                    planned_downloads=planned_downloads,
+                    run_settings=RunSettings(download_concurrency=2),
+                    run_deadline=run_deadline,
+                )
+
+        mock_download.assert_not_called()
+        self.assertEqual((download_results, fixity_results), ([], []))
+        self.assertEqual(run_deadline.get_deferred_count(123), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import json
+import sqlite3
+import sys
+import unittest
+from contextlib import closing
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.local_state import build_state_file_path, make_default_collection_state, save_collection_state
+from lib.sqlite_state import (
+    build_sqlite_state_path,
+    count_files_by_status,
+    hold_state_database,
+    load_collection_state_from_sqlite,
+    release_state_database,
+    save_collection_state_to_sqlite,
+    save_file_manifest_entry_to_sqlite,
+)
+
+
+class TestSqliteStateStore(TestCase):
+    """
+    Test cases for the SQLite-backed collection state store.
+    """
+
+    def test_save_and_load_round_trip(self) -> None:
+        """
+        Checks that the SQLite adapter returns the same state shape that was saved.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = {
+                'enumeration_checkpoint_store_time_max': '2026-03-06T12:00:00Z',
+                'files': {
+                    'alpha.warc.gz': {'status': 'failed', 'seed_id': '111', 'error_count': 2},
+                    'beta.warc.gz': {'status': 'downloaded', 'size': 42},
+                },
+            }
+
+            save_collection_state_to_sqlite(storage_root, 123, state)
+            result = load_collection_state_from_sqlite(storage_root, 123)
+
+        self.assertEqual(result, state)
+
+    def test_whole_state_save_removes_entries_no_longer_in_manifest(self) -> None:
+        """
+        Checks that a whole-state save replaces the manifest rather than merging into it.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files'] = {'alpha.warc.gz': {'status': 'failed'}, 'beta.warc.gz': {'status': 'failed'}}
+            save_collection_state_to_sqlite(storage_root, 123, state)
+            state['files'] = {'beta.warc.gz': {'status': 'downloaded'}}
+            save_collection_state_to_sqlite(storage_root, 123, state)
+
+            result = load_collection_state_from_sqlite(storage_root, 123)
+
+        self.assertEqual(result['files'], {'beta.warc.gz': {'status': 'downloaded'}})
+
+    def test_whole_state_save_writes_only_changed_rows(self) -> None:
+        """
+        Checks that a whole-state save leaves unchanged rows alone and rewrites the rows whose entry changed.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files'] = {'alpha.warc.gz': {'status': 'failed'}, 'beta.warc.gz': {'status': 'failed'}}
+            save_collection_state_to_sqlite(storage_root, 123, state)
+            with closing(sqlite3.connect(build_sqlite_state_path(storage_root, 123))) as connection:
+                with connection:
+                    connection.execute("UPDATE files SET status = 'untouched-marker'")
+            state['files']['beta.warc.gz'] = {'status': 'downloaded'}
+
+            save_collection_state_to_sqlite(storage_root, 123, state)
+            status_counts = count_files_by_status(storage_root, 123)
+
+        self.assertEqual(status_counts, {'untouched-marker': 1, 'downloaded': 1})
+
+    def test_migrates_existing_state_json_once(self) -> None:
+        """
+        Checks that the first SQLite load imports state.json and later loads read only the database.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['enumeration_checkpoint_store_time_max'] = '2026-03-06T12:00:00Z'
+            state['files']['alpha.warc.gz'] = {'status': 'downloaded', 'seed_id': '111'}
+            save_collection_state(storage_root, 123, state)
+
+            migrated_result = load_collection_state_from_sqlite(storage_root, 123)
+            build_state_file_path(storage_root, 123).write_text(
+                json.dumps({'enumeration_checkpoint_store_time_max': None, 'files': {}}),
+                encoding='utf-8',
+            )
+            later_result = load_collection_state_from_sqlite(storage_root, 123)
+            database_exists = build_sqlite_state_path(storage_root, 123).exists()
+
+        self.assertTrue(database_exists)
+        self.assertEqual(migrated_result, state)
+        self.assertEqual(later_result, state)
+
+    def test_per_file_save_updates_one_row_and_the_status_column(self) -> None:
+        """
+        Checks that a per-file save writes only that entry and keeps the indexed status column current.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files'] = {'alpha.warc.gz': {'status': 'pending_download'}, 'beta.warc.gz': {'status': 'failed'}}
+            save_collection_state_to_sqlite(storage_root, 123, state)
+            state['files']['alpha.warc.gz'] = {'status': 'downloaded', 'last_attempt_at': '2026-03-07T00:00:00+00:00'}
+            state['files']['beta.warc.gz'] = {'status': 'unsaved-in-memory-change'}
+
+            save_file_manifest_entry_to_sqlite(storage_root, 123, state, 'alpha.warc.gz')
+            status_counts = count_files_by_status(storage_root, 123)
+            result = load_collection_state_from_sqlite(storage_root, 123)
+
+        self.assertEqual(status_counts, {'downloaded': 1, 'failed': 1})
+        self.assertEqual(
+            result['files'],
+            {
+                'alpha.warc.gz': {'status': 'downloaded', 'last_attempt_at': '2026-03-07T00:00:00+00:00'},
+                'beta.warc.gz': {'status': 'failed'},
+            },
+        )
+
+    def test_held_database_is_reused_for_every_save_until_released(self) -> None:
+        """
+        Checks that saves during a held collection run open no new connection, and that the held state is durable.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            state = make_default_collection_state()
+            state['files'] = {'alpha.warc.gz': {'status': 'pending_download'}}
+
+            hold_state_database(storage_root, 123)
+            try:
+                with patch('lib.sqlite_state.sqlite3.connect', side_effect=AssertionError('reconnected')):
+                    save_collection_state_to_sqlite(storage_root, 123, state)
+                    state['files']['alpha.warc.gz'] = {'status': 'downloaded'}
+                    save_file_manifest_entry_to_sqlite(storage_root, 123, state, 'alpha.warc.gz')
+                    held_result = load_collection_state_from_sqlite(storage_root, 123)
+            finally:
+                release_state_database(storage_root, 123)
+            released_result = load_collection_state_from_sqlite(storage_root, 123)
+
+        self.assertEqual(held_result['files'], {'alpha.warc.gz': {'status': 'downloaded'}})
+        self.assertEqual(released_result, held_result)
+
+    def test_drops_indexes_of_columns_no_longer_written(self) -> None:
+        """
+        Checks that a database created with the first schema loses its unused seed, size, and attempt indexes.
+        """
+        with TemporaryDirectory() as temp_dir:
+            storage_root = Path(temp_dir)
+            database_path = build_sqlite_state_path(storage_root, 123)
+            database_path.parent.mkdir(parents=True)
+            with closing(sqlite3.connect(database_path)) as connection:
+                with connection:
+                    connection.execute(
+                        'CREATE TABLE files (filename TEXT PRIMARY KEY, status TEXT, seed_id TEXT, size INTEGER, '
+                        'last_attempt_at TEXT, entry_json TEXT NOT NULL)'
+                    )
+                    connection.execute('CREATE INDEX files_seed_id_idx ON files (seed_id)')
+                    connection.execute('CREATE INDEX files_size_idx ON files (size)')
+
+            save_collection_state_to_sqlite(storage_root, 123, {'files': {'alpha.warc.gz': {'status': 'failed'}}})
+            with closing(sqlite3.connect(database_path)) as connection:
+                index_names = [
+                    row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' ORDER BY name")
+                ]
+            result = load_collection_state_from_sqlite(storage_root, 123)
+
+        self.assertNotIn('files_seed_id_idx', index_names)
+        self.assertNotIn('files_size_idx', index_names)
+        self.assertIn('files_status_idx', index_names)
+        self.assertEqual(result['files'], {'alpha.warc.gz': {'status': 'failed'}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import re
 import sys
 import unittest
 from pathlib import Path
@@ -11,6 +12,8 @@ from lib.storage_layout import (
     build_warc_destination_path,
     extract_warc_seed_id,
     extract_warc_timestamp_parts,
+    parse_warc_filename,
+    parse_warc_filenames,
     plan_collection_paths,
 )
 
@@ -135,5 +138,64 @@ class TestBuildPaths(TestCase):
         )
 
 
+
+class TestParseWarcFilename(TestCase):
+    """
+    Test cases for the single-pass WARC filename parser.
+    """
+
+    def test_matches_separate_timestamp_and_seed_patterns(self) -> None:
+        """
+        Checks that the combined regex finds the same year, month, and seed as two separate leftmost searches.
+        """
+        timestamp_pattern = re.compile(r'-(\d{4})(\d{2})\d{2}\d{6}(?:\d+)?-')
+        seed_pattern = re.compile(r'(?:^|-)SEED(?P<seed_digits>[0-9]+)(?:-|$)')
+        filenames = [
+            'ARCHIVEIT-123-JOB456-SEED789-20260306123456-00000-example.warc.gz',
+            'ARCHIVEIT-123-20260306123456789-00000-example.warc.gz',
+            'SEED42-ARCHIVEIT-20251231235959-00001.warc.gz',
+            'ARCHIVEIT-123-SEEDLING-20260306123456-00000-SEED5.warc.gz',
+            'ARCHIVEIT-123-20260306123456-SEED1-20270101000000-x-SEED2-y.warc.gz',
+            'example.warc.gz',
+        ]
+
+        for filename in filenames:
+            result = parse_warc_filename(filename)
+            timestamp_match = timestamp_pattern.search(filename)
+            seed_match = seed_pattern.search(filename)
+            self.assertEqual(result.year, timestamp_match.group(1) if timestamp_match else None, filename)
+            self.assertEqual(result.month, timestamp_match.group(2) if timestamp_match else None, filename)
+            expected_seed = f'SEED{seed_match.group("seed_digits")}' if seed_match else 'UNKNOWN_SEED'
+            self.assertEqual(result.seed_id, expected_seed, filename)
+
+    def test_memoises_parse_results_per_filename(self) -> None:
+        """
+        Checks that parsing the same filename again returns the cached parse object.
+        """
+        filename = 'ARCHIVEIT-123-JOB456-SEED31337-20260306123456-00000-memo.warc.gz'
+
+        first_result = parse_warc_filename(filename)
+        second_result = parse_warc_filename(filename)
+
+        self.assertIs(first_result, second_result)
+
+    def test_batch_parse_skips_blank_and_duplicate_filenames(self) -> None:
+        """
+        Checks that the batch API parses each distinct non-blank filename once.
+        """
+        filenames = [
+            'ARCHIVEIT-123-SEED1-20260306123456-00000-a.warc.gz',
+            '  ',
+            'ARCHIVEIT-123-SEED1-20260306123456-00000-a.warc.gz',
+            'ARCHIVEIT-123-20260406123456-00000-b.warc.gz',
+        ]
+
+        result = parse_warc_filenames(filenames)
+
+        self.assertEqual(list(result), [filenames[0], filenames[3]])
+        self.assertEqual(result[filenames[0]].seed_id, 'SEED1')
+        self.assertEqual(result[filenames[3]].month, '04')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import sys
+import threading
 import unittest
 from datetime import UTC, datetime
 from pathlib import Path
@@ -13,6 +14,7 @@ from lib.wasapi_discovery import (
     compute_store_time_after_datetime,
     extract_record_store_time,
     fetch_collection_discovery,
+    iter_collection_discovery_pages,
 )
 
 
@@ -242,5 +244,143 @@ class TestFetchCollectionDiscovery(TestCase):
         self.assertFalse(context.exception.partial_result.completed_successfully)
 
 
+
+class TestIterCollectionDiscoveryPages(TestCase):
+    """
+    Test cases for page-by-page streamed discovery.
+    """
+
+    def test_yields_each_page_before_fetching_the_next(self) -> None:
+        """
+        Checks that pages are yielded as they arrive and carry the running max store-time.
+        """
+        client = FakeClient(
+            [
+                FakeResponse(
+                    'https://example.org/wasapi?page=1',
+                    {
+                        'results': [{'filename': 'alpha.warc.gz', 'store-time': '2026-02-03T09:15:00Z'}],
+                        'next': 'https://example.org/wasapi?page=2',
+                    },
+                ),
+                FakeResponse(
+                    'https://example.org/wasapi?page=2',
+                    {'results': [{'filename': 'beta.warc.gz', 'store-time': '2026-02-01T01:00:00Z'}], 'next': None},
+                ),
+            ],
+        )
+
+        pages = iter_collection_discovery_pages(client, 'https://example.org/wasapi', 123, None, page_size=1)
+        first_page = next(pages)
+        calls_after_first_page = len(client.calls)
+        remaining_pages = list(pages)
+
+        self.assertEqual(calls_after_first_page, 1)
+        self.assertEqual(first_page.records, [{'filename': 'alpha.warc.gz', 'store-time': '2026-02-03T09:15:00Z'}])
+        self.assertEqual(len(remaining_pages), 1)
+        self.assertEqual(remaining_pages[0].page_number, 2)
+        self.assertEqual(remaining_pages[0].max_observed_store_time, '2026-02-03T09:15:00Z')
+
+    def test_failure_reports_partial_record_count_without_holding_records(self) -> None:
+        """
+        Checks that a mid-stream failure reports how many records were already yielded.
+        """
+        client = FakeClient(
+            [
+                FakeResponse(
+                    'https://example.org/wasapi?page=1',
+                    {'results': [{'filename': 'alpha.warc.gz'}, {'filename': 'beta.warc.gz'}], 'next': 2},
+                ),
+                FakeResponse('https://example.org/wasapi?page=2', {}, status_code=503),
+            ],
+        )
+
+        with self.assertRaises(WasapiDiscoveryError) as context:
+            list(iter_collection_discovery_pages(client, 'https://example.org/wasapi', 123, None))
+
+        self.assertEqual(context.exception.partial_record_count, 2)
+        self.assertEqual(context.exception.partial_result.records, [])
+        self.assertEqual(len(context.exception.partial_result.request_records), 2)
+        self.assertIn('page 2', str(context.exception))
+
+
+
+class PagedFakeClient:
+    """
+    Represents a thread-safe fake client that answers by page number, for parallel discovery tests.
+    """
+
+    def __init__(self, record_count: int, failing_page: int | None = None) -> None:
+        self.record_count = record_count
+        self.failing_page = failing_page
+        self.page_three_requested = threading.Event()
+        self.page_two_saw_page_three = False
+
+    def get(self, url: str, params: dict[str, object]) -> FakeResponse:
+        """
+        Returns one record per page; page 2 waits briefly to observe whether page 3 was fetched concurrently.
+        """
+        page_number = int(params['page'])
+        if page_number == 3:
+            self.page_three_requested.set()
+        if page_number == 2:
+            self.page_two_saw_page_three = self.page_three_requested.wait(timeout=2)
+        status_code = 503 if page_number == self.failing_page else 200
+        next_link = f'{url}?page={page_number + 1}' if page_number < self.record_count else None
+        payload = {
+            'count': self.record_count,
+            'results': [{'filename': f'page-{page_number}.warc.gz'}],
+            'next': next_link,
+        }
+        result = FakeResponse(f'{url}?page={page_number}', payload, status_code=status_code)
+        return result
+
+
+class TestParallelDiscoveryPageFetching(TestCase):
+    """
+    Test cases for fetching known WASAPI pages concurrently.
+    """
+
+    def test_fetches_remaining_pages_concurrently_and_keeps_page_order(self) -> None:
+        """
+        Checks that pages 2..N are fetched with fan-out but results and request records stay in page order.
+        """
+        client = PagedFakeClient(record_count=5)
+
+        result = fetch_collection_discovery(
+            client=client,
+            base_url='https://example.org/wasapi',
+            collection_id=123,
+            after_datetime=None,
+            page_size=1,
+            page_fetch_concurrency=3,
+        )
+
+        self.assertTrue(client.page_two_saw_page_three)
+        self.assertEqual([record['filename'] for record in result.records], [f'page-{n}.warc.gz' for n in range(1, 6)])
+        self.assertEqual([record.page_number for record in result.request_records], [1, 2, 3, 4, 5])
+
+    def test_failure_keeps_only_the_contiguous_prefix(self) -> None:
+        """
+        Checks that a failed middle page reports only the pages before it, even if later pages were fetched.
+        """
+        client = PagedFakeClient(record_count=5, failing_page=3)
+
+        with self.assertRaises(WasapiDiscoveryError) as context:
+            fetch_collection_discovery(
+                client=client,
+                base_url='https://example.org/wasapi',
+                collection_id=123,
+                after_datetime=None,
+                page_size=1,
+                page_fetch_concurrency=3,
+            )
+
+        partial_result = context.exception.partial_result
+        self.assertEqual([record['filename'] for record in partial_result.records], ['page-1.warc.gz', 'page-2.warc.gz'])
+        self.assertEqual([record.page_number for record in partial_result.request_records], [1, 2, 3])
+        self.assertEqual(partial_result.request_records[-1].status_code, 503)
+
+
 if __name__ == '__main__':
     unittest.main()